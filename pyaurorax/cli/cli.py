@@ -37,7 +37,7 @@ def __test_connectivity(aurorax):
     # make request
     click.echo("Checking connectivity to %s ...\n" % (aurorax.api_base_url))
     try:
-        r = requests.get(aurorax.api_base_url, timeout=aurorax.api_timeout)
+        r = aurorax.api_session.get(aurorax.api_base_url, timeout=aurorax.api_timeout)
     except requests.RequestException as e:  # pragma: nocover-ok
         click.echo("Error connecting to AuroraX API: %s" % (str(e)))
         sys.exit(1)
@@ -15,7 +15,10 @@
 import os
 import shutil
 import humanize
+import requests
 import pyucalgarysrs
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from texttable import Texttable
 from pathlib import Path
 from typing import Optional, Any, Literal
@@ -50,6 +53,12 @@ class PyAuroraX:
 
     __DEFAULT_API_BASE_URL = "https://api.aurorax.space"
     __DEFAULT_API_TIMEOUT = 10
+    __DEFAULT_API_POOL_SIZE = 10
+    __DEFAULT_API_MAX_RETRIES = 3
+    __DEFAULT_API_RETRY_BACKOFF = 0.5
+    __API_RETRY_STATUS_CODES = [502, 503, 504]
+    __DEFAULT_MOSAIC_SKYMAP_CACHE_MAX_SIZE = 5 * 1024**3  # 5 GB
+    __DEFAULT_SOURCES_CACHE_TTL = 600.0  # 10 minutes
     __DEFAULT_API_HEADERS = {
         "content-type": "application/json",
         "user-agent": "python-pyaurorax/%s" % (__version__),
@@ -63,6 +72,13 @@ class PyAuroraX:
         api_timeout: Optional[int] = None,
         api_key: Optional[str] = None,
         progress_bar_backend: Literal["auto", "standard", "notebook"] = "auto",
+        mosaic_skymap_cache_path: Optional[str] = None,
+        mosaic_skymap_cache_max_size: Optional[int] = None,
+        api_pool_size: Optional[int] = None,
+        api_max_retries: Optional[int] = None,
+        api_retry_backoff: Optional[float] = None,
+        sources_cache_ttl: Optional[float] = None,
+        sources_cache_path: Optional[str] = None,
     ):
         """
         Attributes:
@@ -95,6 +111,41 @@ class PyAuroraX:
                 The progress bar backend to use. Valid choices are 'auto', 'standard', or 'notebook'. 
                 Default is 'auto'. This parameter is optional.
 
+            mosaic_skymap_cache_path (str): 
+                Directory used for caching prepared mosaic skymaps, when the `use_cache` parameter of 
+                `tools.mosaic.prep_skymaps()` is enabled. The default for this is 
+                `<download_output_root_path>/mosaic_skymap_cache`.
+
+            mosaic_skymap_cache_max_size (int): 
+                The maximum size of the mosaic skymap cache, in bytes. When exceeded, the least recently 
+                used skymaps are removed from the cache. Default is 5 GB.
+
+            api_pool_size (int): 
+                The maximum number of connections kept open to the AuroraX API, for reuse by subsequent 
+                requests. Requests to the AuroraX API share a single HTTP session, so connections are kept 
+                alive and compressed responses are used. Default is `10`.
+
+            api_max_retries (int): 
+                The maximum number of times a request to the AuroraX API is retried when a connection error,
+                or a 502, 503, or 504 response is encountered. Only requests that are safe to repeat (ie. not 
+                POST requests) are retried for responses and read timeouts. Set to `0` to disable retries. 
+                Default is `3`.
+
+            api_retry_backoff (float): 
+                The backoff factor used between retries, in seconds. The delay doubles with each retry (ie. 0.5s, 
+                1s, 2s, ...). Default is `0.5`.
+
+            sources_cache_ttl (float): 
+                The time, in seconds, that the local catalog of data sources is used for before being retrieved 
+                from the API again. The catalog is used for looking up data sources when validating uploaded 
+                records and metadata schemas, and when requested by the `search.sources` functions. Set to `0` 
+                to disable it. Default is `600` (10 minutes).
+
+            sources_cache_path (str): 
+                File used to save the local catalog of data sources, so that it can be re-used between sessions 
+                while it is within the `sources_cache_ttl`. The default is None, meaning the catalog is only 
+                kept in memory.
+
             srs_obj (pyucalgarysrs.PyUCalgarySRS): 
                 A [PyUCalgarySRS](https://docs-pyucalgarysrs.phys.ucalgary.ca/#pyucalgarysrs.PyUCalgarySRS) object. 
                 If not supplied, it will create the object with some settings carried over from the PyAuroraX 
@@ -111,6 +162,12 @@ class PyAuroraX:
         self.__read_tar_temp_path = read_tar_temp_path
         if (self.__read_tar_temp_path is None):
             self.__read_tar_temp_path = Path("%s/tar_temp_working" % (self.__download_output_root_path))
+        self.__mosaic_skymap_cache_path = mosaic_skymap_cache_path
+        if (self.__mosaic_skymap_cache_path is None):
+            self.__mosaic_skymap_cache_path = Path("%s/mosaic_skymap_cache" % (self.__download_output_root_path))
+        self.__mosaic_skymap_cache_max_size = mosaic_skymap_cache_max_size
+        if (self.__mosaic_skymap_cache_max_size is None):
+            self.__mosaic_skymap_cache_max_size = self.__DEFAULT_MOSAIC_SKYMAP_CACHE_MAX_SIZE
 
         # initialize api parameters
         self.__api_base_url = api_base_url
@@ -121,6 +178,23 @@ class PyAuroraX:
             self.__api_timeout = self.__DEFAULT_API_TIMEOUT
         self.__api_key = api_key
         self.__api_headers = self.__DEFAULT_API_HEADERS
+        self.__api_pool_size = api_pool_size
+        if (api_pool_size is None):
+            self.__api_pool_size = self.__DEFAULT_API_POOL_SIZE
+        self.__api_max_retries = api_max_retries
+        if (api_max_retries is None):
+            self.__api_max_retries = self.__DEFAULT_API_MAX_RETRIES
+        self.__api_retry_backoff = api_retry_backoff
+        if (api_retry_backoff is None):
+            self.__api_retry_backoff = self.__DEFAULT_API_RETRY_BACKOFF
+        self.__api_session = None
+        self.__init_api_session()
+
+        # initialize data source catalog parameters
+        self.__sources_cache_ttl = sources_cache_ttl
+        if (sources_cache_ttl is None):
+            self.__sources_cache_ttl = self.__DEFAULT_SOURCES_CACHE_TTL
+        self.__sources_cache_path = sources_cache_path
 
         # initialize progress bar parameters
         self.__progress_bar_backend = progress_bar_backend
@@ -227,6 +301,51 @@ class PyAuroraX:
         self.__api_timeout = new_timeout
         self.__srs_obj.api_timeout = new_timeout
 
+    @property
+    def api_pool_size(self):
+        """
+        Property for the API connection pool size. See above for details.
+        """
+        return self.__api_pool_size
+
+    @api_pool_size.setter
+    def api_pool_size(self, value: Optional[int] = None):
+        self.__api_pool_size = self.__DEFAULT_API_POOL_SIZE if value is None else value
+        self.__init_api_session()
+
+    @property
+    def api_max_retries(self):
+        """
+        Property for the API max retries. See above for details.
+        """
+        return self.__api_max_retries
+
+    @api_max_retries.setter
+    def api_max_retries(self, value: Optional[int] = None):
+        self.__api_max_retries = self.__DEFAULT_API_MAX_RETRIES if value is None else value
+        self.__init_api_session()
+
+    @property
+    def api_retry_backoff(self):
+        """
+        Property for the API retry backoff factor. See above for details.
+        """
+        return self.__api_retry_backoff
+
+    @api_retry_backoff.setter
+    def api_retry_backoff(self, value: Optional[float] = None):
+        self.__api_retry_backoff = self.__DEFAULT_API_RETRY_BACKOFF if value is None else value
+        self.__init_api_session()
+
+    @property
+    def api_session(self):
+        """
+        Property for the HTTP session used for all requests to the AuroraX API. This is a 
+        `requests.Session` object, configured using the `api_pool_size`, `api_max_retries` and 
+        `api_retry_backoff` parameters.
+        """
+        return self.__api_session
+
     @property
     def api_key(self):
         """
@@ -273,6 +392,53 @@ class PyAuroraX:
         self.initialize_paths()
         self.__srs_obj.read_tar_temp_path = self.__read_tar_temp_path
 
+    @property
+    def mosaic_skymap_cache_path(self):
+        """
+        Property for the mosaic skymap cache path. See above for details.
+        """
+        return str(self.__mosaic_skymap_cache_path)
+
+    @mosaic_skymap_cache_path.setter
+    def mosaic_skymap_cache_path(self, value: str):
+        self.__mosaic_skymap_cache_path = value
+
+    @property
+    def mosaic_skymap_cache_max_size(self):
+        """
+        Property for the mosaic skymap cache max size. See above for details.
+        """
+        return self.__mosaic_skymap_cache_max_size
+
+    @mosaic_skymap_cache_max_size.setter
+    def mosaic_skymap_cache_max_size(self, value: Optional[int] = None):
+        if (value is None):
+            self.__mosaic_skymap_cache_max_size = self.__DEFAULT_MOSAIC_SKYMAP_CACHE_MAX_SIZE
+        else:
+            self.__mosaic_skymap_cache_max_size = value
+
+    @property
+    def sources_cache_ttl(self):
+        """
+        Property for the data source catalog TTL. See above for details.
+        """
+        return self.__sources_cache_ttl
+
+    @sources_cache_ttl.setter
+    def sources_cache_ttl(self, value: Optional[float] = None):
+        self.__sources_cache_ttl = self.__DEFAULT_SOURCES_CACHE_TTL if value is None else value
+
+    @property
+    def sources_cache_path(self):
+        """
+        Property for the data source catalog file path. See above for details.
+        """
+        return None if self.__sources_cache_path is None else str(self.__sources_cache_path)
+
+    @sources_cache_path.setter
+    def sources_cache_path(self, value: Optional[str] = None):
+        self.__sources_cache_path = value
+
     @property
     def progress_bar_backend(self):
         """
@@ -299,6 +465,36 @@ class PyAuroraX:
         """
         return self.__srs_obj
 
+    # -----------------------------
+    # private methods
+    # -----------------------------
+    def __init_api_session(self):
+        # set up retries
+        #
+        # NOTE: the default allowed methods are used for retrying based on the response
+        # status and read errors, which excludes POST and PATCH requests since they are not
+        # idempotent. We don't raise on the final status so that the API request handling can
+        # produce the usual errors.
+        retry = Retry(
+            total=self.__api_max_retries,
+            backoff_factor=self.__api_retry_backoff,
+            status_forcelist=self.__API_RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+
+        # create session, replacing any existing one
+        #
+        # NOTE: requests sessions accept gzip-compressed responses by default (and brotli
+        # if it's installed), and keep connections alive.
+        adapter = HTTPAdapter(pool_connections=self.__api_pool_size, pool_maxsize=self.__api_pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        old_session = self.__api_session
+        self.__api_session = session
+        if (old_session is not None):
+            old_session.close()
+
     # -----------------------------
     # special methods
     # -----------------------------
@@ -307,7 +503,9 @@ class PyAuroraX:
 
     def __repr__(self) -> str:
         return ("PyAuroraX(download_output_root_path='%s', read_tar_temp_path='%s', api_base_url='%s', " +
-                "api_headers=%s, api_timeout=%s, api_key=%s, progress_bar_backend='%s', srs_obj=PyUCalgarySRS(...))") % (
+                "api_headers=%s, api_timeout=%s, api_key=%s, progress_bar_backend='%s', mosaic_skymap_cache_path='%s', " +
+                "mosaic_skymap_cache_max_size=%d, api_pool_size=%d, api_max_retries=%d, api_retry_backoff=%s, sources_cache_ttl=%s, " +
+                "sources_cache_path=%s, srs_obj=PyUCalgarySRS(...))") % (
                     self.__download_output_root_path,
                     self.__read_tar_temp_path,
                     self.api_base_url,
@@ -315,6 +513,13 @@ class PyAuroraX:
                     self.api_timeout,
                     "None" if self.api_key is None else "'%s'" % (self.api_key),
                     self.progress_bar_backend,
+                    self.__mosaic_skymap_cache_path,
+                    self.mosaic_skymap_cache_max_size,
+                    self.api_pool_size,
+                    self.api_max_retries,
+                    self.api_retry_backoff,
+                    self.sources_cache_ttl,
+                    "None" if self.sources_cache_path is None else "'%s'" % (self.sources_cache_path),
                 )
 
     def pretty_print(self):
@@ -325,14 +530,21 @@ class PyAuroraX:
 
         # print
         print("PyAuroraX:")
-        print("  %-27s: %s" % ("download_output_root_path", self.download_output_root_path))
-        print("  %-27s: %s" % ("read_tar_temp_path", self.read_tar_temp_path))
-        print("  %-27s: %s" % ("api_base_url", self.api_base_url))
-        print("  %-27s: %s" % ("api_headers", self.api_headers))
-        print("  %-27s: %s" % ("api_timeout", self.api_timeout))
-        print("  %-27s: %s" % ("api_key", self.api_key))
-        print("  %-27s: %s" % ("progress_bar_backend", self.progress_bar_backend))
-        print("  %-27s: %s" % ("srs_obj", "PyUCalgarySRS(...)"))
+        print("  %-28s: %s" % ("download_output_root_path", self.download_output_root_path))
+        print("  %-28s: %s" % ("read_tar_temp_path", self.read_tar_temp_path))
+        print("  %-28s: %s" % ("api_base_url", self.api_base_url))
+        print("  %-28s: %s" % ("api_headers", self.api_headers))
+        print("  %-28s: %s" % ("api_timeout", self.api_timeout))
+        print("  %-28s: %s" % ("api_key", self.api_key))
+        print("  %-28s: %s" % ("api_pool_size", self.api_pool_size))
+        print("  %-28s: %s" % ("api_max_retries", self.api_max_retries))
+        print("  %-28s: %s" % ("api_retry_backoff", self.api_retry_backoff))
+        print("  %-28s: %s" % ("progress_bar_backend", self.progress_bar_backend))
+        print("  %-28s: %s" % ("mosaic_skymap_cache_path", self.mosaic_skymap_cache_path))
+        print("  %-28s: %s" % ("mosaic_skymap_cache_max_size", humanize.naturalsize(self.mosaic_skymap_cache_max_size)))
+        print("  %-28s: %s" % ("sources_cache_ttl", self.sources_cache_ttl))
+        print("  %-28s: %s" % ("sources_cache_path", self.sources_cache_path))
+        print("  %-28s: %s" % ("srs_obj", "PyUCalgarySRS(...)"))
 
     # -----------------------------
     # public methods
@@ -417,6 +629,19 @@ class PyAuroraX:
         except Exception as e:  # pragma: nocover-ok
             raise AuroraXPurgeError("Error while purging read tar temp path: %s" % (str(e))) from e
 
+    def purge_mosaic_skymap_cache(self):
+        """
+        Delete all prepared skymaps in the `mosaic_skymap_cache_path` directory. 
+
+        Raises:
+            pyaurorax.exceptions.AuroraXPurgeError: an error was encountered during the purge operation
+        """
+        try:
+            if (os.path.exists(self.mosaic_skymap_cache_path) is True):
+                shutil.rmtree(self.mosaic_skymap_cache_path)
+        except Exception as e:  # pragma: nocover-ok
+            raise AuroraXPurgeError("Error while purging mosaic skymap cache path: %s" % (str(e))) from e
+
     def show_data_usage(self, order: Literal["name", "size"] = "size", return_dict: bool = False) -> Any:
         """
         Print the volume of data existing in the download_output_root_path, broken down
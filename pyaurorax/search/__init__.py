@@ -17,11 +17,12 @@ for conjunctions or ephemeris data, and uploading/managing your own data in the
 """
 
 # pull in classes
-from .location import Location
+from .location import Location, FrozenLocation
 from .sources.classes.data_source import DataSource
 from .availability.classes.availability_result import AvailabilityResult
 from .ephemeris.classes.ephemeris import EphemerisData
 from .ephemeris.classes.search import EphemerisSearch
+from .ephemeris.classes.ephemeris_columnar import EphemerisColumnarData
 from .data_products.classes.data_product import DataProductData
 from .data_products.classes.search import DataProductSearch
 from .conjunctions.classes.conjunction import Conjunction
@@ -33,6 +34,8 @@ from .conjunctions.classes.criteria_block import (
     CustomLocationsCriteriaBlock,
 )
 from .metadata_filters import MetadataFilter, MetadataFilterExpression
+from .fan_out_result import FanOutSearchResult
+from .upload_report import UploadReport, UploadChunkResult
 
 # pull in constants
 from .sources.classes.data_source import (
@@ -57,6 +60,8 @@ from .data_products.classes.data_product import (
 from .conjunctions.classes.conjunction import CONJUNCTION_TYPE_NBTRACE, CONJUNCTION_TYPE_SBTRACE
 
 # imports for this file
+import datetime
+from typing import Literal
 from . import api as module_api
 from .util import UtilManager
 from .sources import SourcesManager
@@ -66,6 +71,8 @@ from .requests import RequestsManager
 from .ephemeris import EphemerisManager
 from .data_products import DataProductsManager
 from .conjunctions import ConjunctionsManager
+from .aio import AsyncSearchManager
+from ._fan_out import fan_out_search as func_fan_out_search
 
 __all__ = [
     "SearchManager",
@@ -88,9 +95,11 @@ __all__ = [
     "CONJUNCTION_TYPE_SBTRACE",
     "DataSource",
     "Location",
+    "FrozenLocation",
     "AvailabilityResult",
     "EphemerisData",
     "EphemerisSearch",
+    "EphemerisColumnarData",
     "DataProductData",
     "DataProductSearch",
     "Conjunction",
@@ -101,6 +110,9 @@ __all__ = [
     "CustomLocationsCriteriaBlock",
     "MetadataFilter",
     "MetadataFilterExpression",
+    "FanOutSearchResult",
+    "UploadReport",
+    "UploadChunkResult",
 ]
 
 
@@ -123,10 +135,12 @@ class SearchManager:
         self.__ephemeris = EphemerisManager(self.__aurorax_obj)
         self.__data_products = DataProductsManager(self.__aurorax_obj)
         self.__conjunctions = ConjunctionsManager(self.__aurorax_obj)
+        self.__aio = AsyncSearchManager(self.__aurorax_obj)
 
         # initialize class vars
         self.DataSource = DataSource
         self.Location = Location
+        self.FrozenLocation = FrozenLocation
         self.MetadataFilter = MetadataFilter
         self.MetadataFilterExpression = MetadataFilterExpression
         self.GroundCriteriaBlock = GroundCriteriaBlock
@@ -137,7 +151,11 @@ class SearchManager:
         self.EphemerisSearch = EphemerisSearch
         self.DataProductSearch = DataProductSearch
         self.EphemerisData = EphemerisData
+        self.EphemerisColumnarData = EphemerisColumnarData
         self.DataProductData = DataProductData
+        self.FanOutSearchResult = FanOutSearchResult
+        self.UploadReport = UploadReport
+        self.UploadChunkResult = UploadChunkResult
 
         # initialize static vars
         self.FORMAT_BASIC_INFO = FORMAT_BASIC_INFO
@@ -223,3 +241,105 @@ class SearchManager:
         Access to the `conjunctions` submodule from within a PyAuroraX object.
         """
         return self.__conjunctions
+
+    @property
+    def aio(self):
+        """
+        Access to the `aio` submodule from within a PyAuroraX object. This provides
+        asyncio versions of the ephemeris, data products, and conjunction search functions.
+        """
+        return self.__aio
+
+    # ------------------------------------------
+    # functions
+    # ------------------------------------------
+    def fan_out_search(self,
+                       search_type: Literal["ephemeris", "data_products", "conjunctions"],
+                       start: datetime.datetime,
+                       end: datetime.datetime,
+                       window: datetime.timedelta = datetime.timedelta(days=1),
+                       n_parallel: int = 4,
+                       max_retries: int = 2,
+                       retry_backoff: float = 1.0,
+                       allow_partial: bool = False,
+                       poll_interval: float = 1.0,
+                       progress_bar_disable: bool = False,
+                       **search_kwargs) -> FanOutSearchResult:
+        """
+        Perform an ephemeris, data product, or conjunction search over a long time range, by
+        splitting it into several shorter windows that are searched in parallel.
+
+        Each window is its own search request, and the records from all windows are merged
+        together in time order, with duplicates removed. This is often much faster than a
+        single large search, and each window's data is retrieved separately.
+
+        Note that a conjunction spanning the boundary between two windows is returned as a
+        separate conjunction for each window, with start and end timestamps clipped to the
+        window.
+
+        Args:
+            search_type (str): 
+                The type of search to perform. Valid options are `ephemeris`, `data_products`,
+                and `conjunctions`.
+
+            start (datetime.datetime): 
+                Start timestamp of the search (inclusive)
+
+            end (datetime.datetime): 
+                End timestamp of the search (inclusive)
+
+            window (datetime.timedelta): 
+                The length of each window, defaults to 1 day
+
+            n_parallel (int): 
+                Number of windows to search at once, defaults to 4
+
+            max_retries (int): 
+                Number of times to retry a window that failed, defaults to 2. Once a window's search 
+                has been submitted, retries keep waiting for the same search request and retrieving its
+                data. Invalid search parameters, authorization errors, maintenance mode, and searches that
+                the API reports an error for are not retried.
+
+            retry_backoff (float): 
+                Seconds to wait before the first retry of a window, doubling for each
+                subsequent retry. Defaults to 1 second.
+
+            allow_partial (bool): 
+                Return the results from the successful windows if any windows failed after
+                all retries, instead of raising an exception. The failed windows are listed
+                in the `failed_windows` attribute of the result. Defaults to False.
+
+            poll_interval (float): 
+                Time in seconds to wait between polling attempts, defaults to 1 second
+
+            progress_bar_disable (bool): 
+                Disable the progress bar showing the number of completed windows, defaults
+                to False
+
+            **search_kwargs: 
+                The remaining search parameters, passed to the `EphemerisSearch`, `DataProductSearch`,
+                or `ConjunctionSearch` object for each window (ie. `programs`, `instrument_types`,
+                `distance`, `ground`, `space`, `response_format`, etc.)
+
+        Returns:
+            A `pyaurorax.search.FanOutSearchResult` object
+
+        Raises:
+            ValueError: invalid parameters were supplied
+            pyaurorax.exceptions.AuroraXSearchError: one or more windows failed, and partial
+                results were not allowed
+        """
+        return func_fan_out_search(
+            self.__aurorax_obj,
+            search_type,
+            start,
+            end,
+            window,
+            n_parallel,
+            max_retries,
+            retry_backoff,
+            allow_partial,
+            poll_interval,
+            progress_bar_disable,
+            search_kwargs,
+        )
@@ -0,0 +1,265 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Functions for performing searches split into several time windows
+"""
+
+import re
+import json
+import time
+import datetime
+import requests
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .fan_out_result import FanOutSearchResult
+from .ephemeris.classes.search import EphemerisSearch
+from .ephemeris.classes.ephemeris_columnar import EphemerisColumnarData
+from .data_products.classes.search import DataProductSearch
+from .conjunctions.classes.search import ConjunctionSearch
+from ..exceptions import AuroraXError, AuroraXAPIError, AuroraXSearchError, AuroraXUnauthorizedError, AuroraXMaintenanceError
+
+# globals
+__SEARCH_CLASSES = {
+    "ephemeris": EphemerisSearch,
+    "data_products": DataProductSearch,
+    "conjunctions": ConjunctionSearch,
+}
+__TIME_FIELDS = {
+    "ephemeris": "epoch",
+    "data_products": "start",
+    "conjunctions": "start",
+}
+__CLIENT_ERROR_REGEX = re.compile(r"^API error code 4\d\d")
+
+
+def get_windows(start, end, window):
+    """
+    Split a time range into consecutive windows. Search times are inclusive and have
+    a resolution of one second, so each window ends one second before the next starts.
+    """
+    if (window < datetime.timedelta(seconds=1)):
+        raise ValueError("The window must be at least 1 second long")
+    if (end < start):
+        raise ValueError("The end timestamp must be after the start timestamp")
+    windows = []
+    window_start = start
+    while (window_start <= end):
+        window_end = min(window_start + window - datetime.timedelta(seconds=1), end)
+        windows.append((window_start, window_end))
+        window_start = window_start + window
+    return windows
+
+
+def __get_field(record, name):
+    # records are objects, or dictionaries if a response format was used
+    if (isinstance(record, dict) is True):
+        return record.get(name)
+    return getattr(record, name, None)
+
+
+def __get_record_key(search_type, record):
+    # get the fields that identify a record
+    if (search_type == "ephemeris"):
+        key = (__get_field(__get_field(record, "data_source"), "identifier"), __get_field(record, "epoch"))
+    elif (search_type == "data_products"):
+        key = (
+            __get_field(__get_field(record, "data_source"), "identifier"),
+            __get_field(record, "data_product_type"),
+            __get_field(record, "url"),
+            __get_field(record, "start"),
+            __get_field(record, "end"),
+        )
+    else:
+        data_sources = __get_field(record, "data_sources")
+        key = (
+            __get_field(record, "conjunction_type"),
+            __get_field(record, "start"),
+            __get_field(record, "end"),
+            None if data_sources is None else tuple(__get_field(ds, "identifier") for ds in data_sources),
+        )
+
+    # if the response format left out any of the fields, use the whole record instead
+    if (None in key):
+        if (isinstance(record, dict) is True):
+            return json.dumps(record, sort_keys=True, default=str)
+        return repr(record)
+    return key
+
+
+def __merge_columnar_data(items):
+    # join the columns, and sort by epoch and data source
+    data = EphemerisColumnarData.concatenate(items)
+    sort_idx = np.lexsort((data.data_source_idx, data.epoch))
+
+    # remove duplicates, which are next to each other once sorted
+    epochs = data.epoch[sort_idx]
+    data_source_idx = data.data_source_idx[sort_idx]
+    keep = np.ones(sort_idx.shape[0], dtype=bool)
+    keep[1:] = (epochs[1:] != epochs[:-1]) | (data_source_idx[1:] != data_source_idx[:-1])
+
+    # return
+    return data[sort_idx[keep]]
+
+
+def merge_data(search_type, searches):
+    """
+    Merge the records of several searches, removing duplicates and sorting them
+    in time order.
+    """
+    # columnar ephemeris results are merged as columns
+    if (search_type == "ephemeris" and len(searches) > 0 and all(isinstance(s.data, EphemerisColumnarData) for s in searches)):
+        return __merge_columnar_data([s.data for s in searches])
+
+    # merge and remove duplicates
+    data = []
+    seen_keys = set()
+    for s in searches:
+        for record in s.data:
+            key = __get_record_key(search_type, record)
+            if (key in seen_keys):
+                continue
+            seen_keys.add(key)
+            data.append(record)
+
+    # sort by time, if the response format included it
+    time_field = __TIME_FIELDS[search_type]
+    if (all(isinstance(__get_field(record, time_field), datetime.datetime) for record in data)):
+        data.sort(key=lambda record: __get_field(record, time_field))
+
+    # return
+    return data
+
+
+def __is_retryable(e):
+    # retrying won't help for authorization, maintenance mode, invalid search parameters, or
+    # a search that the API reported an error for
+    if (isinstance(e, (AuroraXUnauthorizedError, AuroraXMaintenanceError, AuroraXSearchError)) is True):
+        return False
+    if (isinstance(e, AuroraXAPIError) is True and __CLIENT_ERROR_REGEX.match(str(e)) is not None):
+        return False
+    return True
+
+
+def __search_window(aurorax_obj, search_class, window_start, window_end, search_kwargs, poll_interval, max_retries, retry_backoff):
+    attempt = 0
+    s = None
+    while (True):
+        try:
+            # create and execute the search
+            #
+            # NOTE: once the search has been submitted, retries keep waiting for the same
+            # request and retrieving its data, instead of submitting a new one
+            if (s is None):
+                new_search = search_class(aurorax_obj, window_start, window_end, **search_kwargs)
+                new_search.execute()
+                s = new_search
+            if (s.completed is False):
+                s.wait(poll_interval=poll_interval)
+
+            # check if error condition encountered
+            if (s.status["search_result"]["error_condition"] is True):  # pragma: nocover-ok
+                raise AuroraXSearchError(s.logs[-1]["summary"])
+
+            # get the data
+            s.get_data()
+            return s
+        except (AuroraXError, requests.exceptions.RequestException) as e:
+            if (__is_retryable(e) is False or attempt >= max_retries):
+                __cancel_search(s)
+                raise
+            time.sleep(retry_backoff * (2**attempt))
+            attempt += 1
+
+
+def __cancel_search(s):
+    # cancel a search that is still running on the server, since its results won't be used
+    if (s is None or s.completed is True):
+        return
+    try:
+        s.cancel()
+    except (AuroraXError, requests.exceptions.RequestException):  # pragma: nocover
+        # the original error is more useful
+        pass
+
+
+def fan_out_search(aurorax_obj, search_type, start, end, window, n_parallel, max_retries, retry_backoff, allow_partial, poll_interval,
+                   progress_bar_disable, search_kwargs):
+    # check parameters
+    if (search_type not in __SEARCH_CLASSES):
+        raise ValueError("Invalid search_type '%s'. Must be one of %s." % (search_type, ", ".join("'%s'" % (x) for x in __SEARCH_CLASSES)))
+    if (n_parallel < 1):
+        raise ValueError("The n_parallel value must be at least 1")
+    if (max_retries < 0):
+        raise ValueError("The max_retries value must be 0 or greater")
+    search_class = __SEARCH_CLASSES[search_type]
+    windows = get_windows(start, end, window)
+
+    # check the search parameters before submitting anything
+    search_class(aurorax_obj, windows[0][0], windows[0][1], **search_kwargs)
+
+    # search all windows
+    searches = [None] * len(windows)
+    errors = [None] * len(windows)
+    progress_bar = None
+    if (progress_bar_disable is False):
+        progress_bar = aurorax_obj._tqdm(total=len(windows), desc="Searching windows: ", unit="window")
+    try:
+        with ThreadPoolExecutor(max_workers=n_parallel) as executor:
+            futures = {}
+            for i, (window_start, window_end) in enumerate(windows):
+                future = executor.submit(
+                    __search_window,
+                    aurorax_obj,
+                    search_class,
+                    window_start,
+                    window_end,
+                    search_kwargs,
+                    poll_interval,
+                    max_retries,
+                    retry_backoff,
+                )
+                futures[future] = i
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    searches[i] = future.result()
+                except Exception as e:
+                    errors[i] = e
+                if (progress_bar is not None):
+                    progress_bar.update(1)
+    finally:
+        if (progress_bar is not None):
+            progress_bar.close()
+
+    # check for failed windows
+    failed_windows = [(windows[i][0], windows[i][1], errors[i]) for i in range(0, len(windows)) if errors[i] is not None]
+    if (len(failed_windows) > 0 and allow_partial is False):
+        raise AuroraXSearchError("%d of %d search windows failed, the first failure was for %s to %s: %s" % (
+            len(failed_windows),
+            len(windows),
+            failed_windows[0][0],
+            failed_windows[0][1],
+            failed_windows[0][2],
+        )) from failed_windows[0][2]
+
+    # merge results
+    searches = [s for s in searches if s is not None]
+    return FanOutSearchResult(
+        search_type=search_type,
+        start=start,
+        end=end,
+        data=merge_data(search_type, searches),
+        searches=searches,
+        failed_windows=failed_windows,
+    )
@@ -0,0 +1,155 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Functions for uploading records in chunks, several at a time
+"""
+
+import re
+import json
+import time
+import datetime
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .api import AuroraXAPIRequest
+from .upload_report import UploadChunkResult, UploadReport
+from ..exceptions import (
+    AuroraXAPIError,
+    AuroraXUploadError,
+    AuroraXUnauthorizedError,
+    AuroraXMaintenanceError,
+)
+
+# globals
+__CLIENT_ERROR_REGEX = re.compile(r"^API error code 4\d\d")
+
+
+def __json_converter(o):
+    # NOTE: same as the API request class, this is a last-ditch catch for any datetimes
+    # in dictionary records that weren't already converted to string format
+    if (isinstance(o, datetime.datetime) is True):  # pragma: nocover-ok
+        return str(o)
+
+
+def serialize_records(records):
+    """
+    Serialize records into a compact JSON request body. Record objects are converted
+    to dictionaries without being modified, and dictionaries are used as they are.
+    """
+    records_json = [r if isinstance(r, dict) else r.to_json_serializable() for r in records]
+    return json.dumps(records_json, separators=(",", ":"), default=__json_converter).encode("utf-8")
+
+
+def __is_retryable(e):
+    # retrying won't help for authorization, maintenance mode, or a problem with the records
+    if (isinstance(e, (AuroraXUnauthorizedError, AuroraXMaintenanceError, AuroraXUploadError)) is True):
+        return False
+    if (isinstance(e, AuroraXAPIError) is True and __CLIENT_ERROR_REGEX.match(str(e)) is not None):
+        return False
+    return True
+
+
+def __upload_chunk(aurorax_obj, url, records, chunk, max_retries, retry_backoff, stop_event):
+    # skip if the upload was stopped
+    if (stop_event is not None and stop_event.is_set() is True):
+        chunk.status = "skipped"
+        return chunk
+
+    # serialize only when the chunk is about to be sent, so that only the chunks in
+    # flight are held in memory
+    start_time = time.perf_counter()
+    body = serialize_records(records[chunk.start_index:chunk.end_index])
+    while (True):
+        chunk.attempts += 1
+        try:
+            # make request
+            req = AuroraXAPIRequest(aurorax_obj, method="post", url=url, body=body, null_response=True)
+            res = req.execute()
+            chunk.status_code = res.status_code
+
+            # evaluate response
+            if (res.status_code == 400):  # pragma: nocover-ok
+                if isinstance(res.data, list):
+                    raise AuroraXUploadError("%s - %s" % (res.status_code, res.data[0]["message"]))
+                raise AuroraXUploadError("%s - %s" % (res.data["error_code"], res.data["error_message"]))
+
+            # done
+            chunk.status = "success"
+            chunk.error = None
+            break
+        except (AuroraXAPIError, AuroraXUploadError, AuroraXMaintenanceError, AuroraXUnauthorizedError,
+                requests.exceptions.RequestException) as e:
+            chunk.error = e
+            if (__is_retryable(e) is False or chunk.attempts > max_retries):
+                chunk.status = "failed"
+                if (stop_event is not None):
+                    stop_event.set()
+                break
+            time.sleep(retry_backoff * (2**(chunk.attempts - 1)))
+
+    # return
+    chunk.duration = time.perf_counter() - start_time
+    return chunk
+
+
+def upload_records(aurorax_obj, url, identifier, records, chunk_size, n_parallel, max_retries, retry_backoff, stop_on_error,
+                   progress_bar_disable):
+    """
+    Upload records in chunks, with several requests in flight at a time, and report
+    on the outcome of each chunk.
+    """
+    # check parameters
+    if (chunk_size < 1):
+        raise ValueError("The chunk_size value must be at least 1")
+    if (n_parallel < 1):
+        raise ValueError("The n_parallel value must be at least 1")
+    if (max_retries < 0):
+        raise ValueError("The max_retries value must be 0 or greater")
+
+    # split records into chunks
+    chunks = []
+    for i, start_index in enumerate(range(0, len(records), chunk_size)):
+        chunks.append(UploadChunkResult(
+            index=i,
+            start_index=start_index,
+            end_index=min(start_index + chunk_size, len(records)),
+            status="skipped",
+        ))
+    stop_event = threading.Event() if stop_on_error is True else None
+
+    # upload chunks
+    progress_bar = None
+    if (progress_bar_disable is False):
+        progress_bar = aurorax_obj._tqdm(total=len(records), desc="Uploading records: ", unit="record")
+    try:
+        if (n_parallel == 1):
+            for chunk in chunks:
+                __upload_chunk(aurorax_obj, url, records, chunk, max_retries, retry_backoff, stop_event)
+                if (progress_bar is not None):
+                    progress_bar.update(chunk.record_count)
+        else:
+            with ThreadPoolExecutor(max_workers=n_parallel) as executor:
+                futures = []
+                for chunk in chunks:
+                    futures.append(executor.submit(__upload_chunk, aurorax_obj, url, records, chunk, max_retries, retry_backoff, stop_event))
+                for future in as_completed(futures):
+                    chunk = future.result()
+                    if (progress_bar is not None):
+                        progress_bar.update(chunk.record_count)
+    finally:
+        if (progress_bar is not None):
+            progress_bar.close()
+
+    # return
+    return UploadReport(identifier=identifier, record_count=len(records), chunks=chunks)
@@ -0,0 +1,403 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Perform ephemeris, data product, and conjunction searches using asyncio.
+
+The functions in this module are coroutines, and return the same search objects as their
+blocking counterparts. Many searches can be run at once using `asyncio.gather()`, with
+the number of API calls in flight at any time limited by the `max_concurrency` setting.
+
+Example:
+    ```python
+    import asyncio
+
+    async def main():
+        return await asyncio.gather(
+            aurorax.search.aio.conjunctions.search(start1, end1, distance, ground=ground, space=space),
+            aurorax.search.aio.conjunctions.search(start2, end2, distance, ground=ground, space=space),
+        )
+
+    results = asyncio.run(main())
+    ```
+"""
+
+import datetime
+import weakref
+from typing import Dict, List, Optional, Union, Sequence, Literal
+from ..metadata_filters import MetadataFilter
+from ..ephemeris.classes.search import EphemerisSearch
+from ..data_products.classes.search import DataProductSearch
+from ..conjunctions.classes.search import ConjunctionSearch
+from ..conjunctions.classes.criteria_block import (
+    GroundCriteriaBlock,
+    SpaceCriteriaBlock,
+    EventsCriteriaBlock,
+    CustomLocationsCriteriaBlock,
+)
+from ._aio import get_semaphore as func_get_semaphore
+from ._aio import search_ephemeris as func_search_ephemeris
+from ._aio import search_data_products as func_search_data_products
+from ._aio import search_conjunctions as func_search_conjunctions
+
+__all__ = ["AsyncSearchManager"]
+
+
+class AsyncSearchManager:
+    """
+    The AsyncSearchManager object is initialized within every PyAuroraX object. It acts as a way to access
+    the submodules and carry over configuration information in the super class.
+
+    Attributes:
+        max_concurrency (int): 
+            The maximum number of API calls that can be in flight at once, across all
+            searches running in an event loop. Defaults to the `api_pool_size` of the
+            PyAuroraX object, so that each call can reuse a pooled connection.
+    """
+
+    def __init__(self, aurorax_obj):
+        self.__aurorax_obj = aurorax_obj
+        self.__max_concurrency = None
+        self.__semaphores = weakref.WeakKeyDictionary()
+
+        # initialize sub-modules
+        self.__ephemeris = AsyncEphemerisManager(self.__aurorax_obj, self)
+        self.__data_products = AsyncDataProductsManager(self.__aurorax_obj, self)
+        self.__conjunctions = AsyncConjunctionsManager(self.__aurorax_obj, self)
+
+    @property
+    def max_concurrency(self) -> int:
+        if (self.__max_concurrency is None):
+            return self.__aurorax_obj.api_pool_size
+        return self.__max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value: Optional[int]):
+        if (value is not None and value < 1):
+            raise ValueError("The max_concurrency value must be at least 1")
+        self.__max_concurrency = value
+        self.__semaphores = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self):
+        return func_get_semaphore(self.__semaphores, self.max_concurrency)
+
+    # ------------------------------------------
+    # properties for submodule managers
+    # ------------------------------------------
+    @property
+    def ephemeris(self):
+        """
+        Access to the asyncio `ephemeris` search functions from within a PyAuroraX object.
+        """
+        return self.__ephemeris
+
+    @property
+    def data_products(self):
+        """
+        Access to the asyncio `data_products` search functions from within a PyAuroraX object.
+        """
+        return self.__data_products
+
+    @property
+    def conjunctions(self):
+        """
+        Access to the asyncio `conjunctions` search functions from within a PyAuroraX object.
+        """
+        return self.__conjunctions
+
+
+class AsyncEphemerisManager:
+    """
+    Asyncio ephemeris search functions. See `pyaurorax.search.ephemeris.EphemerisManager`
+    for the blocking versions.
+    """
+
+    __STANDARD_POLLING_SLEEP_TIME: float = 1.0  # polling sleep time when waiting for data, in seconds
+
+    def __init__(self, aurorax_obj, aio_manager):
+        self.__aurorax_obj = aurorax_obj
+        self.__aio_manager = aio_manager
+
+    async def search(self,
+                     start: datetime.datetime,
+                     end: datetime.datetime,
+                     programs: Optional[List[str]] = None,
+                     platforms: Optional[List[str]] = None,
+                     instrument_types: Optional[List[str]] = None,
+                     metadata_filters: Optional[Union[MetadataFilter, List[Dict]]] = None,
+                     metadata_filters_logical_operator: Optional[Literal["and", "or", "AND", "OR"]] = None,
+                     response_format: Optional[Dict] = None,
+                     poll_interval: float = __STANDARD_POLLING_SLEEP_TIME,
+                     return_immediately: bool = False,
+                     verbose: bool = False,
+                     result_container: Literal["list", "columnar"] = "list") -> EphemerisSearch:
+        """
+        Search for ephemeris records, without blocking the event loop
+
+        Takes the same parameters as `pyaurorax.search.ephemeris.EphemerisManager.search()`.
+
+        Args:
+            start (datetime.datetime): 
+                Start timestamp of the search (inclusive)
+
+            end (datetime.datetime): 
+                End timestamp of the search (inclusive)
+
+            programs (List[str]): 
+                List of programs to search through, defaults to None
+
+            platforms (List[str]): 
+                List of platforms to search through, defaults to None
+
+            instrument_types (List[str]): 
+                List of instrument types to search through, defaults to None
+
+            metadata_filters (MetadataFilter or List[Dict]): 
+                The metadata filters to use when searching, defaults to None
+
+            metadata_filters_logical_operator (str): 
+                The logical operator to use when evaluating metadata filters (either `and` or `or`),
+                defaults to `and`. This parameter is deprecated in exchange for passing a
+                MetadataFilter object into the metadata_filters parameter.
+
+            response_format (Dict): 
+                JSON representation of desired data response format
+
+            poll_interval (float): 
+                Time in seconds to wait between polling attempts, defaults to 1 second
+
+            return_immediately (bool): 
+                Initiate the search and return without waiting for data to be received, defaults to False
+
+            verbose (bool): 
+                Output poll times and other progress messages, defaults to False
+
+            result_container (str): 
+                How the ephemeris records are stored, either `list` or `columnar`. Defaults
+                to `list`.
+
+        Returns:
+            A `pyaurorax.search.EphemerisSearch` object
+
+        Raises:
+            pyaurorax.exceptions.AuroraXAPIError: An API error was encountered
+            pyaurorax.exceptions.AuroraXSearchError: The API experienced a search error
+        """
+        return await func_search_ephemeris(
+            self.__aurorax_obj,
+            self.__aio_manager._get_semaphore(),
+            start,
+            end,
+            programs,
+            platforms,
+            instrument_types,
+            metadata_filters,
+            metadata_filters_logical_operator,
+            response_format,
+            result_container,
+            poll_interval,
+            return_immediately,
+            verbose,
+        )
+
+
+class AsyncDataProductsManager:
+    """
+    Asyncio data product search functions. See `pyaurorax.search.data_products.DataProductsManager`
+    for the blocking versions.
+    """
+
+    __STANDARD_POLLING_SLEEP_TIME: float = 1.0  # polling sleep time when waiting for data, in seconds
+
+    def __init__(self, aurorax_obj, aio_manager):
+        self.__aurorax_obj = aurorax_obj
+        self.__aio_manager = aio_manager
+
+    async def search(self,
+                     start: datetime.datetime,
+                     end: datetime.datetime,
+                     programs: Optional[List[str]] = None,
+                     platforms: Optional[List[str]] = None,
+                     instrument_types: Optional[List[str]] = None,
+                     data_product_types: Optional[List[Literal["keogram", "montage", "movie", "summary_plot", "data_availability"]]] = None,
+                     metadata_filters: Optional[Union[MetadataFilter, List[Dict]]] = None,
+                     metadata_filters_logical_operator: Optional[Literal["and", "or", "AND", "OR"]] = None,
+                     response_format: Optional[Dict] = None,
+                     poll_interval: float = __STANDARD_POLLING_SLEEP_TIME,
+                     return_immediately: bool = False,
+                     verbose: bool = False) -> DataProductSearch:
+        """
+        Search for data product records, without blocking the event loop
+
+        Takes the same parameters as `pyaurorax.search.data_products.DataProductsManager.search()`.
+
+        Args:
+            start (datetime.datetime): 
+                Start timestamp of the search (inclusive)
+
+            end (datetime.datetime): 
+                End timestamp of the search (inclusive)
+
+            programs (List[str]): 
+                List of programs to search through, defaults to None
+
+            platforms (List[str]): 
+                List of platforms to search through, defaults to None
+
+            instrument_types (List[str]): 
+                List of instrument types to search through, defaults to None
+
+            data_product_types (List[str]): 
+                List of strings describing data product types to filter on e.g. "keogram", defaults
+                to None. Valid options are: `keogram`, `montage`, `movie`, `summary_plot`, and
+                `data_availability`.
+
+            metadata_filters (MetadataFilter or List[Dict]): 
+                The metadata filters to use when searching, defaults to None
+
+            metadata_filters_logical_operator (str): 
+                The logical operator to use when evaluating metadata filters (either `and` or `or`),
+                defaults to `and`. This parameter is deprecated in exchange for passing a
+                MetadataFilter object into the metadata_filters parameter.
+
+            response_format (Dict): 
+                JSON representation of desired data response format
+
+            poll_interval (float): 
+                Time in seconds to wait between polling attempts, defaults to 1 second
+
+            return_immediately (bool): 
+                Initiate the search and return without waiting for data to be received, defaults to False
+
+            verbose (bool): 
+                Output poll times and other progress messages, defaults to False
+
+        Returns:
+            A `pyaurorax.search.DataProductSearch` object
+
+        Raises:
+            pyaurorax.exceptions.AuroraXAPIError: An API error was encountered
+            pyaurorax.exceptions.AuroraXSearchError: The API experienced a search error
+        """
+        return await func_search_data_products(
+            self.__aurorax_obj,
+            self.__aio_manager._get_semaphore(),
+            start,
+            end,
+            programs,
+            platforms,
+            instrument_types,
+            data_product_types,
+            metadata_filters,
+            metadata_filters_logical_operator,
+            response_format,
+            poll_interval,
+            return_immediately,
+            verbose,
+        )
+
+
+class AsyncConjunctionsManager:
+    """
+    Asyncio conjunction search functions. See `pyaurorax.search.conjunctions.ConjunctionsManager`
+    for the blocking versions.
+    """
+
+    __STANDARD_POLLING_SLEEP_TIME: float = 1.0  # polling sleep time when waiting for data, in seconds
+
+    def __init__(self, aurorax_obj, aio_manager):
+        self.__aurorax_obj = aurorax_obj
+        self.__aio_manager = aio_manager
+
+    async def search(self,
+                     start: datetime.datetime,
+                     end: datetime.datetime,
+                     distance: Union[int, float, Dict],
+                     ground: Sequence[Union[GroundCriteriaBlock, Dict]] = [],
+                     space: Sequence[Union[SpaceCriteriaBlock, Dict]] = [],
+                     events: Sequence[Union[EventsCriteriaBlock, Dict]] = [],
+                     custom_locations: Sequence[Union[CustomLocationsCriteriaBlock, Dict]] = [],
+                     conjunction_types: Sequence[Union[str, Literal["nbtrace", "sbtrace", "geographic"]]] = [],
+                     response_format: Optional[Dict] = None,
+                     poll_interval: float = __STANDARD_POLLING_SLEEP_TIME,
+                     return_immediately: bool = False,
+                     verbose: bool = False) -> ConjunctionSearch:
+        """
+        Search for conjunctions, without blocking the event loop
+
+        Takes the same parameters as `pyaurorax.search.conjunctions.ConjunctionsManager.search()`.
+
+        Args:
+            start (datetime.datetime): 
+                Start timestamp of the search (inclusive).
+
+            end (datetime.datetime): 
+                End timestamp of the search (inclusive).
+
+            distance (int or float or Dict): 
+                The maximum distance allowed between data sources when searching for
+                conjunctions. This can either be a number (int or float), or a dictionary
+                modified from the output of the "get_advanced_distances_combos()" function.
+
+            ground (List[GroundCriteriaBlock or Dict]): 
+                List of ground instrument criteria blocks, defaults to [].
+
+            space (List[SpaceCriteriaBlock or Dict]): 
+                List of space instrument criteria blocks, defaults to [].
+
+            events (List[EventsCriteriaBlock or Dict]): 
+                List of event criteria blocks, defaults to [].
+
+            custom_locations (List[CustomLocationsCriteriaBlock or Dict]): 
+                List of custom location criteria blocks, defaults to [].
+
+            conjunction_types (List[str]): 
+                List of conjunction types, defaults to [] (meaning all conjunction types). Valid
+                options are 'nbtrace', 'sbtrace', and 'geographic'.
+
+            response_format (Dict): 
+                JSON representation of desired data response format.
+
+            poll_interval (float): 
+                Seconds to wait between polling calls, defaults to 1 second.
+
+            return_immediately (bool): 
+                Initiate the search and return without waiting for data to be received, defaults
+                to `False`.
+
+            verbose (bool): 
+                Show the progress of the request using the request log, defaults to `False`.
+
+        Returns:
+            A `pyaurorax.search.ConjunctionSearch` object
+
+        Raises:
+            pyaurorax.exceptions.AuroraXAPIError: An API error was encountered
+            pyaurorax.exceptions.AuroraXSearchError: The API experienced a search error
+        """
+        return await func_search_conjunctions(
+            self.__aurorax_obj,
+            self.__aio_manager._get_semaphore(),
+            start,
+            end,
+            distance,
+            ground,
+            space,
+            events,
+            custom_locations,
+            conjunction_types,
+            response_format,
+            poll_interval,
+            return_immediately,
+            verbose,
+        )
@@ -0,0 +1,146 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Functions for performing searches using asyncio
+"""
+
+import asyncio
+import datetime
+import humanize
+from ..ephemeris.classes.search import EphemerisSearch
+from ..data_products.classes.search import DataProductSearch
+from ..conjunctions.classes.search import ConjunctionSearch
+from ...exceptions import AuroraXSearchError
+
+
+def get_semaphore(semaphores, max_concurrency):
+    # semaphores are bound to the event loop they are first used in, so we keep
+    # one for each running loop
+    loop = asyncio.get_running_loop()
+    if (loop not in semaphores):
+        semaphores[loop] = asyncio.Semaphore(max_concurrency)
+    return semaphores[loop]
+
+
+async def __call(semaphore, func, *args):
+    # run a blocking API call in a worker thread, limiting the number of calls in flight. The
+    # calls share the PyAuroraX object's pooled HTTP session.
+    async with semaphore:
+        return await asyncio.to_thread(func, *args)
+
+
+async def run_search(s, semaphore, poll_interval, return_immediately, verbose):
+    """
+    Execute a search, wait for it to complete, and retrieve the data, without
+    blocking the event loop. The semaphore is only held while an API call is in
+    flight, so waiting searches don't use up the available slots.
+    """
+    if (verbose is True):
+        print("[%s] Search object created" % (datetime.datetime.now()))
+
+    # execute the search
+    await __call(semaphore, s.execute)
+    if (verbose is True):
+        print("[%s] Request submitted" % (datetime.datetime.now()))
+        print("[%s] Request ID: %s" % (datetime.datetime.now(), s.request_id))
+        print("[%s] Request details available at: %s" % (datetime.datetime.now(), s.request_url))
+
+    # return immediately if we wanted to
+    if (return_immediately is True):
+        return s
+
+    # wait for data
+    if (verbose is True):
+        print("[%s] Waiting for data ..." % (datetime.datetime.now()))
+    await __call(semaphore, s.update_status)
+    while (s.completed is False):
+        await asyncio.sleep(poll_interval)
+        if (verbose is True):
+            print("[%s] Checking for data ..." % (datetime.datetime.now()))
+        await __call(semaphore, s.update_status)
+    if (verbose is True):
+        print("[%s] Data is now available" % (datetime.datetime.now()))
+
+    # check if error condition encountered
+    if (s.status["search_result"]["error_condition"] is True):  # pragma: nocover-ok
+        # error encountered
+        raise AuroraXSearchError(s.logs[-1]["summary"])
+
+    # get the data
+    if (verbose is True):
+        print("[%s] Retrieving data ..." % (datetime.datetime.now()))
+    await __call(semaphore, s.get_data)
+
+    # return response with the data
+    if (verbose is True):
+        print("[%s] Retrieved %s of data containing %d records" % (
+            datetime.datetime.now(),
+            humanize.filesize.naturalsize(s.status["search_result"]["file_size"]),  # type: ignore
+            s.status["search_result"]["result_count"],
+        ))
+    return s
+
+
+async def search_ephemeris(aurorax_obj, semaphore, start, end, programs, platforms, instrument_types, metadata_filters,
+                           metadata_filters_logical_operator, response_format, result_container, poll_interval, return_immediately, verbose):
+    # create a search object
+    s = EphemerisSearch(aurorax_obj,
+                        start,
+                        end,
+                        programs=programs,
+                        platforms=platforms,
+                        instrument_types=instrument_types,
+                        metadata_filters=metadata_filters,
+                        metadata_filters_logical_operator=metadata_filters_logical_operator,
+                        response_format=response_format,
+                        result_container=result_container)
+
+    # run search
+    return await run_search(s, semaphore, poll_interval, return_immediately, verbose)
+
+
+async def search_data_products(aurorax_obj, semaphore, start, end, programs, platforms, instrument_types, data_product_types, metadata_filters,
+                               metadata_filters_logical_operator, response_format, poll_interval, return_immediately, verbose):
+    # create a search object
+    s = DataProductSearch(aurorax_obj,
+                          start,
+                          end,
+                          programs=programs,
+                          platforms=platforms,
+                          instrument_types=instrument_types,
+                          data_product_types=data_product_types,
+                          metadata_filters=metadata_filters,
+                          metadata_filters_logical_operator=metadata_filters_logical_operator,
+                          response_format=response_format)
+
+    # run search
+    return await run_search(s, semaphore, poll_interval, return_immediately, verbose)
+
+
+async def search_conjunctions(aurorax_obj, semaphore, start, end, distance, ground, space, events, custom_locations, conjunction_types,
+                              response_format, poll_interval, return_immediately, verbose):
+    # create a search object
+    s = ConjunctionSearch(aurorax_obj,
+                          start,
+                          end,
+                          distance,
+                          ground=ground,
+                          space=space,
+                          events=events,
+                          custom_locations=custom_locations,
+                          conjunction_types=conjunction_types,
+                          response_format=response_format)
+
+    # run search
+    return await run_search(s, semaphore, poll_interval, return_immediately, verbose)
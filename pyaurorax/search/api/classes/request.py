@@ -38,7 +38,8 @@ class AuroraXAPIRequest:
             URL parameters to send in the request, defaults to `{}`
 
         body (Dict): 
-            The body of the request (ie. post data), defaults to `{}`
+            The body of the request (ie. post data), defaults to `{}`. Bytes are sent as they
+            are, for a body that has already been serialized to JSON.
 
         headers (Dict): 
             Any headers to send as part of the request (in addition to the default ones), defaults to `{}`
@@ -46,6 +47,11 @@ class AuroraXAPIRequest:
         null_response (bool): 
             Signifies if we expect a response from the API that has no body/data in it (ie. 
             requests to upload data that respond with just a 202 status code), defaults to `False`
+
+        stream (bool): 
+            Don't read the body of a successful response, so that it can be read incrementally
+            from the `request` attribute of the response (a `requests.Response` object). The caller
+            is responsible for closing it. Defaults to `False`.
     """
 
     __API_KEY_HEADER_NAME = "x-aurorax-api-key"
@@ -55,9 +61,10 @@ class AuroraXAPIRequest:
                  url: str,
                  method: Literal["get", "post", "put", "delete", "patch"],
                  params: Dict = {},
-                 body: Union[List, Dict] = {},
+                 body: Union[List, Dict, bytes] = {},
                  headers: Dict = {},
-                 null_response: bool = False):
+                 null_response: bool = False,
+                 stream: bool = False):
         self.__aurorax_obj = aurorax_obj
         self.url = url
         self.method = method
@@ -65,6 +72,7 @@ class AuroraXAPIRequest:
         self.body = body
         self.headers = headers
         self.null_response = null_response
+        self.stream = stream
 
     def __json_converter(self, o):
         # NOTE: this method is a last-ditch catch for any datetimes that snuck
@@ -75,7 +83,10 @@ class AuroraXAPIRequest:
 
     def __merge_headers(self):
         # set initial headers
-        all_headers = self.__aurorax_obj.api_headers
+        #
+        # NOTE: we copy them so that the shared headers aren't changed, since requests
+        # may be made from several threads at once
+        all_headers = self.__aurorax_obj.api_headers.copy()
 
         # add headers passed into the class
         #
@@ -104,19 +115,42 @@ class AuroraXAPIRequest:
             pyaurorax.exceptions.AuroraXMaintenanceError: AuroraX API is currently undergoing maintenance
         """
         # sanitize data
-        body_santized = json.dumps(self.body, default=self.__json_converter)
+        if (isinstance(self.body, bytes) is True):
+            # already serialized
+            body_santized = self.body
+        else:
+            body_santized = json.dumps(self.body, default=self.__json_converter)
 
         # make request
         try:
-            req = requests.request(self.method,
-                                   self.url,
-                                   headers=self.__merge_headers(),
-                                   params=self.params,
-                                   data=body_santized,
-                                   timeout=self.__aurorax_obj.api_timeout)
+            req = self.__aurorax_obj.api_session.request(self.method,
+                                                         self.url,
+                                                         headers=self.__merge_headers(),
+                                                         params=self.params,
+                                                         data=body_santized,
+                                                         timeout=self.__aurorax_obj.api_timeout,
+                                                         stream=self.stream)
         except requests.exceptions.Timeout:  # pragma: nocover-ok
             raise AuroraXAPIError("API request timeout reached") from None
 
+        # check the response
+        #
+        # NOTE: a streamed response must be closed if it isn't returned to the caller, so
+        # that its connection is released back to the pool right away
+        try:
+            response_data = self.__get_response_data(req)
+        except Exception:
+            if (self.stream is True):
+                req.close()
+            raise
+
+        # create response object
+        res = AuroraXAPIResponse(request=req, data=response_data, status_code=req.status_code)
+
+        # return
+        return res
+
+    def __get_response_data(self, req):
         # check if authorization worked (raised by API or Nginx)
         if (req.status_code == 401):  # pragma: nocover-ok
             if (req.headers["Content-Type"] == "application/json"):
@@ -168,7 +202,12 @@ class AuroraXAPIRequest:
                 raise AuroraXAPIError("API error code %d: %s" % (req.status_code, response_json["error_message"]))
 
         # check content type
-        if (self.null_response is False):  # pragma: nocover-ok
+        if (self.stream is True):
+            # body is read by the caller
+            if (req.headers["Content-Type"] != "application/json"):  # pragma: nocover-ok
+                raise AuroraXAPIError("API error code %d: %s" % (req.status_code, req.content.decode()))
+            response_data = None
+        elif (self.null_response is False):  # pragma: nocover-ok
             if (req.headers["Content-Type"] == "application/json"):
                 if (len(req.content) == 0):
                     raise AuroraXAPIError("API error code %d: no response received" % (req.status_code))
@@ -182,11 +221,8 @@ class AuroraXAPIRequest:
             else:
                 response_data = req.json()
 
-        # create response object
-        res = AuroraXAPIResponse(request=req, data=response_data, status_code=req.status_code)
-
         # return
-        return res
+        return response_data
 
     def __str__(self) -> str:
         return self.__repr__()  # pragma: nocover-ok
@@ -21,9 +21,12 @@ here instead of digging in deeper to the submodules.
 """
 
 import datetime
-from typing import Dict, Optional, Union, Sequence, Literal
+from typing import Dict, List, Optional, Union, Sequence, Literal
 from .swarmaurora import SwarmAuroraManager
 from .classes.search import ConjunctionSearch
+from .classes.conjunction import Conjunction
+from ..ephemeris.classes.ephemeris import EphemerisData
+from ..ephemeris.classes.ephemeris_columnar import EphemerisColumnarData
 from .classes.criteria_block import (
     GroundCriteriaBlock,
     SpaceCriteriaBlock,
@@ -35,6 +38,7 @@ from ._conjunctions import search_from_raw_query as func_search_from_raw_query
 from ._conjunctions import describe as func_describe
 from ._conjunctions import get_request_url as func_get_request_url
 from ._conjunctions import create_advanced_distance_combos as func_create_advanced_distance_combos
+from ._local import search_local as func_search_local
 
 __all__ = ["ConjunctionsManager"]
 
@@ -145,6 +149,76 @@ class ConjunctionsManager:
             verbose,
         )
 
+    def search_local(self,
+                     ephemeris: Union[EphemerisColumnarData, Sequence[EphemerisData]],
+                     distance: Union[int, float, Dict],
+                     ground: Sequence[Union[GroundCriteriaBlock, Dict]] = [],
+                     space: Sequence[Union[SpaceCriteriaBlock, Dict]] = [],
+                     events: Sequence[Union[EventsCriteriaBlock, Dict]] = [],
+                     custom_locations: Sequence[Union[CustomLocationsCriteriaBlock, Dict]] = [],
+                     conjunction_types: Sequence[Union[str, Literal["nbtrace", "sbtrace", "geographic"]]] = ["nbtrace"],
+                     start: Optional[datetime.datetime] = None,
+                     end: Optional[datetime.datetime] = None) -> List[Conjunction]:
+        """
+        Find conjunctions locally, using ephemeris records that have already been retrieved
+        (ie. from an ephemeris search).
+
+        This works the same way as a conjunction search, but nothing is sent to the AuroraX
+        API. It is useful for quickly trying out different distances or criteria blocks on
+        the same ephemeris data, without waiting for a new search each time.
+
+        The footprints of the data sources matching each criteria block are indexed in a KD-tree
+        of unit vectors, with one bucket per minute, and every group of data sources (one from
+        each criteria block) that are within the distance of each other is found. Consecutive
+        minutes with the same group of data sources are joined into a single conjunction.
+
+        Some differences from the search engine:
+
+        - Only the data sources and records in the `ephemeris` parameter are used.
+        - Space criteria block `hemisphere` values are evaluated using the geographic latitude
+          of each record.
+        - Custom locations are given placeholder data sources with the program 'adhoc'.
+
+        Args:
+            ephemeris (EphemerisColumnarData or List[EphemerisData]): 
+                The ephemeris records to find conjunctions in.
+
+            distance (int or float or Dict): 
+                The maximum distance in kilometers allowed between data sources. This can
+                either be a number (int or float), or a dictionary modified from the output of
+                the "create_advanced_distance_combos()" function. Pairs of criteria blocks that
+                aren't in the dictionary, or have a value of None, have no distance limit.
+
+            ground (List[GroundCriteriaBlock or Dict]): 
+                List of ground instrument criteria blocks, defaults to [].
+
+            space (List[SpaceCriteriaBlock or Dict]): 
+                List of space instrument criteria blocks, defaults to [].
+
+            events (List[EventsCriteriaBlock or Dict]): 
+                List of event criteria blocks, defaults to [].
+
+            custom_locations (List[CustomLocationsCriteriaBlock or Dict]): 
+                List of custom location criteria blocks, defaults to [].
+
+            conjunction_types (List[str]): 
+                List of conjunction types, defaults to ['nbtrace']. Valid options are 'nbtrace',
+                'sbtrace', and 'geographic'.
+
+            start (datetime.datetime): 
+                Only use records at or after this timestamp, optional.
+
+            end (datetime.datetime): 
+                Only use records at or before this timestamp, optional.
+
+        Returns:
+            A list of `pyaurorax.search.Conjunction` objects, sorted by start time
+
+        Raises:
+            ValueError: invalid parameters were supplied
+        """
+        return func_search_local(ephemeris, distance, ground, space, events, custom_locations, conjunction_types, start, end)
+
     def search_from_raw_query(self,
                               query: Union[Dict, str],
                               poll_interval: float = __STANDARD_POLLING_SLEEP_TIME,
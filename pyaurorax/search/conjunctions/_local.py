@@ -0,0 +1,470 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Functions for finding conjunctions locally, using ephemeris records that have
+already been retrieved
+"""
+
+import datetime
+import numpy as np
+from scipy.spatial import cKDTree
+from .classes.conjunction import Conjunction
+from .classes.criteria_block import (
+    GroundCriteriaBlock,
+    SpaceCriteriaBlock,
+    EventsCriteriaBlock,
+    CustomLocationsCriteriaBlock,
+)
+from ..ephemeris.classes.ephemeris_columnar import EphemerisColumnarData
+from ..metadata_filters import MetadataFilter
+from ..sources.classes.data_source import (
+    DataSource,
+    FORMAT_BASIC_INFO,
+    SOURCE_TYPE_GROUND,
+    SOURCE_TYPE_EVENT_LIST,
+    SOURCE_TYPE_NOT_APPLICABLE,
+)
+
+# globals
+__EARTH_RADIUS_KM = 6371.0
+__EPOCH_PRECISION = 60  # seconds, same as the search engine
+__EPOCH_SPACING = 10.0  # spacing between epochs in the search trees, larger than the longest chord between two unit vectors (2)
+__LOCATION_FIELDS = {"nbtrace": "nbtrace", "sbtrace": "sbtrace", "geographic": "location_geo"}
+__CRITERIA_BLOCK_CLASSES = {
+    "ground": GroundCriteriaBlock,
+    "space": SpaceCriteriaBlock,
+    "events": EventsCriteriaBlock,
+    "adhoc": CustomLocationsCriteriaBlock,
+}
+
+
+def __get_block_spec(block):
+    # convert a criteria block object or dictionary to a dictionary of the values used for matching
+    if (isinstance(block, dict) is True):
+        metadata_filters = block.get("ephemeris_metadata_filters", block.get("metadata_filters"))
+        spec = {
+            "programs": block.get("programs", []),
+            "platforms": block.get("platforms", []),
+            "instrument_types": block.get("instrument_types", []),
+            "hemisphere": block.get("hemisphere", []),
+            "locations": [(loc["lat"], loc["lon"]) if isinstance(loc, dict) else tuple(loc) for loc in block.get("locations", [])],
+        }
+    else:
+        metadata_filters = getattr(block, "metadata_filters", None)
+        spec = {
+            "programs": getattr(block, "programs", []),
+            "platforms": getattr(block, "platforms", []),
+            "instrument_types": getattr(block, "instrument_types", []),
+            "hemisphere": getattr(block, "hemisphere", []),
+            "locations": [tuple(loc) for loc in getattr(block, "locations", [])],
+        }
+    if (isinstance(metadata_filters, MetadataFilter) is True):
+        metadata_filters = metadata_filters.to_query_dict()
+    spec["metadata_filters"] = metadata_filters
+    return spec
+
+
+def __get_blocks(ground, space, events, custom_locations):
+    # check the criteria blocks and name them the same way as the search engine (ie. ground1, space1)
+    blocks = []
+    for category, items in [("ground", ground), ("space", space), ("events", events), ("adhoc", custom_locations)]:
+        for i, item in enumerate(items):
+            if (isinstance(item, dict) is False and isinstance(item, __CRITERIA_BLOCK_CLASSES[category]) is False):
+                raise ValueError("A %s object was found in the '%s' parameter. Only %s objects or dictionaries are allowed." % (
+                    item.__class__.__name__,
+                    "custom_locations" if category == "adhoc" else category,
+                    __CRITERIA_BLOCK_CLASSES[category].__name__,
+                ))
+            spec = __get_block_spec(item)
+            if (category == "events"):
+                spec["programs"] = ["events"]
+            blocks.append({"name": "%s%d" % (category, i + 1), "category": category, "spec": spec})
+    if (len(blocks) < 2):
+        raise ValueError("At least two criteria blocks are needed to find conjunctions")
+    return blocks
+
+
+def __get_distances(distance, blocks):
+    # get the maximum distance for each pair of criteria blocks. Pairs that aren't in a
+    # distance dictionary, or are None, have no distance limit.
+    names = [b["name"] for b in blocks]
+    distances = {}
+    if (isinstance(distance, dict) is False):
+        for a in range(0, len(blocks)):
+            for b in range(a + 1, len(blocks)):
+                distances[(a, b)] = float(distance)
+        return distances
+    for key, value in distance.items():
+        key_split = [k.strip() for k in key.split("-")]
+        if (len(key_split) != 2 or key_split[0] not in names or key_split[1] not in names or key_split[0] == key_split[1]):
+            raise ValueError("Invalid distance key '%s'. Keys must be two criteria block names, such as 'ground1-space1'." % (key))
+        a, b = sorted([names.index(key_split[0]), names.index(key_split[1])])
+        distances[(a, b)] = None if value is None else float(value)
+    return distances
+
+
+def __to_filter_str(value):
+    if (isinstance(value, bool) is True):
+        return "true" if value is True else "false"
+    return str(value)
+
+
+def __to_filter_float(key, operator, value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError("Metadata filter value '%s' for key '%s' must be numeric to use the '%s' operator" % (value, key, operator)) from None
+
+
+def __evaluate_expression(key, column, operator, values, n_records):
+    # records without the metadata key never match
+    if (column is None):
+        return np.zeros(n_records, dtype=bool)
+    if (isinstance(values, list) is False):
+        values = [values]
+
+    # get the values to compare against. Numeric columns are compared as numbers, and
+    # all other columns are compared as strings (or as numbers for the range operators).
+    is_range = operator in [">", "<", ">=", "<=", "between"]
+    if (column.dtype != object):
+        present = np.ones(n_records, dtype=bool)
+        column_values = column.astype(np.float64)
+        if (is_range is True):
+            filter_values = np.array([__to_filter_float(key, operator, v) for v in values], dtype=np.float64)
+        else:
+            # NOTE: values that aren't numbers can never equal a number, so they are
+            # left out of the equality and membership comparisons
+            filter_values = []
+            for v in values:
+                try:
+                    filter_values.append(float(v))
+                except (TypeError, ValueError):
+                    pass
+            filter_values = np.array(filter_values, dtype=np.float64)
+    else:
+        present = np.array([v is not None for v in column], dtype=bool)
+        if (is_range is True):
+            column_values = np.full(n_records, np.nan)
+            for i, v in enumerate(column):
+                try:
+                    column_values[i] = float(v)
+                except (TypeError, ValueError):
+                    present[i] = False
+            filter_values = np.array([__to_filter_float(key, operator, v) for v in values], dtype=np.float64)
+        else:
+            column_values = np.array([__to_filter_str(v) for v in column], dtype=object)
+            filter_values = np.array([__to_filter_str(v) for v in values], dtype=object)
+
+    # evaluate
+    if (operator in ["=", "in"]):
+        mask = np.isin(column_values, filter_values)
+    elif (operator in ["!=", "not in"]):
+        mask = ~np.isin(column_values, filter_values)
+    elif (operator == ">"):
+        mask = column_values > filter_values[0]
+    elif (operator == "<"):
+        mask = column_values < filter_values[0]
+    elif (operator == ">="):
+        mask = column_values >= filter_values[0]
+    elif (operator == "<="):
+        mask = column_values <= filter_values[0]
+    elif (operator == "between"):
+        mask = (column_values >= filter_values[0]) & (column_values <= filter_values[1])
+    else:
+        raise ValueError("Operator '%s' not allowed in metadata filters" % (operator))
+    return mask & present
+
+
+def __evaluate_metadata_filters(metadata_filters, ephemeris):
+    # get the records matching a metadata filter, in its query dictionary format
+    n_records = len(ephemeris)
+    expressions = metadata_filters.get("expressions", [])
+    if (len(expressions) == 0):
+        return np.ones(n_records, dtype=bool)
+    logical_operator = str(metadata_filters.get("logical_operator", metadata_filters.get("logicalOperator", "AND"))).lower()
+    masks = [__evaluate_expression(e["key"], ephemeris.metadata.get(e["key"]), e["operator"], e["values"], n_records) for e in expressions]
+    if (logical_operator == "or"):
+        return np.logical_or.reduce(masks)
+    return np.logical_and.reduce(masks)
+
+
+def __match_data_source(ds, category, spec):
+    if (len(spec["programs"]) > 0 and ds.program not in spec["programs"]):
+        return False
+    if (len(spec["platforms"]) > 0 and ds.platform not in spec["platforms"]):
+        return False
+    if (len(spec["instrument_types"]) > 0 and ds.instrument_type not in spec["instrument_types"]):
+        return False
+    if (ds.source_type is not None):
+        if (category == "ground" and ds.source_type != SOURCE_TYPE_GROUND):
+            return False
+        if (category == "space" and ds.source_type in [SOURCE_TYPE_GROUND, SOURCE_TYPE_EVENT_LIST, SOURCE_TYPE_NOT_APPLICABLE]):
+            return False
+    return True
+
+
+def __get_record_mask(block, ephemeris, start, end):
+    # get the records that match a ground, space, or events criteria block
+    spec = block["spec"]
+    source_mask = np.array([__match_data_source(ds, block["category"], spec) for ds in ephemeris.data_sources] + [False], dtype=bool)
+    mask = source_mask[ephemeris.data_source_idx]  # records without a data source use the last (False) value
+    if (start is not None):
+        mask &= ephemeris.epoch >= np.datetime64(start, "s")
+    if (end is not None):
+        mask &= ephemeris.epoch <= np.datetime64(end, "s")
+    if (len(spec["hemisphere"]) > 0):
+        lat = ephemeris.location_geo[:, 0]
+        hemisphere_mask = np.zeros(len(ephemeris), dtype=bool)
+        if ("northern" in spec["hemisphere"]):
+            hemisphere_mask |= lat >= 0
+        if ("southern" in spec["hemisphere"]):
+            hemisphere_mask |= lat < 0
+        mask &= hemisphere_mask
+    if (spec["metadata_filters"] is not None):
+        mask &= __evaluate_metadata_filters(spec["metadata_filters"], ephemeris)
+    return mask
+
+
+def __to_unit_vectors(lat, lon):
+    lat_rad = np.radians(lat)
+    lon_rad = np.radians(lon)
+    return np.stack([np.cos(lat_rad) * np.cos(lon_rad), np.cos(lat_rad) * np.sin(lon_rad), np.sin(lat_rad)], axis=-1)
+
+
+def __get_block_points(blocks, ephemeris, conjunction_type, start, end):
+    # get the footprint of each record matching each criteria block, as (epoch, source, unit vector)
+    locations = getattr(ephemeris, __LOCATION_FIELDS[conjunction_type])
+    epochs = (ephemeris.epoch.astype(np.int64) // __EPOCH_PRECISION) * __EPOCH_PRECISION
+    points = [None] * len(blocks)
+    for i, block in enumerate(blocks):
+        if (block["category"] == "adhoc"):
+            continue
+        mask = __get_record_mask(block, ephemeris, start, end) & np.isfinite(locations).all(axis=1) & ~np.isnat(ephemeris.epoch)
+        idx = np.nonzero(mask)[0]
+
+        # keep one record per data source per epoch
+        _, unique_idx = np.unique(np.stack([epochs[idx], ephemeris.data_source_idx[idx]], axis=1), axis=0, return_index=True)
+        idx = idx[np.sort(unique_idx)]
+        points[i] = {
+            "epoch": epochs[idx],
+            "source": ephemeris.data_source_idx[idx].astype(np.int64),
+            "xyz": __to_unit_vectors(locations[idx, 0], locations[idx, 1]),
+        }
+
+    # custom locations are present at every epoch that any data source is. Each location
+    # is given a source code after the data sources.
+    all_epochs = np.unique(np.concatenate([p["epoch"] for p in points if p is not None] + [np.array([], dtype=np.int64)]))
+    custom_sources = []
+    for i, block in enumerate(blocks):
+        if (block["category"] != "adhoc"):
+            continue
+        source_codes = []
+        for lat, lon in block["spec"]["locations"]:
+            source_codes.append(len(ephemeris.data_sources) + len(custom_sources))
+            custom_sources.append(DataSource(
+                program="adhoc",
+                platform="%s, location %d" % (block["name"], len(source_codes)),
+                instrument_type="custom location",
+                source_type=SOURCE_TYPE_NOT_APPLICABLE,
+                display_name="Custom location (lat=%s, lon=%s)" % (lat, lon),
+                format=FORMAT_BASIC_INFO,
+            ))
+        xyz = __to_unit_vectors(np.array([loc[0] for loc in block["spec"]["locations"]], dtype=np.float64),
+                                np.array([loc[1] for loc in block["spec"]["locations"]], dtype=np.float64)).reshape((-1, 3))
+        points[i] = {
+            "epoch": np.repeat(all_epochs, len(source_codes)),
+            "source": np.tile(np.array(source_codes, dtype=np.int64), len(all_epochs)),
+            "xyz": np.tile(xyz, (len(all_epochs), 1)),
+        }
+
+    # return
+    return points, all_epochs, custom_sources
+
+
+def __find_pairs(points, all_epochs, distances, n_blocks):
+    # index the points of each criteria block in a KD-tree of unit vectors, with the epoch as a
+    # fourth dimension spaced far enough apart that points at different epochs are never close
+    trees = []
+    for p in points:
+        epoch_coord = np.searchsorted(all_epochs, p["epoch"]).astype(np.float64) * __EPOCH_SPACING
+        trees.append(cKDTree(np.concatenate([p["xyz"], epoch_coord[:, np.newaxis]], axis=1)))
+
+    # find all pairs of points within the distance of each other, for each pair of criteria blocks
+    pairs = {}
+    for a in range(0, n_blocks):
+        for b in range(a + 1, n_blocks):
+            distance = distances.get((a, b))
+            if (distance is None):
+                radius = 2.0 + 1e-9
+            else:
+                radius = 2.0 * np.sin(min(distance / __EARTH_RADIUS_KM, np.pi) / 2.0) + 1e-9
+            result = trees[a].sparse_distance_matrix(trees[b], radius, output_type="ndarray")
+            ia = result["i"].astype(np.int64)
+            ib = result["j"].astype(np.int64)
+            dist = 2.0 * __EARTH_RADIUS_KM * np.arcsin(np.clip(result["v"] / 2.0, 0.0, 1.0))
+            if (distance is not None):
+                keep = dist <= distance
+                ia, ib, dist = ia[keep], ib[keep], dist[keep]
+
+            # a data source can't be in conjunction with itself
+            keep = points[a]["source"][ia] != points[b]["source"][ib]
+            pairs[(a, b)] = (ia[keep], ib[keep], dist[keep])
+    return pairs
+
+
+def __join_pairs(pairs, points, n_blocks):
+    # join the pairs of points into groups with one point from every criteria block, where every
+    # pair of points in the group is close enough
+    groups = np.stack([pairs[(0, 1)][0], pairs[(0, 1)][1]], axis=1)
+    group_distances = {(0, 1): pairs[(0, 1)][2]}
+    for k in range(2, n_blocks):
+        # expand each group with the points in block k that are close to its first point
+        p0, pk, dist0k = pairs[(0, k)]
+        order = np.argsort(p0, kind="stable")
+        p0, pk, dist0k = p0[order], pk[order], dist0k[order]
+        left = np.searchsorted(p0, groups[:, 0], side="left")
+        counts = np.searchsorted(p0, groups[:, 0], side="right") - left
+        rows = np.repeat(np.arange(0, groups.shape[0]), counts)
+        pos = np.arange(0, rows.shape[0]) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(left, counts)
+        groups = groups[rows]
+        group_distances = {key: value[rows] for key, value in group_distances.items()}
+        new_column = pk[pos]
+        group_distances[(0, k)] = dist0k[pos]
+
+        # keep the groups where the new point is also close to the other points
+        keep = np.ones(groups.shape[0], dtype=bool)
+        n_points_k = points[k]["epoch"].shape[0]
+        for j in range(1, k):
+            pj, pk2, distjk = pairs[(j, k)]
+            codes = pj * n_points_k + pk2
+            order = np.argsort(codes)
+            codes, distjk = codes[order], distjk[order]
+            query = groups[:, j] * n_points_k + new_column
+            loc = np.clip(np.searchsorted(codes, query), 0, max(codes.shape[0] - 1, 0))
+            if (codes.shape[0] == 0):
+                keep[:] = False
+                group_distances[(j, k)] = np.zeros(groups.shape[0])
+            else:
+                keep &= codes[loc] == query
+                group_distances[(j, k)] = distjk[loc]
+        groups = np.concatenate([groups[keep], new_column[keep][:, np.newaxis]], axis=1)
+        group_distances = {key: value[keep] for key, value in group_distances.items()}
+    return groups, group_distances
+
+
+def __get_source_dict(ds):
+    return {
+        "identifier": ds.identifier,
+        "program": ds.program,
+        "platform": ds.platform,
+        "instrument_type": ds.instrument_type,
+        "source_type": ds.source_type,
+        "display_name": ds.display_name,
+    }
+
+
+def __to_datetime(value):
+    return value.astype("datetime64[s]").astype(datetime.datetime)
+
+
+def __find_conjunctions_for_type(ephemeris, blocks, distances, conjunction_type, start, end):
+    # get points and find groups of points close enough to each other
+    n_blocks = len(blocks)
+    points, all_epochs, custom_sources = __get_block_points(blocks, ephemeris, conjunction_type, start, end)
+    pairs = __find_pairs(points, all_epochs, distances, n_blocks)
+    groups, group_distances = __join_pairs(pairs, points, n_blocks)
+    if (groups.shape[0] == 0):
+        return []
+
+    # get the epoch and data sources of each group, and the distance between the two farthest
+    # apart data sources in it
+    epochs = points[0]["epoch"][groups[:, 0]]
+    sources = np.stack([points[k]["source"][groups[:, k]] for k in range(0, n_blocks)], axis=1)
+    pair_keys = sorted(group_distances.keys())
+    spread = np.max(np.stack([group_distances[key] for key in pair_keys], axis=1), axis=1)
+
+    # sort by data sources and epoch, and split into conjunctions wherever the data sources
+    # change or there's a gap in time
+    order = np.lexsort([epochs] + [sources[:, k] for k in reversed(range(0, n_blocks))])
+    epochs, sources, spread = epochs[order], sources[order], spread[order]
+    group_distances = {key: value[order] for key, value in group_distances.items()}
+    is_split = np.ones(epochs.shape[0], dtype=bool)
+    is_split[1:] = np.any(sources[1:] != sources[:-1], axis=1) | (np.diff(epochs) > __EPOCH_PRECISION)
+    starts = np.nonzero(is_split)[0]
+    ends = np.append(starts[1:], epochs.shape[0]) - 1
+    segment_ids = np.cumsum(is_split) - 1
+
+    # get closest and farthest epochs for each conjunction
+    closest_idx = np.lexsort([spread, segment_ids])[starts]
+    farthest_idx = np.lexsort([-spread, segment_ids])[starts]
+    min_distances = np.minimum.reduceat(spread, starts)
+    max_distances = np.maximum.reduceat(spread, starts)
+    event_min_distances = {key: np.minimum.reduceat(value, starts) for key, value in group_distances.items()}
+    event_max_distances = {key: np.maximum.reduceat(value, starts) for key, value in group_distances.items()}
+
+    # create conjunction objects
+    all_sources = list(ephemeris.data_sources) + custom_sources
+    conjunctions = []
+    for c in range(0, starts.shape[0]):
+        data_sources = [all_sources[s] for s in sources[starts[c]]]
+        conjunction_start = __to_datetime(np.datetime64(int(epochs[starts[c]]), "s"))
+        conjunction_end = __to_datetime(np.datetime64(int(epochs[ends[c]]), "s"))
+        events = []
+        for a, b in pair_keys:
+            events.append({
+                "conjunction_type": conjunction_type,
+                "e1_source": __get_source_dict(data_sources[a]),
+                "e2_source": __get_source_dict(data_sources[b]),
+                "start": conjunction_start,
+                "end": conjunction_end,
+                "min_distance": float(event_min_distances[(a, b)][c]),
+                "max_distance": float(event_max_distances[(a, b)][c]),
+            })
+        conjunctions.append(
+            Conjunction(
+                conjunction_type=conjunction_type,
+                start=conjunction_start,
+                end=conjunction_end,
+                data_sources=data_sources,
+                min_distance=float(min_distances[c]),
+                max_distance=float(max_distances[c]),
+                events=events,
+                closest_epoch=__to_datetime(np.datetime64(int(epochs[closest_idx[c]]), "s")),
+                farthest_epoch=__to_datetime(np.datetime64(int(epochs[farthest_idx[c]]), "s")),
+            ))
+
+    # return
+    return conjunctions
+
+
+def search_local(ephemeris, distance, ground, space, events, custom_locations, conjunction_types, start, end):
+    # check parameters
+    if (isinstance(ephemeris, EphemerisColumnarData) is False):
+        ephemeris = EphemerisColumnarData.from_ephemeris_data(ephemeris)
+    if (isinstance(conjunction_types, str) is True):
+        conjunction_types = [conjunction_types]
+    for conjunction_type in conjunction_types:
+        if (conjunction_type not in __LOCATION_FIELDS):
+            raise ValueError("Invalid conjunction type '%s'. Must be one of 'nbtrace', 'sbtrace', or 'geographic'." % (conjunction_type))
+    blocks = __get_blocks(ground, space, events, custom_locations)
+    distances = __get_distances(distance, blocks)
+
+    # find conjunctions
+    conjunctions = []
+    for conjunction_type in conjunction_types:
+        conjunctions.extend(__find_conjunctions_for_type(ephemeris, blocks, distances, conjunction_type, start, end))
+
+    # return, sorted by time
+    conjunctions.sort(key=lambda c: (c.start, c.end))
+    return conjunctions
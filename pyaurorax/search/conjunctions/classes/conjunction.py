@@ -73,6 +73,18 @@ class Conjunction:
             Timestamp for when data sources were farthest
     """
 
+    __slots__ = (
+        "conjunction_type",
+        "start",
+        "end",
+        "data_sources",
+        "min_distance",
+        "max_distance",
+        "events",
+        "closest_epoch",
+        "farthest_epoch",
+    )
+
     def __init__(
         self,
         conjunction_type: str,
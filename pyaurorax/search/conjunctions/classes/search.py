@@ -19,7 +19,7 @@ from __future__ import annotations
 import datetime
 import itertools
 from copy import deepcopy
-from typing import TYPE_CHECKING, Dict, Union, Optional, Sequence, Literal
+from typing import TYPE_CHECKING, Dict, List, Union, Optional, Sequence, Literal, Iterator
 from .conjunction import Conjunction
 from .criteria_block import (
     GroundCriteriaBlock,
@@ -34,6 +34,7 @@ from ...requests._requests import (
     cancel as requests_cancel,
     wait_for_data as requests_wait_for_data,
     get_data as requests_get_data,
+    iter_data as requests_iter_data,
     get_status as requests_get_status,
 )
 if TYPE_CHECKING:
@@ -108,6 +109,7 @@ class ConjunctionSearch:
     """
 
     __STANDARD_POLLING_SLEEP_TIME: float = 1.0
+    __STREAM_BATCH_SIZE: int = 10000
 
     def __init__(self,
                  aurorax_obj: PyAuroraX,
@@ -475,17 +477,56 @@ class ConjunctionSearch:
         raw_data = requests_get_data(self.__aurorax_obj, self.data_url, self.response_format, False)
 
         # set data variable
+        self.data = self.__cast_data(raw_data)
+
+    def __cast_data(self, raw_data: List[Dict]):
+        # records are left as dictionaries if a response format was used
         if (self.response_format is not None):
-            self.data = raw_data
-        else:
-            # cast data source objects
-            for i in range(0, len(raw_data)):
-                for j in range(0, len(raw_data[i]["data_sources"])):
-                    ds = DataSource(**raw_data[i]["data_sources"][j], format=FORMAT_BASIC_INFO)
-                    raw_data[i]["data_sources"][j] = ds
-
-            # cast conjunctions
-            self.data = [Conjunction(**c) for c in raw_data]
+            return raw_data
+
+        # cast data source objects
+        for i in range(0, len(raw_data)):
+            for j in range(0, len(raw_data[i]["data_sources"])):
+                ds = DataSource(**raw_data[i]["data_sources"][j], format=FORMAT_BASIC_INFO)
+                raw_data[i]["data_sources"][j] = ds
+
+        # cast conjunctions
+        return [Conjunction(**c) for c in raw_data]
+
+    def iter_data(self,
+                  batch_size: int = __STREAM_BATCH_SIZE,
+                  spool_filename: Optional[str] = None) -> Iterator[Union[List[Conjunction], List[Dict]]]:
+        """
+        Retrieve the data available for this conjunction search request, reading and parsing
+        it as it is downloaded. Batches of records are yielded as soon as they have been
+        received, and the `data` attribute is not set.
+
+        This is useful for very large search results, which would otherwise need to be
+        held in memory all at once.
+
+        Args:
+            batch_size (int): 
+                The number of records in each batch, defaults to 10000
+
+            spool_filename (str): 
+                Save the raw data to this file as it is downloaded, so that it can be read
+                again later using `pyaurorax.search.requests.RequestsManager.iter_data_file()`.
+                Defaults to None.
+
+        Yields:
+            Lists of `Conjunction` objects
+
+        Raises:
+            pyaurorax.exceptions.AuroraXDataRetrievalError: Error retrieving data
+        """
+        # check if completed yet
+        if (self.completed is False):
+            print("No data available, update status or check for data first")
+            return
+
+        # get data
+        for raw_data in requests_iter_data(self.__aurorax_obj, self.data_url, self.response_format, False, batch_size, spool_filename):
+            yield self.__cast_data(raw_data)
 
     def wait(self, poll_interval: float = __STANDARD_POLLING_SLEEP_TIME, verbose: bool = False) -> None:
         """
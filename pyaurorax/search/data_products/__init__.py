@@ -25,8 +25,10 @@ from .classes.data_product import DataProductData
 from .classes.search import DataProductSearch
 from ..sources.classes.data_source import DataSource
 from ..metadata_filters import MetadataFilter
+from ..upload_report import UploadReport
 from ._data_products import search as func_search
 from ._data_products import upload as func_upload
+from ._data_products import bulk_upload as func_bulk_upload
 from ._data_products import delete as func_delete
 from ._data_products import delete_urls as func_delete_urls
 from ._data_products import describe as func_describe
@@ -166,6 +168,77 @@ class DataProductsManager:
         """
         return func_upload(self.__aurorax_obj, identifier, records, validate_source, chunk_size)
 
+    def bulk_upload(self,
+                    identifier: int,
+                    records: List[DataProductData],
+                    validate_source: bool = False,
+                    chunk_size: int = __UPLOAD_CHUNK_SIZE,
+                    n_parallel: int = 4,
+                    max_retries: int = 2,
+                    retry_backoff: float = 1.0,
+                    stop_on_error: bool = False,
+                    progress_bar_disable: bool = False) -> UploadReport:
+        """
+        Upload a large number of data product records to AuroraX, with several chunks of records
+        being uploaded at a time.
+
+        Unlike `upload()`, a failed chunk does not stop the upload. Instead, each chunk is retried
+        with an increasing delay, and the outcome of every chunk is returned in a report. The records
+        passed in are not modified.
+
+        Args:
+            identifier (int): 
+                The AuroraX data source ID
+
+            records (List[DataProductData]): 
+                Data product records to upload
+
+            validate_source (bool): 
+                Validate all records before uploading, defaults to False
+
+            chunk_size (int): 
+                Number of records to upload in a single call, defaults to 500
+
+            n_parallel (int): 
+                The maximum number of upload requests in flight at once, defaults to 4. The
+                requests share the PyAuroraX object's HTTP session, so this is best kept at or
+                below the `api_pool_size` value.
+
+            max_retries (int): 
+                The number of times to retry a chunk that failed, defaults to 2. Errors due to the
+                records themselves or authorization are not retried.
+
+            retry_backoff (float): 
+                The delay before the first retry of a chunk in seconds, which doubles for each
+                subsequent retry. Defaults to 1.0.
+
+            stop_on_error (bool): 
+                Stop uploading chunks once a chunk has failed, defaults to False. Chunks that were
+                not uploaded are marked as skipped in the report.
+
+            progress_bar_disable (bool): 
+                Disable the progress bar, defaults to False
+
+        Returns:
+            A `pyaurorax.search.UploadReport` object
+
+        Raises:
+            ValueError: Invalid parameter values
+            pyaurorax.exceptions.AuroraXError: Data source validation error
+        """
+        return func_bulk_upload(
+            self.__aurorax_obj,
+            identifier,
+            records,
+            validate_source,
+            chunk_size,
+            n_parallel,
+            max_retries,
+            retry_backoff,
+            stop_on_error,
+            progress_bar_disable,
+        )
+
     def delete_urls(self, data_source: DataSource, urls: List[str]) -> int:
         """
         Delete data products by URL.
@@ -92,6 +92,8 @@ class DataProductData:
             Metadata for this record (arbitrary keys and values)
     """
 
+    __slots__ = ("data_source", "data_product_type", "start", "end", "url", "metadata")
+
     def __init__(self,
                  data_source: DataSource,
                  data_product_type: str,
@@ -115,7 +117,15 @@ class DataProductData:
             A dictionary object that is JSON-serializable
         """
         # init
-        d = self.__dict__
+        #
+        # NOTE: we build a new dictionary so that this object is left unchanged
+        d = {
+            "data_product_type": self.data_product_type,
+            "start": self.start,
+            "end": self.end,
+            "url": self.url,
+            "metadata": self.metadata,
+        }
 
         # format epoch as str
         if (type(d["start"]) is datetime.datetime):
@@ -125,15 +135,15 @@ class DataProductData:
 
         # format metadata
         if (self.metadata is not None):
+            d["metadata"] = self.metadata.copy()
             for key, value in self.metadata.items():
                 if (isinstance(value, datetime.datetime) is True or isinstance(value, datetime.date) is True):
-                    self.metadata[key] = self.metadata[key].strftime("%Y-%m-%dT%H:%M:%S.%f")  # pragma: nocover
+                    d["metadata"][key] = value.strftime("%Y-%m-%dT%H:%M:%S.%f")  # pragma: nocover
 
         # format data source fields for query
         d["program"] = self.data_source.program
         d["platform"] = self.data_source.platform
         d["instrument_type"] = self.data_source.instrument_type
-        del d["data_source"]
 
         # return
         return d
@@ -17,7 +17,7 @@ Class definition for a data product search
 
 from __future__ import annotations
 import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional, Literal, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Literal, Union, Iterator
 from .data_product import DataProductData
 from ...metadata_filters import MetadataFilter
 from ...api import AuroraXAPIRequest
@@ -27,6 +27,7 @@ from ...requests._requests import (
     cancel as requests_cancel,
     wait_for_data as requests_wait_for_data,
     get_data as requests_get_data,
+    iter_data as requests_iter_data,
     get_status as requests_get_status,
 )
 from ...._util import show_warning
@@ -102,6 +103,7 @@ class DataProductSearch:
     """
 
     __STANDARD_POLLING_SLEEP_TIME: float = 1.0
+    __STREAM_BATCH_SIZE: int = 10000
 
     def __init__(self,
                  aurorax_obj: PyAuroraX,
@@ -304,16 +306,55 @@ class DataProductSearch:
         raw_data = requests_get_data(self.__aurorax_obj, self.data_url, self.response_format, False)
 
         # set data variable
+        self.data = self.__cast_data(raw_data)
+
+    def __cast_data(self, raw_data: List[Dict]):
+        # records are left as dictionaries if a response format was used
         if (self.response_format is not None):
-            self.data = raw_data
-        else:
-            # cast data source objects
-            for i in range(0, len(raw_data)):
-                ds = DataSource(**raw_data[i]["data_source"], format=FORMAT_BASIC_INFO)
-                raw_data[i]["data_source"] = ds
+            return raw_data
+
+        # cast data source objects
+        for i in range(0, len(raw_data)):
+            ds = DataSource(**raw_data[i]["data_source"], format=FORMAT_BASIC_INFO)
+            raw_data[i]["data_source"] = ds
+
+        # cast data product objects
+        return [DataProductData(**dp) for dp in raw_data]
+
+    def iter_data(self,
+                  batch_size: int = __STREAM_BATCH_SIZE,
+                  spool_filename: Optional[str] = None) -> Iterator[Union[List[DataProductData], List[Dict]]]:
+        """
+        Retrieve the data available for this data product search request, reading and parsing
+        it as it is downloaded. Batches of records are yielded as soon as they have been
+        received, and the `data` attribute is not set.
+
+        This is useful for very large search results, which would otherwise need to be
+        held in memory all at once.
+
+        Args:
+            batch_size (int): 
+                The number of records in each batch, defaults to 10000
+
+            spool_filename (str): 
+                Save the raw data to this file as it is downloaded, so that it can be read
+                again later using `pyaurorax.search.requests.RequestsManager.iter_data_file()`.
+                Defaults to None.
 
-            # cast data product objects
-            self.data = [DataProductData(**dp) for dp in raw_data]
+        Yields:
+            Lists of `DataProductData` objects
+
+        Raises:
+            pyaurorax.exceptions.AuroraXDataRetrievalError: Error retrieving data
+        """
+        # check if completed yet
+        if (self.completed is False):
+            print("No data available, update status or check for data first")
+            return
+
+        # get data
+        for raw_data in requests_iter_data(self.__aurorax_obj, self.data_url, self.response_format, False, batch_size, spool_filename):
+            yield self.__cast_data(raw_data)
 
     def wait(self, poll_interval: float = __STANDARD_POLLING_SLEEP_TIME, verbose: bool = False) -> None:
         """
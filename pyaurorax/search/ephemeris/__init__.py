@@ -24,9 +24,11 @@ from typing import Dict, List, Optional, Union, Literal
 from .classes.ephemeris import EphemerisData
 from .classes.search import EphemerisSearch
 from ..metadata_filters import MetadataFilter
+from ..upload_report import UploadReport
 from ..sources.classes.data_source import DataSource
 from ._ephemeris import search as func_search
 from ._ephemeris import upload as func_upload
+from ._ephemeris import bulk_upload as func_bulk_upload
 from ._ephemeris import delete as func_delete
 from ._ephemeris import describe as func_describe
 from ._ephemeris import get_request_url as func_get_request_url
@@ -57,7 +59,8 @@ class EphemerisManager:
                response_format: Optional[Dict] = None,
                poll_interval: float = __STANDARD_POLLING_SLEEP_TIME,
                return_immediately: bool = False,
-               verbose: bool = False) -> EphemerisSearch:
+               verbose: bool = False,
+               result_container: Literal["list", "columnar"] = "list") -> EphemerisSearch:
         """
         Search for ephemeris records
 
@@ -106,6 +109,12 @@ class EphemerisManager:
             verbose (bool): 
                 Output poll times and other progress messages, defaults to False
 
+            result_container (str): 
+                How the ephemeris records are stored in the `data` attribute of the search object,
+                either `list` (a list of `EphemerisData` objects) or `columnar` (an `EphemerisColumnarData`
+                object, storing each field as a NumPy array). The columnar container uses much less
+                memory and is much faster for large searches. Defaults to `list`.
+
         Returns:
             A `pyaurorax..search.EphemerisSearch` object
 
@@ -123,6 +132,7 @@ class EphemerisManager:
             metadata_filters,
             metadata_filters_logical_operator,
             response_format,
+            result_container,
             poll_interval,
             return_immediately,
             verbose,
@@ -154,6 +164,77 @@ class EphemerisManager:
         """
         return func_upload(self.__aurorax_obj, identifier, records, validate_source, chunk_size)
 
+    def bulk_upload(self,
+                    identifier: int,
+                    records: List[EphemerisData],
+                    validate_source: bool = False,
+                    chunk_size: int = __UPLOAD_CHUNK_SIZE,
+                    n_parallel: int = 4,
+                    max_retries: int = 2,
+                    retry_backoff: float = 1.0,
+                    stop_on_error: bool = False,
+                    progress_bar_disable: bool = False) -> UploadReport:
+        """
+        Upload a large number of ephemeris records to AuroraX, with several chunks of records
+        being uploaded at a time.
+
+        Unlike `upload()`, a failed chunk does not stop the upload. Instead, each chunk is retried
+        with an increasing delay, and the outcome of every chunk is returned in a report. The records
+        passed in are not modified.
+
+        Args:
+            identifier (int): 
+                The AuroraX data source ID
+
+            records (List[EphemerisData]): 
+                Ephemeris records to upload
+
+            validate_source (bool): 
+                Validate all records before uploading, defaults to False
+
+            chunk_size (int): 
+                Number of records to upload in a single call, defaults to 500
+
+            n_parallel (int): 
+                The maximum number of upload requests in flight at once, defaults to 4. The
+                requests share the PyAuroraX object's HTTP session, so this is best kept at or
+                below the `api_pool_size` value.
+
+            max_retries (int): 
+                The number of times to retry a chunk that failed, defaults to 2. Errors due to the
+                records themselves or authorization are not retried.
+
+            retry_backoff (float): 
+                The delay before the first retry of a chunk in seconds, which doubles for each
+                subsequent retry. Defaults to 1.0.
+
+            stop_on_error (bool): 
+                Stop uploading chunks once a chunk has failed, defaults to False. Chunks that were
+                not uploaded are marked as skipped in the report.
+
+            progress_bar_disable (bool): 
+                Disable the progress bar, defaults to False
+
+        Returns:
+            A `pyaurorax.search.UploadReport` object
+
+        Raises:
+            ValueError: Invalid parameter values
+            pyaurorax.exceptions.AuroraXError: Data source validation error
+        """
+        return func_bulk_upload(
+            self.__aurorax_obj,
+            identifier,
+            records,
+            validate_source,
+            chunk_size,
+            n_parallel,
+            max_retries,
+            retry_backoff,
+            stop_on_error,
+            progress_bar_disable,
+        )
+
     def delete(self, data_source: DataSource, start: datetime.datetime, end: datetime.datetime) -> int:
         """
         Delete ephemeris records between a timeframe.
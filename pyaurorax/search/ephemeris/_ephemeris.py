@@ -17,24 +17,24 @@ Functions for performing ephemeris searches
 
 import datetime
 import humanize
-import numpy as np
-from .classes.ephemeris import EphemerisData
 from .classes.search import EphemerisSearch
 from ..api import AuroraXAPIRequest
+from .._upload import upload_records
 from ..sources.classes.data_source import FORMAT_DEFAULT
-from ..sources._sources import get_using_identifier
 from ...exceptions import (
     AuroraXError,
     AuroraXAPIError,
     AuroraXSearchError,
-    AuroraXUploadError,
+    AuroraXNotFoundError,
 )
 
 
 def __validate_data_source(aurorax_obj, identifier, records):
-    # get data source
+    # get data source, from the local catalog
     try:
-        ds = get_using_identifier(aurorax_obj, identifier, FORMAT_DEFAULT, False)
+        ds = aurorax_obj.search.sources.catalog.get_using_identifier(identifier, FORMAT_DEFAULT)
+    except AuroraXNotFoundError as e:  # pragma: nocover-ok
+        raise AuroraXAPIError("Data source with identifier %d could not be found" % (identifier)) from e
     except AuroraXAPIError as e:  # pragma: nocover-ok
         if ("no data source record found" in str(e).lower()):
             raise AuroraXAPIError("Data source with identifier %d could not be found" % (identifier)) from e
@@ -53,7 +53,7 @@ def __validate_data_source(aurorax_obj, identifier, records):
 
 
 def search(aurorax_obj, start, end, programs, platforms, instrument_types, metadata_filters, metadata_filters_logical_operator, response_format,
-           poll_interval, return_immediately, verbose):
+           result_container, poll_interval, return_immediately, verbose):
     # create a search object
     s = EphemerisSearch(aurorax_obj,
                         start,
@@ -63,7 +63,8 @@ def search(aurorax_obj, start, end, programs, platforms, instrument_types, metad
                         instrument_types=instrument_types,
                         metadata_filters=metadata_filters,
                         metadata_filters_logical_operator=metadata_filters_logical_operator,
-                        response_format=response_format)
+                        response_format=response_format,
+                        result_container=result_container)
     if (verbose is True):
         print("[%s] Search object created" % (datetime.datetime.now()))
 
@@ -103,48 +104,46 @@ def search(aurorax_obj, start, end, programs, platforms, instrument_types, metad
     return s
 
 
-def upload(aurorax_obj, identifier, all_records, validate_source, chunk_size):
+def __check_records(aurorax_obj, identifier, all_records, validate_source):
     # validate record sources if the flag is set
     if (validate_source is True):
         validation_error = __validate_data_source(aurorax_obj, identifier, all_records)
         if (validation_error is not None):
             raise AuroraXError("Unable to validate data source found in record: {}".format(validation_error))
 
-    # translate each ephemeris record to a request-friendly
-    # dict (ie. convert datetimes to strings, etc.)
-    for i, _ in enumerate(all_records):
-        if (isinstance(all_records[i], EphemerisData) is True):
-            all_records[i] = all_records[i].to_json_serializable()
 
-    # chunk up the records
+def upload(aurorax_obj, identifier, all_records, validate_source, chunk_size):
+    # validate records
+    __check_records(aurorax_obj, identifier, all_records, validate_source)
+
+    # upload the records in chunks, one after another
     #
     # NOTE: we do this so that upload requests that are large are able to
     # more consistently succeed. If a call is to upload 10,000 records, we
-    # under-the-hood chunk it up into N-record calls.
-    if (len(all_records) > chunk_size):
-        chunked_indexes = np.array_split(np.array(range(0, len(all_records)), dtype=np.int32), int(np.floor(len(all_records) / chunk_size)))
-    else:
-        chunked_indexes = [np.arange(0, len(all_records), dtype=np.int32)]
-    for idxs in chunked_indexes:
-        records = []
-        for idx in idxs:
-            records.append(all_records[idx])
-
-        # make request
-        url = "%s/%s" % (aurorax_obj.api_base_url, aurorax_obj.search.api.URL_SUFFIX_EPHEMERIS_UPLOAD.format(identifier))
-        req = AuroraXAPIRequest(aurorax_obj, method="post", url=url, body=records, null_response=True)
-        res = req.execute()
-
-        # evaluate response
-        if (res.status_code == 400):
-            if isinstance(res.data, list):  # pragma: nocover-ok
-                raise AuroraXUploadError("%s - %s" % (res.status_code, res.data[0]["message"]))
-            raise AuroraXUploadError("%s - %s" % (res.data["error_code"], res.data["error_message"]))  # pragma: nocover
+    # under-the-hood chunk it up into N-record calls. The records are serialized
+    # without being changed.
+    url = "%s/%s" % (aurorax_obj.api_base_url, aurorax_obj.search.api.URL_SUFFIX_EPHEMERIS_UPLOAD.format(identifier))
+    report = upload_records(aurorax_obj, url, identifier, all_records, chunk_size, 1, 0, 0.0, True, True)
+
+    # raise the error of the chunk that failed
+    if (report.success is False):
+        raise report.failed_chunks[0].error  # type: ignore
 
     # return
     return 0
 
 
+def bulk_upload(aurorax_obj, identifier, all_records, validate_source, chunk_size, n_parallel, max_retries, retry_backoff, stop_on_error,
+                progress_bar_disable):
+    # validate records
+    __check_records(aurorax_obj, identifier, all_records, validate_source)
+
+    # upload the records in chunks, several at a time
+    url = "%s/%s" % (aurorax_obj.api_base_url, aurorax_obj.search.api.URL_SUFFIX_EPHEMERIS_UPLOAD.format(identifier))
+    return upload_records(aurorax_obj, url, identifier, all_records, chunk_size, n_parallel, max_retries, retry_backoff, stop_on_error,
+                          progress_bar_disable)
+
+
 def delete(aurorax_obj, data_source, start, end):
     # check to make sure the identifier, program, platform, and instrument type are all set in the data source
     if not all([data_source.identifier, data_source.program, data_source.platform, data_source.instrument_type]):  # pragma: nocover
@@ -17,7 +17,7 @@ Class definition for an ephemeris record
 
 import datetime
 from typing import Dict, Optional
-from ...location import Location
+from ...location import Location, EMPTY_LOCATION
 from ...sources.classes.data_source import DataSource
 
 
@@ -47,8 +47,13 @@ class EphemerisData:
 
         metadata (Dict): 
             Metadata for this record (arbitrary keys and values)
+
+    Locations that aren't supplied are set to a shared immutable empty location. To
+    set values for these, assign a new `Location` object.
     """
 
+    __slots__ = ("data_source", "epoch", "location_geo", "nbtrace", "sbtrace", "location_gsm", "metadata")
+
     def __init__(self,
                  data_source: DataSource,
                  epoch: datetime.datetime,
@@ -59,10 +64,10 @@ class EphemerisData:
                  metadata: Optional[Dict] = None):
         self.data_source = data_source
         self.epoch = epoch
-        self.location_geo = Location(lat=None, lon=None) if location_geo is None else location_geo
-        self.nbtrace = Location(lat=None, lon=None) if nbtrace is None else nbtrace
-        self.sbtrace = Location(lat=None, lon=None) if sbtrace is None else sbtrace
-        self.location_gsm = Location(lat=None, lon=None) if location_gsm is None else location_gsm
+        self.location_geo = EMPTY_LOCATION if location_geo is None else location_geo
+        self.nbtrace = EMPTY_LOCATION if nbtrace is None else nbtrace
+        self.sbtrace = EMPTY_LOCATION if sbtrace is None else sbtrace
+        self.location_gsm = EMPTY_LOCATION if location_gsm is None else location_gsm
         self.metadata = metadata
 
     def to_json_serializable(self) -> Dict:
@@ -74,33 +79,37 @@ class EphemerisData:
             A dictionary object that is JSON-serializable
         """
         # init
-        d = self.__dict__
+        #
+        # NOTE: we build a new dictionary so that this object is left unchanged
+        d = {
+            "epoch": self.epoch,
+            "location_geo": self.location_geo,
+            "nbtrace": self.nbtrace,
+            "sbtrace": self.sbtrace,
+            "location_gsm": self.location_gsm,
+            "metadata": self.metadata,
+        }
 
         # format epoch as str
         if (isinstance(d["epoch"], datetime.datetime) is True):
             d["epoch"] = d["epoch"].strftime("%Y-%m-%dT%H:%M:00.000Z")
 
         # format location
-        if (isinstance(d["location_geo"], Location) is True):
-            d["location_geo"] = d["location_geo"].to_json_serializable()
-        if (isinstance(d["location_gsm"], Location) is True):
-            d["location_gsm"] = d["location_gsm"].to_json_serializable()
-        if (isinstance(d["nbtrace"], Location) is True):
-            d["nbtrace"] = d["nbtrace"].to_json_serializable()
-        if (isinstance(d["sbtrace"], Location) is True):
-            d["sbtrace"] = d["sbtrace"].to_json_serializable()
+        for key in ["location_geo", "nbtrace", "sbtrace", "location_gsm"]:
+            if (isinstance(d[key], Location) is True):
+                d[key] = d[key].to_json_serializable()
 
         # format metadata
         if (self.metadata is not None):
+            d["metadata"] = self.metadata.copy()
             for key, value in self.metadata.items():
                 if (isinstance(value, datetime.datetime) is True or isinstance(value, datetime.date) is True):
-                    self.metadata[key] = self.metadata[key].strftime("%Y-%m-%dT%H:%M:%S.%f")  # pragma: nocover
+                    d["metadata"][key] = value.strftime("%Y-%m-%dT%H:%M:%S.%f")  # pragma: nocover
 
         # format data source fields for query
         d["program"] = self.data_source.program
         d["platform"] = self.data_source.platform
         d["instrument_type"] = self.data_source.instrument_type
-        del d["data_source"]
 
         # return
         return d
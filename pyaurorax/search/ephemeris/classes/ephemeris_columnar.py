@@ -0,0 +1,359 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Class definition for ephemeris records stored in columns
+"""
+
+from __future__ import annotations
+import datetime
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Union, Iterator
+from ...location import Location, EMPTY_LOCATION
+from ...sources.classes.data_source import DataSource, FORMAT_BASIC_INFO
+from .ephemeris import EphemerisData
+
+# globals
+__LOCATION_NAMES = ["location_geo", "location_gsm", "nbtrace", "sbtrace"]
+
+
+def get_data_source_key(data_source):
+    """
+    Get the key used to identify a data source in the data source table.
+    """
+    # data sources are identified by their identifier, or their program/platform/instrument_type
+    # if the response format left out the identifier
+    if (isinstance(data_source, dict) is True):
+        if (data_source.get("identifier") is not None):
+            return data_source["identifier"]
+        return (data_source.get("program"), data_source.get("platform"), data_source.get("instrument_type"))
+    if (data_source.identifier is not None):
+        return data_source.identifier
+    return (data_source.program, data_source.platform, data_source.instrument_type)
+
+
+def __get_location_array(locations):
+    # convert a list of locations (Location objects, dictionaries, or None) to an Nx2 array of
+    # latitude and longitude, with NaN for missing values
+    lat_list = []
+    lon_list = []
+    for loc in locations:
+        if (loc is None):
+            lat_list.append(None)
+            lon_list.append(None)
+        elif (isinstance(loc, dict) is True):
+            lat_list.append(loc.get("lat"))
+            lon_list.append(loc.get("lon"))
+        else:
+            lat_list.append(loc.lat)
+            lon_list.append(loc.lon)
+    return np.stack([np.array(lat_list, dtype=np.float64), np.array(lon_list, dtype=np.float64)], axis=-1).reshape((len(lat_list), 2))
+
+
+def __get_metadata_columns(metadata_list):
+    # get all keys, in the order they first appear
+    keys = {}
+    for metadata in metadata_list:
+        if (metadata is not None):
+            keys.update(dict.fromkeys(metadata))
+
+    # build a column for each key. Numbers present in every record are stored as a numeric
+    # array, and anything else is stored as an object array with None for missing values.
+    columns = {}
+    for key in keys:
+        values = [None if metadata is None else metadata.get(key) for metadata in metadata_list]
+        if (all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)):
+            columns[key] = np.array(values)
+        else:
+            column = np.empty(len(values), dtype=object)
+            for i, v in enumerate(values):
+                column[i] = v
+            columns[key] = column
+
+    # return
+    return columns
+
+
+def build_columns(epochs, data_sources, locations, metadata_list):
+    """
+    Build the columns for a set of ephemeris records. Data sources can be DataSource
+    objects or dictionaries, and locations can be Location objects or dictionaries.
+    """
+    # set data source codes
+    data_source_list = []
+    data_source_codes = {}
+    data_source_idx = np.full(len(data_sources), -1, dtype=np.int32)
+    for i, ds in enumerate(data_sources):
+        if (ds is None):
+            continue
+        key = get_data_source_key(ds)
+        if (key not in data_source_codes):
+            data_source_codes[key] = len(data_source_list)
+            if (isinstance(ds, dict) is True):
+                ds = DataSource(**ds, format=FORMAT_BASIC_INFO)
+            data_source_list.append(ds)
+        data_source_idx[i] = data_source_codes[key]
+
+    # return
+    return {
+        "epoch": np.array(epochs, dtype="datetime64[s]"),
+        "data_source_idx": data_source_idx,
+        "data_sources": data_source_list,
+        "locations": {name: __get_location_array(locations[name]) for name in __LOCATION_NAMES},
+        "metadata": __get_metadata_columns(metadata_list),
+    }
+
+
+class EphemerisColumnarData:
+    """
+    Ephemeris records stored as columns of NumPy arrays, instead of as a list of
+    `EphemerisData` objects. This uses much less memory for large numbers of records.
+
+    Indexing with an integer returns an `EphemerisData` object, created when it is
+    accessed. Indexing with a slice, boolean mask, or integer array returns a new
+    `EphemerisColumnarData` object.
+
+    Attributes:
+        epoch (numpy.ndarray): 
+            Timestamp for each record, as a `datetime64[s]` array (assumed it is in UTC)
+
+        data_source_idx (numpy.ndarray): 
+            Index into `data_sources` for each record, or -1 if the record has no data source
+
+        data_sources (List[DataSource]): 
+            The unique data sources of the records
+
+        location_geo (numpy.ndarray): 
+            Geographic latitude and longitude of each record, as an Nx2 float64 array with
+            NaN for missing values
+
+        location_gsm (numpy.ndarray): 
+            GSM latitude and longitude of each record, as an Nx2 float64 array
+
+        nbtrace (numpy.ndarray): 
+            North B-trace geographic latitude and longitude of each record, as an Nx2 float64 array
+
+        sbtrace (numpy.ndarray): 
+            South B-trace geographic latitude and longitude of each record, as an Nx2 float64 array
+
+        metadata (Dict[str, numpy.ndarray]): 
+            A column for each metadata key. Numeric values that are present in every record are
+            stored in a numeric array, and all other values are stored in an object array, with
+            None for records that don't have the key.
+    """
+
+    def __init__(self,
+                 epoch: np.ndarray,
+                 data_source_idx: np.ndarray,
+                 data_sources: List[DataSource],
+                 location_geo: Optional[np.ndarray] = None,
+                 location_gsm: Optional[np.ndarray] = None,
+                 nbtrace: Optional[np.ndarray] = None,
+                 sbtrace: Optional[np.ndarray] = None,
+                 metadata: Optional[Dict[str, np.ndarray]] = None):
+        self.epoch = np.asarray(epoch, dtype="datetime64[s]")
+        self.data_source_idx = np.asarray(data_source_idx, dtype=np.int32)
+        self.data_sources = data_sources
+        n_records = self.epoch.shape[0]
+        self.location_geo = np.full((n_records, 2), np.nan) if location_geo is None else np.asarray(location_geo, dtype=np.float64)
+        self.location_gsm = np.full((n_records, 2), np.nan) if location_gsm is None else np.asarray(location_gsm, dtype=np.float64)
+        self.nbtrace = np.full((n_records, 2), np.nan) if nbtrace is None else np.asarray(nbtrace, dtype=np.float64)
+        self.sbtrace = np.full((n_records, 2), np.nan) if sbtrace is None else np.asarray(sbtrace, dtype=np.float64)
+        self.metadata = {} if metadata is None else metadata
+
+        # check sizes
+        for name, value in [("data_source_idx", self.data_source_idx), ("location_geo", self.location_geo), ("location_gsm", self.location_gsm),
+                            ("nbtrace", self.nbtrace), ("sbtrace", self.sbtrace)] + list(self.metadata.items()):
+            if (value.shape[0] != n_records):
+                raise ValueError("The '%s' column has %d values, but there are %d epochs" % (name, value.shape[0], n_records))
+
+    @classmethod
+    def from_raw_data(cls, raw_data: List[Dict]) -> EphemerisColumnarData:
+        """
+        Create the columns from the ephemeris records returned by the AuroraX API, without
+        creating any intermediate objects.
+
+        Args:
+            raw_data (List[Dict]): 
+                The ephemeris records, in the raw JSON format returned by the API
+
+        Returns:
+            An `EphemerisColumnarData` object
+        """
+        columns = build_columns(
+            [r.get("epoch") for r in raw_data],
+            [r.get("data_source") for r in raw_data],
+            {name: [r.get(name) for r in raw_data] for name in ["location_geo", "location_gsm", "nbtrace", "sbtrace"]},
+            [r.get("metadata") for r in raw_data],
+        )
+        return cls(columns["epoch"], columns["data_source_idx"], columns["data_sources"], metadata=columns["metadata"], **columns["locations"])
+
+    @classmethod
+    def from_ephemeris_data(cls, records: Sequence[EphemerisData]) -> EphemerisColumnarData:
+        """
+        Create the columns from a list of `EphemerisData` objects.
+
+        Args:
+            records (List[EphemerisData]): 
+                The ephemeris records
+
+        Returns:
+            An `EphemerisColumnarData` object
+        """
+        columns = build_columns(
+            [r.epoch for r in records],
+            [r.data_source for r in records],
+            {name: [getattr(r, name) for r in records] for name in ["location_geo", "location_gsm", "nbtrace", "sbtrace"]},
+            [r.metadata for r in records],
+        )
+        return cls(columns["epoch"], columns["data_source_idx"], columns["data_sources"], metadata=columns["metadata"], **columns["locations"])
+
+    @classmethod
+    def concatenate(cls, items: Sequence[EphemerisColumnarData]) -> EphemerisColumnarData:
+        """
+        Join several `EphemerisColumnarData` objects together, in order.
+
+        Args:
+            items (List[EphemerisColumnarData]): 
+                The objects to join
+
+        Returns:
+            An `EphemerisColumnarData` object
+        """
+        # merge data source tables
+        data_source_list = []
+        data_source_codes = {}
+        data_source_idx_list = []
+        for item in items:
+            remap = np.full(len(item.data_sources) + 1, -1, dtype=np.int32)
+            for i, ds in enumerate(item.data_sources):
+                key = get_data_source_key(ds)
+                if (key not in data_source_codes):
+                    data_source_codes[key] = len(data_source_list)
+                    data_source_list.append(ds)
+                remap[i] = data_source_codes[key]
+            data_source_idx_list.append(remap[item.data_source_idx])
+
+        # merge metadata columns, filling in missing keys with None
+        metadata = {}
+        keys = {}
+        for item in items:
+            keys.update(dict.fromkeys(item.metadata))
+        for key in keys:
+            column_list = []
+            for item in items:
+                if (key in item.metadata):
+                    column_list.append(item.metadata[key])
+                else:
+                    column_list.append(np.full(len(item), None, dtype=object))
+            if (all(c.dtype != object for c in column_list)):
+                metadata[key] = np.concatenate(column_list)
+            else:
+                metadata[key] = np.concatenate([c.astype(object) for c in column_list])
+
+        # return
+        return cls(
+            np.concatenate([item.epoch for item in items]) if len(items) > 0 else np.array([], dtype="datetime64[s]"),
+            np.concatenate(data_source_idx_list) if len(items) > 0 else np.array([], dtype=np.int32),
+            data_source_list,
+            location_geo=np.concatenate([item.location_geo for item in items]) if len(items) > 0 else None,
+            location_gsm=np.concatenate([item.location_gsm for item in items]) if len(items) > 0 else None,
+            nbtrace=np.concatenate([item.nbtrace for item in items]) if len(items) > 0 else None,
+            sbtrace=np.concatenate([item.sbtrace for item in items]) if len(items) > 0 else None,
+            metadata=metadata,
+        )
+
+    def to_ephemeris_data(self) -> List[EphemerisData]:
+        """
+        Convert to a list of `EphemerisData` objects.
+
+        Returns:
+            A list of `EphemerisData` objects
+        """
+        return [self.__get_record(i) for i in range(0, len(self))]
+
+    def __get_record(self, i: int) -> EphemerisData:
+        # get location objects
+        locations = {}
+        for name in ["location_geo", "location_gsm", "nbtrace", "sbtrace"]:
+            lat, lon = getattr(self, name)[i]
+            if (np.isnan(lat) or np.isnan(lon)):
+                locations[name] = EMPTY_LOCATION
+            else:
+                locations[name] = Location(lat=float(lat), lon=float(lon))
+
+        # get metadata
+        metadata = {}
+        for key, column in self.metadata.items():
+            value = column[i]
+            if (column.dtype == object):
+                if (value is None):
+                    continue
+                metadata[key] = value
+            else:
+                metadata[key] = value.item()
+
+        # return
+        epoch = self.epoch[i]
+        return EphemerisData(
+            data_source=self.data_sources[self.data_source_idx[i]] if self.data_source_idx[i] >= 0 else None,  # type: ignore
+            epoch=None if np.isnat(epoch) else epoch.astype(datetime.datetime),  # type: ignore
+            metadata=metadata,
+            **locations,
+        )
+
+    def __len__(self) -> int:
+        return self.epoch.shape[0]
+
+    def __iter__(self) -> Iterator[EphemerisData]:
+        for i in range(0, len(self)):
+            yield self.__get_record(i)
+
+    def __getitem__(self, key: Union[int, slice, np.ndarray, List[int]]) -> Union[EphemerisData, EphemerisColumnarData]:
+        if (isinstance(key, (int, np.integer)) is True):
+            if (key < -len(self) or key >= len(self)):
+                raise IndexError("Index %d is out of range for %d records" % (key, len(self)))
+            return self.__get_record(int(key) % len(self))  # type: ignore
+        return EphemerisColumnarData(
+            self.epoch[key],
+            self.data_source_idx[key],
+            self.data_sources,
+            location_geo=self.location_geo[key],
+            location_gsm=self.location_gsm[key],
+            nbtrace=self.nbtrace[key],
+            sbtrace=self.sbtrace[key],
+            metadata={k: v[key] for k, v in self.metadata.items()},
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return "EphemerisColumnarData(%d records, %d data sources, metadata_keys=%s)" % (
+            len(self),
+            len(self.data_sources),
+            list(self.metadata.keys()),
+        )
+
+    def pretty_print(self):
+        """
+        A special print output for this class.
+        """
+        print("EphemerisColumnarData:")
+        print("  %-16s: %s" % ("epoch", "array(dims=%s, dtype=%s)" % (self.epoch.shape, self.epoch.dtype)))
+        print("  %-16s: %s" % ("data_source_idx", "array(dims=%s, dtype=%s)" % (self.data_source_idx.shape, self.data_source_idx.dtype)))
+        print("  %-16s: [%d data sources]" % ("data_sources", len(self.data_sources)))
+        for name in ["location_geo", "location_gsm", "nbtrace", "sbtrace"]:
+            value = getattr(self, name)
+            print("  %-16s: %s" % (name, "array(dims=%s, dtype=%s)" % (value.shape, value.dtype)))
+        print("  %-16s: %s" % ("metadata", list(self.metadata.keys())))
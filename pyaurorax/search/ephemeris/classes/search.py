@@ -17,9 +17,10 @@ Class definition for an ephemeris search
 
 from __future__ import annotations
 import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional, Literal, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Literal, Union, Iterator
 from ...metadata_filters import MetadataFilter
 from .ephemeris import EphemerisData
+from .ephemeris_columnar import EphemerisColumnarData
 from ...api import AuroraXAPIRequest
 from ...sources.classes.data_source import DataSource, FORMAT_BASIC_INFO
 from ....exceptions import AuroraXError, AuroraXAPIError
@@ -27,6 +28,7 @@ from ...requests._requests import (
     cancel as requests_cancel,
     wait_for_data as requests_wait_for_data,
     get_data as requests_get_data,
+    iter_data as requests_iter_data,
     get_status as requests_get_status,
 )
 from ...._util import show_warning
@@ -67,6 +69,11 @@ class EphemerisSearch:
 
         response_format (Dict): 
             JSON representation of desired data response format
+
+        result_container (str): 
+            How the ephemeris records are stored in the `data` attribute, either `list` (a list
+            of `EphemerisData` objects) or `columnar` (an `EphemerisColumnarData` object). The
+            columnar container uses much less memory for large searches. Defaults to `list`.
         
         request (AuroraXResponse): 
             AuroraXResponse object returned when the search is executed
@@ -92,7 +99,7 @@ class EphemerisSearch:
         status (Dict): 
             The status of the query
       
-        data (List[EphemerisData]): 
+        data (List[EphemerisData] or EphemerisColumnarData): 
             The ephemeris records found
       
         logs (List[Dict]): 
@@ -100,6 +107,7 @@ class EphemerisSearch:
     """
 
     __STANDARD_POLLING_SLEEP_TIME: float = 1.0
+    __STREAM_BATCH_SIZE: int = 10000
 
     def __init__(self,
                  aurorax_obj: PyAuroraX,
@@ -110,7 +118,12 @@ class EphemerisSearch:
                  instrument_types: Optional[List[str]] = None,
                  metadata_filters: Optional[Union[MetadataFilter, List[Dict]]] = None,
                  metadata_filters_logical_operator: Optional[Literal["and", "or", "AND", "OR"]] = None,
-                 response_format: Optional[Dict] = None) -> None:
+                 response_format: Optional[Dict] = None,
+                 result_container: Literal["list", "columnar"] = "list") -> None:
+
+        # check result container
+        if (result_container not in ["list", "columnar"]):
+            raise ValueError("Invalid result_container '%s'. Must be one of 'list' or 'columnar'." % (result_container))
 
         # show warnings
         if (isinstance(metadata_filters, MetadataFilter) and metadata_filters_logical_operator is not None):
@@ -129,6 +142,7 @@ class EphemerisSearch:
         self.metadata_filters = metadata_filters
         self.metadata_filters_logical_operator = "AND" if metadata_filters_logical_operator is None else metadata_filters_logical_operator.upper()
         self.response_format = response_format
+        self.result_container = result_container
 
         # initialize additional variables
         self.request = None
@@ -302,19 +316,64 @@ class EphemerisSearch:
             return
 
         # get data
-        raw_data = requests_get_data(self.__aurorax_obj, self.data_url, self.response_format, False)
+        raw_data = requests_get_data(self.__aurorax_obj, self.data_url, self.response_format, self.result_container == "columnar")
 
         # set data variable
+        self.data = self.__cast_data(raw_data)
+
+    def __cast_data(self, raw_data: List[Dict]):
+        # build columns straight from the JSON records
+        if (self.result_container == "columnar"):
+            return EphemerisColumnarData.from_raw_data(raw_data)
+
+        # records are left as dictionaries if a response format was used
         if (self.response_format is not None):
-            self.data = raw_data
-        else:
-            # cast data source objects
-            for i in range(0, len(raw_data)):
-                ds = DataSource(**raw_data[i]["data_source"], format=FORMAT_BASIC_INFO)
-                raw_data[i]["data_source"] = ds
+            return raw_data
+
+        # cast data source objects
+        for i in range(0, len(raw_data)):
+            ds = DataSource(**raw_data[i]["data_source"], format=FORMAT_BASIC_INFO)
+            raw_data[i]["data_source"] = ds
+
+        # cast ephemeris objects
+        return [EphemerisData(**e) for e in raw_data]
+
+    def iter_data(self,
+                  batch_size: int = __STREAM_BATCH_SIZE,
+                  spool_filename: Optional[str] = None) -> Iterator[Union[List[EphemerisData], List[Dict], EphemerisColumnarData]]:
+        """
+        Retrieve the data available for this ephemeris search request, reading and parsing
+        it as it is downloaded. Batches of records are yielded as soon as they have been
+        received, and the `data` attribute is not set.
+
+        This is useful for very large search results, which would otherwise need to be
+        held in memory all at once.
+
+        Args:
+            batch_size (int): 
+                The number of records in each batch, defaults to 10000
+
+            spool_filename (str): 
+                Save the raw data to this file as it is downloaded, so that it can be read
+                again later using `pyaurorax.search.requests.RequestsManager.iter_data_file()`.
+                Defaults to None.
+
+        Yields:
+            Lists of `EphemerisData` objects, or `EphemerisColumnarData` objects if the
+            `columnar` result container is used
 
-            # cast ephemeris objects
-            self.data = [EphemerisData(**e) for e in raw_data]
+        Raises:
+            pyaurorax.exceptions.AuroraXDataRetrievalError: Error retrieving data
+        """
+        # check if completed yet
+        if (self.completed is False):
+            print("No data available, update status or check for data first")
+            return
+
+        # get data
+        skip_serializing = self.result_container == "columnar"
+        for raw_data in requests_iter_data(self.__aurorax_obj, self.data_url, self.response_format, skip_serializing, batch_size, spool_filename):
+            yield self.__cast_data(raw_data)
 
     def wait(self, poll_interval: float = __STANDARD_POLLING_SLEEP_TIME, verbose: bool = False) -> None:
         """
@@ -0,0 +1,79 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Class definition for the results of a fan-out search
+"""
+
+import datetime
+from dataclasses import dataclass, field
+from typing import List, Tuple, Literal, Any
+
+
+@dataclass
+class FanOutSearchResult:
+    """
+    The merged results of a search that was split into several time windows.
+
+    Attributes:
+        search_type (str): 
+            The type of search performed, either `ephemeris`, `data_products`, or `conjunctions`
+
+        start (datetime.datetime): 
+            Start timestamp of the full search
+
+        end (datetime.datetime): 
+            End timestamp of the full search
+
+        data (List): 
+            The merged records from all windows, in time order and with duplicates removed
+
+        searches (List): 
+            The `EphemerisSearch`, `DataProductSearch`, or `ConjunctionSearch` object for each
+            successful window, in time order
+
+        failed_windows (List[Tuple[datetime.datetime, datetime.datetime, Exception]]): 
+            The start, end, and last error of each window that failed after all retries. This
+            is only populated if partial results were allowed.
+    """
+    search_type: Literal["ephemeris", "data_products", "conjunctions"]
+    start: datetime.datetime
+    end: datetime.datetime
+    data: List[Any] = field(default_factory=list)
+    searches: List[Any] = field(default_factory=list)
+    failed_windows: List[Tuple[datetime.datetime, datetime.datetime, Exception]] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return "FanOutSearchResult(search_type='%s', start=%s, end=%s, data=[%d records], searches=[%d searches], failed_windows=[%d windows])" % (
+            self.search_type,
+            repr(self.start),
+            repr(self.end),
+            len(self.data),
+            len(self.searches),
+            len(self.failed_windows),
+        )
+
+    def pretty_print(self):
+        """
+        A special print output for this class.
+        """
+        print("FanOutSearchResult:")
+        print("  %-16s: %s" % ("search_type", self.search_type))
+        print("  %-16s: %s" % ("start", self.start))
+        print("  %-16s: %s" % ("end", self.end))
+        print("  %-16s: [%d records]" % ("data", len(self.data)))
+        print("  %-16s: [%d searches]" % ("searches", len(self.searches)))
+        print("  %-16s: [%d windows]" % ("failed_windows", len(self.failed_windows)))
@@ -36,6 +36,10 @@ class Location:
         ValueError: if both latitude and longitude are not real numbers, or not both None.
     """
 
+    # NOTE: slots avoid a per-object dictionary, since search results can hold
+    # millions of these objects
+    __slots__ = ("__lat", "__lon")
+
     def __init__(self, lat: Optional[float] = None, lon: Optional[float] = None):
         if (lat is None and lon is not None) or (lat is not None and lon is None):
             # one of them is None, not allowed
@@ -80,3 +84,51 @@ class Location:
 
     def __repr__(self) -> str:
         return "%s(lat=%s, lon=%s)" % (self.__class__.__name__, str(self.lat), str(self.lon))
+
+
+class FrozenLocation(Location):
+    """
+    An immutable `Location`. Values are set when the object is created and can't be
+    changed afterwards, which allows a single object to be shared between many records.
+    Frozen locations are hashable, and compare equal to any location with the same
+    latitude and longitude.
+
+    Attributes:
+        lat (float): latitude value
+        lon (float): longitude value
+
+    Raises:
+        ValueError: if both latitude and longitude are not real numbers, or not both None.
+    """
+
+    __slots__ = ()
+
+    def __readonly(self, value):
+        raise AttributeError("%s values can't be changed, create a new Location instead" % (self.__class__.__name__))
+
+    lat = property(Location.lat.fget, __readonly)
+    lon = property(Location.lon.fget, __readonly)
+
+    def __eq__(self, other) -> bool:
+        if (isinstance(other, Location) is False):
+            return NotImplemented
+        return (self.lat == other.lat and self.lon == other.lon)
+
+    def __hash__(self) -> int:
+        return hash((self.lat, self.lon))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (self.lat, self.lon))
+
+
+EMPTY_LOCATION = FrozenLocation(lat=None, lon=None)
+"""
+Shared immutable location with no latitude or longitude, used for records that have
+no value for a location
+"""
@@ -58,7 +58,8 @@ class MetadataManager:
 
     def get_ephemeris_schema(self, identifier: int) -> List[Dict]:
         """
-        Retrieve the ephemeris metadata schema for a data source
+        Retrieve the ephemeris metadata schema for a data source. The data source is looked up
+        using the local catalog of data sources (see `pyaurorax.search.sources.DataSourceCatalog`).
 
         Args:
             identifier (int): 
@@ -66,12 +67,16 @@ class MetadataManager:
 
         Returns:
             The ephemeris metadata schema for the data source
+
+        Raises:
+            pyaurorax.exceptions.AuroraXAPIError: Data source not found, or error during API call
         """
         return func_get_ephemeris_schema(self.__aurorax_obj, identifier)
 
     def get_data_products_schema(self, identifier: int) -> List[Dict]:
         """
-        Retrieve the data products metadata schema for a data source
+        Retrieve the data products metadata schema for a data source. The data source is looked up
+        using the local catalog of data sources (see `pyaurorax.search.sources.DataSourceCatalog`).
 
         Args:
             identifier (int): 
@@ -79,5 +84,8 @@ class MetadataManager:
 
         Returns:
             The data products metadata schema for the data source
+
+        Raises:
+            pyaurorax.exceptions.AuroraXAPIError: Data source not found, or error during API call
         """
         return func_get_data_products_schema(self.__aurorax_obj, identifier)
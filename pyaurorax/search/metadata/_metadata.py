@@ -16,7 +16,7 @@ Functions for interacting with metadata filters
 """
 
 from ..sources import FORMAT_FULL_RECORD
-from ..sources._sources import get_using_identifier
+from ...exceptions import AuroraXAPIError, AuroraXNotFoundError
 
 
 def validate(schema, record, quiet):
@@ -34,9 +34,18 @@ def validate(schema, record, quiet):
     return True
 
 
+def __get_data_source(aurorax_obj, identifier):
+    # NOTE: a missing data source has always surfaced from the schema functions as
+    # an AuroraXAPIError, so we translate the catalog's not-found error to keep that
+    try:
+        return aurorax_obj.search.sources.catalog.get_using_identifier(identifier, FORMAT_FULL_RECORD)
+    except AuroraXNotFoundError as e:
+        raise AuroraXAPIError("Data source with identifier %d could not be found" % (identifier)) from e
+
+
 def get_ephemeris_schema(aurorax_obj, identifier):
-    # get the data source
-    source_info = get_using_identifier(aurorax_obj, identifier, FORMAT_FULL_RECORD, False)
+    # get the data source, from the local catalog
+    source_info = __get_data_source(aurorax_obj, identifier)
 
     # if there's an ephemeris metadata schema, return it
     if source_info.ephemeris_metadata_schema:  # pragma: nocover-ok
@@ -46,8 +55,8 @@ def get_ephemeris_schema(aurorax_obj, identifier):
 
 
 def get_data_products_schema(aurorax_obj, identifier):
-    # get the data source
-    source_info = get_using_identifier(aurorax_obj, identifier, FORMAT_FULL_RECORD, False)
+    # get the data source, from the local catalog
+    source_info = __get_data_source(aurorax_obj, identifier)
 
     # if there's a data products metadata schema, return it
     if source_info.data_product_metadata_schema:  # pragma: nocover-ok
@@ -21,16 +21,22 @@ here instead of digging in deeper to the submodules.
 """
 
 import datetime
-from typing import Dict, List, Optional, Literal
+from typing import Dict, List, Optional, Literal, Iterator
 from ._requests import get_status as func_get_status
 from ._requests import get_data as func_get_data
+from ._requests import iter_data as func_iter_data
+from ._requests import iter_data_file as func_iter_data_file
 from ._requests import get_logs as func_get_logs
 from ._requests import wait_for_data as func_wait_for_data
 from ._requests import list as func_list
 from ._requests import delete as func_delete
 from ._requests import cancel as func_cancel
+from .classes.monitor import SearchRequestMonitor
 
-__all__ = ["RequestsManager"]
+__all__ = [
+    "RequestsManager",
+    "SearchRequestMonitor",
+]
 
 
 class RequestsManager:
@@ -40,9 +46,20 @@ class RequestsManager:
     """
 
     __STANDARD_POLLING_SLEEP_TIME: float = 1.0  # Polling sleep time when waiting for data (after the initial sleep time), in seconds
+    __STREAM_BATCH_SIZE: int = 10000  # Number of records in each batch when streaming data
 
     def __init__(self, aurorax_obj):
         self.__aurorax_obj = aurorax_obj
+        self.__monitor = SearchRequestMonitor(aurorax_obj)
+
+    @property
+    def monitor(self) -> SearchRequestMonitor:
+        """
+        A monitor that tracks many outstanding search requests from a single background
+        thread, completing a future for each one when its data is available. See
+        `pyaurorax.search.requests.SearchRequestMonitor` for details.
+        """
+        return self.__monitor
 
     def get_status(self, request_url: str) -> Dict:
         """
@@ -79,6 +96,77 @@ class RequestsManager:
         """
         return func_get_data(self.__aurorax_obj, data_url, response_format, skip_serializing)
 
+    def iter_data(self,
+                  data_url: str,
+                  response_format: Optional[Dict] = None,
+                  skip_serializing: bool = False,
+                  batch_size: int = __STREAM_BATCH_SIZE,
+                  spool_filename: Optional[str] = None) -> Iterator[List]:
+        """
+        Retrieve the data for a request, reading and parsing it as it is downloaded
+
+        Unlike `get_data()`, the full response is never held in memory. Records are yielded
+        in batches as soon as they have been received, which is useful for very large
+        search results.
+
+        Args:
+            data_url (str): 
+                The URL for the data of a request
+
+            response_format (Dict): 
+                The response format to send as post data, defaults to None
+
+            skip_serializing (bool): 
+                Skip any object serializing, defaults to False
+
+            batch_size (int): 
+                The number of records in each batch, defaults to 10000
+
+            spool_filename (str): 
+                Save the raw data to this file as it is downloaded, so that it can be read
+                again later using `iter_data_file()`. The file is only created if all data
+                was received. Defaults to None.
+
+        Raises:
+            pyaurorax.exceptions.AuroraXDataRetrievalError: Error retrieving data
+
+        Returns:
+            An iterator of lists of records
+        """
+        return func_iter_data(self.__aurorax_obj, data_url, response_format, skip_serializing, batch_size, spool_filename)
+
+    def iter_data_file(self,
+                       filename: str,
+                       search_type: Optional[Literal["ephemeris", "conjunctions", "data_products"]] = None,
+                       skip_serializing: bool = False,
+                       batch_size: int = __STREAM_BATCH_SIZE) -> Iterator[List]:
+        """
+        Read the data for a request that was previously saved to a file, parsing it in chunks. See
+        `iter_data()` for more details.
+
+        Args:
+            filename (str): 
+                The file that the data was saved to
+
+            search_type (str): 
+                The type of search that the data is for, used to serialize the records. Valid
+                options are `ephemeris`, `conjunctions`, and `data_products`. Defaults to None,
+                meaning that no serializing is done.
+
+            skip_serializing (bool): 
+                Skip any object serializing, defaults to False
+
+            batch_size (int): 
+                The number of records in each batch, defaults to 10000
+
+        Raises:
+            pyaurorax.exceptions.AuroraXDataRetrievalError: Invalid data was found in the file
+
+        Returns:
+            An iterator of lists of records
+        """
+        return func_iter_data_file(filename, search_type, skip_serializing, batch_size)
+
     def get_logs(self, request_url: str) -> List:
         """
         Retrieve the logs for a request
@@ -15,10 +15,14 @@
 Functions for interacting with AuroraX requests
 """
 
+import os
+import uuid
 import datetime
 import time
+import numpy as np
+from ._stream import ResultStreamParser
 from ..api.classes.request import AuroraXAPIRequest
-from ..location import Location
+from ..location import Location, EMPTY_LOCATION
 from ...exceptions import (
     AuroraXDataRetrievalError,
     AuroraXAPIError,
@@ -26,6 +30,67 @@ from ...exceptions import (
 )
 
 __ALLOWED_SEARCH_LISTING_TYPES = ["conjunction", "data_product", "ephemeris"]
+__STREAM_CHUNK_SIZE = 1024 * 1024  # number of bytes to read at a time when streaming data
+__DESERIALIZATION_SCHEMAS = {
+    "ephemeris": {
+        "timestamps": ["epoch"],
+        "locations": ["location_geo", "location_gsm", "nbtrace", "sbtrace"],
+        "event_timestamps": [],
+    },
+    "conjunctions": {
+        "timestamps": ["farthest_epoch", "closest_epoch", "start", "end"],
+        "locations": [],
+        "event_timestamps": ["start", "end"],
+    },
+    "data_products": {
+        "timestamps": ["start", "end"],
+        "locations": [],
+        "event_timestamps": [],
+    },
+}
+
+
+def __get_search_type(data_url):
+    # determine the type of search from the data URL
+    for search_type in ["ephemeris", "conjunctions", "data_products"]:
+        if (search_type in data_url):
+            return search_type
+    return None
+
+
+def __deserialize_timestamps(records, field):
+    # find the records with this field, and parse all of their timestamps at once
+    idx_list = [i for i in range(0, len(records)) if isinstance(records[i].get(field), str)]
+    if (len(idx_list) == 0):
+        return
+    timestamps = np.array([records[i][field] for i in idx_list], dtype="datetime64[s]").tolist()
+    for i, timestamp in zip(idx_list, timestamps, strict=True):
+        records[i][field] = timestamp
+
+
+def __deserialize_locations(records, field):
+    for record in records:
+        value = record.get(field)
+        if (isinstance(value, dict) is True):
+            if (value["lat"] is None and value["lon"] is None):
+                # share a single object for empty locations, which are common (ie. GSM
+                # locations for ground-based instruments)
+                record[field] = EMPTY_LOCATION
+            else:
+                record[field] = Location(lat=value["lat"], lon=value["lon"])
+
+
+def __deserialize(search_type, data_result):
+    # serialize each field in the schema for this search type, across all records
+    schema = __DESERIALIZATION_SCHEMAS[search_type]
+    for field in schema["timestamps"]:
+        __deserialize_timestamps(data_result, field)
+    for field in schema["locations"]:
+        __deserialize_locations(data_result, field)
+    if (len(schema["event_timestamps"]) > 0):
+        events = [event for record in data_result if record.get("events") is not None for event in record["events"]]
+        for field in schema["event_timestamps"]:
+            __deserialize_timestamps(events, field)
 
 
 def get_status(aurorax_obj, request_url):
@@ -63,48 +128,101 @@ def get_data(aurorax_obj, data_url, response_format, skip_serializing):
     # NOTE: this is primarily used when searches were done where the response_format
     # parameter was specified. So we like to serialize a few fields
     if (skip_serializing is False):
-        for i in range(0, len(data_result)):
-            # ephemeris serializing
-            if ("ephemeris" in data_url):
-                if ("epoch" in data_result[i]):
-                    data_result[i]["epoch"] = datetime.datetime.strptime(data_result[i]["epoch"], "%Y-%m-%dT%H:%M:%S")
-                if ("location_geo" in data_result[i]):
-                    data_result[i]["location_geo"] = Location(lat=data_result[i]["location_geo"]["lat"], lon=data_result[i]["location_geo"]["lon"])
-                if ("location_gsm" in data_result[i]):
-                    data_result[i]["location_gsm"] = Location(lat=data_result[i]["location_gsm"]["lat"], lon=data_result[i]["location_gsm"]["lon"])
-                if ("nbtrace" in data_result[i]):
-                    data_result[i]["nbtrace"] = Location(lat=data_result[i]["nbtrace"]["lat"], lon=data_result[i]["nbtrace"]["lon"])
-                if ("sbtrace" in data_result[i]):
-                    data_result[i]["sbtrace"] = Location(lat=data_result[i]["sbtrace"]["lat"], lon=data_result[i]["sbtrace"]["lon"])
-
-            # conjunction serializing
-            if ("conjunctions" in data_url):
-                if ("farthest_epoch" in data_result[i]):
-                    data_result[i]["farthest_epoch"] = datetime.datetime.strptime(data_result[i]["farthest_epoch"], "%Y-%m-%dT%H:%M:%S")
-                if ("closest_epoch" in data_result[i]):
-                    data_result[i]["closest_epoch"] = datetime.datetime.strptime(data_result[i]["closest_epoch"], "%Y-%m-%dT%H:%M:%S")
-                if ("start" in data_result[i]):
-                    data_result[i]["start"] = datetime.datetime.strptime(data_result[i]["start"], "%Y-%m-%dT%H:%M:%S")
-                if ("end" in data_result[i]):
-                    data_result[i]["end"] = datetime.datetime.strptime(data_result[i]["end"], "%Y-%m-%dT%H:%M:%S")
-                if ("events" in data_result[i]):
-                    for j in range(0, len(data_result[i]["events"])):
-                        if ("start" in data_result[i]["events"][j]):
-                            data_result[i]["events"][j]["start"] = datetime.datetime.strptime(data_result[i]["events"][j]["start"],
-                                                                                              "%Y-%m-%dT%H:%M:%S")
-                        if ("end" in data_result[i]["events"][j]):
-                            data_result[i]["events"][j]["end"] = datetime.datetime.strptime(data_result[i]["events"][j]["end"], "%Y-%m-%dT%H:%M:%S")
-
-            if ("data_products" in data_url):
-                if ("start" in data_result[i]):
-                    data_result[i]["start"] = datetime.datetime.strptime(data_result[i]["start"], "%Y-%m-%dT%H:%M:%S")
-                if ("end" in data_result[i]):
-                    data_result[i]["end"] = datetime.datetime.strptime(data_result[i]["end"], "%Y-%m-%dT%H:%M:%S")
+        search_type = __get_search_type(data_url)
+        if (search_type is not None):
+            __deserialize(search_type, data_result)
 
     # return
     return data_result
 
 
+def __spool_chunks(chunks, spool_filename):
+    # write the chunks to a file as they pass through, only keeping the file
+    # if all the data was received
+    tmp_filename = "%s.tmp_%s" % (spool_filename, uuid.uuid4().hex)
+    completed = False
+    try:
+        with open(tmp_filename, "wb") as fp:
+            for chunk in chunks:
+                fp.write(chunk)
+                yield chunk
+        completed = True
+    finally:
+        if (completed is True):
+            os.replace(tmp_filename, spool_filename)
+        elif (os.path.exists(tmp_filename) is True):
+            os.remove(tmp_filename)
+
+
+def __iter_batches(chunks, search_type, skip_serializing, batch_size, spool_filename):
+    # check batch size
+    if (batch_size < 1):
+        raise ValueError("The batch_size value must be at least 1")
+
+    # set up parser
+    if (spool_filename is not None):
+        chunks = __spool_chunks(chunks, spool_filename)
+    parser = ResultStreamParser(chunks)
+
+    # parse records, yielding them in batches
+    batch = []
+    for record in parser:
+        batch.append(record)
+        if (len(batch) >= batch_size):
+            if (skip_serializing is False and search_type is not None):
+                __deserialize(search_type, batch)
+            yield batch
+            batch = []
+
+    # check for error message
+    if ("error" in parser.extra):  # pragma: nocover
+        raise AuroraXDataRetrievalError("%s: %s" % (
+            parser.extra["error"]["error_code"],
+            parser.extra["error"]["error_message"],
+        ))
+
+    # yield last batch
+    if (len(batch) > 0):
+        if (skip_serializing is False and search_type is not None):
+            __deserialize(search_type, batch)
+        yield batch
+
+
+def iter_data(aurorax_obj, data_url, response_format, skip_serializing, batch_size, spool_filename):
+    # do request, without reading the body
+    try:
+        if (response_format is not None):
+            req = AuroraXAPIRequest(aurorax_obj, method="post", url=data_url, body=response_format, stream=True)
+        else:
+            req = AuroraXAPIRequest(aurorax_obj, method="get", url=data_url, stream=True)
+        res = req.execute()
+    except Exception as e:  # pragma: nocover
+        raise AuroraXDataRetrievalError("unable to retrieve data (likely there is none)") from e
+
+    # read and parse the body as it arrives
+    http_response = res.request
+    try:
+        yield from __iter_batches(
+            http_response.iter_content(chunk_size=__STREAM_CHUNK_SIZE),
+            __get_search_type(data_url),
+            skip_serializing,
+            batch_size,
+            spool_filename,
+        )
+    finally:
+        http_response.close()
+
+
+def iter_data_file(filename, search_type, skip_serializing, batch_size):
+    # check search type
+    if (search_type is not None and search_type not in __DESERIALIZATION_SCHEMAS):
+        raise ValueError("Invalid search_type '%s'. Must be one of 'ephemeris', 'conjunctions', or 'data_products'." % (search_type))
+
+    # read and parse the file in chunks
+    with open(filename, "rb") as fp:
+        yield from __iter_batches(iter(lambda: fp.read(__STREAM_CHUNK_SIZE), b""), search_type, skip_serializing, batch_size, None)
+
+
 def get_logs(aurorax_obj, request_url):
     # get status
     status = get_status(aurorax_obj, request_url)
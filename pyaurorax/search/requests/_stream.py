@@ -0,0 +1,112 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Incremental parsing of search result data
+"""
+
+import re
+import json
+import codecs
+from ...exceptions import AuroraXDataRetrievalError
+
+
+class ResultStreamParser:
+    """
+    Incrementally parse a JSON object of the form `{"result": [...]}` from an iterable of byte
+    chunks, yielding each element of the `result` array as soon as it has been received. Only
+    the partially received element is kept in memory. Any other top-level keys are saved in
+    the `extra` dictionary.
+    """
+
+    __WHITESPACE = re.compile(r"[ \t\n\r]*")
+    __NUMBER_CHARS = "0123456789+-.eE"
+
+    def __init__(self, chunks):
+        self.__chunks = iter(chunks)
+        self.__decoder = json.JSONDecoder()
+        self.__utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+        self.extra = {}
+
+    def __read_more(self):
+        # drop the data already parsed, and add the next chunk
+        try:
+            chunk = next(self.__chunks)
+        except StopIteration:
+            chunk = None
+        if (chunk is None):
+            self.__buffer = self.__buffer[self.__pos:] + self.__utf8_decoder.decode(b"", final=True)
+            self.__eof = True
+        else:
+            self.__buffer = self.__buffer[self.__pos:] + self.__utf8_decoder.decode(chunk)
+        self.__pos = 0
+
+    def __peek(self):
+        # skip whitespace, and return the next character
+        while (True):
+            self.__pos = self.__WHITESPACE.match(self.__buffer, self.__pos).end()
+            if (self.__pos < len(self.__buffer)):
+                return self.__buffer[self.__pos]
+            if (self.__eof is True):
+                raise AuroraXDataRetrievalError("Unexpected end of data received")
+            self.__read_more()
+
+    def __expect(self, allowed_chars):
+        char = self.__peek()
+        if (char not in allowed_chars):
+            raise AuroraXDataRetrievalError("Invalid data received, expected one of '%s' but found '%s'" % (allowed_chars, char))
+        self.__pos += 1
+        return char
+
+    def __decode_value(self):
+        self.__peek()
+        while (True):
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__pos)
+            except json.JSONDecodeError as e:
+                # likely incomplete, unless there's no more data
+                if (self.__eof is True):
+                    raise AuroraXDataRetrievalError("Invalid data received: %s" % (str(e))) from e
+            else:
+                # a number may continue in the next chunk, so we need to see the character
+                # after the value first
+                if (self.__eof is True or (end < len(self.__buffer) and self.__buffer[end] not in self.__NUMBER_CHARS)):
+                    self.__pos = end
+                    return value
+            self.__read_more()
+
+    def __iter__(self):
+        self.__expect("{")
+        if (self.__peek() == "}"):
+            self.__pos += 1
+            return
+        while (True):
+            key = self.__decode_value()
+            self.__expect(":")
+            if (key == "result" and self.__peek() == "["):
+                # yield each element of the result array
+                self.__pos += 1
+                if (self.__peek() == "]"):
+                    self.__pos += 1
+                else:
+                    while (True):
+                        yield self.__decode_value()
+                        if (self.__expect(",]") == "]"):
+                            break
+            else:
+                self.extra[key] = self.__decode_value()
+            if (self.__expect(",}") == "}"):
+                break
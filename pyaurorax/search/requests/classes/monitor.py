@@ -0,0 +1,365 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Class definition for a monitor of outstanding search requests
+"""
+
+import time
+import heapq
+import statistics
+import threading
+import itertools
+import collections
+import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from .._requests import get_status as func_get_status
+from ....exceptions import AuroraXError, AuroraXSearchError
+
+
+class SearchRequestMonitor:
+    """
+    Tracks many outstanding search requests from a single background thread, and completes
+    a `concurrent.futures.Future` for each one when its data is available.
+
+    Instead of each search sleeping for a fixed interval in its own loop, the monitor keeps
+    one schedule for all requests. Each request is checked again around the time that similar
+    searches have taken to complete (based on the `query_duration` of recently completed
+    requests of the same search type), and with increasing intervals after that. Status checks
+    that are due are done by a small pool of worker threads, and once a search is done, its
+    data is retrieved by the same worker right away.
+
+    The background thread is started when a request is added, and stops once there are no
+    requests left to track.
+
+    A monitor is initialized within every PyAuroraX object, and is accessible at
+    `pyaurorax.search.requests.monitor`. Additional monitors with different settings can
+    be created using this class.
+
+    Attributes:
+        min_poll_interval (float): 
+            The shortest time between status checks of a request, in seconds. Defaults to 0.5.
+
+        max_poll_interval (float): 
+            The longest time between status checks of a request, in seconds. Defaults to 10.
+
+        backoff_factor (float): 
+            The amount the time between status checks grows by each time, once a request
+            has taken longer than expected. Defaults to 1.5.
+
+        max_workers (int): 
+            The number of threads used for checking the status of requests and retrieving
+            data of completed searches. Defaults to 4.
+
+    Raises:
+        ValueError: invalid parameters were supplied
+    """
+
+    __MAX_STATUS_ERRORS = 3  # number of failed status checks in a row before a request is failed
+    __DURATION_HISTORY_SIZE = 20  # number of recent query durations kept for each search type
+    __SEARCH_TYPES = ["ephemeris", "conjunctions", "data_products"]
+
+    def __init__(self,
+                 aurorax_obj,
+                 min_poll_interval: float = 0.5,
+                 max_poll_interval: float = 10.0,
+                 backoff_factor: float = 1.5,
+                 max_workers: int = 4):
+        # check parameters
+        if (min_poll_interval <= 0):
+            raise ValueError("The min_poll_interval value must be greater than 0")
+        if (max_poll_interval < min_poll_interval):
+            raise ValueError("The max_poll_interval value must be greater than or equal to min_poll_interval")
+        if (backoff_factor < 1):
+            raise ValueError("The backoff_factor value must be at least 1")
+        if (max_workers < 1):
+            raise ValueError("The max_workers value must be at least 1")
+
+        # set values
+        self.__aurorax_obj = aurorax_obj
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.max_workers = max_workers
+
+        # initialize state
+        self.__condition = threading.Condition()
+        self.__schedule = []  # heap of (next check time, sequence number, entry)
+        self.__sequence = itertools.count()
+        self.__durations = {}
+        self.__n_pending = 0
+        self.__thread = None
+        self.__executor = None
+        self.__closed = False
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return "SearchRequestMonitor(pending=%d, min_poll_interval=%s, max_poll_interval=%s, backoff_factor=%s, closed=%s)" % (
+            self.pending_count,
+            self.min_poll_interval,
+            self.max_poll_interval,
+            self.backoff_factor,
+            self.__closed,
+        )
+
+    @property
+    def pending_count(self) -> int:
+        """
+        The number of requests being tracked, including those having their data retrieved
+        """
+        with self.__condition:
+            return self.__n_pending
+
+    @property
+    def expected_durations(self) -> Dict[str, float]:
+        """
+        The expected time for a search to complete for each search type, in seconds. This is
+        the median `query_duration` of recently completed requests seen by this monitor.
+        """
+        with self.__condition:
+            return {search_type: statistics.median(durations) for search_type, durations in self.__durations.items() if len(durations) > 0}
+
+    def submit(self, search: Any, fetch_data: bool = True, callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """
+        Start tracking a search request.
+
+        Args:
+            search (EphemerisSearch or DataProductSearch or ConjunctionSearch or str): 
+                A search that has been executed, or the URL of a search request.
+
+            fetch_data (bool): 
+                Retrieve the data for the search as soon as it is available, defaults to True.
+                Only used for search objects.
+
+            callback (Callable): 
+                A function to call with the future once it is done, optional. This is the
+                same as calling `add_done_callback()` on the future.
+
+        Returns:
+            A `concurrent.futures.Future`. For search objects, the result is the search object,
+            with its status updated and data retrieved (if `fetch_data` is True). For request
+            URLs, the result is the status of the request. If the search fails, the future's
+            exception is set instead. Cancelling the future stops tracking the request, but does
+            not cancel the search request itself.
+
+        Raises:
+            ValueError: the search has not been executed
+            pyaurorax.exceptions.AuroraXError: the monitor has been shut down
+        """
+        # get request URL
+        if (isinstance(search, str) is True):
+            request_url = search
+            search = None
+        else:
+            request_url = getattr(search, "request_url", "")
+            if (request_url == "" or request_url is None):
+                raise ValueError("The search must be executed before it can be monitored")
+
+        # create entry
+        future = Future()
+        entry = {
+            "search": search,
+            "request_url": request_url,
+            "search_type": self.__get_search_type(request_url),
+            "fetch_data": fetch_data,
+            "future": future,
+            "submitted": time.monotonic(),
+            "n_checks_late": 0,
+            "n_errors": 0,
+        }
+        if (callback is not None):
+            future.add_done_callback(callback)
+
+        # schedule first status check, and start the background thread if needed
+        with self.__condition:
+            if (self.__closed is True):
+                raise AuroraXError("The monitor has been shut down")
+            self.__n_pending += 1
+            self.__schedule_check(entry)
+
+        # return
+        return future
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """
+        Stop the monitor. Requests that are being tracked are no longer checked.
+
+        Args:
+            cancel_pending (bool): 
+                Cancel the futures of requests that are still being tracked, defaults to True.
+                If False, they are left unfinished.
+        """
+        # stop the background thread, once it finishes checking any requests that are due
+        with self.__condition:
+            self.__closed = True
+            thread = self.__thread
+            self.__condition.notify()
+        if (thread is not None and thread is not threading.current_thread()):
+            thread.join()
+
+        # wait for any status checks and data retrievals in progress, then cancel futures
+        if (self.__executor is not None):
+            self.__executor.shutdown(wait=True)
+        with self.__condition:
+            pending = [item[2] for item in self.__schedule]
+            self.__schedule = []
+        for entry in pending:
+            if (cancel_pending is True and entry["future"].cancel() is True):
+                self.__set_done(entry)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def __get_search_type(self, request_url):
+        for search_type in self.__SEARCH_TYPES:
+            if (search_type in request_url):
+                return search_type
+        return None
+
+    def __get_check_delay(self, entry):
+        # wait until around the time similar searches have taken to complete
+        elapsed = time.monotonic() - entry["submitted"]
+        expected = self.expected_durations.get(entry["search_type"])
+        if (expected is not None and elapsed < expected):
+            return min(max(expected - elapsed, self.min_poll_interval), self.max_poll_interval)
+
+        # otherwise, check at increasing intervals
+        delay = min(self.min_poll_interval * (self.backoff_factor**entry["n_checks_late"]), self.max_poll_interval)
+        entry["n_checks_late"] += 1
+        return delay
+
+    def __schedule_check(self, entry):
+        # NOTE: must be called while holding the condition lock
+        heapq.heappush(self.__schedule, (time.monotonic() + self.__get_check_delay(entry), next(self.__sequence), entry))
+
+        # start the background thread if needed, otherwise wake it up in case this check is due first
+        if (self.__closed is True):
+            return
+        if (self.__thread is None):
+            self.__thread = threading.Thread(target=self.__run, name="SearchRequestMonitor", daemon=True)
+            self.__thread.start()
+        self.__condition.notify()
+
+    def __run(self):
+        while (True):
+            # wait for the next requests to be due
+            with self.__condition:
+                while (True):
+                    if (self.__closed is True or len(self.__schedule) == 0):
+                        self.__thread = None
+                        return
+                    wait_time = self.__schedule[0][0] - time.monotonic()
+                    if (wait_time <= 0):
+                        break
+                    self.__condition.wait(wait_time)
+                due = []
+                while (len(self.__schedule) > 0 and self.__schedule[0][0] <= time.monotonic()):
+                    due.append(heapq.heappop(self.__schedule)[2])
+                if (self.__executor is None):
+                    self.__executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="SearchRequestMonitor")
+                executor = self.__executor
+
+            # check each request
+            for entry in due:
+                executor.submit(self.__check, entry)
+
+    def __check(self, entry):
+        # NOTE: this runs in a worker thread, where an unexpected exception would otherwise be
+        # lost and the future would never complete, so it is set as the future's exception
+        try:
+            self.__check_status(entry)
+        except Exception as e:
+            self.__finish(entry, exception=e)
+
+    def __check_status(self, entry):
+        # stop tracking if the future was cancelled
+        if (entry["future"].cancelled() is True):
+            self.__set_done(entry)
+            return
+
+        # get status
+        try:
+            status = func_get_status(self.__aurorax_obj, entry["request_url"])
+        except (AuroraXError, requests.exceptions.RequestException) as e:
+            entry["n_errors"] += 1
+            if (entry["n_errors"] >= self.__MAX_STATUS_ERRORS):
+                self.__finish(entry, exception=e)
+            else:
+                self.__reschedule(entry)
+            return
+        entry["n_errors"] = 0
+        if (entry["search"] is not None):
+            entry["search"].update_status(status)
+
+        # keep waiting if the search isn't done
+        search_result = status["search_result"]
+        if (search_result["data_uri"] is None and search_result.get("error_condition") is not True):
+            self.__reschedule(entry)
+            return
+
+        # record how long the search took
+        if (search_result.get("query_duration") is not None and entry["search_type"] is not None):
+            with self.__condition:
+                if (entry["search_type"] not in self.__durations):
+                    self.__durations[entry["search_type"]] = collections.deque(maxlen=self.__DURATION_HISTORY_SIZE)
+                self.__durations[entry["search_type"]].append(search_result["query_duration"] / 1000.0)
+
+        # check for an error
+        if (search_result.get("error_condition") is True):
+            logs = status.get("logs", [])
+            summary = logs[-1]["summary"] if len(logs) > 0 else "The search request encountered an error"
+            self.__finish(entry, exception=AuroraXSearchError(summary))
+            return
+
+        # done, retrieve the data if needed
+        if (entry["search"] is None):
+            self.__finish(entry, result=status)
+        elif (entry["fetch_data"] is False):
+            self.__finish(entry, result=entry["search"])
+        else:
+            self.__fetch_data(entry)
+
+    def __reschedule(self, entry):
+        with self.__condition:
+            self.__schedule_check(entry)
+
+    def __set_done(self, entry):
+        with self.__condition:
+            self.__n_pending -= 1
+
+    def __fetch_data(self, entry):
+        if (entry["future"].cancelled() is True):
+            self.__set_done(entry)
+            return
+        try:
+            entry["search"].get_data()
+        except Exception as e:
+            self.__finish(entry, exception=e)
+            return
+        self.__finish(entry, result=entry["search"])
+
+    def __finish(self, entry, result=None, exception=None):
+        # the future was cancelled while the request was being checked
+        self.__set_done(entry)
+        if (entry["future"].set_running_or_notify_cancel() is False):
+            return
+        if (exception is not None):
+            entry["future"].set_exception(exception)
+        else:
+            entry["future"].set_result(result)
@@ -26,6 +26,7 @@ from ._sources import add as func_add
 from ._sources import delete as func_delete
 from ._sources import update as func_update
 from .classes.data_source import DataSource, DataSourceStatistics
+from .classes.catalog import DataSourceCatalog
 from .classes.data_source import (
     FORMAT_BASIC_INFO,
     FORMAT_BASIC_INFO_WITH_METADATA,
@@ -44,6 +45,7 @@ __all__ = [
     "SourcesManager",
     "DataSource",
     "DataSourceStatistics",
+    "DataSourceCatalog",
     "FORMAT_BASIC_INFO",
     "FORMAT_BASIC_INFO_WITH_METADATA",
     "FORMAT_DEFAULT",
@@ -66,6 +68,15 @@ class SourcesManager:
 
     def __init__(self, aurorax_obj):
         self.__aurorax_obj = aurorax_obj
+        self.__catalog = DataSourceCatalog(aurorax_obj)
+
+    @property
+    def catalog(self) -> DataSourceCatalog:
+        """
+        The local catalog of data sources, used for lookups that don't need to make
+        requests to the API. See `pyaurorax.search.sources.DataSourceCatalog` for details.
+        """
+        return self.__catalog
 
     def list(self,
              program: Optional[str] = None,
@@ -75,7 +86,8 @@ class SourcesManager:
              owner: Optional[str] = None,
              format: Optional[str] = FORMAT_FULL_RECORD,
              order: Optional[str] = "identifier",
-             include_stats: Optional[bool] = False) -> List[DataSource]:
+             include_stats: Optional[bool] = False,
+             use_cache: bool = False) -> List[DataSource]:
         """
         Retrieve all data source records. Parameters can be used to filter as desired.
 
@@ -109,12 +121,20 @@ class SourcesManager:
             include_stats (bool): 
                 Include additional stats information about the data source, defaults to `False`
 
+            use_cache (bool): 
+                Use the local catalog of data sources instead of making a request to the API, defaults
+                to `False`. The catalog is refreshed once it is older than the `sources_cache_ttl` value
+                of the PyAuroraX object. Statistics are not cached, so the API is always used if
+                `include_stats` is enabled.
+
         Returns:
             A list of `DataSource` records matching the requested parameters
 
         Raises:
             pyaurorax.exceptions.AuroraXAPIError: Error during API call
         """
+        if (use_cache is True and include_stats is False):
+            return self.__catalog.list(program, platform, instrument_type, source_type, owner, format, order)  # type: ignore
         return func_list(
             self.__aurorax_obj,
             program,
@@ -296,7 +316,8 @@ class SourcesManager:
             platform: str,
             instrument_type: str,
             format: Optional[str] = FORMAT_FULL_RECORD,
-            include_stats: Optional[bool] = False) -> DataSource:
+            include_stats: Optional[bool] = False,
+            use_cache: bool = False) -> DataSource:
         """
         Retrieve a specific data source record
 
@@ -318,6 +339,12 @@ class SourcesManager:
             include_stats (bool): 
                 Include additional stats information about the data source, defaults to `False`
 
+            use_cache (bool): 
+                Use the local catalog of data sources instead of making a request to the API, defaults
+                to `False`. The catalog is refreshed once it is older than the `sources_cache_ttl` value
+                of the PyAuroraX object. Statistics are not cached, so the API is always used if
+                `include_stats` is enabled.
+
         Returns:
             The `DataSource` matching the requested parameters
 
@@ -325,6 +352,8 @@ class SourcesManager:
             pyaurorax.exceptions.AuroraXAPIError: Error during API call
             pyaurorax.exceptions.AuroraXNotFoundError: Source not found
         """
+        if (use_cache is True and include_stats is False):
+            return self.__catalog.get(program, platform, instrument_type, format)  # type: ignore
         return func_get(
             self.__aurorax_obj,
             program,
@@ -342,7 +371,8 @@ class SourcesManager:
                           owner: Optional[str] = None,
                           format: Optional[str] = FORMAT_FULL_RECORD,
                           order: Optional[str] = "identifier",
-                          include_stats: Optional[bool] = False) -> List[DataSource]:
+                          include_stats: Optional[bool] = False,
+                          use_cache: bool = False) -> List[DataSource]:
         """
         Retrieve all data sources matching a filter
 
@@ -376,12 +406,20 @@ class SourcesManager:
             include_stats (bool): 
                 Include additional stats information about the data source, defaults to `False`.
 
+            use_cache (bool): 
+                Use the local catalog of data sources instead of making a request to the API, defaults
+                to `False`. The catalog is refreshed once it is older than the `sources_cache_ttl` value
+                of the PyAuroraX object. Statistics are not cached, so the API is always used if
+                `include_stats` is enabled.
+
         Returns:
             A list of `DataSource` records matching the requested parameters
 
         Raises:
             pyaurorax.exceptions.AuroraXAPIError: Error during API call
         """
+        if (use_cache is True and include_stats is False):
+            return self.__catalog.list(program, platform, instrument_type, source_type, owner, format, order)  # type: ignore
         return func_get_using_filters(
             self.__aurorax_obj,
             program,
@@ -394,7 +432,11 @@ class SourcesManager:
             include_stats,
         )
 
-    def get_using_identifier(self, identifier: int, format: Optional[str] = FORMAT_FULL_RECORD, include_stats: Optional[bool] = False) -> DataSource:
+    def get_using_identifier(self,
+                             identifier: int,
+                             format: Optional[str] = FORMAT_FULL_RECORD,
+                             include_stats: Optional[bool] = False,
+                             use_cache: bool = False) -> DataSource:
         """
         Retrieve data source for a specific identifier
 
@@ -410,12 +452,21 @@ class SourcesManager:
             include_stats (bool): 
                 Include additional stats information about the data source, defaults to `False`
 
+            use_cache (bool): 
+                Use the local catalog of data sources instead of making a request to the API, defaults
+                to `False`. The catalog is refreshed once it is older than the `sources_cache_ttl` value
+                of the PyAuroraX object. Statistics are not cached, so the API is always used if
+                `include_stats` is enabled.
+
         Returns:
             The `DataSource` for the specified identifier
 
         Raises:
             pyaurorax.exceptions.AuroraXAPIError: Error during API call
+            pyaurorax.exceptions.AuroraXNotFoundError: Source not found, when using the local catalog
         """
+        if (use_cache is True and include_stats is False):
+            return self.__catalog.get_using_identifier(identifier, format)  # type: ignore
         return func_get_using_identifier(self.__aurorax_obj, identifier, format, include_stats)
 
     def add(self, data_source: DataSource) -> DataSource:
@@ -436,7 +487,9 @@ class SourcesManager:
             pyaurorax.exceptions.AuroraXUnauthorizedError: Not allowed to perform task, or API key / user permissions are invalid
             pyaurorax.exceptions.AuroraXDuplicateError: Duplicate data source, already exists
         """
-        return func_add(self.__aurorax_obj, data_source)
+        data_source = func_add(self.__aurorax_obj, data_source)
+        self.__catalog.invalidate()
+        return data_source
 
     def delete(self, identifier: int) -> int:
         """
@@ -455,7 +508,9 @@ class SourcesManager:
             pyaurorax.exceptions.AuroraXNotFoundError: Data source not found
             pyaurorax.exceptions.AuroraXConflictError: A conflict occurred
         """
-        return func_delete(self.__aurorax_obj, identifier)
+        result = func_delete(self.__aurorax_obj, identifier)
+        self.__catalog.invalidate()
+        return result
 
     def update(self,
                identifier: int,
@@ -522,7 +577,7 @@ class SourcesManager:
             pyaurorax.exceptions.AuroraXUnauthorizedError: Not allowed to perform task, or API key / user permissions are invalid
             pyaurorax.exceptions.AuroraXNotFoundError: Data source not found
         """
-        return func_update(
+        data_source = func_update(
             self.__aurorax_obj,
             identifier,
             program,
@@ -536,3 +591,5 @@ class SourcesManager:
             ephemeris_metadata_schema,
             data_product_metadata_schema,
         )
+        self.__catalog.invalidate()
+        return data_source
@@ -0,0 +1,375 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Class definition for a local catalog of AuroraX data sources
+"""
+
+import os
+import copy
+import json
+import time
+import uuid
+import datetime
+import threading
+from typing import Optional, List, Dict
+from .data_source import (
+    DataSource,
+    FORMAT_BASIC_INFO,
+    FORMAT_BASIC_INFO_WITH_METADATA,
+    FORMAT_IDENTIFIER_ONLY,
+    FORMAT_FULL_RECORD,
+)
+from .._sources import list as func_list
+from .._sources import get as func_get
+from .._sources import get_using_identifier as func_get_using_identifier
+from ...._util import show_warning
+from ....exceptions import AuroraXNotFoundError
+
+
+class DataSourceCatalog:
+    """
+    A local catalog of all AuroraX data sources. All data source records are retrieved at once, and
+    kept in memory indexed by identifier and by program, platform, and instrument type, so that
+    repeated lookups don't need to make requests to the API.
+
+    The catalog is refreshed automatically once it is older than the `sources_cache_ttl` value of the
+    PyAuroraX object, and is invalidated whenever a data source is added, updated, or deleted using
+    this library. If the `sources_cache_path` value is set, the catalog is also saved to that file
+    and re-used between sessions while it is still within the TTL.
+
+    The catalog is initialized within every PyAuroraX object, and is accessible at
+    `pyaurorax.search.sources.catalog`.
+    """
+
+    __MISS_REFRESH_INTERVAL = 30.0  # minimum time between refreshes due to lookups that weren't found, in seconds
+    __CACHE_FILE_VERSION = 1
+    __FORMAT_FIELDS = {
+        FORMAT_IDENTIFIER_ONLY: ["identifier"],
+        FORMAT_BASIC_INFO: ["identifier", "program", "platform", "instrument_type", "source_type", "display_name"],
+        FORMAT_BASIC_INFO_WITH_METADATA: ["identifier", "program", "platform", "instrument_type", "source_type", "display_name", "metadata"],
+    }
+
+    def __init__(self, aurorax_obj):
+        self.__aurorax_obj = aurorax_obj
+        self.__lock = threading.RLock()
+        self.__records = []
+        self.__by_identifier = {}
+        self.__by_name = {}
+        self.__sorted_records = {}
+        self.__refreshed_at = None
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return "DataSourceCatalog(sources=[%d records], last_refreshed=%s, ttl=%s, enabled=%s)" % (
+            len(self.__records),
+            repr(self.last_refreshed),
+            self.ttl,
+            self.enabled,
+        )
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    @property
+    def ttl(self) -> float:
+        """
+        The time, in seconds, that the catalog is used for before being refreshed. This is
+        the `sources_cache_ttl` value of the PyAuroraX object.
+        """
+        return self.__aurorax_obj.sources_cache_ttl
+
+    @property
+    def enabled(self) -> bool:
+        """
+        False if caching is disabled (ie. the TTL is 0), in which case lookups are always made
+        using the API
+        """
+        return (self.ttl > 0)
+
+    @property
+    def last_refreshed(self) -> Optional[datetime.datetime]:
+        """
+        The time that the data sources in the catalog were retrieved from the API, or None if
+        they haven't been yet
+        """
+        if (self.__refreshed_at is None):
+            return None
+        return datetime.datetime.fromtimestamp(self.__refreshed_at)
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        True if the catalog has not been retrieved yet, or is older than the TTL
+        """
+        return (self.__refreshed_at is None or time.time() - self.__refreshed_at > self.ttl)
+
+    def refresh(self) -> None:
+        """
+        Retrieve all data sources from the API, replacing the contents of the catalog, and save
+        them to the `sources_cache_path` file if it is set.
+
+        Raises:
+            pyaurorax.exceptions.AuroraXAPIError: Error during API call
+        """
+        # get all data sources, as full records
+        sources = func_list(self.__aurorax_obj, None, None, None, None, None, FORMAT_FULL_RECORD, "identifier", False)
+        records = [self.__to_dict(ds) for ds in sources]
+
+        # update catalog
+        with self.__lock:
+            self.__set_records(records, time.time())
+            self.__save()
+
+    def invalidate(self) -> None:
+        """
+        Clear the catalog, and remove the `sources_cache_path` file if it exists. The data sources
+        will be retrieved again on the next lookup.
+        """
+        with self.__lock:
+            self.__set_records([], None)
+            cache_path = self.__aurorax_obj.sources_cache_path
+            if (cache_path is not None and os.path.exists(cache_path) is True):
+                try:
+                    os.remove(cache_path)
+                except OSError:  # pragma: nocover-ok
+                    pass
+
+    def get_using_identifier(self, identifier: int, format: str = FORMAT_FULL_RECORD) -> DataSource:
+        """
+        Look up a data source using its identifier.
+
+        Args:
+            identifier (int): 
+                The AuroraX data source ID
+
+            format (str): 
+                The format of the data source returned, defaults to `FORMAT_FULL_RECORD`
+
+        Returns:
+            A `pyaurorax.search.DataSource` object. This is a copy, so changing it doesn't
+            affect the catalog.
+
+        Raises:
+            pyaurorax.exceptions.AuroraXNotFoundError: No data source with this identifier exists
+            pyaurorax.exceptions.AuroraXAPIError: Error during API call
+        """
+        # use the API directly if caching is disabled
+        if (self.enabled is False):
+            return func_get_using_identifier(self.__aurorax_obj, identifier, format, False)
+
+        # find the data source
+        record = self.__lookup(lambda: self.__by_identifier.get(identifier))
+        if (record is None):
+            raise AuroraXNotFoundError("No data source with identifier %d found" % (identifier))
+        return self.__to_data_source(record, format)
+
+    def get(self, program: str, platform: str, instrument_type: str, format: str = FORMAT_FULL_RECORD) -> DataSource:
+        """
+        Look up a data source using its program, platform, and instrument type.
+
+        Args:
+            program (str): 
+                The program for the data source
+
+            platform (str): 
+                The platform for the data source
+
+            instrument_type (str): 
+                The instrument type for the data source
+
+            format (str): 
+                The format of the data source returned, defaults to `FORMAT_FULL_RECORD`
+
+        Returns:
+            A `pyaurorax.search.DataSource` object. This is a copy, so changing it doesn't
+            affect the catalog.
+
+        Raises:
+            pyaurorax.exceptions.AuroraXNotFoundError: No matching data source found
+            pyaurorax.exceptions.AuroraXAPIError: Error during API call
+        """
+        # use the API directly if caching is disabled
+        if (self.enabled is False):
+            return func_get(self.__aurorax_obj, program, platform, instrument_type, format, False)
+
+        # find the data source
+        matches = self.__lookup(lambda: self.__by_name.get((program, platform, instrument_type)))
+        if (matches is None):
+            raise AuroraXNotFoundError("No matching data source found")
+        if (len(matches) > 1):  # pragma: nocover-ok
+            show_warning("Found more than one data source matching this criteria, returning the first (found %d)" % (len(matches)), stacklevel=1)
+        return self.__to_data_source(matches[0], format)
+
+    def list(self,
+             program: Optional[str] = None,
+             platform: Optional[str] = None,
+             instrument_type: Optional[str] = None,
+             source_type: Optional[str] = None,
+             owner: Optional[str] = None,
+             format: str = FORMAT_FULL_RECORD,
+             order: str = "identifier") -> List[DataSource]:
+        """
+        Retrieve the data sources in the catalog. Parameters can be used to filter for exact
+        matches as desired.
+
+        Args:
+            program (str): 
+                The program to filter for, defaults to `None`
+
+            platform (str): 
+                The platform to filter for, defaults to `None`
+
+            instrument_type (str): 
+                The instrument type to filter for, defaults to `None`
+
+            source_type (str): 
+                The data source type to filter for, defaults to `None`
+
+            owner (str): 
+                The owner's email address to filter for, defaults to `None`
+
+            format (str): 
+                The format of the data sources returned, defaults to `FORMAT_FULL_RECORD`
+
+            order (str): 
+                The category to order results by. Valid values are identifier, program, platform,
+                instrument_type, display_name, or owner. Defaults to `identifier`
+
+        Returns:
+            A list of `pyaurorax.search.DataSource` objects matching the requested parameters
+
+        Raises:
+            pyaurorax.exceptions.AuroraXAPIError: Error during API call
+        """
+        # use the API directly if caching is disabled
+        if (self.enabled is False):
+            return func_list(self.__aurorax_obj, program, platform, instrument_type, source_type, owner, format, order, False)
+
+        # get records, sorted in the requested order
+        #
+        # NOTE: the sort order is kept until the next refresh, so that it's only done once
+        self.__ensure_fresh()
+        with self.__lock:
+            if (order not in self.__sorted_records):
+                self.__sorted_records[order] = sorted(self.__records, key=lambda x: "None" if x[order] is None else x[order])
+            records = self.__sorted_records[order]
+
+        # filter
+        filters = {
+            "program": program,
+            "platform": platform,
+            "instrument_type": instrument_type,
+            "source_type": source_type,
+            "owner": owner,
+        }
+        filters = {key: value for key, value in filters.items() if value is not None}
+        return [self.__to_data_source(r, format) for r in records if all(r[key] == value for key, value in filters.items())]
+
+    def __lookup(self, find_func):
+        # find a record, refreshing the catalog first if needed. If it isn't found, the catalog
+        # is refreshed once in case the data source was added recently.
+        self.__ensure_fresh()
+        with self.__lock:
+            result = find_func()
+            if (result is None and time.time() - self.__refreshed_at > self.__MISS_REFRESH_INTERVAL):
+                self.refresh()
+                result = find_func()
+        return result
+
+    def __ensure_fresh(self):
+        # NOTE: the lock is held while refreshing, so that threads doing lookups at the
+        # same time wait for a single refresh
+        with self.__lock:
+            if (self.is_stale is False):
+                return
+            if (self.__load() is True):
+                return
+            self.refresh()
+
+    def __set_records(self, records, refreshed_at):
+        # build indexes
+        by_identifier = {}
+        by_name = {}
+        for r in records:
+            by_identifier[r["identifier"]] = r
+            by_name.setdefault((r["program"], r["platform"], r["instrument_type"]), []).append(r)
+
+        # set
+        self.__records = records
+        self.__by_identifier = by_identifier
+        self.__by_name = by_name
+        self.__sorted_records = {}
+        self.__refreshed_at = refreshed_at
+
+    def __load(self):
+        # load the catalog from the cache file, if it's still valid
+        cache_path = self.__aurorax_obj.sources_cache_path
+        if (cache_path is None or os.path.exists(cache_path) is False):
+            return False
+        try:
+            with open(cache_path, "r") as fp:
+                contents = json.load(fp)
+            if (contents["version"] != self.__CACHE_FILE_VERSION or contents["api_base_url"] != self.__aurorax_obj.api_base_url):
+                return False
+            if (time.time() - contents["refreshed_at"] > self.ttl):
+                return False
+            self.__set_records(contents["sources"], contents["refreshed_at"])
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            # corrupt or unreadable file, so we'll retrieve the data sources again
+            return False
+
+    def __save(self):
+        # save the catalog to the cache file, if one is set
+        cache_path = self.__aurorax_obj.sources_cache_path
+        if (cache_path is None):
+            return
+        contents = {
+            "version": self.__CACHE_FILE_VERSION,
+            "api_base_url": self.__aurorax_obj.api_base_url,
+            "refreshed_at": self.__refreshed_at,
+            "sources": self.__records,
+        }
+        try:
+            if (os.path.dirname(cache_path) != ""):
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_filename = "%s.tmp_%s" % (cache_path, uuid.uuid4().hex)
+            with open(tmp_filename, "w") as fp:
+                json.dump(contents, fp)
+            os.replace(tmp_filename, cache_path)
+        except OSError as e:  # pragma: nocover-ok
+            show_warning("Unable to save data source catalog to '%s': %s" % (cache_path, str(e)), stacklevel=1)
+
+    def __to_dict(self, ds: DataSource) -> Dict:
+        return {
+            "identifier": ds.identifier,
+            "program": ds.program,
+            "platform": ds.platform,
+            "instrument_type": ds.instrument_type,
+            "source_type": ds.source_type,
+            "display_name": ds.display_name,
+            "metadata": ds.metadata,
+            "owner": ds.owner,
+            "maintainers": ds.maintainers,
+            "ephemeris_metadata_schema": ds.ephemeris_metadata_schema,
+            "data_product_metadata_schema": ds.data_product_metadata_schema,
+        }
+
+    def __to_data_source(self, record: Dict, format: str) -> DataSource:
+        # only include the fields that the API would return for this format. Nested values
+        # are copied so that the cached records can't be changed.
+        fields = self.__FORMAT_FIELDS.get(format, record.keys())
+        return DataSource(**{key: copy.deepcopy(record[key]) for key in fields}, format=format)
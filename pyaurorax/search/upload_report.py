@@ -0,0 +1,148 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Class definitions for the results of a bulk upload
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Literal, Optional
+
+
+@dataclass
+class UploadChunkResult:
+    """
+    The outcome of uploading a single chunk of records.
+
+    Attributes:
+        index (int): 
+            Position of the chunk in the upload
+
+        start_index (int): 
+            Index of the first record in this chunk, in the list of records that was uploaded
+
+        end_index (int): 
+            Index after the last record in this chunk, in the list of records that was uploaded
+
+        status (str): 
+            The outcome of the chunk, either `success`, `failed`, or `skipped`. Chunks are
+            skipped if the upload was stopped at the first error.
+
+        attempts (int): 
+            Number of requests made for this chunk, including retries
+
+        status_code (int): 
+            The HTTP status code of the last request, if a response was received
+
+        duration (float): 
+            Time taken for this chunk in seconds, including retries
+
+        error (Exception): 
+            The last error encountered, if the chunk failed
+    """
+    index: int
+    start_index: int
+    end_index: int
+    status: Literal["success", "failed", "skipped"]
+    attempts: int = 0
+    status_code: Optional[int] = None
+    duration: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def record_count(self) -> int:
+        """
+        The number of records in this chunk
+        """
+        return self.end_index - self.start_index
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return "UploadChunkResult(index=%d, records=[%d:%d], status='%s', attempts=%d, status_code=%s, duration=%.2fs, error=%s)" % (
+            self.index,
+            self.start_index,
+            self.end_index,
+            self.status,
+            self.attempts,
+            self.status_code,
+            self.duration,
+            repr(self.error),
+        )
+
+
+@dataclass
+class UploadReport:
+    """
+    A report of a bulk upload, with the outcome of each chunk of records.
+
+    Attributes:
+        identifier (int): 
+            The AuroraX data source ID that records were uploaded for
+
+        record_count (int): 
+            Total number of records in the upload
+
+        chunks (List[UploadChunkResult]): 
+            The outcome of each chunk, in the order of the records
+    """
+    identifier: int
+    record_count: int
+    chunks: List[UploadChunkResult] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """
+        True if all chunks were uploaded successfully
+        """
+        return all(c.status == "success" for c in self.chunks)
+
+    @property
+    def failed_chunks(self) -> List[UploadChunkResult]:
+        """
+        The chunks that failed or were skipped. The `start_index` and `end_index` of
+        each can be used to select the records to upload again.
+        """
+        return [c for c in self.chunks if c.status != "success"]
+
+    @property
+    def uploaded_record_count(self) -> int:
+        """
+        The number of records that were uploaded successfully
+        """
+        return sum(c.record_count for c in self.chunks if c.status == "success")
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return "UploadReport(identifier=%d, record_count=%d, uploaded_record_count=%d, chunks=[%d chunks], failed_chunks=[%d chunks])" % (
+            self.identifier,
+            self.record_count,
+            self.uploaded_record_count,
+            len(self.chunks),
+            len(self.failed_chunks),
+        )
+
+    def pretty_print(self):
+        """
+        A special print output for this class.
+        """
+        print("UploadReport:")
+        print("  %-22s: %d" % ("identifier", self.identifier))
+        print("  %-22s: %d" % ("record_count", self.record_count))
+        print("  %-22s: %d" % ("uploaded_record_count", self.uploaded_record_count))
+        print("  %-22s: %s" % ("success", self.success))
+        print("  %-22s: [%d chunks]" % ("chunks", len(self.chunks)))
+        print("  %-22s: [%d chunks]" % ("failed_chunks", len(self.failed_chunks)))
@@ -17,9 +17,12 @@ B-trace geographic locations.
 """
 
 import datetime
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
 from ..location import Location
 from ._calculate_btrace import ground_geo_to_nbtrace as func_ground_geo_to_nbtrace
 from ._calculate_btrace import ground_geo_to_sbtrace as func_ground_geo_to_sbtrace
+from ._calculate_btrace import ground_geo_to_btrace_arr as func_ground_geo_to_btrace_arr
 
 
 class UtilManager:
@@ -70,3 +73,87 @@ class UtilManager:
             The south B-trace location as a `Location` object
         """
         return func_ground_geo_to_sbtrace(geo_location, timestamp)
+
+    def ground_geo_to_nbtrace_array(
+        self,
+        lat: Union[np.ndarray, Sequence[float]],
+        lon: Union[np.ndarray, Sequence[float]],
+        timestamp: Union[datetime.datetime, np.ndarray, Sequence[datetime.datetime]],
+        time_resolution: Optional[datetime.timedelta] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert arrays of geographic locations to North B-Trace geographic locations
+
+        This is the same as `ground_geo_to_nbtrace()`, but for many locations at once. The
+        locations are grouped by timestamp, and each group is converted with a single
+        call to AACGM. Repeated locations at the same timestamp (ie. a ground instrument
+        that doesn't move) are only converted once.
+
+        Args:
+            lat (numpy.ndarray or List[float]): 
+                Geographic latitudes
+
+            lon (numpy.ndarray or List[float]): 
+                Geographic longitudes, the same shape as `lat`
+
+            timestamp (datetime.datetime or numpy.ndarray or List[datetime.datetime]): 
+                A single timestamp for all locations, or a timestamp for each location
+
+            time_resolution (datetime.timedelta): 
+                Round timestamps down to this resolution before converting, so that more
+                locations are converted together. The B-trace locations change slowly over
+                time (less than 100 meters in a day), so using a resolution of an hour or a
+                day is much faster for long time ranges. Optional, defaults to None (each
+                timestamp is converted separately, giving the same results as
+                `ground_geo_to_nbtrace()`).
+
+        Returns:
+            The north B-trace latitudes and longitudes, as a tuple of two arrays of the
+            same shape as `lat`. Missing (NaN) locations are returned as NaN.
+
+        Raises:
+            ValueError: invalid parameters were supplied
+        """
+        return func_ground_geo_to_btrace_arr(lat, lon, timestamp, time_resolution, "north")
+
+    def ground_geo_to_sbtrace_array(
+        self,
+        lat: Union[np.ndarray, Sequence[float]],
+        lon: Union[np.ndarray, Sequence[float]],
+        timestamp: Union[datetime.datetime, np.ndarray, Sequence[datetime.datetime]],
+        time_resolution: Optional[datetime.timedelta] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert arrays of geographic locations to South B-Trace geographic locations
+
+        This is the same as `ground_geo_to_sbtrace()`, but for many locations at once. The
+        locations are grouped by timestamp, and each group is converted with a single
+        call to AACGM. Repeated locations at the same timestamp (ie. a ground instrument
+        that doesn't move) are only converted once.
+
+        Args:
+            lat (numpy.ndarray or List[float]): 
+                Geographic latitudes
+
+            lon (numpy.ndarray or List[float]): 
+                Geographic longitudes, the same shape as `lat`
+
+            timestamp (datetime.datetime or numpy.ndarray or List[datetime.datetime]): 
+                A single timestamp for all locations, or a timestamp for each location
+
+            time_resolution (datetime.timedelta): 
+                Round timestamps down to this resolution before converting, so that more
+                locations are converted together. The B-trace locations change slowly over
+                time (less than 100 meters in a day), so using a resolution of an hour or a
+                day is much faster for long time ranges. Optional, defaults to None (each
+                timestamp is converted separately, giving the same results as
+                `ground_geo_to_sbtrace()`).
+
+        Returns:
+            The south B-trace latitudes and longitudes, as a tuple of two arrays of the
+            same shape as `lat`. Missing (NaN) locations are returned as NaN.
+
+        Raises:
+            ValueError: invalid parameters were supplied
+        """
+        return func_ground_geo_to_btrace_arr(lat, lon, timestamp, time_resolution, "south")
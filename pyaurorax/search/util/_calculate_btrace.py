@@ -18,6 +18,7 @@ locations for ground-based instruments.
 
 import datetime
 import aacgmv2
+import numpy as np
 from ..location import Location
 
 
@@ -55,3 +56,128 @@ def ground_geo_to_sbtrace(geo_location: Location, timestamp: datetime.datetime)
     # calculate North B-trace and return
     nbtrace = __calculate_btrace(geo_location, timestamp)
     return nbtrace
+
+
+def __get_timestamp_array(timestamp, shape, time_resolution):
+    # broadcast the timestamps to the shape of the locations
+    if (isinstance(timestamp, datetime.datetime) is True):
+        timestamps = np.full(shape, np.datetime64(timestamp, "s"))
+    else:
+        timestamps = np.asarray(timestamp, dtype="datetime64[s]")
+        try:
+            timestamps = np.broadcast_to(timestamps, shape)
+        except ValueError:
+            raise ValueError("The timestamp array of shape %s can't be matched to the locations of shape %s" % (timestamps.shape, shape)) from None
+    timestamps = timestamps.reshape(-1)
+
+    # round down to the time resolution, so that nearby timestamps are converted together
+    if (time_resolution is not None):
+        resolution = int(time_resolution.total_seconds())
+        if (resolution < 1):
+            raise ValueError("The time_resolution value must be at least 1 second")
+        timestamps = ((timestamps.astype(np.int64) // resolution) * resolution).astype("datetime64[s]")
+    return timestamps
+
+
+def __group_sorted_points(order, keys):
+    # get the index of the first of each set of equal points, and the position of each point
+    # in that list, given the order that sorts them
+    is_duplicate = np.ones(order.shape[0] - 1, dtype=bool)
+    for key in keys:
+        key_sorted = key[order]
+        is_duplicate &= key_sorted[1:] == key_sorted[:-1]
+    is_first = np.concatenate([[True], ~is_duplicate])
+    point_inverse = np.empty(order.shape[0], dtype=np.int64)
+    point_inverse[order] = np.cumsum(is_first) - 1
+    return order[is_first], point_inverse
+
+
+def __find_unique_points(lat, lon, timestamps):
+    # find the unique (timestamp, lat, lon) points
+    #
+    # NOTE: the points are hashed to a single integer first, since sorting one array of
+    # integers is much faster than sorting rows of several values. If there are any hash
+    # collisions, the rows are sorted instead.
+    timestamps = timestamps.astype(np.int64)
+    with np.errstate(over="ignore"):
+        hashes = (lat + 0.0).view(np.uint64) * np.uint64(0x9E3779B97F4A7C15)  # adding 0.0 changes -0.0 to 0.0
+        hashes ^= (lon + 0.0).view(np.uint64) * np.uint64(0xC2B2AE3D27D4EB4F)
+        hashes ^= timestamps.view(np.uint64) * np.uint64(0x165667B19E3779F9)
+    rep_idx, point_inverse = __group_sorted_points(np.argsort(hashes), [hashes])
+    for key in [lat, lon, timestamps]:
+        if (np.array_equal(key[rep_idx][point_inverse], key) is False):
+            return __group_sorted_points(np.lexsort([lon, lat, timestamps]), [lon, lat, timestamps])
+    return rep_idx, point_inverse
+
+
+def __calculate_btrace_arr(lat, lon, timestamps, convert_mask):
+    # start with the geographic locations, and replace the ones to convert
+    btrace_lat = lat.copy()
+    btrace_lon = lon.copy()
+    idx_to_convert = np.nonzero(convert_mask & np.isfinite(lat) & np.isfinite(lon))[0]
+    if (idx_to_convert.shape[0] == 0):
+        return btrace_lat, btrace_lon
+
+    # find the unique points, and group them by timestamp, since the magnetic coordinates are
+    # set for one timestamp at a time
+    rep_idx, point_inverse = __find_unique_points(lat[idx_to_convert], lon[idx_to_convert], timestamps[idx_to_convert])
+    rep_idx = idx_to_convert[rep_idx]
+    rep_order = np.argsort(timestamps[rep_idx], kind="stable")
+    rep_idx = rep_idx[rep_order]
+    rep_inverse = np.empty(rep_order.shape[0], dtype=np.int64)
+    rep_inverse[rep_order] = np.arange(0, rep_order.shape[0])
+    point_inverse = rep_inverse[point_inverse]
+    unique_timestamps, group_bounds = np.unique(timestamps[rep_idx], return_index=True)
+    group_bounds = np.append(group_bounds, rep_idx.shape[0])
+    pair_lat = lat[rep_idx]
+    pair_lon = lon[rep_idx]
+
+    # convert each group of locations with the same timestamp
+    pair_btrace_lat = np.full(rep_idx.shape[0], np.nan)
+    pair_btrace_lon = np.full(rep_idx.shape[0], np.nan)
+    for i in range(0, unique_timestamps.shape[0]):
+        group = slice(group_bounds[i], group_bounds[i + 1])
+        dt = unique_timestamps[i].astype(datetime.datetime)
+
+        # convert to magnetic coordinates, change magnetic latitude to the other hemisphere,
+        # and convert back to geographic
+        mag_location = aacgmv2.convert_latlon_arr(pair_lat[group], pair_lon[group], 0.0, dt, method_code="G2A")
+        btrace_aacgm = aacgmv2.convert_latlon_arr(np.atleast_1d(mag_location[0]) * -1.0,
+                                                  np.atleast_1d(mag_location[1]),
+                                                  np.atleast_1d(mag_location[2]),
+                                                  dt,
+                                                  method_code="A2G")
+        pair_btrace_lat[group] = btrace_aacgm[0]
+        pair_btrace_lon[group] = btrace_aacgm[1]
+
+    # set the converted locations
+    btrace_lat[idx_to_convert] = pair_btrace_lat[point_inverse]
+    btrace_lon[idx_to_convert] = pair_btrace_lon[point_inverse]
+
+    # return
+    return btrace_lat, btrace_lon
+
+
+def ground_geo_to_btrace_arr(lat, lon, timestamp, time_resolution, hemisphere):
+    """
+    Convert arrays of geographic locations to north or south B-trace geographic locations.
+    """
+    # check parameters
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    if (lat.shape != lon.shape):
+        raise ValueError("The lat and lon arrays must be the same shape, got %s and %s" % (lat.shape, lon.shape))
+    shape = lat.shape
+    timestamps = __get_timestamp_array(timestamp, shape, time_resolution)
+    lat = lat.reshape(-1)
+    lon = lon.reshape(-1)
+
+    # locations in the same hemisphere as the B-trace are left as they are
+    if (hemisphere == "north"):
+        convert_mask = lat < 0.0
+    else:
+        convert_mask = lat >= 0.0
+
+    # calculate and return
+    btrace_lat, btrace_lon = __calculate_btrace_arr(lat, lon, timestamps, convert_mask)
+    return btrace_lat.reshape(shape), btrace_lon.reshape(shape)
@@ -48,12 +48,15 @@ from .spectra import SpectraManager
 from .fov import FOVManager
 from ._display import display as func_display
 from ._movie import movie as func_movie
+from ._movie import movie_from_frames as func_movie_from_frames
 from ._scale_intensity import scale_intensity as func_scale_intensity
 from ._util import set_theme as func_set_theme
 
 # typing imports
 import numpy as np
-from typing import Literal, Optional, Tuple, Union, Any, List
+from pathlib import Path
+from matplotlib.figure import Figure
+from typing import Literal, Optional, Tuple, Union, Any, List, Iterable
 
 __all__ = ["ToolsManager", "Keogram", "Montage", "Mosaic", "MosaicData", "MosaicSkymap", "FOV", "FOVData"]
 
@@ -72,8 +75,8 @@ class ToolsManager:
         self.__calibration = CalibrationManager()
         self.__ccd_contour = CCDContourManager()
         self.__grid_files = GridFilesManager(self.__aurorax_obj)
-        self.__keogram = KeogramManager()
-        self.__montage = MontageManager()
+        self.__keogram = KeogramManager(self.__aurorax_obj)
+        self.__montage = MontageManager(self.__aurorax_obj)
         self.__mosaic = MosaicManager(self.__aurorax_obj)
         self.__spectra = SpectraManager()
         self.__fov = FOVManager(self.__aurorax_obj)
@@ -244,8 +247,7 @@ class ToolsManager:
                 Filename for the created movie file. This parameter is required.
 
             n_parallel (int): 
-                Number of multiprocessing workers to use. Default is `1`, which does not use
-                multiprocessing.
+                Number of worker threads to use for reading files. Default is `1`.
 
             fps (int): 
                 Frames per second (FPS) for the movie file. Default is `25`.
@@ -258,6 +260,54 @@ class ToolsManager:
         """
         return func_movie(self.__aurorax_obj, input_filenames, output_filename, n_parallel, fps, progress_bar_disable)
 
+    def movie_from_frames(
+        self,
+        frames: Iterable[Union[str, Path, np.ndarray, Figure, Tuple[Figure, Any]]],
+        output_filename: str,
+        n_parallel: int = 1,
+        fps: int = 25,
+        max_queued_frames: Optional[int] = None,
+        progress_bar_disable: bool = False,
+    ) -> None:
+        """
+        Generate a movie file from a sequence of frames, without holding all of them in memory. Note 
+        that the codec used is "mp4v".
+
+        Frames are read (or converted) by a pool of worker threads, and encoded in order by another
+        thread as soon as they are ready. The frames can be produced by a generator, such as one that
+        creates a mosaic for each timestamp, in which case encoding happens while the next frames are
+        being produced and there is no need to save each frame to a file first.
+
+        Args:
+            frames (Iterable): 
+                The frames to use for movie generation, in order. Each frame can be the filename of an image,
+                a uint8 numpy array of a [rows, cols] grayscale or [rows, cols, 3] RGB image, or a matplotlib
+                figure (or the `(fig, ax)` tuple returned by the `plot()` functions when using `returnfig`).
+                Figures are closed once they have been rendered. All frames must be the same size. This
+                parameter is required.
+
+            output_filename (str): 
+                Filename for the created movie file. This parameter is required.
+
+            n_parallel (int): 
+                Number of worker threads to use for reading frames. Default is `1`.
+
+            fps (int): 
+                Frames per second (FPS) for the movie file. Default is `25`.
+
+            max_queued_frames (int): 
+                The maximum number of frames waiting to be encoded. When this is reached, reading further
+                frames pauses until the encoder catches up. Default is `2 * n_parallel + 2`.
+
+            progress_bar_disable (bool): 
+                Toggle the progress bar off. Default is `False`.        
+
+        Raises:
+            IOError: I/O related issue while generating movie
+            ValueError: an unsupported frame was supplied, or issues with supplied parameters
+        """
+        return func_movie_from_frames(self.__aurorax_obj, frames, output_filename, n_parallel, fps, max_queued_frames, progress_bar_disable)
+
     def scale_intensity(
         self,
         data: np.ndarray,
@@ -265,6 +315,8 @@ class ToolsManager:
         max: Optional[float] = None,
         top: Optional[float] = None,
         memory_saver: bool = True,
+        out: Optional[np.ndarray] = None,
+        n_parallel: int = 1,
     ) -> np.ndarray:
         """
         Scale all values of an array that lie in the range min<=x<=max in to 
@@ -288,17 +340,30 @@ class ToolsManager:
                 of the data array's dtype is used.
 
             memory_saver (bool): 
-                Utilize less RAM when scaling a set of images. Defaults to `True`. If set to `False` then
-                the scaling routine will be faster, but will utilize significantly more RAM.
+                Scale each image of a set of images separately. Defaults to `True`. If set to `False`, then
+                the whole array is scaled at once. This only makes a difference to the result if `min` or
+                `max` is not supplied, since they are determined for each image separately when this is
+                `True`, and for the whole array otherwise. In either case, the data is processed in small
+                blocks, so little additional RAM is used.
+
+            out (numpy.ndarray): 
+                An array to write the scaled data into, optional. It must be the same shape and dtype as
+                the data array. This can be the data array itself, to scale it in place.
+
+            n_parallel (int): 
+                Number of threads to use for scaling the data. Defaults to `1`.
 
         Returns:
-            A new `numpy.ndarray` that is the same dimensions as the inputted data array, 
-            with the scaling applied.
+            A `numpy.ndarray` that is the same dimensions as the inputted data array, with the
+            scaling applied. This is the `out` array if it was supplied, otherwise a new array.
+
+            For uint8 and uint16 data, the scaled value of every possible input value is computed
+            once, and the data is scaled using this lookup table.
 
         Raises:
             ValueError: issues encountered with supplied min, max, or top value(s)
         """
-        return func_scale_intensity(data, min, max, top, memory_saver)
+        return func_scale_intensity(data, min, max, top, memory_saver, out, n_parallel)
 
     def set_theme(self, theme: str) -> None:
         """
@@ -13,83 +13,150 @@
 # limitations under the License.
 
 import cv2
-from tqdm.contrib.concurrent import process_map as tqdm_process_map
-from concurrent.futures import ProcessPoolExecutor
+import queue
+import threading
+import numpy as np
+import matplotlib.pyplot as plt
+from pathlib import Path
+from matplotlib.figure import Figure
+from concurrent.futures import Future, ThreadPoolExecutor
 
 
-def __process_frame(fname):  # pragma: nocover-ok
-    return {
-        "fname": fname,
-        "img": cv2.imread(fname),
-    }
+def __read_frame(frame):
+    # read the file
+    if (isinstance(frame, (str, Path)) is True):
+        img = cv2.imread(str(frame))
+        if (img is None):
+            raise IOError("Unable to read frame from file %s" % (frame))
+        return img
 
+    # convert the numpy array from RGB, the way that cv2 expects it
+    if (isinstance(frame, np.ndarray) is True):
+        if (frame.dtype != np.uint8):
+            raise ValueError("Frame arrays must be of dtype uint8, found %s" % (frame.dtype))
+        if (len(frame.shape) == 2):
+            return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        elif (len(frame.shape) == 3 and frame.shape[2] == 3):
+            return cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        elif (len(frame.shape) == 3 and frame.shape[2] == 4):
+            return cv2.cvtColor(frame, cv2.COLOR_RGBA2BGR)
+        else:
+            raise IOError("Unexpected shape of image data. Found shape %s, but was expecting only 2 or 3 dimensions." % (frame.shape, ))
 
-def movie(aurorax_obj, input_filenames, output_filename, n_parallel, fps, progress_bar_disable):
-    # read in all frames
+    # unknown
+    raise ValueError("Unsupported frame type %s, frames must be filenames, numpy arrays, or matplotlib figures" % (type(frame)))
+
+
+def __render_figure(fig):
+    # render the figure to an image, and close it since it won't be used again
+    fig.canvas.draw()
+    img = cv2.cvtColor(np.asarray(fig.canvas.buffer_rgba()), cv2.COLOR_RGBA2BGR)
+    plt.close(fig)
+    return img
+
+
+def __get_figure(frame):
+    # NOTE: the plot functions return a (fig, ax) tuple when using returnfig
+    if (isinstance(frame, tuple) is True and len(frame) > 0 and isinstance(frame[0], Figure) is True):
+        return frame[0]
+    if (isinstance(frame, Figure) is True):
+        return frame
+    return None
+
+
+def movie_from_frames(aurorax_obj, frames, output_filename, n_parallel, fps, max_queued_frames, progress_bar_disable):
+    # check parameters
+    if (n_parallel < 1):
+        raise ValueError("The n_parallel value must be at least 1")
+    if (max_queued_frames is None):
+        max_queued_frames = 2 * n_parallel + 2
+    elif (max_queued_frames < 1):
+        raise ValueError("The max_queued_frames value must be at least 1")
+
+    # set up progress bar
+    total = len(frames) if hasattr(frames, "__len__") else None
+    progress_bar = None
+    if (progress_bar_disable is False):
+        progress_bar = aurorax_obj._tqdm(total=total, desc="Encoding frames: ", unit="frames")
+
+    # encode frames in order as they become ready, in a separate thread
     #
-    # NOTE: we do with using multiprocessing, but we need to be very
-    # careful to ensure that the frames are being added to the list
-    # in order. This preserves the order of the file list that was
-    # supplied.
-    frame_list = []
-    if (n_parallel == 1):
-        # don't do anything special, just a basic loop
-        if (progress_bar_disable is True):
-            # no progress bar
-            for fname in input_filenames:
-                img = cv2.imread(fname)
-                frame_list.append(img)
-        else:
-            # with progress bar
-            for fname in aurorax_obj._tqdm(input_filenames, desc="Reading files: ", unit="files"):
-                img = cv2.imread(fname)
-                frame_list.append(img)
-    else:
-        # multiple workers, do it in a multiprocessing loop
-        if (progress_bar_disable is True):
-            with ProcessPoolExecutor(max_workers=n_parallel) as executor:
-                for result in executor.map(__process_frame, input_filenames):
-                    frame_list.append(result["img"])
-        else:
-            results = tqdm_process_map(
-                __process_frame,
-                input_filenames,
-                max_workers=n_parallel,
-                chunksize=1,
-                desc="Reading files: ",
-                unit="files",
-                tqdm_class=aurorax_obj._tqdm,
-            )
-            for result in results:
-                frame_list.append(result["img"])
-
-    # get dimensions of images so we can initialize the video writer
+    # NOTE: frames are handed over as futures through a bounded queue, so that
+    # only a handful of frames are held in memory at any time. If an error is
+    # encountered, the remaining frames are discarded so that the producer never
+    # blocks on a full queue.
+    frame_queue = queue.Queue(maxsize=max_queued_frames)
+    state = {"writer": None, "frame_shape": None, "n_frames": 0, "error": None}
+
+    def encode_frames():
+        while (True):
+            future = frame_queue.get()
+            if (future is None):
+                break
+            if (state["error"] is not None):
+                continue
+            try:
+                img = future.result()
+
+                # initialize videowriter object using the first frame
+                #
+                # NOTE: all frames must be the same size as the first one
+                if (state["writer"] is None):
+                    state["frame_shape"] = img.shape
+                    fourcc = cv2.VideoWriter_fourcc(*"mp4v")  # type: ignore
+                    frame_size = (img.shape[1], img.shape[0])
+                    state["writer"] = cv2.VideoWriter(output_filename, fourcc, fps, frame_size)
+                elif (img.shape != state["frame_shape"]):
+                    raise IOError("All frames must be the same size. Frame %d has shape %s, but the first frame has shape %s" %
+                                  (state["n_frames"], img.shape, state["frame_shape"]))
+
+                # write the frame
+                state["writer"].write(img)
+                state["n_frames"] += 1
+                if (progress_bar is not None):
+                    progress_bar.update(1)
+            except Exception as e:
+                state["error"] = e
+
+    encode_thread = threading.Thread(target=encode_frames, daemon=True)
+    encode_thread.start()
+
+    # read frames in a pool of workers, and hand them to the encoder in order
     #
-    # NOTE: we assume that all images are the same size. Perhaps we can
-    # put a check in while we read all the images in?
-    if (len(frame_list) == 0):
+    # NOTE: figures are rendered here, since matplotlib is not thread-safe
+    try:
+        with ThreadPoolExecutor(max_workers=n_parallel) as executor:
+            for frame in frames:
+                if (state["error"] is not None):
+                    break
+                fig = __get_figure(frame)
+                if (fig is not None):
+                    future = Future()
+                    try:
+                        future.set_result(__render_figure(fig))
+                    except Exception as e:
+                        future.set_exception(e)
+                else:
+                    future = executor.submit(__read_frame, frame)
+                frame_queue.put(future)
+    finally:
+        frame_queue.put(None)
+        encode_thread.join()
+        if (state["writer"] is not None):
+            state["writer"].release()
+        if (progress_bar is not None):
+            progress_bar.close()
+
+    # check for errors
+    if (state["error"] is not None):
+        raise state["error"]
+    if (state["n_frames"] == 0):
         raise IOError("No images read in. Check that filenames were indeed supplied.")
-    elif (len(frame_list[0].shape) == 2 or len(frame_list[0].shape) == 3):
-        width = frame_list[0].shape[0]
-        height = frame_list[0].shape[1]
-    else:  # pragma: nocover
-        # some unexpected image shape
-        raise IOError("Unexpected shape of image data. Found shape %s, but was expecting only 2 or 3 dimensions." % (frame_list[0].shape))
-
-    # initialize videowriter object
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")  # type: ignore
-    frame_size = (height, width)
-    writer = cv2.VideoWriter(output_filename, fourcc, fps, frame_size)
-
-    # write the frames
-    if (progress_bar_disable is True):
-        # no progress bar
-        for i in range(0, len(frame_list)):
-            writer.write(frame_list[i])
-    else:
-        # with progress bar
-        for i in aurorax_obj._tqdm(range(0, len(frame_list)), desc="Encoding frames: ", unit="frames"):
-            writer.write(frame_list[i])
-
-    # close the writer
-    writer.release()
+
+
+def movie(aurorax_obj, input_filenames, output_filename, n_parallel, fps, progress_bar_disable):
+    # read and encode the frames as a stream
+    #
+    # NOTE: this preserves the order of the file list that was supplied, while only
+    # keeping a few frames in memory at a time
+    movie_from_frames(aurorax_obj, input_filenames, output_filename, n_parallel, fps, None, progress_bar_disable)
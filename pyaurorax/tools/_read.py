@@ -0,0 +1,63 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Routines for reading data files in bounded chunks
+"""
+
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+
+def iter_data_chunks(aurorax_obj, dataset, file_list, chunk_size, n_parallel, first_record, no_metadata, start_time, end_time, quiet):
+    """
+    Read a list of data files a few at a time, yielding a `Data` object for each chunk
+    of files that contains any records.
+
+    The next chunk is read in the background while the current one is being used, so at
+    most two chunks are held in memory at once (plus whatever the caller keeps from them).
+    """
+    # check parameters
+    if (chunk_size < 1):
+        raise ValueError("The chunk_size value must be at least 1")
+    if (isinstance(file_list, (str, Path)) is True):
+        file_list = [file_list]
+    file_list = list(file_list)
+    if (len(file_list) == 0):
+        raise ValueError("No files were supplied to read")
+
+    # set up the reads
+    def read_chunk(chunk_file_list):
+        return aurorax_obj.data.ucalgary.read(
+            dataset,
+            chunk_file_list,
+            n_parallel=n_parallel,
+            first_record=first_record,
+            no_metadata=no_metadata,
+            start_time=start_time,
+            end_time=end_time,
+            quiet=quiet,
+        )
+
+    chunks = [file_list[i:i + chunk_size] for i in range(0, len(file_list), chunk_size)]
+
+    # read each chunk, while the next one is read in the background
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_future = executor.submit(read_chunk, chunks[0])
+        for i in range(0, len(chunks)):
+            data = next_future.result()
+            if (i + 1 < len(chunks)):
+                next_future = executor.submit(read_chunk, chunks[i + 1])
+            if (len(data.timestamp) > 0):
+                yield data
+            del data
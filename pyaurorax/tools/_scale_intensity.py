@@ -13,9 +13,16 @@
 # limitations under the License.
 
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
+# number of values scaled at a time, sized so that the temporary arrays stay in cache
+__CHUNK_SIZE = 2**18
 
-def __scale_data(data, min, max, top):
+# largest unsigned integer dtype that is scaled using a lookup table
+__LUT_MAX_BITS = 16
+
+
+def __get_scaling(dtype, data_min, data_max, min, max, top):
     # init
     bottom = 0
 
@@ -23,12 +30,12 @@ def __scale_data(data, min, max, top):
     #
     # NOTE: we only care about this if it's a uint array. If it's a double array, then we
     # check to make sure that a top was specified.
-    if ("float" in str(data.dtype)):
+    if ("float" in str(dtype)):
         # this is float type, check that the top was specified
         if (top is None):
             raise ValueError("The top parameter must be specified when a float array is supplied")
     else:
-        dtype_maxval = np.iinfo(data.dtype).max
+        dtype_maxval = np.iinfo(dtype).max
         if (top is None):
             # derive values using dtype of data array
             top = dtype_maxval
@@ -39,11 +46,11 @@ def __scale_data(data, min, max, top):
 
     # set min and max
     if (min is None):
-        cmin = data.min()
+        cmin = data_min
     else:
         cmin = float(min)
     if (max is None):
-        cmax = data.max()
+        cmax = data_max
     else:
         cmax = float(max)
 
@@ -53,50 +60,106 @@ def __scale_data(data, min, max, top):
         raise ValueError("The max value must be larger than the min value")
     elif cscale == 0:
         cscale = 1
-
-    # do scaling
     scale = float(top - bottom) / cscale
-    byte_data = (data - cmin) * scale + bottom
-    scaled_data = (byte_data.clip(bottom, top) + 0.5).astype(data.dtype)
 
     # return
-    return scaled_data
-
-
-def scale_intensity(data, min, max, top, memory_saver):
-    if (memory_saver is True):
-        # Save original data shape
-        input_shape = data.shape
-
-        # determine if we are single or 3 channel
-        if (len(data.shape) == 2):
-            n_channels = 1
-            data = data[:, :, np.newaxis]
-        elif (len(data.shape) == 3):
-            # single channel
-            n_channels = 1
-        elif (len(data.shape) == 4):
-            # three channel
-            n_channels = 3
-        else:  # pragma: nocover
+    return (cmin, scale, bottom, top)
+
+
+def __apply_scaling(data, scaling, out):
+    cmin, scale, bottom, top = scaling
+    byte_data = (data - cmin) * scale + bottom
+    out[...] = (byte_data.clip(bottom, top) + 0.5).astype(out.dtype)
+
+
+def __get_lut(dtype, scaling):
+    """
+    Build a table of the scaled value for every possible value of an unsigned integer
+    dtype, or None if a table can't be used for the dtype.
+    """
+    if (dtype.kind != "u" or dtype.itemsize * 8 > __LUT_MAX_BITS):
+        return None
+
+    # NOTE: the table is computed with the same routine as for the data itself, so
+    # that the values are identical
+    values = np.arange(0, np.iinfo(dtype).max + 1, dtype=dtype)
+    lut = np.empty(values.shape, dtype=dtype)
+    __apply_scaling(values, scaling, lut)
+    return lut
+
+
+def __scale_chunk(data, scaling, lut, out):
+    if (lut is not None):
+        np.take(lut, data, out=out, mode="clip")
+    else:
+        __apply_scaling(data, scaling, out)
+
+
+def __run(func, items, n_parallel):
+    if (n_parallel > 1 and len(items) > 1):
+        with ThreadPoolExecutor(max_workers=n_parallel) as executor:
+            for _ in executor.map(func, items):
+                pass
+    else:
+        for item in items:
+            func(item)
+
+
+def scale_intensity(data, min, max, top, memory_saver, out, n_parallel):
+    # check the output array
+    if (out is None):
+        out = np.empty(data.shape, dtype=data.dtype)
+    elif (out.shape != data.shape):
+        raise ValueError("The out array must be the same shape as the data, expected %s but got %s" % (data.shape, out.shape))
+    elif (out.dtype != data.dtype):
+        raise ValueError("The out array must be of dtype %s, but got %s" % (data.dtype, out.dtype))
+
+    # get the scaling to apply
+    #
+    # NOTE: when memory saving, the min and max are determined for each image separately
+    # (along the last axis) if they are not supplied
+    lut = None
+    if (memory_saver is True and (min is None or max is None) and len(data.shape) > 2):
+        # check values
+        if (len(data.shape) > 4):  # pragma: nocover
             raise ValueError("Unable to determine number of channels based on the supplied images. Make sure you are supplying a " +
                              "[rows,cols,images] or [rows,cols,channels,images] sized array.")
 
-        # init destination array
-        images_scaled = np.empty((data.shape), dtype=data.dtype)
+        # get the scaling for each image
+        image_axes = tuple(range(0, len(data.shape) - 1))
+        data_min = data.min(axis=image_axes) if (min is None) else [None] * data.shape[-1]
+        data_max = data.max(axis=image_axes) if (max is None) else [None] * data.shape[-1]
+        image_scalings = [__get_scaling(data.dtype, data_min[i], data_max[i], min, max, top) for i in range(0, data.shape[-1])]
+
+        # combine them into arrays along the last axis
+        #
+        # NOTE: the arrays use the same dtypes that scaling each image on its own would
+        # have used, so that the results are identical
+        if (len(image_scalings) > 0):
+            probe = np.zeros(1, dtype=data.dtype) - image_scalings[0][0]
+            cmin = np.array([x[0] for x in image_scalings], dtype=probe.dtype)
+            scale = np.array([x[1] for x in image_scalings], dtype=(probe * image_scalings[0][1]).dtype)
+            scaling = (cmin, scale, image_scalings[0][2], image_scalings[0][3])
+        else:
+            scaling = (0, 1.0, 0, top)
+    else:
+        # the same scaling applies to all values, so use a lookup table if possible
+        data_min = data.min() if (min is None) else None
+        data_max = data.max() if (max is None) else None
+        scaling = __get_scaling(data.dtype, data_min, data_max, min, max, top)
+        if (data.size > 2**(data.dtype.itemsize * 8)):
+            lut = __get_lut(data.dtype, scaling)
+
+    # scale blocks of whole rows, which are contiguous in memory
+    #
+    # NOTE: the min and max builtins are shadowed by the parameters here
+    row_size = int(data.size // data.shape[0])
+    n_chunk_rows = int(np.clip(__CHUNK_SIZE // np.clip(row_size, 1, None), 1, None))
 
-        # cycle through each image
-        for i in range(0, data.shape[-1]):
-            if (n_channels == 1):
-                images_scaled[:, :, i] = __scale_data(data[:, :, i], min, max, top)
-            else:
-                images_scaled[:, :, :, i] = __scale_data(data[:, :, :, i], min, max, top)
+    def scale_rows(row_idx):
+        __scale_chunk(data[row_idx:row_idx + n_chunk_rows], scaling, lut, out[row_idx:row_idx + n_chunk_rows])
 
-        # Reshape to confirm output is the same shape as input
-        images_scaled = np.reshape(images_scaled, input_shape)
+    __run(scale_rows, range(0, data.shape[0], n_chunk_rows), n_parallel)
 
-        # return
-        return images_scaled
-    else:
-        # scale and return
-        return __scale_data(data, min, max, top)
+    # return
+    return out
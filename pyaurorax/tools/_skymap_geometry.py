@@ -0,0 +1,145 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import aacgmv2
+import numpy as np
+from collections import OrderedDict
+
+# globals
+__CACHE_MAX_ENTRIES = 16
+__cache = OrderedDict()
+__cache_lock = threading.Lock()
+
+
+def __get_cache_key(kind, skymap, *args):
+    # cache entries are keyed on the identity of the skymap arrays, and validated
+    # against the arrays themselves when retrieved (see __cache_get)
+    return (kind, id(skymap.full_map_altitude), id(skymap.full_map_latitude), id(skymap.full_map_longitude)) + args
+
+
+def __cache_get(key, skymap):
+    with __cache_lock:
+        entry = __cache.get(key)
+        if (entry is None):
+            return None
+        arrays, result = entry
+        if (arrays[0] is not skymap.full_map_altitude or arrays[1] is not skymap.full_map_latitude
+                or arrays[2] is not skymap.full_map_longitude):  # pragma: nocover
+            # skymap arrays were replaced, and the id was reused
+            del __cache[key]
+            return None
+        __cache.move_to_end(key)
+        return result
+
+
+def __cache_set(key, skymap, result):
+    with __cache_lock:
+        __cache[key] = ((skymap.full_map_altitude, skymap.full_map_latitude, skymap.full_map_longitude), result)
+        __cache.move_to_end(key)
+        while (len(__cache) > __CACHE_MAX_ENTRIES):
+            __cache.popitem(last=False)
+
+
+def __interpolate(altitudes, values, altitude_m):
+    # linearly interpolate all pixels at once, along the altitude axis. This gives the
+    # same results as calling np.interp for each pixel.
+    j = int(np.clip(np.searchsorted(altitudes, altitude_m, side="right") - 1, 0, altitudes.shape[0] - 2))
+    values_lo = values[j].astype(np.float64)
+    values_hi = values[j + 1].astype(np.float64)
+    slope = (values_hi - values_lo) / (altitudes[j + 1] - altitudes[j])
+    return (slope * (altitude_m - altitudes[j]) + values_lo).astype(values.dtype)
+
+
+def get_latlon(skymap, altitude_km, mask_incomplete=False):
+    """
+    Get the latitude and longitude of each skymap pixel at an altitude, interpolating between the
+    skymap's altitudes if needed. Longitudes are converted to the (-180,180) format.
+
+    When interpolating, each pixel only depends on the two skymap altitudes on either side of
+    the requested one, the same as np.interp. If mask_incomplete is True, pixels that have a
+    NaN latitude or longitude at any of the skymap's altitudes are set to NaN instead.
+
+    Results are cached, so the returned arrays are read-only.
+    """
+    # check cache
+    key = __get_cache_key("geo", skymap, float(altitude_km), mask_incomplete)
+    result = __cache_get(key, skymap)
+    if (result is not None):
+        return result
+
+    # Obtain lat/lon arrays from skymap
+    altitudes = np.asarray(skymap.full_map_altitude, dtype=np.float64)
+    altitude_m = altitude_km * 1000.0
+    if (altitude_m in altitudes):
+        altitude_idx = np.where(altitude_m == altitudes)[0][0]
+        lats = np.array(skymap.full_map_latitude[altitude_idx])
+        lons = np.array(skymap.full_map_longitude[altitude_idx])
+    else:
+        # Make sure altitude is in range that can be interpolated
+        if (altitude_m < altitudes[0]) or (altitude_m > altitudes[-1]):
+            raise ValueError("Altitude " + str(altitude_km) + " outside valid range of " + str((altitudes[0] / 1000.0, altitudes[-1] / 1000.0)))
+
+        # Interpolate lats and lons at desired altitude
+        lats = __interpolate(altitudes, skymap.full_map_latitude, altitude_m)
+        lons = __interpolate(altitudes, skymap.full_map_longitude, altitude_m)
+
+        # mask the pixels that are missing at any altitude, if needed
+        if (mask_incomplete is True):
+            incomplete = np.isnan(skymap.full_map_latitude).any(axis=0) | np.isnan(skymap.full_map_longitude).any(axis=0)
+            lats[incomplete] = np.nan
+            lons[incomplete] = np.nan
+
+    # Fix skymap to be in (-180,180) format
+    lons[np.where(lons > 180)] -= 360.0
+
+    # cache and return
+    lats.setflags(write=False)
+    lons.setflags(write=False)
+    __cache_set(key, skymap, (lats, lons))
+    return lats, lons
+
+
+def get_mag_latlon(skymap, altitude_km, timestamp, mask_incomplete=False):
+    """
+    Get the AACGM magnetic latitude and longitude of each skymap pixel at an altitude and
+    time. See `get_latlon()` for more details.
+
+    Results are cached, so the returned arrays are read-only.
+    """
+    # check cache
+    key = __get_cache_key("mag", skymap, float(altitude_km), timestamp, mask_incomplete)
+    result = __cache_get(key, skymap)
+    if (result is not None):
+        return result
+
+    # Convert geographic lats and lons to magnetic coords
+    lats, lons = get_latlon(skymap, altitude_km, mask_incomplete)
+    mag_lats, mag_lons, _ = aacgmv2.convert_latlon_arr(lats.flatten(), lons.flatten(), (lons * 0.0).flatten(), timestamp, method_code="G2A")
+    mag_lats = np.reshape(mag_lats, lats.shape)
+    mag_lons = np.reshape(mag_lons, lons.shape)
+
+    # cache and return
+    mag_lats.setflags(write=False)
+    mag_lons.setflags(write=False)
+    __cache_set(key, skymap, (mag_lats, mag_lons))
+    return mag_lats, mag_lons
+
+
+def clear_cache():
+    """
+    Remove all cached skymap lat/lon data.
+    """
+    with __cache_lock:
+        __cache.clear()
@@ -14,6 +14,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from ..._skymap_geometry import get_latlon
 
 
 def geo(aurorax_obj, images, skymap, altitude_km, lonlat_bounds, metric, n_channels, show_preview):
@@ -63,33 +64,9 @@ def geo(aurorax_obj, images, skymap, altitude_km, lonlat_bounds, metric, n_chann
         raise ValueError("Polygon defined with zero area.")
 
     # Obtain lat/lon arrays from skymap
-    interp_alts = skymap.full_map_altitude / 1000.0
-    if (altitude_km in interp_alts):
-        altitude_idx = np.where(altitude_km == interp_alts)
-
-        lats = np.squeeze(skymap.full_map_latitude[altitude_idx, :, :])
-        lons = np.squeeze(skymap.full_map_longitude[altitude_idx, :, :])
-        lons[np.where(lons > 180)] -= 360.0  # Fix skymap to be in (-180,180) format
-    else:
-        # Make sure altitude is in range that can be interpolated
-        if (altitude_km < interp_alts[0]) or (altitude_km > interp_alts[2]):
-            raise ValueError("Altitude " + str(altitude_km) + " outside valid range of " + str((interp_alts[0], interp_alts[2])))
-
-        # Initialize empty lat/lon arrays
-        lats = np.full(np.squeeze(skymap.full_map_latitude[0, :, :]).shape, np.nan, dtype=skymap.full_map_latitude[0, :, :].dtype)
-        lons = np.full(np.squeeze(skymap.full_map_latitude[0, :, :]).shape, np.nan, dtype=skymap.full_map_latitude[0, :, :].dtype)
-
-        # Interpolate lats and lons at desired altitude
-        for i in range(skymap.full_map_latitude.shape[1]):
-            for j in range(skymap.full_map_latitude.shape[2]):
-                pixel_lats = skymap.full_map_latitude[:, i, j]
-                pixel_lons = skymap.full_map_longitude[:, i, j]
-                if np.isnan(pixel_lats).any() or np.isnan(pixel_lons).any():
-                    continue
-                lats[i, j] = np.interp(altitude_km, interp_alts, pixel_lats)
-                lons[i, j] = np.interp(altitude_km, interp_alts, pixel_lons)
-
-        lons[np.where(lons > 180)] -= 360.0  # Fix skymap to be in (-180,180) format
+    #
+    # NOTE: when interpolating, pixels that are missing at any of the skymap's altitudes are excluded
+    lats, lons = get_latlon(skymap, altitude_km, mask_incomplete=True)
 
     # Check that lat/lon range is reasonable
     min_skymap_lat = np.nanmin(lats)
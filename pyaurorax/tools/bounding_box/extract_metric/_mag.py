@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import aacgmv2
 import numpy as np
 import matplotlib.pyplot as plt
+from ..._skymap_geometry import get_mag_latlon
 
 
 def mag(aurorax_obj, images, timestamp, skymap, altitude_km, lonlat_bounds, metric, n_channels, show_preview):
@@ -63,40 +63,10 @@ def mag(aurorax_obj, images, timestamp, skymap, altitude_km, lonlat_bounds, metr
     if (lat_0 == lat_1) or (lon_0 == lon_1):
         raise ValueError("Polygon defined with zero area.")
 
-    # Obtain lat/lon arrays from skymap
-    interp_alts = skymap.full_map_altitude / 1000.0
-    if (altitude_km in interp_alts):
-        altitude_idx = np.where(altitude_km == interp_alts)
-
-        lats = np.squeeze(skymap.full_map_latitude[altitude_idx, :, :])
-        lons = np.squeeze(skymap.full_map_longitude[altitude_idx, :, :])
-        lons[np.where(lons > 180)] -= 360.0  # Fix skymap to be in (-180,180) format
-
-    else:
-        # Make sure altitude is in range that can be interpolated
-        if (altitude_km < interp_alts[0]) or (altitude_km > interp_alts[2]):
-            raise ValueError("Altitude " + str(altitude_km) + " outside valid range of " + str((interp_alts[0], interp_alts[2])))
-
-        # Initialze empty lat/lon arrays
-        lats = np.full(np.squeeze(skymap.full_map_latitude[0, :, :]).shape, np.nan, dtype=skymap.full_map_latitude[0, :, :].dtype)
-        lons = np.full(np.squeeze(skymap.full_map_latitude[0, :, :]).shape, np.nan, dtype=skymap.full_map_latitude[0, :, :].dtype)
-
-        # Interpolate lats and lons at desired altitude
-        for i in range(skymap.full_map_latitude.shape[1]):
-            for j in range(skymap.full_map_latitude.shape[2]):
-                pixel_lats = skymap.full_map_latitude[:, i, j]
-                pixel_lons = skymap.full_map_longitude[:, i, j]
-                if np.isnan(pixel_lats).any() or np.isnan(pixel_lons).any():
-                    continue
-                lats[i, j] = np.interp(altitude_km, interp_alts, pixel_lats)
-                lons[i, j] = np.interp(altitude_km, interp_alts, pixel_lons)
-
-        lons[np.where(lons > 180)] -= 360.0  # Fix skymap to be in (-180,180) format
-
-    # Convert skymap to magnetic coords
-    mag_lats, mag_lons, _ = aacgmv2.convert_latlon_arr(lats.flatten(), lons.flatten(), (lons * 0.0).flatten(), timestamp, method_code="G2A")
-    mag_lats = np.reshape(mag_lats, lats.shape)
-    mag_lons = np.reshape(mag_lons, lons.shape)
+    # Obtain magnetic lat/lon arrays from skymap
+    #
+    # NOTE: when interpolating, pixels that are missing at any of the skymap's altitudes are excluded
+    mag_lats, mag_lons = get_mag_latlon(skymap, altitude_km, timestamp, mask_incomplete=True)
 
     # Check that lat/lon range is reasonable
     min_skymap_lat = np.nanmin(mag_lats)
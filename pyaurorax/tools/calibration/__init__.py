@@ -42,6 +42,8 @@ class CalibrationManager:
         step_flatfield_calibration: bool = True,
         step_rayleighs_calibration: bool = True,
         exposure_length_sec: float = 2.0,
+        out: Optional[np.ndarray] = None,
+        n_parallel: int = 1,
     ) -> np.ndarray:
         """
         Apply various calibration adjustments to a single or set of images raw images.
@@ -67,13 +69,24 @@ class CalibrationManager:
             exposure_length_sec (float): 
                 Force the exposure length to be a certain value. Default is TREx NIR's nominal operating mode 
                 exposure length of `2.0 seconds`. Adjusting this field should be done with caution.
+            out (numpy.ndarray): 
+                An array to write the calibrated images into, optional. It must be the same shape as the images,
+                and the same dtype as the calibrated data (see below). Use this to avoid allocating a new array
+                for each set of images, or pass in the images themselves to calibrate them in place when the
+                Rayleighs conversion is not being done.
+            n_parallel (int): 
+                Number of threads to use for calibrating the images. Defaults to `1`.
 
         Returns:
             The calibrated images. 
             
             The shape of the calibrated data will be same as the input images. The dtype of the calibrated data 
             will depend on if the Rayleighs conversion was performed. If it was, a float32 array will be returned. 
-            If it wasn't, the dtype will be the same as input images' dtype.
+            If it wasn't, the dtype will be the same as input images' dtype. If the `out` parameter was supplied,
+            that array is returned.
+
+            All steps are done in a single pass over the images, with the flatfield and Rayleighs conversion
+            applied as one per-pixel gain.
 
         Raises:
             ValueError: issues encountered with supplied parameters.
@@ -86,6 +99,8 @@ class CalibrationManager:
             step_flatfield_calibration,
             step_rayleighs_calibration,
             exposure_length_sec,
+            out,
+            n_parallel,
         )
 
     def trex_nir(
@@ -97,6 +112,8 @@ class CalibrationManager:
         step_flatfield_calibration: bool = True,
         step_rayleighs_calibration: bool = True,
         exposure_length_sec: float = 5.0,
+        out: Optional[np.ndarray] = None,
+        n_parallel: int = 1,
     ) -> np.ndarray:
         """
         Apply various calibration adjustments to a single or set of images raw images.
@@ -121,13 +138,24 @@ class CalibrationManager:
             exposure_length_sec (float): 
                 Force the exposure length to be a certain value. Default is TREx NIR's nominal operating mode 
                 exposure length of `5.0 seconds`. Adjusting this field should be done with caution.
+            out (numpy.ndarray): 
+                An array to write the calibrated images into, optional. It must be the same shape as the images,
+                and the same dtype as the calibrated data (see below). Use this to avoid allocating a new array
+                for each set of images, or pass in the images themselves to calibrate them in place when the
+                Rayleighs conversion is not being done.
+            n_parallel (int): 
+                Number of threads to use for calibrating the images. Defaults to `1`.
 
         Returns:
             The calibrated images. 
             
             The shape of the calibrated data will be same as the input images. The dtype of the calibrated data 
             will depend on if the Rayleighs conversion was performed. If it was, a float32 array will be returned. 
-            If it wasn't, the dtype will be the same as input images' dtype.
+            If it wasn't, the dtype will be the same as input images' dtype. If the `out` parameter was supplied,
+            that array is returned.
+
+            All steps are done in a single pass over the images, with the flatfield and Rayleighs conversion
+            applied as one per-pixel gain.
 
         Raises:
             ValueError: issues encountered with supplied parameters.
@@ -140,4 +168,6 @@ class CalibrationManager:
             step_flatfield_calibration,
             step_rayleighs_calibration,
             exposure_length_sec,
+            out,
+            n_parallel,
         )
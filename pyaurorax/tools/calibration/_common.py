@@ -13,82 +13,121 @@
 # limitations under the License.
 
 import numpy as np
-from ...data.ucalgary import Calibration
+from concurrent.futures import ThreadPoolExecutor
 
+# number of pixels processed at a time, sized so that the working data stays in cache
+__CHUNK_PIXELS = 2**18
 
-def perform_dark_frame_correction(images: np.ndarray, size: int) -> np.ndarray:
-    """
-    This method will perform a dark frame correction by subtracting an average
-    of a bottom corner grid from the image (ie. 4x4.).
 
-    NOTE: This is an internal-only used function. It is not publicly exposed.
+def __get_chunks(shape):
     """
-    # init
-    original_dtype = images.dtype
-    if (len(images.shape) == 2):
-        # only a single image, add an axis
-        images = images[:, :, np.newaxis]
-
-    # extract NxN box from lower left corner, compute means
-    dark_boxes = images[0:size, 0:size, :]
-    dark_means = np.mean(dark_boxes, axis=(0, 1))
-    dark_means = dark_means.astype(np.int32)
-
-    # apply
-    #
-    # NOTE: we convert to int32 to avoid lower-bound rollover and allow
-    # for negative numbers, which we then cast to 0 and convert back to
-    # the native dtype.
-    #
-    # TODO: there's definitely some optimization possible here
-    images = images.astype(np.int32)
-    for i in range(0, images.shape[2]):
-        images[:, :, i] = images[:, :, i] - dark_means[i]
-    images[np.where(images < 0)] = 0
-    images = images.astype(original_dtype)
-
-    # remove last axis if there's only one image
-    if (images.shape[2] == 1):
-        images = np.squeeze(images, axis=2)
-
-    # return
-    return images
-
+    Split a [rows, cols, images] array into blocks of about __CHUNK_PIXELS pixels. Blocks
+    are groups of whole rows where possible, since those are contiguous in memory.
+    """
+    n_rows, n_cols, n_images = shape
+    row_pixels = n_cols * n_images
+    if (row_pixels <= __CHUNK_PIXELS):
+        n_chunk_rows = __CHUNK_PIXELS // row_pixels
+        return [(slice(r, r + n_chunk_rows), slice(None)) for r in range(0, n_rows, n_chunk_rows)]
+    n_chunk_images = max(1, __CHUNK_PIXELS // n_cols)
+    return [(slice(r, r + 1), slice(i, i + n_chunk_images)) for r in range(0, n_rows) for i in range(0, n_images, n_chunk_images)]
 
-def perform_flatfield_calibration(images: np.ndarray, cal_flatfield: Calibration) -> np.ndarray:
-    # add axis if it's a single image
-    if (len(images.shape) == 2):
-        # only a single image, add an axis
-        images = images[:, :, np.newaxis]
 
-    # for each image, apply multiplier
-    for i in range(0, images.shape[-1]):
-        images[:, :, i] = images[:, :, i] * cal_flatfield.flat_field_multiplier
+def apply_calibration_steps(images, dark_frame_size, cal_flatfield, cal_rayleighs, exposure_length_sec, out, n_parallel):
+    """
+    Perform the dark frame correction, flatfield calibration and Rayleighs conversion in
+    a single pass over the images.
 
-    # remove last axis if there's only one image
-    if (images.shape[2] == 1):
-        images = np.squeeze(images, axis=2)
+    The dark frame correction subtracts an average of a bottom corner grid (ie. 5x5) from each
+    image, and is skipped if dark_frame_size is None. The flatfield and Rayleighs steps are
+    combined into a single per-pixel gain, and are skipped if their calibration is None.
 
-    # return
-    return images
+    The images are processed in cache-sized blocks, optionally using several threads, and are
+    written into the out array (or a new one). The output is float32 if the Rayleighs conversion
+    is done, otherwise it is the same dtype as the images.
 
+    NOTE: This is an internal-only used function. It is not publicly exposed.
+    """
+    # nothing to do
+    if (dark_frame_size is None and cal_flatfield is None and cal_rayleighs is None and out is None):
+        return images
+
+    # remove the last axis of the result if there's only one image, unless an out array
+    # was supplied (which is returned as it is)
+    squeeze_out = (out is None and len(images.shape) == 3 and images.shape[2] == 1)
+
+    # check the output array
+    out_dtype = np.dtype(np.float32) if cal_rayleighs is not None else images.dtype
+    if (out is None):
+        out = np.empty(images.shape, dtype=out_dtype)
+    elif (out.shape != images.shape):
+        raise ValueError("The out array must be the same shape as the images, expected %s but got %s" % (images.shape, out.shape))
+    elif (out.dtype != out_dtype):
+        raise ValueError("The out array must be of dtype %s, but got %s" % (out_dtype, out.dtype))
+    return_out = out
 
-def perform_rayleighs_correction(images: np.ndarray, cal_rayleighs: Calibration, exposure_length_sec: float) -> np.ndarray:
     # add axis if it's a single image
     if (len(images.shape) == 2):
-        # only a single image, add an axis
         images = images[:, :, np.newaxis]
+        out = out[:, :, np.newaxis]
 
-    # convert image array to a float array
-    images = images.astype(np.float32)
-
-    # for each images, apply rayleighs conversion
-    for i in range(0, images.shape[-1]):
-        images[:, :, i] = images[:, :, i] * cal_rayleighs.rayleighs_perdn_persecond / float(exposure_length_sec)
+    # compute the dark frame means of all images
+    #
+    # NOTE: we truncate the means to integers, and clip negative values to 0 after
+    # subtracting them, as if the images were still in their native dtype
+    dark_means = None
+    if (dark_frame_size is not None):
+        dark_means = np.mean(images[0:dark_frame_size, 0:dark_frame_size, :], axis=(0, 1)).astype(np.int32)
 
-    # remove last axis if there's only one image
-    if (images.shape[2] == 1):
-        images = np.squeeze(images, axis=2)
+    # combine the flatfield and rayleighs steps into a single gain for each pixel
+    #
+    # NOTE: when the rayleighs conversion isn't done, the flatfield result is truncated back
+    # to the images' dtype, so we keep that step in double precision
+    gain = None
+    work_dtype = np.int32
+    if (cal_flatfield is not None):
+        gain = np.asarray(cal_flatfield.flat_field_multiplier, dtype=np.float64)
+        work_dtype = np.float64
+    if (cal_rayleighs is not None):
+        gain = (1.0 if gain is None else gain) * cal_rayleighs.rayleighs_perdn_persecond / float(exposure_length_sec)
+        gain = np.broadcast_to(np.asarray(gain, dtype=np.float32), images.shape[0:2])
+        work_dtype = np.float32
+
+    # process each block of pixels
+    def process_chunk(chunk):
+        row_slice, image_slice = chunk
+        images_chunk = images[row_slice, :, image_slice]
+        out_chunk = out[row_slice, :, image_slice]
+
+        # work in the output array if it can hold the intermediate values, otherwise
+        # in a temporary buffer
+        work = out_chunk if (out.dtype == work_dtype) else np.empty(images_chunk.shape, dtype=work_dtype)
+
+        # dark frame correction
+        if (dark_means is not None):
+            np.subtract(images_chunk, dark_means[image_slice], out=work, dtype=work_dtype, casting="unsafe")
+            np.maximum(work, 0, out=work)
+        else:
+            np.copyto(work, images_chunk, casting="unsafe")
+
+        # flatfield and rayleighs
+        if (gain is not None):
+            np.multiply(work, gain[row_slice, :, np.newaxis], out=work, casting="unsafe")
+
+        # write to the output
+        if (work is not out_chunk):
+            np.copyto(out_chunk, work, casting="unsafe")
+
+    chunks = __get_chunks(images.shape)
+    if (n_parallel > 1 and len(chunks) > 1):
+        with ThreadPoolExecutor(max_workers=n_parallel) as executor:
+            for _ in executor.map(process_chunk, chunks):
+                pass
+    else:
+        for chunk in chunks:
+            process_chunk(chunk)
 
     # return
-    return images
+    if (squeeze_out is True):
+        return_out = np.squeeze(return_out, axis=2)
+    return return_out
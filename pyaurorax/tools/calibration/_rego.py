@@ -15,11 +15,7 @@
 Calibration procedures for REGO data.
 """
 
-from ._common import (
-    perform_dark_frame_correction,
-    perform_flatfield_calibration,
-    perform_rayleighs_correction,
-)
+from ._common import apply_calibration_steps
 
 
 def apply_calibration(
@@ -30,6 +26,8 @@ def apply_calibration(
     step_flatfield_calibration,
     step_rayleighs_calibration,
     exposure_length_sec,
+    out,
+    n_parallel,
 ):
     # verify that we have everything we need for each requested step
     if (step_flatfield_calibration is True and cal_flatfield is None):
@@ -37,22 +35,18 @@ def apply_calibration(
     if (step_rayleighs_calibration is True and cal_rayleighs is None):
         raise ValueError("The cal_rayleighs parameter must be supplied to perform the rayleighs conversion step")
 
-    # init
-    calibrated_images = images
-
-    # perform the dark frame correction
+    # perform the calibration steps in a single pass over the images
     #
-    # NOTE: we do a 5x5 bottom corner mean
-    if (step_dark_frame_correction is True):
-        calibrated_images = perform_dark_frame_correction(images, 5)
-
-    # apply the flatfield correction
-    if (step_flatfield_calibration is True and cal_flatfield is not None):
-        calibrated_images = perform_flatfield_calibration(calibrated_images, cal_flatfield)
-
-    # apply the rayleighs conversion
-    if (step_rayleighs_calibration is True and cal_rayleighs is not None):
-        calibrated_images = perform_rayleighs_correction(calibrated_images, cal_rayleighs, exposure_length_sec)
+    # NOTE: we do a 5x5 bottom corner mean for the dark frame correction
+    calibrated_images = apply_calibration_steps(
+        images,
+        5 if step_dark_frame_correction is True else None,
+        cal_flatfield if step_flatfield_calibration is True else None,
+        cal_rayleighs if step_rayleighs_calibration is True else None,
+        exposure_length_sec,
+        out,
+        n_parallel,
+    )
 
     # return
     return calibrated_images
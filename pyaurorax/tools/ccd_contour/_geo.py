@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import numpy as np
+from .._skymap_geometry import get_latlon
 
 
 def __haversine_distances(target_lat, target_lon, lat_array, lon_array):
@@ -47,29 +48,7 @@ def geo(skymap, altitude_km, contour_lats, contour_lons, constant_lat, constant_
         raise ValueError("No contour defined in input: Pass one of 'contour_lats & contour_lons', 'constant_lat', or 'constant_lon'.")
 
     # Obtain lat/lon arrays from skymap at desired altitude
-    if (altitude_km * 1000.0 in skymap.full_map_altitude):
-        altitude_idx = np.where(altitude_km * 1000.0 == skymap.full_map_altitude)
-
-        lats = np.squeeze(skymap.full_map_latitude[altitude_idx, :, :])
-        lons = np.squeeze(skymap.full_map_longitude[altitude_idx, :, :])
-        lons[np.where(lons > 180)] -= 360.0  # Fix skymap to be in (-180,180) format
-    else:
-        # Make sure altitude is in range that can be interpolated
-        if (altitude_km * 1000.0 < skymap.full_map_altitude[0]) or (altitude_km * 1000.0 > skymap.full_map_altitude[2]):
-            raise ValueError("Altitude " + str(altitude_km) + " outside valid range of " +
-                             str((skymap.full_map_altitude[0] / 1000.0, skymap.full_map_altitude[2] / 1000.0)))
-
-        # Initialze empty lat/lon arrays
-        lats = np.full(np.squeeze(skymap.full_map_latitude[0, :, :]).shape, np.nan, dtype=skymap.full_map_latitude[0, :, :].dtype)
-        lons = lats.copy()
-
-        # Interpolate lats and lons at desired altitude
-        for i in range(skymap.full_map_latitude.shape[1]):
-            for j in range(skymap.full_map_latitude.shape[2]):
-                lats[i, j] = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_latitude[:, i, j])
-                lons[i, j] = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_longitude[:, i, j])
-
-        lons[np.where(lons > 180)] -= 360.0  # Fix skymap to be in (-180,180) format
+    lats, lons = get_latlon(skymap, altitude_km)
 
     if (len(lats.shape) < 2) or (len(lons.shape) < 2):
         raise ValueError("Latitude/Longitude arrays within skymap must be multi-dimensional for ASI data.")
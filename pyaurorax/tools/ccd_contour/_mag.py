@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import numpy as np
-import aacgmv2
+from .._skymap_geometry import get_mag_latlon
 
 
 def __haversine_distances(target_lat, target_lon, lat_array, lon_array):
@@ -47,42 +47,8 @@ def mag(skymap, timestamp, altitude_km, contour_lats, contour_lons, constant_lat
     if sum([((contour_lats is not None) and (contour_lons is not None)), (constant_lat is not None), (constant_lon is not None)]) == 0:
         raise ValueError("No contour defined in input: Pass one of 'contour_lats & contour_lons', 'constant_lat', or 'constant_lon'.")
 
-    # Obtain lat/lon arrays from skymap at desired altitude
-    if (altitude_km * 1000.0 in skymap.full_map_altitude):
-        altitude_idx = np.where(altitude_km * 1000.0 == skymap.full_map_altitude)
-
-        lats = np.squeeze(skymap.full_map_latitude[altitude_idx, :, :])
-        lons = np.squeeze(skymap.full_map_longitude[altitude_idx, :, :])
-        lons[np.where(lons > 180)] -= 360.0  # Fix skymap to be in (-180,180) format
-
-    else:
-        # Make sure altitude is in range that can be interpolated
-        if (altitude_km * 1000.0 < skymap.full_map_altitude[0]) or (altitude_km * 1000.0 > skymap.full_map_altitude[2]):
-            raise ValueError("Altitude " + str(altitude_km) + " outside valid range of " +
-                             str((skymap.full_map_altitude[0] / 1000.0, skymap.full_map_altitude[2] / 1000.0)))
-
-        # Initialze empty lat/lon arrays
-        lats = np.full(np.squeeze(skymap.full_map_latitude[0, :, :]).shape, np.nan, dtype=skymap.full_map_latitude[0, :, :].dtype)
-        lons = lats.copy()
-
-        # Interpolate lats and lons at desired altitude
-        for i in range(skymap.full_map_latitude.shape[1]):
-            for j in range(skymap.full_map_latitude.shape[2]):
-                lats[i, j] = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_latitude[:, i, j])
-                lons[i, j] = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_longitude[:, i, j])
-
-        lons[np.where(lons > 180)] -= 360.0  # Fix skymap to be in (-180,180) format
-
-        # Convert to magnetic coords
-        mag_lats, mag_lons, _ = aacgmv2.convert_latlon_arr(
-            lats.flatten(),
-            lons.flatten(),
-            (lons * 0.0).flatten(),
-            timestamp,
-            method_code='G2A',
-        )
-        lats = np.reshape(mag_lats, lats.shape)
-        lons = np.reshape(mag_lons, lons.shape)
+    # Obtain magnetic lat/lon arrays from skymap at desired altitude
+    lats, lons = get_mag_latlon(skymap, altitude_km, timestamp)
 
     if (len(lats.shape) < 2) or (len(lons.shape) < 2):
         raise ValueError("Latitude/Longitude arrays within skymap must be multi-dimensional for ASI data.")
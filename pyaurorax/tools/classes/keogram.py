@@ -17,7 +17,6 @@ Class representation for a keogram.
 
 import os
 import datetime
-import aacgmv2
 import matplotlib.pyplot as plt
 import numpy as np
 from dataclasses import dataclass
@@ -25,6 +24,7 @@ from typing import List, Optional, Tuple, Literal, Union, Any
 from ...data.ucalgary import Skymap
 from ..._util import show_warning
 from ..mosaic._prep_images import __determine_cadence as _determine_cadence
+from .._skymap_geometry import get_latlon, get_mag_latlon
 
 
 @dataclass
@@ -50,6 +50,10 @@ class Keogram:
 
         geo_y (numpy.ndarray): 
             The y-axis representing geographic latitude for the keogram.
+
+        mask (numpy.ndarray): 
+            Which columns of the keogram have data, as a boolean array. This is set by the 
+            `inject_nans()` function, and is None otherwise.
     """
 
     def __init__(self,
@@ -67,6 +71,7 @@ class Keogram:
         self.ccd_y = ccd_y
         self.mag_y = mag_y
         self.geo_y = geo_y
+        self.mask = None
 
         # private vars
         self.__slice_idx = slice_idx
@@ -80,8 +85,16 @@ class Keogram:
         ccd_y_str = "None" if self.ccd_y is None else "array(%d values)" % (self.ccd_y.shape[0])
         mag_y_str = "None" if self.mag_y is None else "array(%d values)" % (self.mag_y.shape[0])
         geo_y_str = "None" if self.geo_y is None else "array(%d values)" % (self.geo_y.shape[0])
+        mask_str = "None" if self.mask is None else "array(%d values)" % (self.mask.shape[0])
 
-        return "Keogram(data=%s, timestamp=%s, ccd_y=%s, mag_y=%s, geo_y=%s)" % (data_str, timestamp_str, ccd_y_str, mag_y_str, geo_y_str)
+        return "Keogram(data=%s, timestamp=%s, ccd_y=%s, mag_y=%s, geo_y=%s, mask=%s)" % (
+            data_str,
+            timestamp_str,
+            ccd_y_str,
+            mag_y_str,
+            geo_y_str,
+            mask_str,
+        )
 
     def pretty_print(self):
         """
@@ -93,6 +106,7 @@ class Keogram:
         ccd_y_str = "None" if self.ccd_y is None else "array(%d values)" % (self.ccd_y.shape[0])
         mag_y_str = "None" if self.mag_y is None else "array(%d values)" % (self.mag_y.shape[0])
         geo_y_str = "None" if self.geo_y is None else "array(%d values)" % (self.geo_y.shape[0])
+        mask_str = "None" if self.mask is None else "array(%d values)" % (self.mask.shape[0])
 
         # print
         print("Keogram:")
@@ -102,6 +116,7 @@ class Keogram:
         print("  %-17s: %s" % ("ccd_y", ccd_y_str))
         print("  %-17s: %s" % ("geo_y", geo_y_str))
         print("  %-17s: %s" % ("mag_y", mag_y_str))
+        print("  %-17s: %s" % ("mask", mask_str))
 
     def set_geographic_latitudes(self, skymap: Skymap, altitude_km: Optional[Union[int, float]] = None) -> None:
         """
@@ -143,29 +158,9 @@ class Keogram:
 
         # determine altitude index to use
         if (altitude_km is not None):
-            # Obtain lat/lon arrays from skymap
-            if (altitude_km * 1000.0 in skymap.full_map_altitude):
-                altitude_idx = np.where(altitude_km * 1000.0 == skymap.full_map_altitude)
-
-                if skymap.full_map_latitude.shape[-1] == 1:
-                    self.geo_y = np.squeeze(skymap.full_map_latitude[altitude_idx, :, 0]).copy()
-                else:
-                    self.geo_y = np.squeeze(skymap.full_map_latitude[altitude_idx, :, self.__slice_idx]).copy()
-            else:
-                # Make sure altitude is in range that can be interpolated
-                if (altitude_km * 1000.0 < skymap.full_map_altitude[0]) or (altitude_km * 1000.0 > skymap.full_map_altitude[2]):
-                    raise ValueError("Altitude " + str(altitude_km) + " outside valid range of " +
-                                     str((skymap.full_map_altitude[0] / 1000.0, skymap.full_map_altitude[2] / 1000.0)))
-
-                # Initialze empty lat/lon arrays
-                lats = np.full(np.squeeze(skymap.full_map_latitude[0, :, :]).shape, np.nan, dtype=skymap.full_map_latitude[0, :, :].dtype)
-
-                # Interpolate lats and lons at desired altitude
-                for i in range(skymap.full_map_latitude.shape[1]):
-                    for j in range(skymap.full_map_latitude.shape[2]):
-                        lats[i, j] = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_latitude[:, i, j])
-
-                self.geo_y = lats[:, self.__slice_idx].copy()
+            # Obtain lat arrays from skymap, interpolating to the desired altitude if needed
+            lats, _ = get_latlon(skymap, altitude_km)
+            self.geo_y = lats[:, self.__slice_idx].copy()
         else:
             # use default middle altitude
             if skymap.full_map_latitude.shape[-1] == 1:
@@ -216,67 +211,21 @@ class Keogram:
             skymap.full_map_longitude = skymap.full_map_longitude[:, :, np.newaxis]
             skymap.full_elevation = skymap.full_elevation[:, np.newaxis]
 
-        # determine altitude index to use
-        if (altitude_km is not None):
-            # Obtain lat/lon arrays from skymap
-            if (altitude_km * 1000.0 in skymap.full_map_altitude):
-                altitude_idx = np.where(altitude_km * 1000.0 == skymap.full_map_altitude)
+        # determine altitude to use, defaulting to the middle altitude of the skymap
+        if (altitude_km is None):
+            altitude_km = skymap.full_map_altitude[1] / 1000.0
 
-                lats = np.squeeze(skymap.full_map_latitude[altitude_idx, :, :])
-                lons = np.squeeze(skymap.full_map_longitude[altitude_idx, :, :])
-                lons[np.where(lons > 180)] -= 360.0
+        # Obtain lats and lons at this altitude, in geomagnetic coordinates
+        mag_lats, _ = get_mag_latlon(skymap, altitude_km, timestamp)
 
-            else:
-                # Make sure altitude is in range that can be interpolated
-                if (altitude_km * 1000.0 < skymap.full_map_altitude[0]) or (altitude_km * 1000.0 > skymap.full_map_altitude[2]):
-                    raise ValueError("Altitude " + str(altitude_km) + " outside valid range of " +
-                                     str((skymap.full_map_altitude[0] / 1000.0, skymap.full_map_altitude[2] / 1000.0)))
-
-                # Initialze empty lat/lon arrays
-                lats = np.full(np.squeeze(skymap.full_map_latitude[0, :, :]).shape, np.nan, dtype=skymap.full_map_latitude[0, :, :].dtype)
-                lons = lats.copy()
-
-                # Interpolate lats and lons at desired altitude
-                for i in range(skymap.full_map_latitude.shape[1]):
-                    for j in range(skymap.full_map_latitude.shape[2]):
-                        lats[i, j] = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_latitude[:, i, j])
-                        lons[i, j] = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_longitude[:, i, j])
-
-                lons[np.where(lons > 180)] -= 360.0
-
-            # Convert lats and lons to geomagnetic coordinates
-            mag_lats, mag_lons, _ = aacgmv2.convert_latlon_arr(lats.flatten(), lons.flatten(), (lons * 0.0).flatten(), timestamp, method_code='G2A')
-            mag_lats = np.reshape(mag_lats, lats.shape)
-            mag_lons = np.reshape(mag_lons, lons.shape)
-
-            # If lat/lon arrays are 1-dimensional then we know it is a spectrograph skymap. In this case, we will simply
-            # reform to add an additional dimension, so that self.__slice_idx (which is always zero for spectrograph data
-            # as there is only one longitudinal bin) can be used to index into the array the same as it would be for ASI data
-            if len(mag_lats.shape) == 1:
-                mag_lats = mag_lats[:, np.newaxis]
-                mag_lons = mag_lons[:, np.newaxis]
-
-            # Set the y axis to the desired slice index of the magnetic latitudes
-            self.mag_y = mag_lats[:, self.__slice_idx].copy()
-        else:
-            # Convert middle altitude lats and lons to geomagnetic coordinates
-            mag_lats, mag_lons, _ = aacgmv2.convert_latlon_arr(np.squeeze(skymap.full_map_latitude[1, :, :]).flatten(),
-                                                               np.squeeze(skymap.full_map_longitude[1, :, :]).flatten(),
-                                                               (skymap.full_map_longitude[1, :, :] * 0.0).flatten(),
-                                                               timestamp,
-                                                               method_code='G2A')
-            mag_lats = np.reshape(mag_lats, np.squeeze(skymap.full_map_latitude[1, :, :]).shape)
-            mag_lons = np.reshape(mag_lons, np.squeeze(skymap.full_map_longitude[1, :, :]).shape)
-
-            # If lat/lon arrays are 1-dimensional then we know it is a spectrograph skymap. In this case, we will simply
-            # reform to add an additional dimension, so that self.__slice_idx (which is always zero for spectrograph data
-            # as there is only one longitudinal bin) can be used to index into the array the same as it would be for ASI data
-            if len(mag_lats.shape) == 1:
-                mag_lats = mag_lats[:, np.newaxis]
-                mag_lons = mag_lons[:, np.newaxis]
-
-            # Set the y axis to the desired slice index of the magnetic latitudes
-            self.mag_y = mag_lats[:, self.__slice_idx].copy()
+        # If lat/lon arrays are 1-dimensional then we know it is a spectrograph skymap. In this case, we will simply
+        # reform to add an additional dimension, so that self.__slice_idx (which is always zero for spectrograph data
+        # as there is only one longitudinal bin) can be used to index into the array the same as it would be for ASI data
+        if len(mag_lats.shape) == 1:
+            mag_lats = mag_lats[:, np.newaxis]
+
+        # Set the y axis to the desired slice index of the magnetic latitudes
+        self.mag_y = mag_lats[:, self.__slice_idx].copy()
 
     def plot(self,
              y_type: Literal["ccd", "mag", "geo"] = "ccd",
@@ -516,6 +465,7 @@ class Keogram:
     def inject_nans(
         self,
         cadence: Optional[Union[int, float]] = None,
+        preserve_dtype: bool = False,
     ) -> None:
         """
         Fill keogram columns that do not have data with NaNs.
@@ -524,10 +474,15 @@ class Keogram:
             cadence (int or float): 
                 The cadence, in seconds, of the data for the keogram. Default is to automatically
                 determine the cadence based on the keogram's timestamp data
+
+            preserve_dtype (bool): 
+                Keep the keogram data in its original dtype, filling the columns that do not have data
+                with zeros instead of NaNs. Default is `False`, which converts the data to floats.
         
         Returns:
             None. If there is missing data, the Keogram object's data and timestamp attributes
-            will be updated accordingly.
+            will be updated accordingly. The `mask` attribute is also set, indicating which columns
+            have data.
 
         # Raises:
             ValueError if called on a keogram with improper / corrupted data format / shape.
@@ -575,11 +530,12 @@ class Keogram:
 
         # If the keogram is not missing any data, nothing is changed
         if n_desired_frames == n_keogram_frames:
+            self.mask = np.ones(n_keogram_frames, dtype=bool)
             return
 
         # Otherwise, we need to find which desired timestamps are missing
 
-        # First, create a new keogram array and new timestamp list with the correct size for the desired number of frames
+        # First, create a new keogram array with the correct size for the desired number of frames
         if len(self.data.shape) == 2:
             desired_keogram_shape = (self.data.shape[0], n_desired_frames)
         elif len(self.data.shape) == 3:
@@ -587,67 +543,48 @@ class Keogram:
         else:
             raise ValueError(f"Could not inject NaNs into keogram with data shape {self.data.shape}")  # pragma: nocover
 
-        desired_keogram = np.empty(shape=desired_keogram_shape)
-        desired_timestamp = []
-        desired_timestamp_indices = []
+        if (preserve_dtype is True):
+            desired_keogram = np.empty(shape=desired_keogram_shape, dtype=self.data.dtype)
+        else:
+            desired_keogram = np.empty(shape=desired_keogram_shape)
 
         if is_burst:
             tol = datetime.timedelta(seconds=(1.0 / 6.0))
         else:
             tol = datetime.timedelta(seconds=1.0)
 
-        # Fill the list of desired timestamps based on the cadence
-
-        # For each *desired* timestamp, we use a binary search to determine whether
-        # or not that timestamp already exists in the data, within tolerance
-        target_dt = start_dt
-        for _ in range(n_desired_frames):
-
-            low = 0
-            high = len(self.timestamp) - 1
-            match_idx = None
-
-            # binary search
-            while low <= high:
-                mid = (low + high) // 2
-                mid_ts = self.timestamp[mid]
-
-                if mid_ts < target_dt - tol:
-                    low = mid + 1
-                elif mid_ts > target_dt + tol:
-                    high = mid - 1
-                else:
-                    # Match, within tolerance, has been found
-                    match_idx = mid
-
-                    high = mid - 1
-
-            # If we've found a matching timestamp, insert it into the new timestamp array, and
-            # otherwise insert the desired timestamp
-            if match_idx is not None:
-                desired_timestamp.append(self.timestamp[match_idx])
-            else:
-                desired_timestamp.append(target_dt)
-
-            # Add the index into the original keogram corresponding to this timestamp if it exists
-            # and otherwise add None to the index tracking list, which we will use to insert the
-            # data and NaN columns
-            desired_timestamp_indices.append(match_idx)
-
-            # Update the desired datetime according to the cadence
-            target_dt += datetime.timedelta(seconds=cadence)
-
-        # Now that we have our desired timestamps, we can go through and fill the new keogram array
-        for i in range(len(desired_timestamp)):
-
-            keo_idx = desired_timestamp_indices[i]
-
-            # If this desired timestamp had no data, fill the keogram column with nans
-            if keo_idx is None:
-                desired_keogram[:, i] = np.nan
-            # Otherwise, keep the data intact for this column
-            else:
-                desired_keogram[:, i] = self.data[:, keo_idx]
+        # Fill the array of desired timestamps based on the cadence
+        #
+        # NOTE: the timestamps are handled as datetime64 values in microseconds, the same
+        # precision as datetime objects
+        one_us = datetime.timedelta(microseconds=1)
+        timestamp_arr = np.array(self.timestamp, dtype="datetime64[us]")
+        cadence_td64 = np.timedelta64(datetime.timedelta(seconds=cadence) // one_us, "us")
+        target_arr = np.datetime64(start_dt, "us") + np.arange(0, n_desired_frames) * cadence_td64
+        tol_td64 = np.timedelta64(tol // one_us, "us")
+
+        # For each *desired* timestamp, determine whether or not that timestamp already exists
+        # in the data, within tolerance. The first timestamp after the start of the tolerance
+        # window is the earliest possible match.
+        match_idx = np.clip(np.searchsorted(timestamp_arr, target_arr - tol_td64, side="left"), 0, len(timestamp_arr) - 1)
+        has_data = np.abs(timestamp_arr[match_idx] - target_arr) <= tol_td64
+
+        # If we've found a matching timestamp, use it in the new timestamp list, and otherwise
+        # use the desired timestamp
+        desired_timestamp = np.where(has_data, timestamp_arr[match_idx], target_arr).tolist()
+
+        # Now we can fill the new keogram array, with the data intact for the columns that have it,
+        # and nans for the rest (or zeros, if the dtype is preserved)
+        #
+        # NOTE: all columns are gathered at once along the timestamp axis, which is much faster
+        # than selecting only the columns with data
+        if (preserve_dtype is True):
+            np.take(self.data, match_idx, axis=1, out=desired_keogram)
+            desired_keogram[:, ~has_data] = 0
+        else:
+            desired_keogram[...] = np.take(self.data, match_idx, axis=1)
+            desired_keogram[:, ~has_data] = np.nan
+        self.mask = has_data
 
         # Update the keogram object with the new data and timestamp arrays
         self.data = desired_keogram
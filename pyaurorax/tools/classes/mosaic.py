@@ -131,6 +131,10 @@ class MosaicData:
 
         data_types (List[str]): 
             The data types for each data object.    
+
+        masks (Dict[str, numpy.ndarray]): 
+            Which timestamps have image data; a dictionary. Keys are the site UID, ndarray is a 
+            boolean array with an element for each timestamp. Optional.
     """
 
     site_uid_list: List[str]
@@ -138,6 +142,7 @@ class MosaicData:
     images: Dict[str, ndarray]
     images_dimensions: Dict[str, Tuple]
     data_types: List[str]
+    masks: Optional[Dict[str, ndarray]] = None
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -147,9 +152,17 @@ class MosaicData:
         unique_dimensions_str = str(list(dict.fromkeys(self.images_dimensions.values()))).replace("[", "").replace("]", "").replace("), (", "),(")
         images_str = "Dict[%d sites of array(dims=%s)]" % (len(self.images.keys()), unique_dimensions_str)
         timestamps_str = "[%d timestamps]" % (len(self.timestamps))
+        masks_str = "None"
+        if (self.masks is not None):
+            masks_str = "{%s}" % (", ".join(["'%s': array(%d values)" % (site_uid, mask.shape[0]) for site_uid, mask in self.masks.items()]))
 
         # return
-        return "MosaicData(images=%s, timestamps=%s, site_uid_list=%s)" % (images_str, timestamps_str, self.site_uid_list.__repr__())
+        return "MosaicData(images=%s, timestamps=%s, site_uid_list=%s, masks=%s)" % (
+            images_str,
+            timestamps_str,
+            self.site_uid_list.__repr__(),
+            masks_str,
+        )
 
     def pretty_print(self):
         """
@@ -159,6 +172,9 @@ class MosaicData:
         unique_dimensions_str = str(list(dict.fromkeys(self.images_dimensions.values()))).replace("[", "").replace("]", "").replace("), (", "),(")
         images_str = "Dict[%d sites of array(dims=%s)]" % (len(self.images.keys()), unique_dimensions_str)
         timestamps_str = "[%d timestamps]" % (len(self.timestamps))
+        masks_str = "None"
+        if (self.masks is not None):
+            masks_str = "{%s}" % (", ".join(["'%s': array(%d values)" % (site_uid, mask.shape[0]) for site_uid, mask in self.masks.items()]))
 
         # print
         print("MosaicData:")
@@ -167,6 +183,7 @@ class MosaicData:
         print("  %-19s: %s" % ("images", images_str))
         print("  %-19s: %s" % ("images_dimensions", self.images_dimensions))
         print("  %-19s: %s" % ("data_types", self.data_types))
+        print("  %-19s: %s" % ("masks", masks_str))
 
 
 @dataclass
@@ -176,7 +193,8 @@ class Mosaic:
 
     Attributes:
         polygon_data (matplotlib.collections.PolyCollection): 
-            Generated polygons containing rendered data.
+            Generated polygons containing rendered data. This is None if the mosaic
+            was created using the raster backend.
 
         cartopy_projection (cartopy.crs.Projection): 
             Cartopy projection to utilize.
@@ -190,39 +208,58 @@ class Mosaic:
         spect_intensity_scale (Tuple[int]): 
             The min and max values that spectrograph data
             is scaled to in the mosaic, if any is present.
+
+        raster_data (numpy.ndarray): 
+            Rendered RGBA image data, if the mosaic was created using the raster 
+            backend. The first row of the image is the bottom of the map.
+
+        raster_extent (Tuple[float]): 
+            The extent of the raster data, in the coordinates of the cartopy projection. This 
+            is in the order of (min_x, max_x, min_y, max_y).
     """
-    polygon_data: Union[PolyCollection, List[PolyCollection]]
+    polygon_data: Optional[Union[PolyCollection, List[PolyCollection]]]
     cartopy_projection: Projection
     contour_data: Optional[Dict[str, List[Any]]] = None
     spect_cmap: Optional[str] = None
     spect_intensity_scale: Optional[Tuple[int, int]] = None
+    raster_data: Optional[ndarray] = None
+    raster_extent: Optional[Tuple[float, float, float, float]] = None
 
     def __str__(self) -> str:
         return self.__repr__()
 
     def __repr__(self) -> str:
-        if isinstance(self.polygon_data, list):
-            polycollection_str = "[PolyCollection(...), ...]"  # pragma: nocover
+        if (self.raster_data is not None):
+            data_str = "raster_data=array(dims=%s, dtype=%s)" % (self.raster_data.shape, self.raster_data.dtype)
+        elif isinstance(self.polygon_data, list):
+            data_str = "polygon_data=[PolyCollection(...), ...]"  # pragma: nocover
         else:
-            polycollection_str = "PolyCollection(...)"
+            data_str = "polygon_data=PolyCollection(...)"
 
         if self.contour_data is not None:
-            return "Mosaic(polygon_data=PolyCollection(...), cartopy_projection=Projection(%s), %d Contours)" % (  # pragma: nocover
+            return "Mosaic(%s, cartopy_projection=Projection(%s), %d Contours)" % (  # pragma: nocover
+                data_str,
                 self.cartopy_projection.to_string(),
                 len(self.contour_data.get("x", [])),
             )
         else:
-            return "Mosaic(polygon_data=" + polycollection_str + ", cartopy_projection=Projection(%s))" % (self.cartopy_projection.to_string())
+            return "Mosaic(" + data_str + ", cartopy_projection=Projection(%s))" % (self.cartopy_projection.to_string())
 
     def pretty_print(self):
         """
         A special print output for this class.
         """
         # set special strings
-        if isinstance(self.polygon_data, list):
+        if (self.polygon_data is None):
+            polycollection_str = "None"
+        elif isinstance(self.polygon_data, list):
             polycollection_str = "[PolyCollection(...), ...]"  # pragma: nocover
         else:
             polycollection_str = "PolyCollection(...)"
+        if (self.raster_data is not None):
+            raster_data_str = "array(dims=%s, dtype=%s)" % (self.raster_data.shape, self.raster_data.dtype)
+        else:
+            raster_data_str = "None"
         cartopy_projection_str = "Projection(%s)" % (self.cartopy_projection.to_string())
         if self.contour_data is not None:
             contour_data_str = "%d Contours" % (len(self.contour_data.get("x", [])), )  # pragma: nocover
@@ -236,6 +273,19 @@ class Mosaic:
         print("  %-23s: %s" % ("contour_data", contour_data_str))
         print("  %-23s: %s" % ("spect_cmap", self.spect_cmap))
         print("  %-23s: %s" % ("spect_intensity_scale", self.spect_intensity_scale))
+        print("  %-23s: %s" % ("raster_data", raster_data_str))
+        print("  %-23s: %s" % ("raster_extent", self.raster_extent))
+
+    def __get_cbar_mappable(self, cbar_colormap):
+        # get the object to attach a colorbar to, using the supplied colormap
+        if (self.raster_data is not None):
+            return plt.cm.ScalarMappable(norm=matplotlib.colors.Normalize(vmin=0, vmax=1), cmap=cbar_colormap)
+        elif isinstance(self.polygon_data, list):  # pragma: nocover
+            self.polygon_data[0].set_cmap(cbar_colormap)
+            return self.polygon_data[0]
+        else:
+            self.polygon_data.set_cmap(cbar_colormap)  # type: ignore
+            return self.polygon_data
 
     def plot(
             self,
@@ -395,7 +445,15 @@ class Mosaic:
         #
         # NOTE: it seems that when running this function a second time, the polygon
         # data is not too happy. So to handle this, we plot a copy of the polygon data
-        if isinstance(self.polygon_data, list):
+        if (self.raster_data is not None):
+            ax.imshow(
+                self.raster_data,
+                origin="lower",
+                extent=self.raster_extent,
+                transform=self.cartopy_projection,
+                interpolation="nearest",
+            )
+        elif isinstance(self.polygon_data, list):
             for polygon_data in self.polygon_data:  # pragma: nocover
                 ax.add_collection(copy(polygon_data))
         else:
@@ -426,8 +484,7 @@ class Mosaic:
 
             # Any pixels with the max Rayleigh value could be greater than it, so we include the plus sign
             cbar_ticknames[-1] += "+"
-            self.polygon_data.set_cmap(cbar_colormap)
-            cbar = plt.colorbar(self.polygon_data, shrink=0.5, ticks=cbar_ticks, ax=ax)
+            cbar = plt.colorbar(self.__get_cbar_mappable(cbar_colormap), shrink=0.5, ticks=cbar_ticks, ax=ax)
             cbar.ax.set_yticklabels(cbar_ticknames)
             plt.text(1.025,
                      0.5,
@@ -454,14 +511,7 @@ class Mosaic:
 
             # Any specrograph bins with the max intensity value could be greater than it, so we include the plus sign
             cbar_ticknames[-1] += "+"
-            if isinstance(self.polygon_data, list):  # pragma: nocover
-                self.polygon_data[0].set_cmap(cbar_colormap)
-            else:
-                self.polygon_data.set_cmap(cbar_colormap)
-            if isinstance(self.polygon_data, list):  # pragma: nocover
-                cbar = plt.colorbar(self.polygon_data[0], shrink=0.5, ticks=cbar_ticks, ax=ax)
-            else:
-                cbar = plt.colorbar(self.polygon_data, shrink=0.5, ticks=cbar_ticks, ax=ax)
+            cbar = plt.colorbar(self.__get_cbar_mappable(cbar_colormap), shrink=0.5, ticks=cbar_ticks, ax=ax)
             cbar.ax.set_yticklabels(cbar_ticknames)
             if (cbar_title is None):
                 plt.text(1.025,
@@ -17,11 +17,14 @@ Generate keograms.
 
 import datetime
 import numpy as np
+from pathlib import Path
 from typing import Optional, List, Literal, Tuple, Union
 from ..classes.keogram import Keogram
-from ...data.ucalgary import Skymap
+from ...data.ucalgary import Skymap, Dataset
 from ._create import create as func_create
 from ._create_custom import create_custom as func_create_custom
+from ._create_from_files import create_from_files as func_create_from_files
+from ._create_from_files import create_custom_from_files as func_create_custom_from_files
 
 __all__ = ["KeogramManager"]
 
@@ -32,8 +35,8 @@ class KeogramManager:
     the submodules and carry over configuration information in the super class.
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, aurorax_obj):
+        self.__aurorax_obj = aurorax_obj
 
     def create(self,
                images: np.ndarray,
@@ -43,7 +46,8 @@ class KeogramManager:
                wavelength: Optional[np.ndarray] = None,
                spect_emission: Literal["green", "red", "blue", "hbeta"] = "green",
                spect_band: Optional[Tuple[float, float]] = None,
-               spect_band_bg: Optional[Tuple[float, float]] = None) -> Keogram:
+               spect_band_bg: Optional[Tuple[float, float]] = None,
+               copy: bool = True) -> Keogram:
         """
         Create a keogram from a set of images.
 
@@ -79,13 +83,19 @@ class KeogramManager:
                 Manual selection of the wavelength region to subtract from integration for manually
                 chosen emissions, via the spect_band argument.
 
+            copy (bool): 
+                Copy the keogram slice out of the images. Defaults to True. If False, the keogram
+                data for ASI data will be a view into the `images` array instead, which avoids a
+                copy but means that changes to one will be reflected in the other. Spectrograph
+                keograms are always a new array.
+
         Returns:
             A `pyaurorax.tools.Keogram` object.
 
         Raises:
             ValueError: issues encountered with supplied parameters
         """
-        return func_create(images, timestamp, axis, spectra, wavelength, spect_emission, spect_band, spect_band_bg)
+        return func_create(images, timestamp, axis, spectra, wavelength, spect_emission, spect_band, spect_band_bg, copy)
 
     def create_custom(
         self,
@@ -157,3 +167,211 @@ class KeogramManager:
             ValueError: issues encountered with supplied parameters
         """
         return func_create_custom(images, timestamp, coordinate_system, width, x_locs, y_locs, preview, skymap, altitude_km, metric, percentile)
+
+    def create_from_files(self,
+                          dataset: Dataset,
+                          file_list: Union[List[str], List[Path], str, Path],
+                          chunk_size: int = 10,
+                          n_parallel: int = 1,
+                          first_record: bool = False,
+                          start_time: Optional[datetime.datetime] = None,
+                          end_time: Optional[datetime.datetime] = None,
+                          quiet: bool = False,
+                          axis: int = 0,
+                          spectra: bool = False,
+                          wavelength: Optional[np.ndarray] = None,
+                          spect_emission: Literal["green", "red", "blue", "hbeta"] = "green",
+                          spect_band: Optional[Tuple[float, float]] = None,
+                          spect_band_bg: Optional[Tuple[float, float]] = None) -> Keogram:
+        """
+        Create a keogram directly from a list of data files, without reading all of them
+        into memory at once.
+
+        The files are read in chunks, and only the keogram slice of each chunk is kept. This
+        produces the same keogram as reading all files and calling `create()`, but the memory
+        used is bounded by the size of a couple of chunks instead of the full time range.
+
+        Args:
+            dataset (pyaurorax.data.ucalgary.Dataset): 
+                The dataset that the files are associated with.
+
+            file_list (List[str], List[Path], str, Path): 
+                The data files to read, in time order.
+
+            chunk_size (int): 
+                The number of files to read in at a time. Defaults to 10. Only a couple of chunks of
+                data are held in memory at any point, so lower this if memory is limited.
+
+            n_parallel (int): 
+                Number of data files to read in parallel within each chunk. Default value is 1.
+
+            first_record (bool): 
+                Only read in the first record in each file. Defaults to False.
+
+            start_time (datetime.datetime): 
+                The start timestamp to read data onwards from (inclusive), optional.
+
+            end_time (datetime.datetime): 
+                The end timestamp to read data up to (inclusive), optional.
+
+            quiet (bool): 
+                Do not print out errors while reading data files, if any are encountered. Defaults
+                to False.
+
+            axis (int): 
+                The axis to extract the keogram slice from. Default is `0`, meaning the rows (or Y) axis.
+
+            spectra (bool): 
+                Make a keogram out of spectrograph data, for a specific emission. Defaults to False (ASI data).
+
+            wavelength (numpy.ndarray): 
+                The wavelength array corresponding to spectrograph data. If not supplied, the wavelength
+                array in the metadata of the data files is used.
+
+            spect_emission (str): 
+                The emission (green, red, blue, hbeta) to prepare from spectrograph data. Default is 
+                'green' (557.7 nm emission).
+
+            spect_band (Tuple[float]): 
+                Manual selection of the wavelength region to integrate for obtaining emissions. Use this
+                to prepare emissions that are not available in spect_emission.
+
+            spect_band_bg (Tuple[float]): 
+                Manual selection of the wavelength region to subtract from integration for manually
+                chosen emissions, via the spect_band argument.
+
+        Returns:
+            A `pyaurorax.tools.Keogram` object.
+
+        Raises:
+            ValueError: issues encountered with supplied parameters, or no data was read
+            pyaurorax.exceptions.AuroraXUnsupportedReadError: an unsupported dataset was used
+            pyaurorax.exceptions.AuroraXError: a generic read error was encountered
+        """
+        return func_create_from_files(
+            self.__aurorax_obj,
+            dataset,
+            file_list,
+            chunk_size,
+            n_parallel,
+            first_record,
+            start_time,
+            end_time,
+            quiet,
+            axis,
+            spectra,
+            wavelength,
+            spect_emission,
+            spect_band,
+            spect_band_bg,
+        )
+
+    def create_custom_from_files(
+        self,
+        dataset: Dataset,
+        file_list: Union[List[str], List[Path], str, Path],
+        coordinate_system: Literal["ccd", "geo", "mag"],
+        width: int,
+        x_locs: Union[List[Union[float, int]], np.ndarray],
+        y_locs: Union[List[Union[float, int]], np.ndarray],
+        skymap: Optional[Skymap] = None,
+        altitude_km: Optional[Union[float, int]] = None,
+        metric: Literal["mean", "median", "sum", "percentile"] = "median",
+        percentile: Optional[float] = None,
+        chunk_size: int = 10,
+        n_parallel: int = 1,
+        first_record: bool = False,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+        quiet: bool = False,
+    ) -> Keogram:
+        """
+        Create a keogram from a custom slice, directly from a list of data files, without reading
+        all of them into memory at once.
+
+        The files are read in chunks, and only the keogram slice of each chunk is kept. See
+        `create_custom()` for details on how the slice is defined.
+
+        Args:
+            dataset (pyaurorax.data.ucalgary.Dataset): 
+                The dataset that the files are associated with.
+
+            file_list (List[str], List[Path], str, Path): 
+                The data files to read, in time order.
+
+            chunk_size (int): 
+                The number of files to read in at a time. Defaults to 10. Only a couple of chunks of
+                data are held in memory at any point, so lower this if memory is limited.
+
+            n_parallel (int): 
+                Number of data files to read in parallel within each chunk. Default value is 1.
+
+            first_record (bool): 
+                Only read in the first record in each file. Defaults to False.
+
+            start_time (datetime.datetime): 
+                The start timestamp to read data onwards from (inclusive), optional.
+
+            end_time (datetime.datetime): 
+                The end timestamp to read data up to (inclusive), optional.
+
+            quiet (bool): 
+                Do not print out errors while reading data files, if any are encountered. Defaults
+                to False.
+
+            coordinate_system (str): 
+                The coordinate system in which input points are defined. Valid options are "ccd", "geo", or "mag".
+
+            width (int): 
+                Width of the desired keogram slice, in CCD pixel units.
+
+            x_locs (Sequence[float, int]): 
+                Sequence of points giving the x-coordinates that define a path through the image data, from
+                which to build the keogram.
+
+            y_locs (Sequence[float, int]): 
+                Sequence of points giving the y-coordinates that define a path through the image data, from
+                which to build the keogram.
+
+            skymap (Skymap): 
+                The skymap to use in georeferencing when working in geographic or magnetic coordinates.
+
+            altitude_km (float, int): 
+                The altitude of the image data, in km, to use in georeferencing when working in geographic
+                or magnetic coordinates.
+
+            metric (str): 
+                The metric used to compute values for each keogram pixel. Valid options are "median", "mean",
+                "sum", and "percentile". Defaults to "median".
+
+            percentile (float): 
+                Sets the brightness percentile to calculate within each keogram bin. This argument is required
+                if metric is set to "percentile" and should be omitted otherwise.
+
+        Returns:
+            A `pyaurorax.tools.Keogram` object.
+
+        Raises:
+            ValueError: issues encountered with supplied parameters, or no data was read
+            pyaurorax.exceptions.AuroraXUnsupportedReadError: an unsupported dataset was used
+            pyaurorax.exceptions.AuroraXError: a generic read error was encountered
+        """
+        return func_create_custom_from_files(
+            self.__aurorax_obj,
+            dataset,
+            file_list,
+            chunk_size,
+            n_parallel,
+            first_record,
+            start_time,
+            end_time,
+            quiet,
+            coordinate_system,
+            width,
+            x_locs,
+            y_locs,
+            skymap,
+            altitude_km,
+            metric,
+            percentile,
+        )
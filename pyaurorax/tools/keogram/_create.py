@@ -17,7 +17,7 @@ from ..classes.keogram import Keogram
 from ..._util import show_warning
 
 
-def create(images, timestamp, axis, spectra, wavelength, spect_emission, spect_band, spect_band_bg):
+def create(images, timestamp, axis, spectra, wavelength, spect_emission, spect_band, spect_band_bg, copy):
     # First check if we are dealing with spectrograph data
     if spectra:
 
@@ -79,28 +79,19 @@ def create(images, timestamp, axis, spectra, wavelength, spect_emission, spect_b
         # set y-axis
         ccd_y = np.arange(0, n_spatial_bins)
 
-        # Initialize keogram array
-        keo_arr = np.full([n_spatial_bins, n_timestamps], 0, dtype=images.dtype)
-
-        # Iterate through each timestamp and compute emissions for all spatial bins
-        for i in range(0, n_timestamps):
-
-            # Integrate over wavelengths to get Rayleighs
-            iter_spectra = images[:, :, i]
-
-            rayleighs = np.trapezoid(iter_spectra[int_w[0], :], x=wavelength[int_w[0]], axis=0)
-
-            if wavelength_bg_range is not None:
-                if int_bg_w is not None:  # type: ignore
-                    rayleighs -= np.trapezoid(
-                        iter_spectra[int_bg_w[0], :],  # type: ignore
-                        x=wavelength[int_bg_w[0]],  # type: ignore
-                        axis=0)
-
-            rayleighs = np.nan_to_num(rayleighs, nan=0.0)
-            rayleighs[np.where(rayleighs < 0.0)] = 0.0  # type: ignore
+        # Integrate over wavelengths to get Rayleighs, for all spatial bins and timestamps at once
+        rayleighs = np.trapezoid(images[int_w[0], :, :], x=wavelength[int_w[0]], axis=0)
+        if wavelength_bg_range is not None:
+            if int_bg_w is not None:  # type: ignore
+                rayleighs -= np.trapezoid(
+                    images[int_bg_w[0], :, :],  # type: ignore
+                    x=wavelength[int_bg_w[0]],  # type: ignore
+                    axis=0)
+        np.nan_to_num(rayleighs, copy=False, nan=0.0)
+        rayleighs[rayleighs < 0.0] = 0.0
 
-            keo_arr[:, i] = rayleighs
+        # set keogram array
+        keo_arr = rayleighs.astype(images.dtype, copy=False)
 
     # Otherwise, for ASI data, slice keogram as required
     else:
@@ -121,27 +112,17 @@ def create(images, timestamp, axis, spectra, wavelength, spect_emission, spect_b
             raise ValueError("Unable to determine number of channels based on the supplied images. Make sure you are supplying a " +
                              "[rows,cols,images] or [rows,cols,channels,images] sized array.")
 
-        # initialize keogram data
-        n_rows = images.shape[0]
-        n_imgs = images.shape[-1]
+        # extract the keogram slice from all images at once
+        #
+        # NOTE: this is a view into the images array, so a copy is made unless
+        # specifically asked not to
+        middle_column_idx = int(np.floor((images.shape[1]) / 2 - 1))
         if (n_channels == 1):
-            keo_arr = np.full([n_rows, n_imgs], 0, dtype=images.dtype)
+            keo_arr = images[:, middle_column_idx, :]
         else:
-            keo_arr = np.full([n_rows, n_imgs, n_channels], 0, dtype=images.dtype)
-
-        # extract the keogram slices
-        middle_column_idx = int(np.floor((images.shape[1]) / 2 - 1))
-        for img_idx in range(0, n_imgs):
-            if (n_channels == 1):
-                # single channel
-                frame = images[:, :, img_idx]
-                frame_middle_slice = frame[:, middle_column_idx]
-                keo_arr[:, img_idx] = frame_middle_slice
-            else:
-                # 3-channel
-                frame = images[:, :, :, img_idx]
-                frame_middle_slice = frame[:, middle_column_idx, :]
-                keo_arr[:, img_idx, :] = frame_middle_slice
+            keo_arr = np.moveaxis(images[:, middle_column_idx, :, :], 1, 2)
+        if (copy is True):
+            keo_arr = keo_arr.copy()
 
     # create the keogram object
     keo_obj = Keogram(data=keo_arr, slice_idx=middle_column_idx, timestamp=timestamp, ccd_y=ccd_y, instrument_type=instrument_type)
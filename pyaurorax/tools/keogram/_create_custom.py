@@ -12,12 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import aacgmv2
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.path import Path
 from ..classes.keogram import Keogram
 from ...data.ucalgary import Skymap
+from .._skymap_geometry import get_latlon, get_mag_latlon
 
 
 # Helper function that returns all array indices within
@@ -71,43 +71,11 @@ def __convert_latlon_to_ccd(lon_locs, lat_locs, timestamp, skymap: Skymap, altit
     locations, and uses a skymap to convert those locations
     to CCD (image index) coordinates.
     """
-    # Obtain lat/lon arrays from skymap
-    if (altitude_km * 1000.0 in skymap.full_map_altitude):
-        altitude_idx = np.where(altitude_km * 1000.0 == skymap.full_map_altitude)
-
-        lats = np.squeeze(skymap.full_map_latitude[altitude_idx, :, :])
-        lons = np.squeeze(skymap.full_map_longitude[altitude_idx, :, :])
-        lons[np.where(lons > 180)] -= 360.0
-
-    else:
-        # Make sure altitude is in range that can be interpolated
-        if (altitude_km * 1000.0 < skymap.full_map_altitude[0]) or (altitude_km * 1000.0 > skymap.full_map_altitude[2]):
-            raise ValueError("Altitude " + str(altitude_km) + " outside valid range of " +
-                             str((skymap.full_map_altitude[0] / 1000.0, skymap.full_map_altitude[2] / 1000.0)))
-
-        # Initialize empty lat/lon arrays
-        lats = np.full(np.squeeze(skymap.full_map_latitude[0, :, :]).shape, np.nan, dtype=skymap.full_map_latitude[0, :, :].dtype)
-        lons = lats.copy()
-
-        # Interpolate lats and lons at desired altitude
-        for i in range(skymap.full_map_latitude.shape[1]):
-            for j in range(skymap.full_map_latitude.shape[2]):
-                lats[i, j] = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_latitude[:, i, j])
-                lons[i, j] = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_longitude[:, i, j])
-
-        lons[np.where(lons > 180)] -= 360.0  # Fix skymap to be in (-180,180) format
-
-    # Convert skymap to magnetic coords if necessary
+    # Obtain lat/lon arrays from skymap, in magnetic coords if necessary
     if magnetic:
-        mag_lats, mag_lons, _ = aacgmv2.convert_latlon_arr(
-            lats.flatten(),
-            lons.flatten(),
-            (lons * 0.0).flatten(),
-            timestamp[0],
-            method_code="G2A",
-        )
-        lats = np.reshape(mag_lats, lats.shape)
-        lons = np.reshape(mag_lons, lons.shape)
+        lats, lons = get_mag_latlon(skymap, altitude_km, timestamp[0])
+    else:
+        lats, lons = get_latlon(skymap, altitude_km)
 
     # Iterate through each target point
     x_locs = []
@@ -184,7 +152,10 @@ def create_custom(images, timestamp, coordinate_system, width, x_locs, y_locs, p
                    "[rows,cols,images] or [rows,cols,channels,images] sized array.")
 
     # Initialize empty keogram array
-    keo_arr = np.squeeze(np.full((x_locs.shape[0] - 1, len(timestamp), n_channels), 0))
+    #
+    # NOTE: length-1 axes are removed once the keogram is filled in, so that a single
+    # image or a single path segment can be used too
+    keo_arr = np.full((x_locs.shape[0] - 1, len(timestamp), n_channels), 0)
 
     if len(x_locs.shape) != 1:
         raise ValueError(f"X coordinates may not be multidimensional. Sequence passed with shape {x_locs.shape}")
@@ -305,7 +276,7 @@ def create_custom(images, timestamp, coordinate_system, width, x_locs, y_locs, p
             else:
                 raise ValueError(f"Metric '{metric}' is not recognized. Currently supported metrics are ['median', 'mean', 'sum', 'percentile'].")
 
-            keo_arr[i, :] = pixel_keogram
+            keo_arr[i, :, 0] = pixel_keogram
         elif n_channels == 3:
             # Update the preview image
             preview_img[row_idx, col_idx, :] = np.iinfo(preview_img.dtype).max
@@ -343,7 +314,7 @@ def create_custom(images, timestamp, coordinate_system, width, x_locs, y_locs, p
                          "try increasing 'width' or decreasing number of points in input coordinates.")
 
     # Create keogram object
-    keo_obj = Keogram(data=keo_arr, timestamp=timestamp, instrument_type="asi")
+    keo_obj = Keogram(data=np.squeeze(keo_arr), timestamp=timestamp, instrument_type="asi")
 
     # show preview
     if preview:
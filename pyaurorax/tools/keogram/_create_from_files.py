@@ -0,0 +1,114 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from ..classes.keogram import Keogram
+from .._read import iter_data_chunks
+from ._create import create as func_create
+from ._create_custom import create_custom as func_create_custom
+
+
+def __check_read(keogram_chunks):
+    if (len(keogram_chunks) == 0):
+        raise ValueError("No data was read from the supplied files")
+
+
+def create_from_files(
+    aurorax_obj,
+    dataset,
+    file_list,
+    chunk_size,
+    n_parallel,
+    first_record,
+    start_time,
+    end_time,
+    quiet,
+    axis,
+    spectra,
+    wavelength,
+    spect_emission,
+    spect_band,
+    spect_band_bg,
+):
+    # read the files in chunks, keeping only the keogram slice of each
+    keogram_chunks = []
+    timestamp = []
+    slice_idx = 0
+    for data in iter_data_chunks(aurorax_obj, dataset, file_list, chunk_size, n_parallel, first_record, not spectra, start_time, end_time, quiet):
+        chunk_wavelength = wavelength
+        if (spectra is True and chunk_wavelength is None and len(data.metadata) > 0):
+            chunk_wavelength = data.metadata[0]["wavelength"]
+        keogram_chunks.append(
+            func_create(data.data, data.timestamp, axis, spectra, chunk_wavelength, spect_emission, spect_band, spect_band_bg, True))
+        timestamp.extend(data.timestamp)
+        if (spectra is False):
+            slice_idx = int(np.floor((data.data.shape[1]) / 2 - 1))
+    __check_read(keogram_chunks)
+
+    # assemble the keogram
+    #
+    # NOTE: only the keogram slices of each chunk were kept, so this is the only point
+    # where the data for the full time range is in memory
+    first = keogram_chunks[0]
+    keo_obj = Keogram(
+        data=np.concatenate([k.data for k in keogram_chunks], axis=1),
+        timestamp=timestamp,
+        instrument_type=first.instrument_type,
+        slice_idx=slice_idx,
+        ccd_y=first.ccd_y,
+    )
+
+    # return
+    return keo_obj
+
+
+def create_custom_from_files(
+    aurorax_obj,
+    dataset,
+    file_list,
+    chunk_size,
+    n_parallel,
+    first_record,
+    start_time,
+    end_time,
+    quiet,
+    coordinate_system,
+    width,
+    x_locs,
+    y_locs,
+    skymap,
+    altitude_km,
+    metric,
+    percentile,
+):
+    # read the files in chunks, keeping only the keogram slice of each
+    keogram_chunks = []
+    timestamp = []
+    for data in iter_data_chunks(aurorax_obj, dataset, file_list, chunk_size, n_parallel, first_record, True, start_time, end_time, quiet):
+        keo_obj = func_create_custom(data.data, data.timestamp, coordinate_system, width, x_locs, y_locs, False, skymap, altitude_km, metric,
+                                     percentile)
+
+        # the keogram data has length-1 axes removed, so restore them to be able to join
+        # the chunks together
+        n_timestamps = len(data.timestamp)
+        n_channels = 1 if len(data.data.shape) == 3 else data.data.shape[2]
+        keogram_chunks.append(np.reshape(keo_obj.data, (-1, n_timestamps, n_channels)))
+        timestamp.extend(data.timestamp)
+    __check_read(keogram_chunks)
+
+    # assemble the keogram, in the same way as create_custom() does for a single set of images
+    keo_obj = Keogram(data=np.squeeze(np.concatenate(keogram_chunks, axis=1)), timestamp=timestamp, instrument_type="asi")
+
+    # return
+    return keo_obj
@@ -17,9 +17,12 @@ Create montages.
 
 import datetime
 import numpy as np
-from typing import List
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
 from ..classes.montage import Montage
+from ...data.ucalgary import Dataset
 from ._create import create as func_create
+from ._create_from_files import create_from_files as func_create_from_files
 
 __all__ = ["MontageManager"]
 
@@ -30,8 +33,8 @@ class MontageManager:
     the submodules and carry over configuration information in the super class.
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, aurorax_obj):
+        self.__aurorax_obj = aurorax_obj
 
     def create(self, images: np.ndarray, timestamp: List[datetime.datetime]) -> Montage:
         """
@@ -51,3 +54,74 @@ class MontageManager:
             A `pyaurorax.tools.Montage` object.
         """
         return func_create(images, timestamp)
+
+    def create_from_files(self,
+                          dataset: Dataset,
+                          file_list: Union[List[str], List[Path], str, Path],
+                          timestamp: List[datetime.datetime],
+                          ccd_bounds: Optional[Sequence[int]] = None,
+                          max_timestamp_difference: float = 60.0,
+                          chunk_size: int = 10,
+                          n_parallel: int = 1,
+                          first_record: bool = False,
+                          quiet: bool = False) -> Montage:
+        """
+        Create a montage directly from a list of data files, without reading all of them into
+        memory at once.
+
+        The files are read in chunks, and for each of the supplied timestamps, the image nearest
+        to it is kept. Only the selected images, and a couple of chunks of data, are held in memory
+        at any point.
+
+        Args:
+            dataset (pyaurorax.data.ucalgary.Dataset): 
+                The dataset that the files are associated with.
+
+            file_list (List[str], List[Path], str, Path): 
+                The data files to read.
+
+            timestamp (List[datetime.datetime]): 
+                The timestamps of the images to include in the montage.
+
+            ccd_bounds (List[int]): 
+                A 4-element sequence specifying the (inclusive) CCD bounds to crop each image to,
+                optional. Anticipated order is [x0, x1, y0, y1].
+
+            max_timestamp_difference (float): 
+                The largest difference, in seconds, between a supplied timestamp and the image used
+                for it. Defaults to 60. Timestamps with no image within this range are left out of the
+                montage, with a warning.
+
+            chunk_size (int): 
+                The number of files to read in at a time. Defaults to 10.
+
+            n_parallel (int): 
+                Number of data files to read in parallel within each chunk. Default value is 1.
+
+            first_record (bool): 
+                Only read in the first record in each file. Defaults to False.
+
+            quiet (bool): 
+                Do not print out errors while reading data files, if any are encountered. Defaults
+                to False.
+
+        Returns:
+            A `pyaurorax.tools.Montage` object.
+
+        Raises:
+            ValueError: issues encountered with supplied parameters, or no data was found
+            pyaurorax.exceptions.AuroraXUnsupportedReadError: an unsupported dataset was used
+            pyaurorax.exceptions.AuroraXError: a generic read error was encountered
+        """
+        return func_create_from_files(
+            self.__aurorax_obj,
+            dataset,
+            file_list,
+            timestamp,
+            ccd_bounds,
+            max_timestamp_difference,
+            chunk_size,
+            n_parallel,
+            first_record,
+            quiet,
+        )
@@ -0,0 +1,77 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import numpy as np
+from .._read import iter_data_chunks
+from ..._util import show_warning
+from ._create import create as func_create
+
+
+def create_from_files(aurorax_obj, dataset, file_list, timestamp, ccd_bounds, max_timestamp_difference, chunk_size, n_parallel, first_record, quiet):
+    # check parameters
+    if (len(timestamp) == 0):
+        raise ValueError("At least one timestamp must be supplied")
+    if (ccd_bounds is not None and len(ccd_bounds) != 4):
+        raise ValueError("The ccd_bounds value must be a 4-element sequence, in the order [x0, x1, y0, y1]")
+    requested = np.array([np.datetime64(t, "us") for t in timestamp])
+    max_difference = np.timedelta64(int(max_timestamp_difference * 1e6), "us")
+
+    # read the files in chunks, keeping the frame nearest each requested timestamp
+    #
+    # NOTE: the read is limited to the span of requested timestamps, and only the
+    # selected (and cropped) frames are kept between chunks
+    frames = [None] * len(timestamp)
+    frame_timestamps = [None] * len(timestamp)
+    differences = np.full(len(timestamp), np.timedelta64(np.iinfo(np.int64).max, "us"))
+    start_time = min(timestamp) - datetime.timedelta(seconds=max_timestamp_difference)
+    end_time = max(timestamp) + datetime.timedelta(seconds=max_timestamp_difference)
+    for data in iter_data_chunks(aurorax_obj, dataset, file_list, chunk_size, n_parallel, first_record, True, start_time, end_time, quiet):
+        # find the nearest frame in this chunk to each requested timestamp
+        chunk_timestamps = np.array([np.datetime64(t, "us") for t in data.timestamp])
+        order = np.argsort(chunk_timestamps, kind="stable")
+        sorted_timestamps = chunk_timestamps[order]
+        right = np.clip(np.searchsorted(sorted_timestamps, requested), 0, len(sorted_timestamps) - 1)
+        left = np.clip(right - 1, 0, len(sorted_timestamps) - 1)
+        left_closer = np.abs(requested - sorted_timestamps[left]) <= np.abs(sorted_timestamps[right] - requested)
+        nearest = np.where(left_closer, left, right)
+        nearest_differences = np.abs(sorted_timestamps[nearest] - requested)
+
+        # keep any frames that are closer than those found so far
+        for i in np.nonzero((nearest_differences < differences) & (nearest_differences <= max_difference))[0]:
+            frame_idx = order[nearest[i]]
+            frame = data.data[..., frame_idx]
+            if (ccd_bounds is not None):
+                frame = frame[ccd_bounds[2]:ccd_bounds[3] + 1, ccd_bounds[0]:ccd_bounds[1] + 1, ...]
+            frames[i] = frame.copy()
+            frame_timestamps[i] = data.timestamp[frame_idx]
+            differences[i] = nearest_differences[i]
+
+    # check for timestamps without a frame
+    found_idx = [i for i in range(0, len(frames)) if frames[i] is not None]
+    if (len(found_idx) == 0):
+        raise ValueError("No data was found for any of the supplied timestamps")
+    if (len(found_idx) != len(frames)):
+        show_warning(
+            "No data was found within %s seconds of %d of the supplied timestamps, these will not be included in the montage" %
+            (max_timestamp_difference, len(frames) - len(found_idx)),
+            stacklevel=1,
+        )
+
+    # create the montage
+    images = np.stack([frames[i] for i in found_idx], axis=-1)
+    montage_obj = func_create(images, [frame_timestamps[i] for i in found_idx])
+
+    # return
+    return montage_obj
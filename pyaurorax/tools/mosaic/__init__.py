@@ -17,13 +17,14 @@ Prepare data and create mosaics.
 
 import datetime
 import cartopy.crs
-from typing import Union, Optional, List, Dict, Tuple, Literal
+from typing import Union, Optional, List, Dict, Tuple, Literal, Generator
 from ..._util import show_warning
 from ...data.ucalgary import Data, Skymap
 from ..classes.mosaic import MosaicData, MosaicSkymap, Mosaic
 from ._prep_skymaps import prep_skymaps as func_prep_skymaps
 from ._prep_images import prep_images as func_prep_images
 from ._create import create as func_create
+from ._create import create_batch as func_create_batch
 
 __all__ = ["MosaicManager"]
 
@@ -50,6 +51,9 @@ class MosaicManager:
             spect_intensity_scales: Optional[Tuple[int, int]] = None,
             colormap: Optional[Union[str, List[str]]] = None,  # deprecated in v1.10.0
             spect_colormap: Optional[Union[str, List[str]]] = None,  # deprecated in v1.10.0
+            backend: Literal["polygon", "raster"] = "polygon",
+            raster_resolution: int = 1000,
+            raster_interpolation: Literal["nearest", "linear"] = "nearest",
     ) -> Mosaic:
         """
         Create a mosaic object.
@@ -108,6 +112,24 @@ class MosaicManager:
             spect_colormap (str): 
                 The name of a matplotlib colormap to use for plotting spectrograph data.
 
+            backend (str): 
+                How the image data is rendered. Either `polygon` or `raster`. Default is `polygon`.
+
+                The `polygon` backend draws every pixel as a polygon on the map. The `raster` backend
+                resamples all pixels onto a regular grid in the map projection, producing a single image
+                which is much faster to plot and save, at the expense of the resolution chosen by the
+                `raster_resolution` parameter. Where sites overlap, the pixel with the highest elevation
+                is used.
+
+            raster_resolution (int): 
+                The number of raster grid cells along the longest side of the mosaic, when using the
+                `raster` backend. Default is `1000`.
+
+            raster_interpolation (str): 
+                The interpolation used to resample pixels onto the raster grid, when using the `raster` 
+                backend. Either `nearest` or `linear`. Default is `nearest`. Spectrograph data always uses 
+                nearest interpolation.
+
         Returns:
             The generated `pyaurorax.tools.Mosaic` object.
 
@@ -130,26 +152,107 @@ class MosaicManager:
         if (use_colormap is False and use_spect_colormap is False):
             # normal
             return func_create(prepped_data, prepped_skymap, timestamp, cartopy_projection, min_elevation, cmap, spect_cmap, image_intensity_scales,
-                               spect_intensity_scales)
+                               spect_intensity_scales, backend, raster_resolution, raster_interpolation)
         elif (use_colormap is True and use_spect_colormap is True):
             # both deprecated parameters were supplied
             return func_create(prepped_data, prepped_skymap, timestamp, cartopy_projection, min_elevation, colormap, spect_colormap,
-                               image_intensity_scales, spect_intensity_scales)
+                               image_intensity_scales, spect_intensity_scales, backend, raster_resolution, raster_interpolation)
         elif (use_colormap is True and use_spect_colormap is False):
             # one deprecated parameter was supplied (colormap)
             return func_create(prepped_data, prepped_skymap, timestamp, cartopy_projection, min_elevation, colormap, spect_cmap,
-                               image_intensity_scales, spect_intensity_scales)
+                               image_intensity_scales, spect_intensity_scales, backend, raster_resolution, raster_interpolation)
         else:
             # one deprecated parameter was supplied (spect_colormap)
             return func_create(prepped_data, prepped_skymap, timestamp, cartopy_projection, min_elevation, cmap, spect_colormap,
-                               image_intensity_scales, spect_intensity_scales)
+                               image_intensity_scales, spect_intensity_scales, backend, raster_resolution, raster_interpolation)
+
+    def create_batch(
+        self,
+        prepped_data: Union[MosaicData, List[MosaicData]],
+        prepped_skymap: Union[MosaicSkymap, List[MosaicSkymap]],
+        timestamps: List[datetime.datetime],
+        cartopy_projection: cartopy.crs.Projection,
+        min_elevation: Union[int, List[int]] = 5,
+        cmap: Optional[Union[str, List[str]]] = None,
+        spect_cmap: Optional[Union[str, List[str]]] = None,
+        image_intensity_scales: Optional[Union[List, Dict]] = None,
+        spect_intensity_scales: Optional[Tuple[int, int]] = None,
+        backend: Literal["polygon", "raster"] = "polygon",
+        raster_resolution: int = 1000,
+        raster_interpolation: Literal["nearest", "linear"] = "nearest",
+    ) -> Generator[Mosaic, None, None]:
+        """
+        Create mosaic objects for many timestamps.
+
+        This produces the same mosaics as calling `create()` once for each timestamp, but the 
+        work that doesn't change between frames (elevation masking, ordering of the pixel 
+        polygons, and the conversion to the map projection) is only done once. This makes it 
+        well-suited for generating frames of a mosaic movie.
+
+        Args:
+            prepped_data (pyaurorax.tools.MosaicData): 
+                The prepared mosaic data. Generated from a prior `prep_images()` function call.
+
+            prepped_skymap (pyaurorax.tools.MosaicSkymap): 
+                The prepared skymap data. Generated from a prior `prep_skymaps()` function call.
+
+            timestamps (List[datetime.datetime]): 
+                The timestamps to generate mosaics for. All must be within the range of timestamps
+                for which image data was prepped and provided.
+
+            cartopy_projection (cartopy.crs.Projection): 
+                The cartopy projection to use when creating the mosaics.
+
+            min_elevation (int): 
+                The minimum elevation cutoff when projecting images on the map, in degrees. Default is `5`.
+
+            cmap (str): 
+                The matplotlib colormap to use for the rendered image data. Default is `gray`. See
+                `create()` for more details.
+
+            spect_cmap (str): 
+                The matplotlib colormap to use for the colorbar if working with spectrograph
+                data. Default is `gnuplot`.
+
+            image_intensity_scales (List or Dict): 
+                Ranges for scaling images. Either a a list with 2 elements which will scale all sites with 
+                the same range, or as a dictionary which can be used for scaling each site differently. See
+                `create()` for more details.
+
+            spect_intensity_scales (Tuple[int]): 
+                Min and max values, in Rayleighs, to scale ALL spectrograph data.
+
+            backend (str): 
+                How the image data is rendered. Either `polygon` or `raster`. Default is `polygon`. See
+                `create()` for more details. With the `raster` backend, the resampling index is built once
+                and reused for every frame.
+
+            raster_resolution (int): 
+                The number of raster grid cells along the longest side of the mosaic, when using the
+                `raster` backend. Default is `1000`.
+
+            raster_interpolation (str): 
+                The interpolation used to resample pixels onto the raster grid, when using the `raster` 
+                backend. Either `nearest` or `linear`. Default is `nearest`.
+
+        Returns:
+            A generator of `pyaurorax.tools.Mosaic` objects, one for each timestamp, in the same 
+            order as the `timestamps` parameter. Mosaics are generated as they are iterated over.
+
+        Raises:
+            ValueError: issues encountered with supplied parameters
+            pyaurorax.exceptions.AuroraXError: general issue encountered
+        """
+        return func_create_batch(prepped_data, prepped_skymap, timestamps, cartopy_projection, min_elevation, cmap, spect_cmap,
+                                 image_intensity_scales, spect_intensity_scales, backend, raster_resolution, raster_interpolation)
 
     def prep_images(self,
                     image_list: List[Data],
                     data_attribute: Literal["data", "calibrated_data"] = "data",
                     spect_emission: Literal["green", "red", "blue", "hbeta"] = "green",
                     spect_band: Optional[Tuple[float, float]] = None,
-                    spect_band_bg: Optional[Tuple[float, float]] = None) -> MosaicData:
+                    spect_band_bg: Optional[Tuple[float, float]] = None,
+                    preserve_dtype: bool = False) -> MosaicData:
         """
         Prepare the image data for use in a mosaic.
 
@@ -173,20 +276,28 @@ class MosaicManager:
                 Manual selection of the wavelength region to subtract from integration for manually
                 chosen emissions, via the spect_band argument.
 
+            preserve_dtype (bool): 
+                Keep the image data in its original dtype, instead of converting it to floats. Timestamps 
+                without image data are then filled with zeros rather than NaNs, and the `masks` attribute of
+                the result indicates which timestamps have data. This uses a fraction of the memory (a quarter
+                for 16-bit data), which is useful when preparing many sites or long time ranges. Default is 
+                `False`. Spectrograph data is always stored as floats.
+
         Returns:
             The prepared data, as a `pyaurorax.tools.MosaicData` object.
 
         Raises:
             ValueError: issues encountered with supplied parameters
         """
-        return func_prep_images(image_list, data_attribute, spect_emission, spect_band, spect_band_bg)
+        return func_prep_images(image_list, data_attribute, spect_emission, spect_band, spect_band_bg, preserve_dtype)
 
     def prep_skymaps(self,
                      skymaps: List[Skymap],
                      height_km: int,
                      site_uid_order: Optional[List[str]] = None,
                      progress_bar_disable: bool = False,
-                     n_parallel: int = 1) -> MosaicSkymap:
+                     n_parallel: int = 1,
+                     use_cache: bool = False) -> MosaicSkymap:
         """
         Prepare skymap data for use by the mosaic routine. This is not time-dependent, so it 
         would only need to be done once.
@@ -209,7 +320,16 @@ class MosaicManager:
                 Disable the progress bar. Defaults to `False`.
 
             n_parallel (int): 
-                Number of skymaps to prepare in parallel using multiprocessing. Default is `1`. 
+                Number of skymaps to prepare in parallel using multiprocessing. Default is `1`. Since 
+                skymap preparation is vectorized, this is generally only beneficial when preparing
+                a large number of skymaps.
+
+            use_cache (bool): 
+                Save the prepared skymaps to disk, and re-use them the next time the same skymap
+                is prepared for the same altitude. Cached skymaps are loaded using memory-mapping,
+                instead of being recomputed. The cache location and size limit are controlled by the 
+                `mosaic_skymap_cache_path` and `mosaic_skymap_cache_max_size` attributes of the
+                PyAuroraX object. Default is `False`.
 
         Returns:
             The prepared skymap data as a `pyaurorax.tools.MosaicSkymap` object.
@@ -217,4 +337,4 @@ class MosaicManager:
         Raises:
             ValueError: issues encountered with supplied parameters
         """
-        return func_prep_skymaps(self.__aurorax_obj, skymaps, height_km, site_uid_order, progress_bar_disable, n_parallel)
+        return func_prep_skymaps(self.__aurorax_obj, skymaps, height_km, site_uid_order, progress_bar_disable, n_parallel, use_cache)
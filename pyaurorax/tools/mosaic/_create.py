@@ -20,6 +20,7 @@ import matplotlib.pyplot as plt
 import matplotlib.collections
 from ..classes.mosaic import Mosaic
 from .._scale_intensity import scale_intensity
+from . import _raster
 from ...exceptions import AuroraXError
 
 # globals
@@ -27,18 +28,10 @@ __DEFAULT_SCALE_MIN = 0
 __DEFAULT_SCALE_MAX = 20000
 __DEFAULT_SPECT_SCALE_MIN = 0
 __DEFAULT_SPECT_SCALE_MAX = 5000
+__DEFAULT_SPECT_CMAP = "gnuplot2"
 
 
-def create(prepped_data, prepped_skymap, timestamp, cartopy_projection, min_elevation, colormap, spect_colormap, image_intensity_scales,
-           spect_intensity_scales):
-    # init coordinates transformer
-    #
-    # To convert from geodetic coordinates onto the map projection, we use pyproj instead
-    # of cartopy's native transformations. This is an optimization.
-    pyproj_src_proj = pyproj.CRS.from_user_input(cartopy.crs.Geodetic())
-    pyproj_des_proj = pyproj.CRS.from_user_input(cartopy_projection)
-    transformer = pyproj.Transformer.from_crs(pyproj_src_proj, pyproj_des_proj, always_xy=True)
-
+def __init_parameters(prepped_data, prepped_skymap, colormap, min_elevation, spect_colormap, spect_intensity_scales):
     # Convert data, skymaps, colormap indicators to lists for iteration purposed
     if not isinstance(prepped_data, list):
         prepped_data = [prepped_data]
@@ -58,6 +51,8 @@ def create(prepped_data, prepped_skymap, timestamp, cartopy_projection, min_elev
         min_elevation = tmp
     if spect_intensity_scales is None:
         spect_intensity_scales = (__DEFAULT_SPECT_SCALE_MIN, __DEFAULT_SPECT_SCALE_MAX)
+    if isinstance(spect_colormap, list):
+        spect_colormap = spect_colormap[0]
 
     # Make sure all lists are same length
     if (len(prepped_data) != len(prepped_skymap)):
@@ -65,305 +60,433 @@ def create(prepped_data, prepped_skymap, timestamp, cartopy_projection, min_elev
     if (len(prepped_data) != len(colormap)) or (len(prepped_skymap) != len(colormap)):
         raise ValueError("List of colormaps must have same length as lists of prepped data and prepped skymaps.")
 
-    # Iterate through each set of prepped data, prepped skymap
-    img_poly_list = []
-    any_spect_data = False
-    for mosaic_data_idx in range(len(prepped_data)):
-        data = prepped_data[mosaic_data_idx]
-        skymap = prepped_skymap[mosaic_data_idx]
-        iter_cmap = colormap[mosaic_data_idx]
-        min_el = min_elevation[mosaic_data_idx]
+    # return
+    return prepped_data, prepped_skymap, colormap, min_elevation, spect_colormap, spect_intensity_scales
 
-        if spect_colormap is None:
-            iter_spect_cmap = 'gnuplot2'
-        else:
-            iter_spect_cmap = spect_colormap
-
-        if isinstance(iter_spect_cmap, list):
-            iter_spect_cmap = iter_spect_cmap[0]
-        # get sites
-        site_list = data.site_uid_list
-
-        # set image intensity scales
-        if (image_intensity_scales is None):
-            # defaults to scaling all sites between 0-20000
-            image_intensity_scales = {}
-            for site_uid in skymap.site_uid_list:
-                image_intensity_scales[site_uid] = [__DEFAULT_SCALE_MIN, __DEFAULT_SCALE_MAX]
-        elif (isinstance(image_intensity_scales, list) is True):
-            image_intensity_scales_dict = {}
-            for site_uid in site_list:
-                image_intensity_scales_dict[site_uid] = image_intensity_scales
-            image_intensity_scales = image_intensity_scales_dict
-        elif (isinstance(image_intensity_scales, dict) is True):
-            # no action needed
-            pass
+
+def __get_image_intensity_scales(image_intensity_scales, data, skymap):
+    # set image intensity scales for each site
+    #
+    # NOTE: sites are referred to without any '_asi' suffix that was added
+    # when prepping the images
+    if (image_intensity_scales is None):
+        # defaults to scaling all sites between 0-20000
+        image_intensity_scales_dict = {}
+        for site_uid in skymap.site_uid_list:
+            image_intensity_scales_dict[site_uid] = [__DEFAULT_SCALE_MIN, __DEFAULT_SCALE_MAX]
+        return image_intensity_scales_dict
+    elif (isinstance(image_intensity_scales, list) is True):
+        image_intensity_scales_dict = {}
+        for site_uid in data.site_uid_list:
+            image_intensity_scales_dict[site_uid.replace("_asi", "")] = image_intensity_scales
+        return image_intensity_scales_dict
+    elif (isinstance(image_intensity_scales, dict) is True):
+        # no action needed
+        return image_intensity_scales
+    else:
+        raise ValueError("Invalid image_intensity_scales format. Please refer to the documentation for this function.")
+
+
+def __check_timestamp(data_timestamps, timestamp):
+    minimum_timestamp = data_timestamps[np.argmin(data_timestamps)]
+    maximum_timestamp = data_timestamps[np.argmax(data_timestamps)]
+    if timestamp < minimum_timestamp or timestamp > maximum_timestamp:
+        raise ValueError("Could not create mosaic for timestamp " + timestamp.strftime("%Y/%m/%d %H:%M:%S") +
+                         " as image data was only supplied for the timestamp range: " + minimum_timestamp.strftime("%Y/%m/%d %H:%M:%S") + " to " +
+                         maximum_timestamp.strftime("%Y/%m/%d %H:%M:%S"))
+
+
+def __prepare_geometry(data, skymap, transformer, min_el):
+    """
+    Determine the pixel polygons to render for a set of prepped data and skymaps, in
+    projection coordinates. This is not dependent on the image values, so it only needs
+    to be done once for any number of frames.
+
+    The polygons are ordered the same way they are drawn: ASI data first, then spectrograph
+    data, in ascending elevation bands of 0.1 degrees.
+    """
+    # Grab the elevation, and filling lats/lons
+    elev = skymap.elevation
+    polyfill_lon = skymap.polyfill_lon
+    polyfill_lat = skymap.polyfill_lat
+    site_list = data.site_uid_list
+
+    # Set up elevation bands for plotting. We start at the min elevation and plot groups
+    # of elevations until reaching 90 deg. Band edges are generated by repeated addition
+    # so that they exactly match the historical band-by-band plotting routine.
+    elev_delta = 0.1
+    band_edges = [min_el]
+    while band_edges[-1] < 90:
+        band_edges.append(band_edges[-1] + elev_delta)
+    band_edges = np.array(band_edges, dtype=np.float64)
+    n_bands = band_edges.shape[0] - 1
+
+    # Determine the elevation band of every pixel, for all sites. Pixels are drawn ASI data
+    # first, then spectrograph data. Within each of those, they are drawn in ascending elevation
+    # bands, then by site, then by pixel index. We get this ordering with a single sort.
+    site_idx_list = []
+    pixel_idx_list = []
+    for do_spect in [False, True]:
+        group_bands = []
+        group_site_idx = []
+        group_pixel_idx = []
+        for site_idx in range(0, len(site_list)):
+            if ((data.data_types[site_idx] == "spect") != do_spect):
+                continue
+
+            # Find the band each pixel falls in, where band k covers the elevation range (edge[k], edge[k+1]].
+            # Edges are compared in the elevation array's precision, and nan elevations land after the last band.
+            site_elev = np.asarray(elev[site_idx])
+            site_band_edges = band_edges.astype(site_elev.dtype) if np.issubdtype(site_elev.dtype, np.floating) else band_edges
+            site_bands = np.searchsorted(site_band_edges, site_elev, side="left") - 1
+
+            # Get all pixels within an elevation band, masking any nans that may have slipped
+            # through in the polygons - done as a precaution
+            valid_mask = (site_bands >= 0) & (site_bands < n_bands)
+            valid_mask &= ~np.isnan(polyfill_lat[site_idx]).any(axis=0) & ~np.isnan(polyfill_lon[site_idx]).any(axis=0)
+            valid_idx = np.nonzero(valid_mask)[0]
+
+            group_bands.append(site_bands[valid_idx])
+            group_site_idx.append(np.full(valid_idx.shape, site_idx))
+            group_pixel_idx.append(valid_idx)
+
+        # sort by band, then site, then pixel
+        if (len(group_bands) > 0):
+            group_bands = np.concatenate(group_bands)
+            group_site_idx = np.concatenate(group_site_idx)
+            group_pixel_idx = np.concatenate(group_pixel_idx)
+            sort_idx = np.lexsort((group_pixel_idx, group_site_idx, group_bands))
+            site_idx_list.append(group_site_idx[sort_idx])
+            pixel_idx_list.append(group_pixel_idx[sort_idx])
+
+    # Gather the polygon lat/lons, in drawing order
+    if (len(site_idx_list) > 0):
+        site_idx_arr = np.concatenate(site_idx_list)
+        pixel_idx_arr = np.concatenate(pixel_idx_list)
+    else:
+        site_idx_arr = np.empty((0), dtype=int)
+        pixel_idx_arr = np.empty((0), dtype=int)
+    lon_arr = np.empty((pixel_idx_arr.shape[0], 5))
+    lat_arr = np.empty((pixel_idx_arr.shape[0], 5))
+    elev_arr = np.empty((pixel_idx_arr.shape[0]))
+    site_polygon_idx = []
+    for site_idx in range(0, len(site_list)):
+        polygon_idx = np.nonzero(site_idx_arr == site_idx)[0]
+        lon_arr[polygon_idx, :] = polyfill_lon[site_idx][:, pixel_idx_arr[polygon_idx]].T
+        lat_arr[polygon_idx, :] = polyfill_lat[site_idx][:, pixel_idx_arr[polygon_idx]].T
+        elev_arr[polygon_idx] = np.asarray(elev[site_idx])[pixel_idx_arr[polygon_idx]]
+        site_polygon_idx.append(polygon_idx)
+
+    # Use our transformer object to convert the lat/lon polygons into projection coordinates.
+    lons, lats = transformer.transform(lon_arr, lat_arr)
+
+    # Format polygons for creation of PolyCollection object
+    lonlat_polygons = np.empty((lons.shape[0], 5, 2))
+    lonlat_polygons[:, :, 0] = lons
+    lonlat_polygons[:, :, 1] = lats
+
+    # return
+    return {
+        "polygons": lonlat_polygons,
+        "site_idx": site_idx_arr,
+        "site_polygon_idx": site_polygon_idx,
+        "pixel_idx": pixel_idx_arr,
+        "elevation": elev_arr,
+        "timestamps": np.array(data.timestamps),
+    }
+
+
+def __get_site_frame(data, site_idx, frame_idx, colormap, spect_colormap, image_intensity_scales, spect_intensity_scales):
+    # set image dimensions
+    site = data.site_uid_list[site_idx]
+    height = data.images_dimensions[site][0]
+    width = data.images_dimensions[site][1]
+
+    # Determine whether current image is single or multi-channel
+    if len(data.images[site].shape) == 4:
+        n_channels = data.images[site].shape[2]
+    else:
+        n_channels = 1
+
+    # Now, obtain the frame of interest, for this site, from the image data and flatten it
+    if data.data_types[site_idx] == 'spect':
+        flattened_img = np.reshape(data.images[site][:, frame_idx], height)
+        scale_min = spect_intensity_scales[0]
+        scale_max = spect_intensity_scales[1]
+        site_cmap = spect_colormap
+    else:
+        if n_channels == 1:
+            flattened_img = np.reshape(data.images[site][:, :, frame_idx], (width * height))
         else:
-            raise ValueError("Invalid image_intensity_scales format. Please refer to the documentation for this function.")
-
-        # We need a numpy array of the sites requested, that will be used to make sure any sites
-        # that don't have data for the requested frame are not plotted. Also empty dict for images.
-        site_list_arr = np.array(site_list)
-        all_images = {}
-
-        # Grab the elevation, and filling lats/lons
-        elev = skymap.elevation
-        polyfill_lon = skymap.polyfill_lon
-        polyfill_lat = skymap.polyfill_lat
-
-        # Now we begin to fill in the above arrays, one site at a time. Before doing so
-        # we need lists to keep track of which sites actually have data for this frame.
-        sites_with_data = []
-        sites_with_data_idx = []
-        datatypes_with_data = []
-
-        # Determine the frame index of data the corresponds to the requested timestamp
-        minimum_timestamp = (np.array(data.timestamps))[np.argmin(np.array(data.timestamps))]
-        maximum_timestamp = (np.array(data.timestamps))[np.argmax(np.array(data.timestamps))]
-        if timestamp < minimum_timestamp or timestamp > maximum_timestamp:
-            raise ValueError("Could not create mosaic for timestamp " + timestamp.strftime("%Y/%m/%d %H:%M:%S") +
-                             " as image data was only supplied for the timestamp range: " + minimum_timestamp.strftime("%Y/%m/%d %H:%M:%S") + " to " +
-                             maximum_timestamp.strftime("%Y/%m/%d %H:%M:%S"))
-
-        # Get the frame index of the timestamp closest to desired mosaic frame
-        frame_idx = np.argmin(np.abs(np.array(data.timestamps) - timestamp))
-
-        # We also define a list that will hold all unique timestamps pulled from each
-        # frame's metadata. This should be of length 1, and we can check that to make
-        # sure all images being plotted correspond to the same time.
-        unique_timestamps = []
-        n_channels_dict = {}
-        for idx_for_dataype, site in enumerate(site_list):
-
-            # set image dimensions
-            height = data.images_dimensions[site][0]
-            width = data.images_dimensions[site][1]
-
-            # Grab the timestamp for this frame/site
-            meta_timestamp = data.timestamps[frame_idx]
-
-            # Determine whether current image is single or multi-channel, and add to dictionary for reference
-            if len(data.images[site].shape) == 4:
-                n_channels = data.images[site].shape[2]
-            else:
-                n_channels = 1
-            n_channels_dict[site] = n_channels
-
-            # Now, obtain the frame of interest, for this site, from the image data and flatten it
-            if data.data_types[idx_for_dataype] == 'spect':
-                any_spect_data = True
-                rayleighs = data.images[site][:, frame_idx]
-                flattened_rayleighs = np.reshape(rayleighs, height)
-
-                tmp = flattened_rayleighs
-
-                if (np.sum(tmp) == 0.0):
-                    # If it's sum is zero, we know there is no data so we can simply continue.
-                    continue
-
-                # Scale this site's data based on previously defined scaling bounds
-                tmp = scale_intensity(
-                    tmp,
-                    min=spect_intensity_scales[0],  # type: ignore
-                    max=spect_intensity_scales[1],  # type: ignore
-                    top=255,
-                    memory_saver=False,
-                )
+            flattened_img = np.reshape(data.images[site][:, :, :, frame_idx], (width * height, n_channels))
+        scale_min = image_intensity_scales[site.replace("_asi", "")][0]
+        scale_max = image_intensity_scales[site.replace("_asi", "")][1]
+        site_cmap = colormap
 
-            else:
-                if n_channels == 1:
-                    img = data.images[site][:, :, frame_idx]
-                    flattened_img = np.reshape(img, (width * height))
-                else:
-                    img = data.images[site][:, :, :, frame_idx]
-                    flattened_img = np.reshape(img, (width * height, n_channels))
-
-                tmp = flattened_img
-
-                if (np.sum(tmp) == 0.0):
-                    # If it's sum is zero, we know there is no data so we can simply continue.
-                    continue  # pragma: nocover
-
-                if "_asi" in site:
-                    site = site.replace("_asi", "")
-
-                # Scale this site's data based on previously defined scaling bounds
-                tmp = scale_intensity(
-                    tmp,
-                    min=image_intensity_scales[site][0],  # type: ignore
-                    max=image_intensity_scales[site][1],  # type: ignore
-                    top=255,
-                    memory_saver=False,
-                )
+    # return
+    return flattened_img, n_channels, scale_min, scale_max, site_cmap
+
+
+def __site_has_data(data, site_idx, frame_idx, flattened_img):
+    # timestamps that the site has no image for are marked in the masks, if there are any
+    if (data.masks is not None and not data.masks[data.site_uid_list[site_idx]][frame_idx]):
+        return False
+
+    # If it's sum is zero, we know there is no data
+    return bool(np.sum(flattened_img) != 0.0)
 
-            # Add the timestamp to tracking list if it's unique
-            if meta_timestamp not in unique_timestamps:
-                unique_timestamps.append(meta_timestamp)
-
-            # Append sites to respective lists, and add image data to master list
-            datatypes_with_data.append(data.data_types[idx_for_dataype])
-            sites_with_data.append(site)
-            sites_with_data_idx.append(np.where(site_list_arr == site)[0][0])
-            all_images[site] = tmp.astype(np.int32)
-
-        # This checks to make sure all images have the same timestamps
-        if len(unique_timestamps) != 1:
-            raise AuroraXError("Error: Images have different timestamps.")
-
-        # Create empty lists for tracking the pixel polygons and their values
-        lon_list = []
-        lat_list = []
-        cmap_vals = []
-
-        # Set up elevation increment for plotting. We start at the min elevation
-        # and plot groups of elevations until reaching 90 deg.
-        elev_delta = 0.1
-        el = min_el
-
-        # Iterate through all elevation ranges - Always do ASI data first !
-        while el < 90:
-
-            # Only iterate through the sites that actually have data
-            for site_id, site_idx in zip(sites_with_data, sites_with_data_idx, strict=False):
-
-                # Skip spectrograph data for now as that should always be plotted last
-                if datatypes_with_data[site_idx] == "spect":
-                    continue
-
-                if spect_colormap is None:
-                    spect_colormap = iter_spect_cmap
-
-                # Get this sites number of channels
-                n_channels = n_channels_dict[site_id]
-
-                # Get all pixels within current elevation threshold
-                el_idx = np.nonzero(np.logical_and(elev[site_idx] > el, elev[site_idx] <= el + elev_delta))[0]
-                if len(el_idx) == 0:
-                    continue
-
-                # Grab this level's filling lat/lons
-                el_lvl_fill_lats = polyfill_lat[site_idx][:, el_idx]
-                el_lvl_fill_lons = polyfill_lon[site_idx][:, el_idx]
-
-                # Grab this level's data values
-                if n_channels == 1:
-                    el_lvl_cmap_vals = all_images[site_id][el_idx]
-                else:
-                    el_lvl_cmap_vals = all_images[site_id][el_idx, :]
-
-                # # Mask any nans that may have slipped through - done as a precaution
-                nan_mask = ~np.isnan(el_lvl_fill_lats).any(axis=0) & ~np.isnan(el_lvl_fill_lons).any(axis=0)
-
-                el_lvl_fill_lats = el_lvl_fill_lats[:, nan_mask]
-                el_lvl_fill_lons = el_lvl_fill_lons[:, nan_mask]
-                if n_channels == 1:
-                    el_lvl_cmap_vals = el_lvl_cmap_vals[nan_mask]
-                else:
-                    el_lvl_cmap_vals = el_lvl_cmap_vals[nan_mask, :]
-
-                # Convert pixel values to a normalized float
-                el_lvl_colors = el_lvl_cmap_vals.astype(np.float32) / 255.0
-
-                # Append polygon lat/lons and values to master lists
-                if n_channels == 1:
-                    cmap = plt.get_cmap(iter_cmap)
-                    for k in range(len(el_lvl_fill_lats[0, :])):
-                        lon_list.append(el_lvl_fill_lons[:, k])
-                        lat_list.append(el_lvl_fill_lats[:, k])
-                        cmap_vals.append(cmap(el_lvl_colors[k]))
-                else:
-                    for k in range(len(el_lvl_fill_lats[0, :])):
-                        lon_list.append(el_lvl_fill_lons[:, k])
-                        lat_list.append(el_lvl_fill_lats[:, k])
-                        cmap_vals.append(el_lvl_colors[k, :])
-
-            el += elev_delta
-
-        # Repeat the above, but for spectrograph data now
-        el = min_el
-        while el < 90:
-
-            # Only iterate through the sites that actually have data
-            for site_id, site_idx in zip(sites_with_data, sites_with_data_idx, strict=False):
-
-                # Now doing spect data
-                if datatypes_with_data[site_idx] != "spect":
-                    continue
-
-                # Get this sites number of channels
-                n_channels = n_channels_dict[site_id]
-
-                # Get all pixels within current elevation threshold
-                el_idx = np.nonzero(np.logical_and(elev[site_idx] > el, elev[site_idx] <= el + elev_delta))[0]
-                if len(el_idx) == 0:
-                    continue
-
-                # Grab this level's filling lat/lons
-                el_lvl_fill_lats = polyfill_lat[site_idx][:, el_idx]
-                el_lvl_fill_lons = polyfill_lon[site_idx][:, el_idx]
-
-                # Grab this level's data values
-                el_lvl_cmap_vals = all_images[site_id][el_idx]
-
-                # # Mask any nans that may have slipped through - done as a precaution
-                nan_mask = ~np.isnan(el_lvl_fill_lats).any(axis=0) & ~np.isnan(el_lvl_fill_lons).any(axis=0)
-
-                el_lvl_fill_lats = el_lvl_fill_lats[:, nan_mask]
-                el_lvl_fill_lons = el_lvl_fill_lons[:, nan_mask]
-                el_lvl_cmap_vals = el_lvl_cmap_vals[nan_mask]
-
-                # Convert pixel values to a normalized float
-                el_lvl_colors = el_lvl_cmap_vals.astype(np.float32) / 255.0
-
-                # Append polygon lat/lons and values to master lists
-                cmap = plt.get_cmap(iter_spect_cmap)
-                for k in range(len(el_lvl_fill_lats[0, :])):
-                    lon_list.append(el_lvl_fill_lons[:, k])
-                    lat_list.append(el_lvl_fill_lats[:, k])
-                    cmap_vals.append(cmap(el_lvl_colors[k]))
-
-            el += elev_delta
-
-        # Use our transformer object to convert the lat/lon polygons into projection coordinates.
-        lons, lats = transformer.transform(np.array(lon_list), np.array(lat_list))
-
-        # Format polygons for creation of PolyCollection object
-        lonlat_polygons = np.empty((lons.shape[0], 5, 2))
-        lonlat_polygons[:, :, 0] = lons
-        lonlat_polygons[:, :, 1] = lats
-
-        # generate a PolyCollection object, containing all of the Polygons shaded with
-        # their corresponding RGB value
-        img_data_poly = matplotlib.collections.PolyCollection(
-            lonlat_polygons,  # type: ignore
-            facecolors=cmap_vals,
-            array=None,
-            # clim=[0.0, 1.0],
-            edgecolors="face",
+
+def __scale_pixel_values(pixel_values, scale_min, scale_max):
+    # Scale the data based on previously defined scaling bounds, and convert to a normalized float
+    pixel_values = scale_intensity(pixel_values, scale_min, scale_max, 255, False, None, 1).astype(np.int32)
+    return pixel_values.astype(np.float32) / 255.0
+
+
+def __get_rgba(pixel_values, n_channels, site_cmap):
+    # convert normalized pixel values to colours
+    if n_channels == 1:
+        return plt.get_cmap(site_cmap)(pixel_values)
+    else:
+        rgba = np.ones((pixel_values.shape[0], 4))
+        rgba[:, 0:3] = pixel_values
+        return rgba
+
+
+def __render_polygons(data, geometry, frame_idx, colormap, spect_colormap, image_intensity_scales, spect_intensity_scales):
+    # Colour each site's polygons using this frame's data. We keep track of which sites
+    # actually have data for this frame, so that the others are not plotted.
+    site_list = data.site_uid_list
+    facecolors = np.zeros((geometry["polygons"].shape[0], 4))
+    sites_with_data = np.zeros((len(site_list)), dtype=bool)
+    for site_idx in range(0, len(site_list)):
+        flattened_img, n_channels, scale_min, scale_max, site_cmap = __get_site_frame(
+            data,
+            site_idx,
+            frame_idx,
+            colormap,
+            spect_colormap,
+            image_intensity_scales,
+            spect_intensity_scales,
         )
+        if (__site_has_data(data, site_idx, frame_idx, flattened_img) is False):
+            # there is no data so we can simply continue.
+            continue
+        sites_with_data[site_idx] = True
+
+        # Grab the values of the pixels that will be rendered, and colour them
+        polygon_idx = geometry["site_polygon_idx"][site_idx]
+        if (len(polygon_idx) == 0):
+            continue
+        pixel_values = __scale_pixel_values(flattened_img[geometry["pixel_idx"][polygon_idx]], scale_min, scale_max)
+        facecolors[polygon_idx, :] = __get_rgba(pixel_values, n_channels, site_cmap)
+
+    # This checks to make sure there are images for this timestamp
+    if (not np.any(sites_with_data)):
+        raise AuroraXError("Error: Images have different timestamps.")
+
+    # generate a PolyCollection object, containing all of the Polygons shaded with
+    # their corresponding RGB value
+    polygon_mask = sites_with_data[geometry["site_idx"]]
+    img_data_poly = matplotlib.collections.PolyCollection(
+        geometry["polygons"][polygon_mask],  # type: ignore
+        facecolors=facecolors[polygon_mask],
+        array=None,
+        edgecolors="face",
+    )
 
-        img_poly_list.append(img_data_poly)
+    # return
+    return img_data_poly, sites_with_data
+
+
+def __render_raster(data, raster_index, raster_img, frame_idx, colormap, spect_colormap, image_intensity_scales, spect_intensity_scales):
+    # Find which sites have data for this frame
+    site_list = data.site_uid_list
+    site_frames = []
+    sites_with_data = np.zeros((len(site_list)), dtype=bool)
+    for site_idx in range(0, len(site_list)):
+        site_frame = __get_site_frame(data, site_idx, frame_idx, colormap, spect_colormap, image_intensity_scales, spect_intensity_scales)
+        site_frames.append(site_frame)
+        sites_with_data[site_idx] = __site_has_data(data, site_idx, frame_idx, site_frame[0])
+
+    # This checks to make sure there are images for this timestamp
+    if (not np.any(sites_with_data)):
+        raise AuroraXError("Error: Images have different timestamps.")
+
+    # Colour the grid cells belonging to each site, using the precomputed resampling index
+    owners = _raster.get_owners(data, raster_index, sites_with_data)
+    for site_idx in range(0, len(site_list)):
+        if (owners[site_idx] is None):
+            continue
+        flattened_img, n_channels, scale_min, scale_max, site_cmap = site_frames[site_idx]
+        site_index = raster_index["sites"][site_idx]
+        rows = owners[site_idx]
+
+        # gather and interpolate the pixel values for each grid cell
+        pixel_values = __scale_pixel_values(flattened_img[site_index["pixel_idx"][rows]], scale_min, scale_max)
+        weights = site_index["weights"][rows]
+        if (n_channels > 1):
+            weights = weights[:, :, np.newaxis]
+        pixel_values = np.clip(np.sum(pixel_values * weights, axis=1), 0, 1)
+        raster_img[site_index["cells"][rows], :] = __get_rgba(pixel_values, n_channels, site_cmap)
 
-    if isinstance(spect_colormap, list):
-        spect_colormap = spect_colormap[0]
+    # return
+    return sites_with_data
+
+
+def __generate_mosaics(prepped_data, geometries, raster_grid, raster_indexes, timestamps, cartopy_projection, colormap, spect_colormap,
+                       image_intensity_scales, spect_intensity_scales):
+    for timestamp in timestamps:
+        # render each set of prepped data
+        img_poly_list = []
+        raster_img = None
+        if (raster_grid is not None):
+            raster_img = np.zeros((raster_grid["shape"][0] * raster_grid["shape"][1], 4), dtype=np.float32)
+        any_spect_data = False
+        any_asi_data = False
+        for mosaic_data_idx in range(len(prepped_data)):
+            # Get the frame index of the timestamp closest to desired mosaic frame
+            frame_idx = np.argmin(np.abs(geometries[mosaic_data_idx]["timestamps"] - timestamp))
+
+            # render
+            if (raster_grid is None):
+                img_data_poly, sites_with_data = __render_polygons(
+                    prepped_data[mosaic_data_idx],
+                    geometries[mosaic_data_idx],
+                    frame_idx,
+                    colormap[mosaic_data_idx],
+                    __DEFAULT_SPECT_CMAP if spect_colormap is None else spect_colormap,
+                    image_intensity_scales[mosaic_data_idx],
+                    spect_intensity_scales,
+                )
+                img_poly_list.append(img_data_poly)
+            else:
+                sites_with_data = __render_raster(
+                    prepped_data[mosaic_data_idx],
+                    raster_indexes[mosaic_data_idx],
+                    raster_img,
+                    frame_idx,
+                    colormap[mosaic_data_idx],
+                    __DEFAULT_SPECT_CMAP if spect_colormap is None else spect_colormap,
+                    image_intensity_scales[mosaic_data_idx],
+                    spect_intensity_scales,
+                )
 
-    # cast into mosaic object
-    if any_spect_data:
-        if len(img_poly_list) == 1:
-            mosaic = Mosaic(polygon_data=img_poly_list[0],
-                            cartopy_projection=cartopy_projection,
-                            spect_cmap=spect_colormap,
-                            spect_intensity_scale=spect_intensity_scales)  # type: ignore
+            # update which types of data are present
+            is_spect = np.array(prepped_data[mosaic_data_idx].data_types) == "spect"
+            any_spect_data = any_spect_data or bool(np.any(is_spect))
+            any_asi_data = any_asi_data or bool(np.any(sites_with_data & ~is_spect))
+
+        # set the spectrograph colormap for the colorbar
+        mosaic_spect_cmap = spect_colormap
+        if (mosaic_spect_cmap is None and any_asi_data is True):
+            mosaic_spect_cmap = __DEFAULT_SPECT_CMAP
+
+        # set the rendered data
+        if (raster_grid is None):
+            polygon_data = img_poly_list[0] if len(img_poly_list) == 1 else img_poly_list
+            raster_data = None
+            raster_extent = None
         else:
-            mosaic = Mosaic(polygon_data=img_poly_list,
+            polygon_data = None
+            raster_data = raster_img.reshape((raster_grid["shape"][0], raster_grid["shape"][1], 4))
+            raster_extent = raster_grid["extent"]
+
+        # cast into mosaic object
+        if any_spect_data:
+            mosaic = Mosaic(polygon_data=polygon_data,
                             cartopy_projection=cartopy_projection,
-                            spect_cmap=spect_colormap,
-                            spect_intensity_scale=spect_intensity_scales)  # type: ignore
-    else:
-        if len(img_poly_list) == 1:
-            mosaic = Mosaic(polygon_data=img_poly_list[0], cartopy_projection=cartopy_projection)
+                            spect_cmap=mosaic_spect_cmap,
+                            spect_intensity_scale=spect_intensity_scales,
+                            raster_data=raster_data,
+                            raster_extent=raster_extent)  # type: ignore
         else:
-            mosaic = Mosaic(polygon_data=img_poly_list, cartopy_projection=cartopy_projection)
+            mosaic = Mosaic(polygon_data=polygon_data, cartopy_projection=cartopy_projection, raster_data=raster_data, raster_extent=raster_extent)
 
-    # return
-    return mosaic
+        # yield
+        yield mosaic
+
+
+def create_batch(prepped_data, prepped_skymap, timestamps, cartopy_projection, min_elevation, colormap, spect_colormap, image_intensity_scales,
+                 spect_intensity_scales, backend, raster_resolution, raster_interpolation):
+    # check backend parameters
+    if (backend not in ["polygon", "raster"]):
+        raise ValueError("Invalid backend '%s'. Must be one of 'polygon' or 'raster'." % (backend))
+    if (raster_interpolation not in ["nearest", "linear"]):
+        raise ValueError("Invalid raster_interpolation '%s'. Must be one of 'nearest' or 'linear'." % (raster_interpolation))
+    if (raster_resolution < 1):
+        raise ValueError("The raster_resolution must be a positive integer.")
+
+    # init coordinates transformer
+    #
+    # To convert from geodetic coordinates onto the map projection, we use pyproj instead
+    # of cartopy's native transformations. This is an optimization.
+    pyproj_src_proj = pyproj.CRS.from_user_input(cartopy.crs.Geodetic())
+    pyproj_des_proj = pyproj.CRS.from_user_input(cartopy_projection)
+    transformer = pyproj.Transformer.from_crs(pyproj_src_proj, pyproj_des_proj, always_xy=True)
+
+    # check and initialize parameters
+    prepped_data, prepped_skymap, colormap, min_elevation, spect_colormap, spect_intensity_scales = __init_parameters(
+        prepped_data,
+        prepped_skymap,
+        colormap,
+        min_elevation,
+        spect_colormap,
+        spect_intensity_scales,
+    )
+
+    # Do everything that doesn't change between frames up front: intensity scales, checking
+    # the timestamps, and determining the polygons to render for each set of prepped data
+    site_image_intensity_scales = []
+    geometries = []
+    for mosaic_data_idx in range(len(prepped_data)):
+        data = prepped_data[mosaic_data_idx]
+        skymap = prepped_skymap[mosaic_data_idx]
+        site_image_intensity_scales.append(__get_image_intensity_scales(image_intensity_scales, data, skymap))
+        data_timestamps = np.array(data.timestamps)
+        for timestamp in timestamps:
+            __check_timestamp(data_timestamps, timestamp)
+        geometries.append(__prepare_geometry(data, skymap, transformer, min_elevation[mosaic_data_idx]))
+
+    # For the raster backend, we also build the index for resampling the pixels onto a
+    # regular grid. Each frame is then rendered by gathering values using this index.
+    raster_grid = None
+    raster_indexes = None
+    if (backend == "raster"):
+        raster_grid = _raster.get_grid(geometries, raster_resolution)
+        raster_indexes = []
+        for mosaic_data_idx in range(len(prepped_data)):
+            raster_indexes.append(_raster.build_index(prepped_data[mosaic_data_idx], geometries[mosaic_data_idx], raster_grid, raster_interpolation))
+
+    # return generator of mosaics
+    return __generate_mosaics(
+        prepped_data,
+        geometries,
+        raster_grid,
+        raster_indexes,
+        timestamps,
+        cartopy_projection,
+        colormap,
+        spect_colormap,
+        site_image_intensity_scales,
+        spect_intensity_scales,
+    )
+
+
+def create(prepped_data, prepped_skymap, timestamp, cartopy_projection, min_elevation, colormap, spect_colormap, image_intensity_scales,
+           spect_intensity_scales, backend, raster_resolution, raster_interpolation):
+    # a single mosaic is a batch of one
+    return next(
+        create_batch(
+            prepped_data,
+            prepped_skymap,
+            [timestamp],
+            cartopy_projection,
+            min_elevation,
+            colormap,
+            spect_colormap,
+            image_intensity_scales,
+            spect_intensity_scales,
+            backend,
+            raster_resolution,
+            raster_interpolation,
+        ))
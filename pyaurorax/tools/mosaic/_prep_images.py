@@ -81,7 +81,44 @@ def __determine_cadence(timestamp_arr: List[datetime.datetime]):
     return most_frequent_diff_second
 
 
-def prep_images(image_list, data_attribute, spect_emission, spect_band, spect_band_bg):
+def __match_timestamps(timestamps, expected_ts, is_burst):
+    """
+    Find the index of the frame for each expected timestamp, and a mask of which expected
+    timestamps have a frame.
+
+    For burst data, the closest frame to each expected timestamp is used. Otherwise, the
+    frame timestamp must match the expected timestamp to the second.
+    """
+    # convert the timestamps, making sure that they are sorted
+    #
+    # NOTE: a stable sort is used so that the first of any identical timestamps is matched
+    ts = np.array(timestamps, dtype="datetime64[us]")
+    sort_idx = None
+    if (np.any(ts[1:] < ts[:-1])):
+        sort_idx = np.argsort(ts, kind="stable")
+        ts = ts[sort_idx]
+
+    if (is_burst is True):
+        # find the frames on either side of each expected timestamp, and use the closer one
+        # (or the earlier one, if they are the same distance away)
+        right_idx = np.clip(np.searchsorted(ts, expected_ts, side="left"), 0, len(ts) - 1)
+        left_idx = np.clip(right_idx - 1, 0, None)
+        use_left = np.abs(expected_ts - ts[left_idx]) <= np.abs(ts[right_idx] - expected_ts)
+        found_idx = np.searchsorted(ts, ts[np.where(use_left, left_idx, right_idx)], side="left")
+        found_mask = np.ones(found_idx.shape, dtype=bool)
+    else:
+        # find exact matches, ignoring the microseconds
+        ts_seconds = ts.astype("datetime64[s]").astype("datetime64[us]")
+        found_idx = np.clip(np.searchsorted(ts_seconds, expected_ts, side="left"), 0, len(ts) - 1)
+        found_mask = ts_seconds[found_idx] == expected_ts
+
+    # return
+    if (sort_idx is not None):
+        found_idx = sort_idx[found_idx]
+    return found_idx, found_mask
+
+
+def prep_images(image_list, data_attribute, spect_emission, spect_band, spect_band_bg, preserve_dtype):
     # set image dimensions and number of sites
     if (data_attribute == "data"):
         # check that the timestamp and data match in size
@@ -157,33 +194,29 @@ def prep_images(image_list, data_attribute, spect_emission, spect_band, spect_ba
     # cadence will be a float if and only if __determine_cadence() decides that burst
     # data has been passed in. If that's the case, we need to be careful with
     # milliseconds
+    #
+    # NOTE: the timestamps are generated as datetime64 values in microseconds, the
+    # same precision as datetime objects
+    start_second = np.datetime64(start_dt.replace(microsecond=0), "us")
     if isinstance(cadence, float):
-
-        is_burst = True
         # round to 2 decimal places (microseconds)
-        curr_dt = start_dt.replace(microsecond=(round(start_dt.microsecond * 10**(-4)) * 10**4))
-        expected_num_frames = 0
-        expected_timestamps = []
-        while (curr_dt <= end_dt):
-            expected_timestamps.append(curr_dt)
-            expected_num_frames += 1
-            curr_dt += datetime.timedelta(seconds=cadence)
+        is_burst = True
+        start_ts = start_second + np.timedelta64(round(start_dt.microsecond * 10**(-4)) * 10**4, "us")
 
     # Otherwise, we just handle the timestamps/cadence in terms of integer seconds
     else:
         is_burst = False
-        curr_dt = start_dt.replace(microsecond=0)
-        expected_num_frames = 0
-        expected_timestamps = []
-        while (curr_dt <= end_dt):
-            expected_timestamps.append(curr_dt)
-            expected_num_frames += 1
-            curr_dt += datetime.timedelta(seconds=cadence)
+        start_ts = start_second
+    cadence_us = datetime.timedelta(seconds=cadence) // datetime.timedelta(microseconds=1)
+    expected_ts = np.arange(start_ts, np.datetime64(end_dt, "us") + np.timedelta64(1, "us"), np.timedelta64(cadence_us, "us"))
+    expected_timestamps = expected_ts.tolist()
+    expected_num_frames = len(expected_timestamps)
 
     # for each site
     data_type_list = []
     site_uid_list = []
     images_dict = {}
+    masks_dict = {}
     for site_image_data in image_list:
 
         if (data_attribute == "data"):
@@ -251,71 +284,50 @@ def prep_images(image_list, data_attribute, spect_emission, spect_band, spect_ba
                 continue
         site_uid_list.append(site_uid)
 
-        # initialize this site's data destination variables
-        images_dict[site_uid] = np.squeeze(np.full((height, width, n_channels, expected_num_frames), np.nan))
-
         # find the index in the data corresponding to each expected timestamp
-        for i in range(0, len(expected_timestamps)):
-
-            # If we are working with burst data, we simply grab the *closest* frame
-            # from each image for each timestamp, as cadence is not consistent enough
-            # to restrict to exact matches
-            if is_burst:
-                searching_dt = expected_timestamps[i]
-                found_idx = min(range(len(site_image_data.timestamp)), key=lambda j: abs(site_image_data.timestamp[j] - searching_dt))
-
-            # If we are not working with burst data, use a binary search (we assume it is already sorted)
-            # to find the location in image_data that exactly matches each expected timestamp
-            else:
-                searching_dt = expected_timestamps[i]
-                found_idx = None
-                low = 0
-                high = len(site_image_data.timestamp) - 1
-                while (low <= high):
-                    mid = low + (high - low) // 2
-                    this_ts = site_image_data.timestamp[mid].replace(microsecond=0)
-
-                    if (this_ts == searching_dt):
-                        found_idx = mid
-                        break
-                    elif (this_ts > searching_dt):
-                        high = mid - 1
-                    else:
-                        low = mid + 1
-
-            if (found_idx is None):
-                # didn't find the timestamp, just move on because there will be no data
-                # for this timestamp
-                continue
-            else:
-                # found data for this timestamp
-                if current_data_type == "spect":
-
-                    # Integrate over wavelengths to get Rayleighs
-                    spectra = site_data[:, :, found_idx]
+        found_idx, found_mask = __match_timestamps(site_image_data.timestamp, expected_ts, is_burst)
+        masks_dict[site_uid] = found_mask
+
+        # initialize this site's data destination variables, and fill in the frames
+        # that were found
+        #
+        # NOTE: when preserving the dtype, timestamps without data are left as zeros,
+        # otherwise they are nan
+        if current_data_type == "spect":
+            images_dict[site_uid] = np.full((height, expected_num_frames), np.nan)
+            if (preserve_dtype is True):
+                images_dict[site_uid][:, ~found_mask] = 0.0
+
+            # Integrate over wavelengths to get Rayleighs
+            spectra = site_data[:, :, found_idx[found_mask]]
+
+            if (int_w is None) or (wavelength is None) or (int_bg_w is None):
+                wavelength = site_image_data.metadata[0]["wavelength"]
+                int_w = np.where((wavelength >= wavelength_range[0]) & (wavelength <= wavelength_range[1]))
+                if wavelength_bg_range is not None:  # pragma: nocover
+                    int_bg_w = np.where((wavelength >= wavelength_bg_range[0]) & (wavelength <= wavelength_bg_range[1]))
+
+            rayleighs = np.trapezoid(spectra[int_w[0], :], x=wavelength[int_w[0]], axis=0)
 
-                    if (int_w is None) or (wavelength is None) or (int_bg_w is None):
-                        wavelength = site_image_data.metadata[0]["wavelength"]
-                        int_w = np.where((wavelength >= wavelength_range[0]) & (wavelength <= wavelength_range[1]))
-                        if wavelength_bg_range is not None:  # pragma: nocover
-                            int_bg_w = np.where((wavelength >= wavelength_bg_range[0]) & (wavelength <= wavelength_bg_range[1]))
-
-                    rayleighs = np.trapezoid(spectra[int_w[0], :], x=wavelength[int_w[0]], axis=0)
-
-                    if wavelength_bg_range is not None:
-                        if int_bg_w is not None:
-                            rayleighs -= np.trapezoid(spectra[int_bg_w[0], :], x=wavelength[int_bg_w[0]], axis=0)  # type: ignore
+            if wavelength_bg_range is not None:
+                if int_bg_w is not None:
+                    rayleighs -= np.trapezoid(spectra[int_bg_w[0], :], x=wavelength[int_bg_w[0]], axis=0)  # type: ignore
 
-                    rayleighs = np.nan_to_num(rayleighs, nan=0.0)
-                    rayleighs[np.where(rayleighs < 0.0)] = 0.0  # type: ignore
+            rayleighs = np.nan_to_num(rayleighs, nan=0.0)
+            rayleighs[np.where(rayleighs < 0.0)] = 0.0  # type: ignore
 
-                    images_dict[site_uid][:, i] = rayleighs
+            images_dict[site_uid][:, found_mask] = rayleighs
 
-                else:
-                    if n_channels != 1:
-                        images_dict[site_uid][:, :, :, i] = site_data[:, :, :, found_idx]
-                    else:
-                        images_dict[site_uid][:, :, i] = site_data[:, :, found_idx]
+        else:
+            if n_channels != 1:
+                image_shape = (height, width, n_channels, expected_num_frames)
+            else:
+                image_shape = (height, width, expected_num_frames)
+            if (preserve_dtype is True):
+                images_dict[site_uid] = np.zeros(image_shape, dtype=site_data.dtype)
+            else:
+                images_dict[site_uid] = np.full(image_shape, np.nan)
+            images_dict[site_uid][..., found_mask] = site_data[..., found_idx[found_mask]]
 
     dimensions_dict = {}
     for site_uid, image in images_dict.items():
@@ -326,7 +338,8 @@ def prep_images(image_list, data_attribute, spect_emission, spect_band, spect_ba
                               timestamps=expected_timestamps,
                               images=images_dict,
                               images_dimensions=dimensions_dict,
-                              data_types=data_type_list)
+                              data_types=data_type_list,
+                              masks=masks_dict)
 
     # return
     return prepped_data
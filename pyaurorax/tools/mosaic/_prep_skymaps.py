@@ -12,68 +12,90 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import scipy
 import numpy as np
 from tqdm.contrib.concurrent import process_map as tqdm_process_map
 from concurrent.futures import ProcessPoolExecutor
 from ..classes.mosaic import MosaicSkymap
+from . import _skymap_cache
 
 # globals
 SPECT_WIDTH_DEG = 1.0
 
 
+def __interpolate_to_height(values, interpol_alts, height_km):
+    """
+    Linearly interpolate (or extrapolate) an array of skymap values, whose first axis is
+    the altitude axis, to a single height. All pixels are handled in one array operation.
+
+    This replicates the behaviour of scipy's interp1d(kind='linear', fill_value='extrapolate'),
+    just without building a separate interpolator for every pixel corner.
+    """
+    # sort the altitude axis, as interp1d would
+    sort_idx = np.argsort(interpol_alts, kind="mergesort")
+    interpol_alts = interpol_alts[sort_idx]
+    values = values[sort_idx]
+
+    # find the altitude bracket to use; clipping it means that heights outside of the
+    # precalculated range are extrapolated using the nearest bracket
+    idx = int(np.clip(np.searchsorted(interpol_alts, height_km), 1, interpol_alts.shape[0] - 1))
+    alt_lo = interpol_alts[idx - 1]
+    alt_hi = interpol_alts[idx]
+
+    # interpolate
+    slope = (values[idx] - values[idx - 1]) / (alt_hi - alt_lo)
+    return slope * (height_km - alt_lo) + values[idx - 1]
+
+
 def __flatten_skymap(processing_dict):
     # init
     skymap = processing_dict["skymap"]
     height_km = processing_dict["height_km"]
     i = processing_dict["i"]
 
+    # grab the necessary data from the skymap
+    altitudes = skymap.full_map_altitude
+    lats = skymap.full_map_latitude
+    lons = np.array(skymap.full_map_longitude)
+    lons[np.where(lons > 180)] -= 360
+    elev = skymap.full_elevation
+
+    # Convert altitudes to km for interpolation
+    interpol_alts = np.asarray(altitudes) / 1000
+
+    # Interpolate all pixel corners to the requested height at once
+    height_lats = __interpolate_to_height(np.asarray(lats), interpol_alts, height_km)
+    height_lons = __interpolate_to_height(lons, interpol_alts, height_km)
+
     # set image dimensions and number of sites
     if skymap.project_uid == 'spect':
         height = skymap.full_elevation.shape[0]
 
-        # grab the necessary data from the skymap
-        altitudes = skymap.full_map_altitude
-        lats = skymap.full_map_latitude
-        tmp_lons = np.array(skymap.full_map_longitude)
-        tmp_lons[np.where(tmp_lons > 180)] -= 360
-        lons = tmp_lons.copy()
-        elev = skymap.full_elevation
-
         # Create this site's filling arrays
         polyfill_lon = np.zeros([5, height])
         polyfill_lat = np.zeros([5, height])
 
-        # Convert altitudes to km for interpolation
-        interpol_alts = altitudes / 1000
-
-        for ii in range(0, height - 1):
-
-            # Interpolate lats / lons
-            # lon1 = np.interp(height_km, interpol_alts, lons[:, ii])
-            # lon2 = np.interp(height_km, interpol_alts, lons[:, ii + 1])
-
-            # lat1 = np.interp(height_km, interpol_alts, lats[:, ii])
-            # lat2 = np.interp(height_km, interpol_alts, lats[:, ii + 1])
-            lon1 = scipy.interpolate.interp1d(interpol_alts, lons[:, ii], kind='linear', bounds_error=False, fill_value='extrapolate')(height_km)
-            lon2 = scipy.interpolate.interp1d(interpol_alts, lons[:, ii + 1], kind='linear', bounds_error=False, fill_value='extrapolate')(height_km)
-            lat1 = scipy.interpolate.interp1d(interpol_alts, lats[:, ii], kind='linear', bounds_error=False, fill_value='extrapolate')(height_km)
-            lat2 = scipy.interpolate.interp1d(interpol_alts, lats[:, ii + 1], kind='linear', bounds_error=False, fill_value='extrapolate')(height_km)
-
-            # Get estimates of pixel corners based on spectrograph width in degrees
-            pix_lons = np.array([
-                lon1 - (SPECT_WIDTH_DEG / 2.0), lon2 - (SPECT_WIDTH_DEG / 2.0), lon2 + (SPECT_WIDTH_DEG / 2.0), lon1 + (SPECT_WIDTH_DEG / 2.0),
-                lon1 - (SPECT_WIDTH_DEG / 2.0)
-            ])
-            pix_lats = np.array([lat1, lat2, lat2, lat1, lat1])
-
-            if np.isnan(np.array(pix_lats)).any():
-                # Skip any nans, as we only fill pixels with 4 finite corners
-                continue
-
-            # Insert into arrays
-            polyfill_lon[:, ii] = pix_lons
-            polyfill_lat[:, ii] = pix_lats
+        # Get the lat/lon at either end of each spectrograph bin
+        lon1 = height_lons[0:height - 1]
+        lon2 = height_lons[1:height]
+        lat1 = height_lats[0:height - 1]
+        lat2 = height_lats[1:height]
+
+        # Get estimates of pixel corners based on spectrograph width in degrees
+        pix_lons = np.stack([
+            lon1 - (SPECT_WIDTH_DEG / 2.0),
+            lon2 - (SPECT_WIDTH_DEG / 2.0),
+            lon2 + (SPECT_WIDTH_DEG / 2.0),
+            lon1 + (SPECT_WIDTH_DEG / 2.0),
+            lon1 - (SPECT_WIDTH_DEG / 2.0),
+        ])
+        pix_lats = np.stack([lat1, lat2, lat2, lat1, lat1])
+
+        # Skip any nans, as we only fill pixels with 4 finite corners
+        valid_idx = np.nonzero(~np.isnan(pix_lats).any(axis=0))[0]
+
+        # Insert into arrays
+        polyfill_lon[:, valid_idx] = pix_lons[:, valid_idx]
+        polyfill_lat[:, valid_idx] = pix_lats[:, valid_idx]
 
         # return
         return {
@@ -88,72 +110,38 @@ def __flatten_skymap(processing_dict):
         height = skymap.full_elevation.shape[0]
         width = skymap.full_elevation.shape[1]
 
-        # grab the necessary data from the skymap
-        altitudes = skymap.full_map_altitude
-        lats = skymap.full_map_latitude
-        tmp_lons = np.array(skymap.full_map_longitude)
-        tmp_lons[np.where(tmp_lons > 180)] -= 360
-        lons = tmp_lons.copy()
-        elev = skymap.full_elevation
-
         # Create this site's filling arrays
         site_polyfill_lon = np.zeros([5, height, width])
         site_polyfill_lat = np.zeros([5, height, width])
 
-        # Convert altitudes to km for interpolation
-        interpol_alts = altitudes / 1000
-
-        # iterate through each image pixel
-        for ii in range(0, height - 1):
-            for jj in range(0, width - 1):
-
-                if np.isnan(elev[ii, jj]):
-                    continue
-
-                # NOTE: Should skip interpolation if using default altitude for efficiency - for
-                # now its fine grab the longitudes of the corners of this pixel, at all three
-                # assumed altitudes included in the skymap, and then use interpolation to obtain
-                # the pixel corner coordinates at the input height. Then add this array of
-                # coordinates (polygon) to the filling array.
-                # lon1 = np.interp(height_km, interpol_alts, lons[:, ii, jj])
-                # lon2 = np.interp(height_km, interpol_alts, lons[:, ii, jj + 1])
-                # lon3 = np.interp(height_km, interpol_alts, lons[:, ii + 1, jj + 1])
-                # lon4 = np.interp(height_km, interpol_alts, lons[:, ii + 1, jj])
-                lon1 = scipy.interpolate.interp1d(interpol_alts, lons[:, ii, jj], kind='linear', bounds_error=False,
-                                                  fill_value='extrapolate')(height_km)
-                lon2 = scipy.interpolate.interp1d(interpol_alts, lons[:, ii, jj + 1], kind='linear', bounds_error=False,
-                                                  fill_value='extrapolate')(height_km)
-                lon3 = scipy.interpolate.interp1d(interpol_alts, lons[:, ii + 1, jj + 1], kind='linear', bounds_error=False,
-                                                  fill_value='extrapolate')(height_km)
-                lon4 = scipy.interpolate.interp1d(interpol_alts, lons[:, ii + 1, jj], kind='linear', bounds_error=False,
-                                                  fill_value='extrapolate')(height_km)
-                
-                pix_lons = np.array([lon1, lon2, lon3, lon4, lon1])
-                if np.isnan(pix_lons).any():
-                    # Skip any nans, as we only fill pixels with 4 finite corners
-                    continue
-
-                # repeat the above for latitudes.
-                # lat1 = np.interp(height_km, interpol_alts, lats[:, ii, jj])
-                # lat2 = np.interp(height_km, interpol_alts, lats[:, ii, jj + 1])
-                # lat3 = np.interp(height_km, interpol_alts, lats[:, ii + 1, jj + 1])
-                # lat4 = np.interp(height_km, interpol_alts, lats[:, ii + 1, jj])
-                lat1 = scipy.interpolate.interp1d(interpol_alts, lats[:, ii, jj], kind='linear', bounds_error=False,
-                                                  fill_value='extrapolate')(height_km)
-                lat2 = scipy.interpolate.interp1d(interpol_alts, lats[:, ii, jj + 1], kind='linear', bounds_error=False,
-                                                  fill_value='extrapolate')(height_km)
-                lat3 = scipy.interpolate.interp1d(interpol_alts, lats[:, ii + 1, jj + 1], kind='linear', bounds_error=False,
-                                                  fill_value='extrapolate')(height_km)
-                lat4 = scipy.interpolate.interp1d(interpol_alts, lats[:, ii + 1, jj], kind='linear', bounds_error=False,
-                                                  fill_value='extrapolate')(height_km)
-
-                pix_lats = np.array([lat1, lat2, lat3, lat4, lat1])
-                if np.isnan(np.array(pix_lats)).any():
-                    # Skip any nans, as we only fill pixels with 4 finite corners
-                    continue  # pragma: nocover
-
-                site_polyfill_lon[:, ii, jj] = pix_lons
-                site_polyfill_lat[:, ii, jj] = pix_lats
+        # Build the corners of every pixel polygon by slicing the interpolated pixel
+        # corner arrays. Corners go clockwise, with the first corner repeated to close
+        # the polygon.
+        #
+        # NOTE: the last row and column of the image are not filled, consistent with
+        # the previous per-pixel implementation.
+        pix_lons = np.stack([
+            height_lons[0:height - 1, 0:width - 1],
+            height_lons[0:height - 1, 1:width],
+            height_lons[1:height, 1:width],
+            height_lons[1:height, 0:width - 1],
+            height_lons[0:height - 1, 0:width - 1],
+        ])
+        pix_lats = np.stack([
+            height_lats[0:height - 1, 0:width - 1],
+            height_lats[0:height - 1, 1:width],
+            height_lats[1:height, 1:width],
+            height_lats[1:height, 0:width - 1],
+            height_lats[0:height - 1, 0:width - 1],
+        ])
+
+        # Skip pixels without an elevation, and any nans, as we only fill pixels with 4 finite corners
+        valid_mask = ~np.isnan(elev[0:height - 1, 0:width - 1])
+        valid_mask &= ~np.isnan(pix_lons).any(axis=0)
+        valid_mask &= ~np.isnan(pix_lats).any(axis=0)
+
+        site_polyfill_lon[:, 0:height - 1, 0:width - 1] = np.where(valid_mask, pix_lons, 0.0)
+        site_polyfill_lat[:, 0:height - 1, 0:width - 1] = np.where(valid_mask, pix_lats, 0.0)
 
         # Flatten this site's filling and elevation arrays and insert them into master arrays
         polyfill_lon = np.reshape(site_polyfill_lon, (5, width * height))
@@ -169,7 +157,7 @@ def __flatten_skymap(processing_dict):
         }
 
 
-def prep_skymaps(aurorax_obj, skymaps, height_km, site_uid_order, progress_bar_disable, n_parallel):
+def prep_skymaps(aurorax_obj, skymaps, height_km, site_uid_order, progress_bar_disable, n_parallel, use_cache):
     # reorder the skymap list based on the site_uid_list supplied
     skymaps_sorted = []
     site_uid_list = []
@@ -207,9 +195,24 @@ def prep_skymaps(aurorax_obj, skymaps, height_km, site_uid_order, progress_bar_d
             polyfill_lat.append(np.zeros((5, skymap.full_elevation.shape[0] * skymap.full_elevation.shape[1])))
             polyfill_lon.append(np.zeros((5, skymap.full_elevation.shape[0] * skymap.full_elevation.shape[1])))
 
+    # check the cache for any skymaps that have already been prepared at this height
+    cache_keys = [None] * len(skymaps_sorted)
+    cache_hits = [False] * len(skymaps_sorted)
+    if (use_cache is True):
+        for i in range(0, len(skymaps_sorted)):
+            cache_keys[i] = _skymap_cache.get_key(skymaps_sorted[i], height_km)
+            cached_dict = _skymap_cache.load(aurorax_obj.mosaic_skymap_cache_path, cache_keys[i])
+            if (cached_dict is not None):
+                elevation[i] = cached_dict["elevation"]
+                polyfill_lon[i] = cached_dict["polyfill_lon"]
+                polyfill_lat[i] = cached_dict["polyfill_lat"]
+                cache_hits[i] = True
+
     # set up processing objects
     processing_dicts = []
     for i in range(0, len(skymaps_sorted)):
+        if (cache_hits[i] is True):
+            continue
         processing_dicts.append({
             "skymap": skymaps_sorted[i],
             "height_km": height_km,
@@ -255,6 +258,21 @@ def prep_skymaps(aurorax_obj, skymaps, height_km, site_uid_order, progress_bar_d
                 polyfill_lon[results_dict["i"]] = results_dict["polyfill_lon"]
                 polyfill_lat[results_dict["i"]] = results_dict["polyfill_lat"]
 
+    # save newly prepared skymaps to the cache
+    if (use_cache is True):
+        for processing_dict in processing_dicts:
+            i = processing_dict["i"]
+            _skymap_cache.store(
+                aurorax_obj.mosaic_skymap_cache_path,
+                cache_keys[i],
+                {
+                    "elevation": elevation[i],
+                    "polyfill_lon": polyfill_lon[i],
+                    "polyfill_lat": polyfill_lat[i],
+                },
+                aurorax_obj.mosaic_skymap_cache_max_size,
+            )
+
     # cast data into object
     flattened_skymap = MosaicSkymap(
         elevation=elevation,
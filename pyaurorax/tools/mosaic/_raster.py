@@ -0,0 +1,213 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import scipy.spatial
+
+# globals
+__N_CANDIDATES = 8
+__CHUNK_SIZE = 262144
+
+
+def __get_valid_polygons(polygons):
+    # pixels without any polyfill data end up as zero-area polygons, and pixels not visible
+    # in the projection have non-finite coordinates. Both are ignored.
+    return np.all(np.isfinite(polygons), axis=(1, 2)) & ~np.all(polygons == polygons[:, 0:1, :], axis=(1, 2))
+
+
+def get_grid(geometries, resolution):
+    """
+    Determine the raster grid, in projection coordinates, that covers all rendered polygons.
+    Grid cells are square, with `resolution` cells along the longest side.
+    """
+    # find the extent of all polygons
+    x_min = np.inf
+    x_max = -np.inf
+    y_min = np.inf
+    y_max = -np.inf
+    for geometry in geometries:
+        polygons = geometry["polygons"]
+        polygons = polygons[__get_valid_polygons(polygons)]
+        if (polygons.shape[0] == 0):
+            continue
+        x_min = min(x_min, np.min(polygons[:, :, 0]))
+        x_max = max(x_max, np.max(polygons[:, :, 0]))
+        y_min = min(y_min, np.min(polygons[:, :, 1]))
+        y_max = max(y_max, np.max(polygons[:, :, 1]))
+    if (not np.isfinite(x_min) or (x_max - x_min) <= 0 or (y_max - y_min) <= 0):
+        raise ValueError("Unable to determine the raster grid, no pixels within the minimum elevation were found")
+
+    # set grid dimensions
+    cell_size = max(x_max - x_min, y_max - y_min) / resolution
+    n_x = max(1, int(np.ceil((x_max - x_min) / cell_size)))
+    n_y = max(1, int(np.ceil((y_max - y_min) / cell_size)))
+
+    # return
+    return {
+        "shape": (n_y, n_x),
+        "extent": (float(x_min), float(x_min + n_x * cell_size), float(y_min), float(y_min + n_y * cell_size)),
+        "cell_size": float(cell_size),
+    }
+
+
+def __points_in_quads(points, quads):
+    # check if each point is within its corresponding quadrilateral (counting the edges), by
+    # checking that it is on the same side of all four edges
+    side_list = []
+    for i in range(0, 4):
+        edge = quads[:, i + 1, :] - quads[:, i, :]
+        to_point = points - quads[:, i, :]
+        side_list.append(edge[:, 0] * to_point[:, 1] - edge[:, 1] * to_point[:, 0])
+    sides = np.stack(side_list, axis=1)
+    return np.all(sides >= 0, axis=1) | np.all(sides <= 0, axis=1)
+
+
+def __build_site_index(polygons, pixel_idx, elevation, grid, interpolation):
+    # get the grid cells within this site's bounding box
+    x0, _, y0, _ = grid["extent"]
+    n_y, n_x = grid["shape"]
+    cell_size = grid["cell_size"]
+    col_min = max(0, int(np.floor((np.min(polygons[:, :, 0]) - x0) / cell_size)))
+    col_max = min(n_x - 1, int(np.floor((np.max(polygons[:, :, 0]) - x0) / cell_size)))
+    row_min = max(0, int(np.floor((np.min(polygons[:, :, 1]) - y0) / cell_size)))
+    row_max = min(n_y - 1, int(np.floor((np.max(polygons[:, :, 1]) - y0) / cell_size)))
+    rows, cols = np.meshgrid(np.arange(row_min, row_max + 1), np.arange(col_min, col_max + 1), indexing="ij")
+    cells = (rows * n_x + cols).ravel()
+    points = np.stack([x0 + (cols.ravel() + 0.5) * cell_size, y0 + (rows.ravel() + 0.5) * cell_size], axis=1)
+
+    # find the pixel polygon containing each grid cell centre, checking the pixels with
+    # the nearest centres first
+    centres = np.mean(polygons[:, 0:4, :], axis=1)
+    tree = scipy.spatial.cKDTree(centres)
+    n_candidates = min(__N_CANDIDATES, centres.shape[0])
+    containing_idx = np.full(cells.shape[0], -1, dtype=np.int64)
+    for chunk_start in range(0, cells.shape[0], __CHUNK_SIZE):
+        chunk_points = points[chunk_start:chunk_start + __CHUNK_SIZE]
+        chunk_containing_idx = containing_idx[chunk_start:chunk_start + __CHUNK_SIZE]
+        _, candidates = tree.query(chunk_points, k=n_candidates)
+        candidates = candidates.reshape((chunk_points.shape[0], n_candidates))
+        for i in range(0, n_candidates):
+            not_found = np.nonzero(chunk_containing_idx < 0)[0]
+            if (not_found.shape[0] == 0):
+                break
+            inside = __points_in_quads(chunk_points[not_found], polygons[candidates[not_found, i]])
+            chunk_containing_idx[not_found[inside]] = candidates[not_found[inside], i]
+    covered = np.nonzero(containing_idx >= 0)[0]
+    cells = cells[covered]
+    points = points[covered]
+    containing_idx = containing_idx[covered]
+
+    # set the pixels and weights used for each grid cell
+    source_idx = containing_idx[:, np.newaxis]
+    weights = np.ones((cells.shape[0], 1), dtype=np.float32)
+    if (interpolation == "linear" and centres.shape[0] >= 3):
+        try:
+            triangulation = scipy.spatial.Delaunay(centres)
+        except scipy.spatial.QhullError:
+            # pixel centres are collinear (ie. spectrograph data), nearest neighbour is used instead
+            triangulation = None
+        if (triangulation is not None):
+            # get barycentric coordinates of each grid cell centre within the triangulated pixel
+            # centres. Cells outside of the triangulation stay as nearest neighbour.
+            simplex = triangulation.find_simplex(points)
+            transform = triangulation.transform[simplex]
+            barycentric = np.einsum("ijk,ik->ij", transform[:, 0:2, :], points - transform[:, 2, :])
+            barycentric = np.concatenate([barycentric, 1 - np.sum(barycentric, axis=1, keepdims=True)], axis=1)
+            in_triangulation = simplex >= 0
+            source_idx = np.repeat(source_idx, 3, axis=1)
+            source_idx[in_triangulation] = triangulation.simplices[simplex[in_triangulation]]
+            weights = np.zeros((cells.shape[0], 3), dtype=np.float32)
+            weights[:, 0] = 1.0
+            weights[in_triangulation] = np.clip(barycentric[in_triangulation], 0, 1)
+            weights /= np.sum(weights, axis=1, keepdims=True)
+
+    # return
+    return {
+        "cells": cells,
+        "pixel_idx": pixel_idx[source_idx],
+        "weights": weights,
+        "elevation": elevation[containing_idx],
+    }
+
+
+def build_index(data, geometry, grid, interpolation):
+    """
+    Build the resampling index from each site's pixels onto the raster grid. This
+    is independent of the image values, so it can be reused for any number of frames.
+    """
+    site_index_list = []
+    for site_idx in range(0, len(data.site_uid_list)):
+        # get this site's polygons
+        polygon_idx = geometry["site_polygon_idx"][site_idx]
+        polygon_idx = polygon_idx[__get_valid_polygons(geometry["polygons"][polygon_idx])]
+        if (polygon_idx.shape[0] == 0):
+            site_index_list.append(None)
+            continue
+
+        # build index
+        site_index_list.append(
+            __build_site_index(
+                geometry["polygons"][polygon_idx],
+                geometry["pixel_idx"][polygon_idx],
+                geometry["elevation"][polygon_idx],
+                grid,
+                interpolation,
+            ))
+
+    # return
+    return {"sites": site_index_list, "owners": {}}
+
+
+def get_owners(data, index, sites_with_data):
+    """
+    Resolve which site is rendered in each grid cell, considering only the sites
+    with data. Where sites overlap, spectrograph data is drawn over ASI data, and
+    otherwise the site with the highest elevation pixel is used. Results are cached
+    since the sites with data rarely change between frames.
+    """
+    # check cache
+    cache_key = sites_with_data.tobytes()
+    if (cache_key in index["owners"]):
+        return index["owners"][cache_key]
+
+    # gather all candidates
+    site_idx_list = []
+    cell_list = []
+    elevation_list = []
+    spect_list = []
+    for site_idx, site_index in enumerate(index["sites"]):
+        if (not sites_with_data[site_idx] or site_index is None):
+            continue
+        site_idx_list.append(np.full(site_index["cells"].shape, site_idx))
+        cell_list.append(site_index["cells"])
+        elevation_list.append(site_index["elevation"])
+        spect_list.append(np.full(site_index["cells"].shape, data.data_types[site_idx] == "spect"))
+
+    # sort by priority, and take the highest priority candidate for each cell
+    owners = [None] * len(index["sites"])
+    if (len(cell_list) > 0):
+        site_idx_arr = np.concatenate(site_idx_list)
+        cell_arr = np.concatenate(cell_list)
+        row_arr = np.concatenate([np.arange(0, cells.shape[0]) for cells in cell_list])
+        sort_idx = np.lexsort((site_idx_arr, np.concatenate(elevation_list), np.concatenate(spect_list)))[::-1]
+        _, first_idx = np.unique(cell_arr[sort_idx], return_index=True)
+        winner_idx = sort_idx[first_idx]
+        for site_idx in range(0, len(owners)):
+            site_winner_idx = winner_idx[site_idx_arr[winner_idx] == site_idx]
+            if (site_winner_idx.shape[0] > 0):
+                owners[site_idx] = row_arr[site_winner_idx]
+
+    # cache and return
+    index["owners"][cache_key] = owners
+    return owners
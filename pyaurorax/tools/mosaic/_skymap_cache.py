@@ -0,0 +1,129 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import uuid
+import json
+import shutil
+import hashlib
+import numpy as np
+from pathlib import Path
+from ... import __version__
+
+# globals
+__ARRAY_NAMES = ["polyfill_lat", "polyfill_lon", "elevation"]
+
+
+def get_key(skymap, height_km):
+    """
+    Generate the cache key for a skymap and altitude combination.
+    """
+    # get generation info details
+    generation_info = getattr(skymap, "generation_info", None)
+    generation_info_dict = {}
+    if (generation_info is not None):
+        for attr in ["author", "code_used", "date_generated", "valid_interval_start", "valid_interval_stop"]:
+            generation_info_dict[attr] = str(getattr(generation_info, attr, None))
+
+    # set key components
+    key_dict = {
+        "filename": os.path.basename(str(skymap.filename)),
+        "generation_info": generation_info_dict,
+        "project_uid": skymap.project_uid,
+        "site_uid": skymap.site_uid,
+        "imager_uid": skymap.imager_uid,
+        "version": skymap.version,
+        "height_km": float(height_km),
+        "pyaurorax_version": __version__,
+    }
+
+    # return hash of the key components
+    return hashlib.sha256(json.dumps(key_dict, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load(cache_path, key):
+    """
+    Load a cached flattened skymap, returning None if it doesn't exist. Arrays
+    are returned as read-only memory-mapped arrays.
+    """
+    # check if the entry exists
+    entry_path = Path(cache_path) / key
+    if (os.path.isdir(entry_path) is False):
+        return None
+
+    # load the arrays
+    results_dict = {}
+    try:
+        for array_name in __ARRAY_NAMES:
+            results_dict[array_name] = np.load(entry_path / ("%s.npy" % (array_name)), mmap_mode="r")
+    except (OSError, ValueError):  # pragma: nocover
+        # corrupted cache entry, remove it and treat it as a miss
+        shutil.rmtree(entry_path, ignore_errors=True)
+        return None
+
+    # mark the entry as recently used
+    try:
+        os.utime(entry_path)
+    except OSError:  # pragma: nocover
+        pass
+
+    # return
+    return results_dict
+
+
+def store(cache_path, key, results_dict, max_size):
+    """
+    Save a flattened skymap to the cache, and evict the least recently used
+    entries if the cache is larger than the max size.
+    """
+    # write to a temporary directory first, so that partially written
+    # entries are never picked up by other processes
+    os.makedirs(cache_path, exist_ok=True)
+    entry_path = Path(cache_path) / key
+    tmp_entry_path = Path(cache_path) / (".tmp_%s_%s" % (key, uuid.uuid4().hex))
+    try:
+        os.makedirs(tmp_entry_path)
+        for array_name in __ARRAY_NAMES:
+            np.save(tmp_entry_path / ("%s.npy" % (array_name)), np.asarray(results_dict[array_name]))
+        os.rename(tmp_entry_path, entry_path)
+    except OSError:
+        # another process may have written this entry already
+        shutil.rmtree(tmp_entry_path, ignore_errors=True)
+
+    # enforce the size limit
+    if (max_size is not None):
+        __evict(cache_path, max_size)
+
+
+def __evict(cache_path, max_size):
+    # get size and last-used time of each entry
+    entries = []
+    total_size = 0
+    for item in os.listdir(cache_path):
+        item_path = Path(cache_path) / item
+        if (item.startswith(".tmp_") is True or os.path.isdir(item_path) is False):
+            continue
+        try:
+            entry_size = sum(os.path.getsize(item_path / f) for f in os.listdir(item_path))
+            entries.append((os.path.getmtime(item_path), entry_size, item_path))
+        except OSError:  # pragma: nocover
+            continue
+        total_size += entry_size
+
+    # remove least recently used entries until we're within the limit
+    for _, entry_size, item_path in sorted(entries, key=lambda x: x[0]):
+        if (total_size <= max_size):
+            break
+        shutil.rmtree(item_path, ignore_errors=True)
+        total_size -= entry_size
@@ -0,0 +1,136 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import asyncio
+import datetime
+from pyaurorax.search import (
+    EphemerisSearch,
+    EphemerisData,
+    DataProductSearch,
+    DataProductData,
+    ConjunctionSearch,
+    Conjunction,
+)
+
+
+@pytest.mark.search_ro
+def test_ephemeris(aurorax, capsys):
+    s = asyncio.run(
+        aurorax.search.aio.ephemeris.search(datetime.datetime(2019, 1, 1, 0, 0, 0),
+                                            datetime.datetime(2019, 1, 1, 0, 9, 59),
+                                            programs=["swarm"],
+                                            platforms=["swarma"],
+                                            instrument_types=["footprint"],
+                                            verbose=True))
+    captured_stdout = capsys.readouterr().out
+    assert captured_stdout != ""
+
+    # check
+    assert isinstance(s, EphemerisSearch) is True
+    assert len(s.data) > 0
+    for e in s.data:
+        assert isinstance(e, EphemerisData) is True
+
+
+@pytest.mark.search_ro
+def test_data_products(aurorax):
+    s = asyncio.run(
+        aurorax.search.aio.data_products.search(datetime.datetime(2020, 1, 1, 0, 0, 0),
+                                                datetime.datetime(2020, 1, 1, 23, 59, 59),
+                                                programs=["auroramax"],
+                                                data_product_types=["keogram"]))
+
+    # check
+    assert isinstance(s, DataProductSearch) is True
+    assert len(s.data) > 0
+    for e in s.data:
+        assert isinstance(e, DataProductData) is True
+
+
+@pytest.mark.search_ro
+def test_conjunctions_concurrent(aurorax):
+    # set criteria blocks
+    distance = 500
+    ground = [aurorax.search.GroundCriteriaBlock(programs=["themis-asi"])]
+    space = [aurorax.search.SpaceCriteriaBlock(programs=["swarm"])]
+
+    # perform several searches at once, with a limited number of calls in flight
+    aurorax.search.aio.max_concurrency = 2
+
+    async def run_searches():
+        return await asyncio.gather(*[
+            aurorax.search.aio.conjunctions.search(
+                datetime.datetime(2020, 1, i, 0, 0, 0),
+                datetime.datetime(2020, 1, i, 6, 59, 59),
+                distance,
+                ground=ground,
+                space=space,
+            ) for i in range(1, 4)
+        ])
+
+    results = asyncio.run(run_searches())
+
+    # check results, and compare to the blocking search
+    assert len(results) == 3
+    for s in results:
+        assert isinstance(s, ConjunctionSearch) is True
+        assert s.completed is True
+        for c in s.data:
+            assert isinstance(c, Conjunction) is True
+    s_blocking = aurorax.search.conjunctions.search(
+        datetime.datetime(2020, 1, 1, 0, 0, 0),
+        datetime.datetime(2020, 1, 1, 6, 59, 59),
+        distance,
+        ground=ground,
+        space=space,
+    )
+    assert len(results[0].data) == len(s_blocking.data)
+
+
+@pytest.mark.search_ro
+def test_return_immediately(aurorax):
+    s = asyncio.run(
+        aurorax.search.aio.ephemeris.search(datetime.datetime(2019, 1, 1, 0, 0, 0),
+                                            datetime.datetime(2019, 1, 1, 0, 9, 59),
+                                            programs=["swarm"],
+                                            platforms=["swarma"],
+                                            instrument_types=["footprint"],
+                                            return_immediately=True))
+
+    # check
+    assert s.executed is True
+    assert s.request_id != ""
+
+    # wait for the data with the blocking functions
+    s.wait()
+    s.get_data()
+    assert len(s.data) > 0
+
+
+@pytest.mark.search_ro
+def test_max_concurrency(aurorax):
+    # defaults to the API pool size
+    assert aurorax.search.aio.max_concurrency == aurorax.api_pool_size
+
+    # set and reset
+    aurorax.search.aio.max_concurrency = 3
+    assert aurorax.search.aio.max_concurrency == 3
+    aurorax.search.aio.max_concurrency = None
+    assert aurorax.search.aio.max_concurrency == aurorax.api_pool_size
+
+    # invalid value
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.aio.max_concurrency = 0
+    assert "must be at least 1" in str(e_info)
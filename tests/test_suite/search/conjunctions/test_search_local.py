@@ -0,0 +1,162 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import datetime
+from pyaurorax.search import (
+    Location,
+    EphemerisData,
+    EphemerisColumnarData,
+    DataSource,
+    Conjunction,
+    GroundCriteriaBlock,
+    SpaceCriteriaBlock,
+    CustomLocationsCriteriaBlock,
+    MetadataFilter,
+    MetadataFilterExpression,
+)
+
+START_DT = datetime.datetime(2020, 1, 1, 0, 0)
+
+
+def __get_ephemeris():
+    # two ground sites at the same latitude, and a spacecraft moving east over both of
+    # them at one degree of longitude per minute
+    site_a = DataSource(identifier=1, program="themis-asi", platform="site-a", instrument_type="panchromatic ASI", source_type="ground")
+    site_b = DataSource(identifier=2, program="themis-asi", platform="site-b", instrument_type="panchromatic ASI", source_type="ground")
+    spacecraft = DataSource(identifier=3, program="swarm", platform="swarma", instrument_type="footprint", source_type="leo")
+    records = []
+    for i in range(0, 51):
+        epoch = START_DT + datetime.timedelta(minutes=i)
+        for ds, lon in [(site_a, -100.0), (site_b, -90.0)]:
+            location = Location(lat=60.0, lon=lon)
+            metadata = {"mode": "night" if i < 25 else "day", "altitude": 0.0}
+            records.append(EphemerisData(ds, epoch, location_geo=location, nbtrace=location, metadata=metadata))
+        location = Location(lat=60.0, lon=-120.0 + i)
+        records.append(EphemerisData(spacecraft, epoch, location_geo=location, nbtrace=location, metadata={"altitude": 450.0}))
+    return records
+
+
+@pytest.mark.search_ro
+def test_search_local(aurorax):
+    records = __get_ephemeris()
+    ground = [GroundCriteriaBlock(programs=["themis-asi"])]
+    space = [SpaceCriteriaBlock(programs=["swarm"])]
+
+    # find conjunctions, with list and columnar records
+    conjunctions = aurorax.search.conjunctions.search_local(records, 200, ground=ground, space=space)
+    columnar = EphemerisColumnarData.from_ephemeris_data(records)
+    conjunctions_columnar = aurorax.search.conjunctions.search_local(columnar, 200, ground=ground, space=space)
+    assert len(conjunctions) == 2
+    assert len(conjunctions_columnar) == 2
+
+    # check the first conjunction
+    c = conjunctions[0]
+    assert isinstance(c, Conjunction) is True
+    assert c.conjunction_type == "nbtrace"
+    assert [ds.platform for ds in c.data_sources] == ["site-a", "swarma"]
+    assert c.start == START_DT + datetime.timedelta(minutes=17)
+    assert c.end == START_DT + datetime.timedelta(minutes=23)
+    assert c.closest_epoch == START_DT + datetime.timedelta(minutes=20)
+    assert c.min_distance == pytest.approx(0.0, abs=1e-3)
+    assert c.max_distance <= 200
+    assert len(c.events) == 1
+    assert c.events[0]["e1_source"]["platform"] == "site-a" and c.events[0]["e2_source"]["platform"] == "swarma"
+    assert c.events[0]["min_distance"] == c.min_distance
+    assert c.start == conjunctions_columnar[0].start and c.end == conjunctions_columnar[0].end
+
+    # the second conjunction is with the other site
+    assert [ds.platform for ds in conjunctions[1].data_sources] == ["site-b", "swarma"]
+    assert conjunctions[1].closest_epoch == START_DT + datetime.timedelta(minutes=30)
+
+    # a larger distance gives longer conjunctions
+    conjunctions = aurorax.search.conjunctions.search_local(records, 400, ground=ground, space=space)
+    assert len(conjunctions) == 2
+    assert conjunctions[0].start < START_DT + datetime.timedelta(minutes=17)
+    assert conjunctions[0].end > START_DT + datetime.timedelta(minutes=23)
+
+    # limit the time range
+    conjunctions = aurorax.search.conjunctions.search_local(
+        records,
+        200,
+        ground=ground,
+        space=space,
+        start=START_DT + datetime.timedelta(minutes=20),
+        end=START_DT + datetime.timedelta(minutes=29),
+    )
+    assert len(conjunctions) == 2
+    assert conjunctions[0].start == START_DT + datetime.timedelta(minutes=20)
+    assert conjunctions[1].end == START_DT + datetime.timedelta(minutes=29)
+
+
+@pytest.mark.search_ro
+def test_search_local_criteria(aurorax):
+    records = __get_ephemeris()
+
+    # metadata filters
+    ground = [GroundCriteriaBlock(metadata_filters=MetadataFilter([MetadataFilterExpression("mode", "night", operator="=")]))]
+    space = [SpaceCriteriaBlock(metadata_filters=MetadataFilter([MetadataFilterExpression("altitude", [400, 500], operator="between")]))]
+    conjunctions = aurorax.search.conjunctions.search_local(records, 200, ground=ground, space=space)
+    assert len(conjunctions) == 1
+    assert conjunctions[0].data_sources[0].platform == "site-a"
+
+    # non-numeric values for a numeric metadata key never match it
+    for operator, values, expected in [("=", "high", 0), ("in", [450, "high"], 2), ("!=", "high", 2), ("not in", ["high"], 2)]:
+        space = [SpaceCriteriaBlock(metadata_filters=MetadataFilter([MetadataFilterExpression("altitude", values, operator=operator)]))]
+        conjunctions = aurorax.search.conjunctions.search_local(records, 200, ground=[{}], space=space)
+        assert len(conjunctions) == expected
+
+    # three criteria blocks, with a custom location and advanced distances
+    distances = {"ground1-space1": 700, "ground1-adhoc1": 100, "space1-adhoc1": None}
+    conjunctions = aurorax.search.conjunctions.search_local(
+        records,
+        distances,
+        ground=[{"platforms": ["site-a"]}],
+        space=[{"programs": ["swarm"]}],
+        custom_locations=[CustomLocationsCriteriaBlock(locations=[(60.5, -100.0)])],
+        conjunction_types=["nbtrace", "geographic"],
+    )
+    assert len(conjunctions) == 2
+    assert sorted([c.conjunction_type for c in conjunctions]) == ["geographic", "nbtrace"]
+    for c in conjunctions:
+        assert [ds.program for ds in c.data_sources] == ["themis-asi", "swarm", "adhoc"]
+        assert len(c.events) == 3
+        assert c.start == START_DT + datetime.timedelta(minutes=8)
+        assert c.end == START_DT + datetime.timedelta(minutes=32)
+        assert c.min_distance == pytest.approx(55.6, abs=0.1)
+
+    # no matching data sources
+    conjunctions = aurorax.search.conjunctions.search_local(records, 200, ground=[{"programs": ["rego"]}], space=[{}])
+    assert conjunctions == []
+
+
+@pytest.mark.search_ro
+def test_search_local_bad_params(aurorax):
+    records = __get_ephemeris()
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.conjunctions.search_local(records, 200, ground=[{}])
+    assert "At least two criteria blocks" in str(e_info)
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.conjunctions.search_local(records, 200, ground=[{}], space=[{}], conjunction_types=["bad"])
+    assert "Invalid conjunction type" in str(e_info)
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.conjunctions.search_local(records, {"ground1-space2": 200}, ground=[{}], space=[{}])
+    assert "Invalid distance key" in str(e_info)
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.conjunctions.search_local(records, 200, ground=[SpaceCriteriaBlock()], space=[{}])
+    assert "Only GroundCriteriaBlock objects" in str(e_info)
+    with pytest.raises(ValueError) as e_info:
+        space = [SpaceCriteriaBlock(metadata_filters=MetadataFilter([MetadataFilterExpression("altitude", "high", operator=">")]))]
+        aurorax.search.conjunctions.search_local(records, 200, ground=[{}], space=space)
+    assert "for key 'altitude' must be numeric" in str(e_info)
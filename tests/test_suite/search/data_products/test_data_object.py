@@ -47,3 +47,28 @@ def test_create_data_product_object(aurorax):
     assert d.data_source.program == program
     assert d.data_source.platform == platform
     assert d.data_source.instrument_type == instrument_type
+
+
+@pytest.mark.search_ro
+def test_to_json_serializable():
+    # create DataProducts object
+    data_source = DataSource(identifier=1, program="test-program", platform="test-platform", instrument_type="test-instrument-type")
+    start_dt = datetime.datetime(2020, 1, 1, 0, 0, 0)
+    end_dt = start_dt.replace(hour=23, minute=59, second=59)
+    dp = DataProductData(data_source=data_source,
+                         data_product_type=DATA_PRODUCT_TYPE_KEOGRAM,
+                         start=start_dt,
+                         end=end_dt,
+                         url="testing_url.jpg",
+                         metadata={"test_meta1": "testing1"})
+
+    # convert
+    d = dp.to_json_serializable()
+    assert d["start"] == "2020-01-01T00:00:00.000" and d["end"] == "2020-01-01T23:59:00.000"
+    assert d["program"] == "test-program" and d["platform"] == "test-platform" and d["instrument_type"] == "test-instrument-type"
+    assert "data_source" not in d
+
+    # check the object wasn't changed
+    assert dp.data_source is data_source
+    assert dp.start == start_dt and dp.end == end_dt
+    assert dp.to_json_serializable() == d
@@ -119,3 +119,32 @@ def test_upload_and_delete_urls(aurorax):
     # delete data
     delete_result = aurorax.search.data_products.delete_urls(ds, urls_to_delete)
     assert delete_result == 0
+
+
+@pytest.mark.search_rw
+def test_bulk_upload_and_delete_urls(aurorax):
+    # get data source
+    ds = aurorax.search.sources.get("test-program", "test-platform", "test-instrument-type")
+
+    # create DataProducts objects
+    records = []
+    for i in range(0, 5):
+        start_dt = datetime.datetime(2020, 2, 10 + i, 0, 0, 0)
+        records.append(
+            DataProductData(
+                data_source=ds,
+                data_product_type=DATA_PRODUCT_TYPE_KEOGRAM,
+                url="test_bulk_delete%d.jpg" % (i),
+                start=start_dt,
+                end=start_dt.replace(hour=23, minute=59, second=59),
+            ))
+
+    # upload records
+    report = aurorax.search.data_products.bulk_upload(ds.identifier, records, validate_source=True, chunk_size=2, n_parallel=2)
+    assert report.success is True
+    assert len(report.chunks) == 3 and report.uploaded_record_count == 5
+    assert all(r.data_source is ds for r in records)
+
+    # delete data
+    delete_result = aurorax.search.data_products.delete_urls(ds, [r.url for r in records])
+    assert delete_result == 0
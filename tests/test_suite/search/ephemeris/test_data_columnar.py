@@ -0,0 +1,131 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import datetime
+import numpy as np
+from pyaurorax.search import Location, EphemerisData, EphemerisColumnarData, EphemerisSearch, DataSource
+
+
+def __get_raw_data(n_records):
+    raw_data = []
+    for i in range(0, n_records):
+        raw_data.append({
+            "epoch": (datetime.datetime(2020, 1, 1, 0, 0) + datetime.timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S"),
+            "data_source": {
+                "identifier": 100 + i % 2,
+                "program": "swarm",
+                "platform": "swarma" if i % 2 == 0 else "swarmb",
+                "instrument_type": "footprint",
+                "source_type": "leo",
+                "display_name": "Swarm A" if i % 2 == 0 else "Swarm B",
+            },
+            "location_geo": {"lat": 51.0 + i, "lon": -110.0},
+            "location_gsm": {"lat": None, "lon": None},
+            "nbtrace": {"lat": 52.0 + i, "lon": -111.0},
+            "sbtrace": {"lat": -52.0 - i, "lon": 60.0},
+            "metadata": {"radial_distance": 6800.5 + i, "state": i, "region": "polar cap" if i % 3 == 0 else None},
+        })
+    return raw_data
+
+
+@pytest.mark.search_ro
+def test_from_raw_data():
+    c = EphemerisColumnarData.from_raw_data(__get_raw_data(5))
+
+    # check columns
+    assert len(c) == 5
+    assert c.epoch.dtype == np.dtype("datetime64[s]")
+    assert c.epoch[1] == np.datetime64("2020-01-01T00:01:00")
+    assert len(c.data_sources) == 2
+    assert c.data_source_idx.tolist() == [0, 1, 0, 1, 0]
+    assert c.location_geo.shape == (5, 2) and c.location_geo.dtype == np.float64
+    assert np.all(np.isnan(c.location_gsm))
+    assert c.metadata["radial_distance"].dtype == np.float64
+    assert c.metadata["state"].dtype == np.int64
+    assert c.metadata["region"].dtype == object
+
+    # check row access
+    e = c[3]
+    assert isinstance(e, EphemerisData) is True
+    assert e.epoch == datetime.datetime(2020, 1, 1, 0, 3)
+    assert e.data_source.platform == "swarmb"
+    assert e.location_geo.lat == 54.0 and e.location_geo.lon == -110.0
+    assert e.location_gsm.lat is None and e.location_gsm.lon is None
+    assert e.metadata == {"radial_distance": 6803.5, "state": 3, "region": "polar cap"}
+    assert isinstance(e.metadata["state"], int) is True
+    assert c[-1].epoch == datetime.datetime(2020, 1, 1, 0, 4)
+    with pytest.raises(IndexError):
+        c[5]
+
+    # check slicing and iterating
+    subset = c[1:3]
+    assert isinstance(subset, EphemerisColumnarData) is True
+    assert len(subset) == 2
+    assert subset[0].epoch == datetime.datetime(2020, 1, 1, 0, 1)
+    assert len(c[c.data_source_idx == 0]) == 3
+    assert [e.epoch for e in c] == [datetime.datetime(2020, 1, 1, 0, i) for i in range(0, 5)]
+
+
+@pytest.mark.search_ro
+def test_convert_ephemeris_data(capsys):
+    # create records
+    ds = DataSource(identifier=1, program="test-program", platform="test-platform", instrument_type="test-instrument-type")
+    records = []
+    for i in range(0, 4):
+        records.append(
+            EphemerisData(
+                data_source=ds,
+                epoch=datetime.datetime(2020, 1, 1, 0, i),
+                location_geo=Location(lat=51.0 + i, lon=-114.0),
+                nbtrace=Location(lat=1.23, lon=45.6),
+                sbtrace=Location(lat=7.89, lon=101.23),
+                metadata={"key": "value%d" % (i)},
+            ))
+
+    # convert and convert back
+    c = EphemerisColumnarData.from_ephemeris_data(records)
+    assert len(c) == 4
+    assert len(c.data_sources) == 1
+    converted_records = c.to_ephemeris_data()
+    for original, converted in zip(records, converted_records, strict=True):
+        assert repr(original) == repr(converted)
+        assert original.metadata == converted.metadata
+        assert original.data_source is converted.data_source
+
+    # join
+    joined = EphemerisColumnarData.concatenate([c, c[0:2]])
+    assert len(joined) == 6
+    assert len(joined.data_sources) == 1
+    assert joined[5].epoch == datetime.datetime(2020, 1, 1, 0, 1)
+
+    # check __str__, __repr__, and pretty_print
+    assert isinstance(str(c), str) is True
+    assert isinstance(repr(c), str) is True
+    c.pretty_print()
+    captured_stdout = capsys.readouterr().out
+    assert captured_stdout != ""
+
+
+@pytest.mark.search_ro
+def test_bad_result_container(aurorax):
+    with pytest.raises(ValueError) as e_info:
+        EphemerisSearch(
+            aurorax,
+            datetime.datetime(2020, 1, 1, 0, 0),
+            datetime.datetime(2020, 1, 1, 0, 59),
+            programs=["swarm"],
+            result_container="bad",  # type: ignore
+        )
+    assert "Invalid result_container" in str(e_info)
@@ -48,3 +48,49 @@ def test_create_data_object(aurorax):
     assert e.data_source.program == program
     assert e.data_source.platform == platform
     assert e.data_source.instrument_type == instrument_type
+
+
+@pytest.mark.search_ro
+def test_to_json_serializable():
+    # create Ephemeris object
+    data_source = DataSource(identifier=1, program="test-program", platform="test-platform", instrument_type="test-instrument-type")
+    e = EphemerisData(
+        data_source=data_source,
+        epoch=datetime.datetime(2020, 1, 1, 0, 0),
+        location_geo=Location(lat=51.049999, lon=-114.066666),
+        metadata={"test_meta1": "testing1"},
+    )
+
+    # convert
+    d = e.to_json_serializable()
+    assert d["epoch"] == "2020-01-01T00:00:00.000Z"
+    assert d["location_geo"] == {"lat": 51.049999, "lon": -114.066666}
+    assert d["location_gsm"] == {"lat": None, "lon": None}
+    assert d["program"] == "test-program" and d["platform"] == "test-platform" and d["instrument_type"] == "test-instrument-type"
+    assert "data_source" not in d
+
+    # check the object wasn't changed
+    assert e.data_source is data_source
+    assert e.epoch == datetime.datetime(2020, 1, 1, 0, 0)
+    assert isinstance(e.location_geo, Location) is True
+    assert e.to_json_serializable() == d
+
+
+@pytest.mark.search_ro
+def test_empty_locations():
+    # create Ephemeris objects without some locations
+    data_source = DataSource(identifier=1, program="test-program", platform="test-platform", instrument_type="test-instrument-type")
+    e1 = EphemerisData(data_source=data_source, epoch=datetime.datetime(2020, 1, 1, 0, 0))
+    e2 = EphemerisData(data_source=data_source, epoch=datetime.datetime(2020, 1, 1, 0, 1))
+
+    # check that missing locations are empty and shared
+    assert e1.location_gsm.lat is None and e1.location_gsm.lon is None
+    assert e1.location_gsm is e2.location_gsm
+    with pytest.raises(AttributeError):
+        e1.location_gsm.lat = 51.0
+    assert e2.location_gsm.lat is None
+
+    # locations are set by assigning a new object
+    e1.location_gsm = Location(lat=51.0, lon=-114.0)
+    assert e1.to_json_serializable()["location_gsm"] == {"lat": 51.0, "lon": -114.0}
+    assert e2.to_json_serializable()["location_gsm"] == {"lat": None, "lon": None}
@@ -15,7 +15,7 @@
 import pytest
 import datetime
 import warnings
-from pyaurorax.search import EphemerisSearch, EphemerisData
+from pyaurorax.search import EphemerisSearch, EphemerisData, EphemerisColumnarData
 
 
 @pytest.mark.search_ro
@@ -249,3 +249,25 @@ def test_cancel_no_wait(aurorax):
 
     # cancel it
     s.cancel(wait=False)
+
+
+@pytest.mark.search_ro
+def test_columnar(aurorax):
+    kwargs = {"programs": ["swarm"], "platforms": ["swarma", "swarmb"], "instrument_types": ["footprint"]}
+    start = datetime.datetime(2019, 1, 1, 0, 0, 0)
+    end = datetime.datetime(2019, 1, 1, 0, 9, 59)
+    s = aurorax.search.ephemeris.search(start, end, result_container="columnar", **kwargs)
+
+    # check
+    assert isinstance(s.data, EphemerisColumnarData) is True
+    assert len(s.data) > 0
+    assert isinstance(s.data[0], EphemerisData) is True
+
+    # compare to the list of records
+    s_list = aurorax.search.ephemeris.search(start, end, **kwargs)
+    assert len(s.data) == len(s_list.data)
+    for e_columnar, e_list in zip(s.data, s_list.data, strict=True):
+        assert e_columnar.epoch == e_list.epoch
+        assert e_columnar.data_source.identifier == e_list.data_source.identifier
+        assert e_columnar.location_geo.lat == e_list.location_geo.lat
+        assert e_columnar.nbtrace.lon == e_list.nbtrace.lon
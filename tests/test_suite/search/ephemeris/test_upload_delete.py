@@ -69,3 +69,49 @@ def test_upload_and_delete_ephemeris(aurorax):
         datetime.datetime(2020, 1, 1, 23, 59),
     )
     assert delete_result == 0
+
+
+@pytest.mark.search_rw
+def test_bulk_upload_and_delete_ephemeris(aurorax):
+    # get the data source
+    ds = aurorax.search.sources.get("test-program", "test-platform", "test-instrument-type")
+
+    # create Ephemeris objects
+    records = []
+    for i in range(0, 10):
+        records.append(
+            EphemerisData(data_source=ds,
+                          epoch=datetime.datetime(2020, 1, 1, 0, i),
+                          location_geo=Location(lat=51.049999, lon=-114.066666),
+                          location_gsm=Location(lat=150.25, lon=-10.75),
+                          nbtrace=Location(lat=1.23, lon=45.6),
+                          sbtrace=Location(lat=7.89, lon=101.23),
+                          metadata={"test_meta1": "testing1"}))
+
+    # upload records
+    report = aurorax.search.ephemeris.bulk_upload(ds.identifier, records, validate_source=True, chunk_size=3, n_parallel=2)
+    assert report.success is True
+    assert report.record_count == 10 and report.uploaded_record_count == 10
+    assert [(c.start_index, c.end_index) for c in report.chunks] == [(0, 3), (3, 6), (6, 9), (9, 10)]
+    assert all(r.data_source is ds for r in records)
+
+    # briefly sleep, arbitrary amount > a few seconds
+    time.sleep(5)
+
+    # cleanup by deleting the ephemeris data that was uploaded
+    delete_result = aurorax.search.ephemeris.delete(
+        ds,
+        datetime.datetime(2020, 1, 1, 0, 0),
+        datetime.datetime(2020, 1, 1, 23, 59),
+    )
+    assert delete_result == 0
+
+
+@pytest.mark.search_ro
+def test_bulk_upload_bad_params(aurorax):
+    with pytest.raises(ValueError, match="chunk_size"):
+        aurorax.search.ephemeris.bulk_upload(1, [], chunk_size=0)
+    with pytest.raises(ValueError, match="n_parallel"):
+        aurorax.search.ephemeris.bulk_upload(1, [], n_parallel=0)
+    with pytest.raises(ValueError, match="max_retries"):
+        aurorax.search.ephemeris.bulk_upload(1, [], max_retries=-1)
@@ -63,3 +63,32 @@ def test_wait_for_request_data(aurorax):
     # get data
     r.get_data()
     assert len(r.data) > 0
+
+
+@pytest.mark.search_ro
+def test_get_data_serializing(aurorax):
+    # start search
+    r = aurorax.search.conjunctions.search(
+        datetime.datetime(2020, 1, 1, 0, 0, 0),
+        datetime.datetime(2020, 1, 1, 6, 59, 59),
+        500,
+        ground=[aurorax.search.GroundCriteriaBlock(programs=["themis-asi"])],
+        space=[aurorax.search.SpaceCriteriaBlock(programs=["swarm"])],
+        return_immediately=True,
+    )
+    r.wait()
+
+    # get data with and without serializing
+    data = aurorax.search.requests.get_data(r.data_url)
+    raw_data = aurorax.search.requests.get_data(r.data_url, skip_serializing=True)
+    assert len(data) == len(raw_data)
+    assert len(data) > 0
+
+    # check serialized values
+    for record, raw_record in zip(data, raw_data, strict=True):
+        for field in ["start", "end", "closest_epoch", "farthest_epoch"]:
+            assert isinstance(record[field], datetime.datetime) is True
+            assert record[field] == datetime.datetime.strptime(raw_record[field], "%Y-%m-%dT%H:%M:%S")
+        for event, raw_event in zip(record["events"], raw_record["events"], strict=True):
+            assert event["start"] == datetime.datetime.strptime(raw_event["start"], "%Y-%m-%dT%H:%M:%S")
+            assert event["end"] == datetime.datetime.strptime(raw_event["end"], "%Y-%m-%dT%H:%M:%S")
@@ -0,0 +1,133 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import json
+import pytest
+import datetime
+from pyaurorax.search import EphemerisSearch, EphemerisData
+from pyaurorax.search.requests._stream import ResultStreamParser
+from pyaurorax.exceptions import AuroraXDataRetrievalError, AuroraXAPIError
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, content_type="application/json"):
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type}
+        self.content = b"{}"
+        self.closed = False
+
+    def json(self):
+        return {}
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.search_ro
+def test_stream_parser():
+    data = {
+        "before": {"a": [1, 2]},
+        "result": [{"x": "café", "n": 12345678, "f": 1.5e-3}, [1, [2, None]], "a,]}", -0.5],
+        "after": True,
+    }
+    raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    # split into tiny chunks, so that values and multi-byte characters are split up
+    for chunk_size in [1, 3, 7, len(raw)]:
+        parser = ResultStreamParser([raw[i:i + chunk_size] for i in range(0, len(raw), chunk_size)])
+        assert list(parser) == data["result"]
+        assert parser.extra == {"before": data["before"], "after": True}
+
+    # empty result
+    assert list(ResultStreamParser([b'{"result": []}'])) == []
+
+    # truncated and invalid data
+    for raw in [b'{"result": [1, 2', b'{"result": [1, 2]', b'{"result": [1 2]}', b"[1]", b""]:
+        with pytest.raises(AuroraXDataRetrievalError):
+            list(ResultStreamParser([raw]))
+
+
+@pytest.mark.search_ro
+def test_iter_data_bad_params(aurorax, tmp_path):
+    filename = str(tmp_path / "data.json")
+    with open(filename, "w") as fp:
+        json.dump({"result": []}, fp)
+
+    with pytest.raises(ValueError, match="search_type"):
+        list(aurorax.search.requests.iter_data_file(filename, search_type="something"))
+    with pytest.raises(ValueError, match="batch_size"):
+        list(aurorax.search.requests.iter_data_file(filename, search_type="ephemeris", batch_size=0))
+
+
+@pytest.mark.search_ro
+def test_iter_data(aurorax, tmp_path):
+    # start search
+    r = EphemerisSearch(aurorax,
+                        datetime.datetime(2020, 1, 1, 0, 0, 0),
+                        datetime.datetime(2020, 1, 1, 1, 0, 0),
+                        programs=["swarm"],
+                        platforms=["swarma"],
+                        instrument_types=["footprint"])
+    r.execute()
+    r.wait()
+
+    # get data all at once
+    data_res = aurorax.search.requests.get_data(r.data_url)
+    assert len(data_res) > 0
+
+    # get data in batches, saving it to a file
+    filename = str(tmp_path / "data.json")
+    batches = list(aurorax.search.requests.iter_data(r.data_url, batch_size=10, spool_filename=filename))
+    assert all(len(batch) <= 10 for batch in batches)
+    assert [record for batch in batches for record in batch] == data_res
+    assert os.path.exists(filename) is True
+
+    # read the saved data
+    batches = list(aurorax.search.requests.iter_data_file(filename, batch_size=10))
+    assert [record for batch in batches for record in batch] == data_res
+
+    # get data using the search object
+    n_records = 0
+    for batch in r.iter_data(batch_size=10):
+        assert all(isinstance(e, EphemerisData) for e in batch)
+        n_records += len(batch)
+    assert n_records == len(data_res)
+    assert r.data == []
+
+
+@pytest.mark.search_ro
+@pytest.mark.parametrize("status_code,content_type", [(400, "application/json"), (502, "text/html"), (200, "text/html")])
+def test_stream_closed_on_error(aurorax, monkeypatch, status_code, content_type):
+    res = FakeResponse(status_code, content_type=content_type)
+    monkeypatch.setattr(aurorax.api_session, "request", lambda *args, **kwargs: res)
+
+    # a streamed response should be closed when an error is raised
+    req = aurorax.search.api.AuroraXAPIRequest(aurorax, method="get", url="https://example.com", stream=True)
+    with pytest.raises(AuroraXAPIError):
+        req.execute()
+    assert res.closed is True
+
+
+@pytest.mark.search_ro
+def test_stream_not_closed(aurorax, monkeypatch):
+    res = FakeResponse(200)
+    monkeypatch.setattr(aurorax.api_session, "request", lambda *args, **kwargs: res)
+
+    # a successful streamed response is left open for the caller to read
+    req = aurorax.search.api.AuroraXAPIRequest(aurorax, method="get", url="https://example.com", stream=True)
+    api_res = req.execute()
+    assert api_res.request is res
+    assert res.closed is False
@@ -0,0 +1,120 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import datetime
+from pyaurorax.search import EphemerisSearch, EphemerisData
+from pyaurorax.search.requests import SearchRequestMonitor
+from pyaurorax.exceptions import AuroraXError
+
+
+@pytest.mark.search_ro
+def test_simple(aurorax):
+    start_dt = datetime.datetime(2019, 1, 1, 0, 0, 0)
+    end_dt = datetime.datetime(2019, 1, 1, 0, 59, 59)
+
+    # do searches
+    searches = []
+    for program in ["themis", "swarm"]:
+        s = EphemerisSearch(aurorax, start=start_dt, end=end_dt, programs=[program])
+        s.execute()
+        searches.append(s)
+
+    # wait for them
+    futures = [aurorax.search.requests.monitor.submit(s) for s in searches]
+    for i in range(0, len(searches)):
+        s = searches[i]
+        result = futures[i].result(timeout=300)
+        assert result is s
+        assert s.completed is True
+        assert len(s.data) > 0 and isinstance(s.data[0], EphemerisData)
+
+    # check state
+    assert aurorax.search.requests.monitor.pending_count == 0
+    assert "ephemeris" in aurorax.search.requests.monitor.expected_durations
+
+
+@pytest.mark.search_ro
+def test_request_url(aurorax):
+    start_dt = datetime.datetime(2019, 1, 1, 0, 0, 0)
+    end_dt = datetime.datetime(2019, 1, 1, 0, 59, 59)
+
+    # do search
+    s = EphemerisSearch(aurorax, start=start_dt, end=end_dt, programs=["themis"])
+    s.execute()
+
+    # wait for it
+    with SearchRequestMonitor(aurorax, min_poll_interval=0.2) as monitor:
+        status = monitor.submit(s.request_url).result(timeout=300)
+    assert status["search_result"]["data_uri"] is not None
+
+
+@pytest.mark.search_ro
+@pytest.mark.parametrize("kwargs", [
+    {"min_poll_interval": 0},
+    {"min_poll_interval": 2, "max_poll_interval": 1},
+    {"backoff_factor": 0.5},
+    {"max_workers": 0},
+])
+def test_bad_parameters(aurorax, kwargs):
+    with pytest.raises(ValueError):
+        SearchRequestMonitor(aurorax, **kwargs)
+
+
+@pytest.mark.search_ro
+def test_not_executed(aurorax):
+    s = EphemerisSearch(aurorax, start=datetime.datetime(2019, 1, 1), end=datetime.datetime(2019, 1, 2), programs=["themis"])
+    with pytest.raises(ValueError):
+        aurorax.search.requests.monitor.submit(s)
+
+
+@pytest.mark.search_ro
+def test_shutdown(aurorax):
+    monitor = SearchRequestMonitor(aurorax)
+    monitor.shutdown()
+    with pytest.raises(AuroraXError):
+        monitor.submit("https://api.aurorax.space/api/v1/ephemeris/requests/abc")
+
+
+@pytest.mark.search_ro
+@pytest.mark.parametrize("status", [{"search_result": {}}, {}])
+def test_bad_status(aurorax, monkeypatch, status):
+    monkeypatch.setattr("pyaurorax.search.requests.classes.monitor.func_get_status", lambda aurorax_obj, request_url: status)
+
+    # an unexpected status should fail the future instead of leaving it pending
+    with SearchRequestMonitor(aurorax, min_poll_interval=0.1) as monitor:
+        future = monitor.submit("https://example.com/api/v1/ephemeris/requests/abc")
+        with pytest.raises(KeyError):
+            future.result(timeout=10)
+        assert monitor.pending_count == 0
+
+
+@pytest.mark.search_ro
+def test_update_status_error(aurorax, monkeypatch):
+    status = {"search_result": {"data_uri": None}}
+    monkeypatch.setattr("pyaurorax.search.requests.classes.monitor.func_get_status", lambda aurorax_obj, request_url: status)
+
+    # an error while updating the search object should fail the future
+    s = EphemerisSearch(aurorax, start=datetime.datetime(2019, 1, 1), end=datetime.datetime(2019, 1, 2), programs=["themis"])
+    s.request_url = "https://example.com/api/v1/ephemeris/requests/abc"
+
+    def update_status(status=None):
+        raise RuntimeError("update failed")
+
+    monkeypatch.setattr(s, "update_status", update_status)
+    with SearchRequestMonitor(aurorax, min_poll_interval=0.1) as monitor:
+        future = monitor.submit(s)
+        with pytest.raises(RuntimeError, match="update failed"):
+            future.result(timeout=10)
+        assert monitor.pending_count == 0
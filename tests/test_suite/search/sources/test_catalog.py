@@ -0,0 +1,128 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import json
+import time
+import pytest
+import pyaurorax
+from pyaurorax.exceptions import AuroraXAPIError
+from pyaurorax.search.sources import DataSource, DataSourceCatalog, FORMAT_BASIC_INFO, FORMAT_FULL_RECORD
+
+
+def __make_record(identifier, program, platform, instrument_type):
+    return {
+        "identifier": identifier,
+        "program": program,
+        "platform": platform,
+        "instrument_type": instrument_type,
+        "source_type": "leo",
+        "display_name": "%s %s" % (program, platform),
+        "metadata": {"key": "value"},
+        "owner": None,
+        "maintainers": [],
+        "ephemeris_metadata_schema": [{"field_name": "key"}],
+        "data_product_metadata_schema": [],
+    }
+
+
+@pytest.mark.search_ro
+def test_catalog_from_file(api_url, tmp_path):
+    # write a catalog file
+    cache_path = str(tmp_path / "sources.json")
+    aurorax = pyaurorax.PyAuroraX(api_base_url=api_url, sources_cache_path=cache_path)
+    with open(cache_path, "w") as fp:
+        json.dump(
+            {
+                "version": 1,
+                "api_base_url": aurorax.api_base_url,
+                "refreshed_at": time.time(),
+                "sources": [
+                    __make_record(2, "program-b", "platform-a", "instrument"),
+                    __make_record(1, "program-a", "platform-b", "instrument"),
+                ],
+            }, fp)
+
+    # the catalog is read from the file, without any API requests
+    catalog = aurorax.search.sources.catalog
+    assert isinstance(catalog, DataSourceCatalog) is True
+    ds = catalog.get_using_identifier(1)
+    assert isinstance(ds, DataSource) is True
+    assert ds.program == "program-a" and ds.metadata == {"key": "value"} and ds.format == FORMAT_FULL_RECORD
+    assert len(catalog) == 2 and catalog.is_stale is False
+
+    # lookups by name, with a different format
+    ds = aurorax.search.sources.get("program-b", "platform-a", "instrument", format=FORMAT_BASIC_INFO, use_cache=True)
+    assert ds.identifier == 2 and ds.metadata is None and ds.format == FORMAT_BASIC_INFO
+
+    # returned data sources are copies
+    ds = aurorax.search.sources.get_using_identifier(1, use_cache=True)
+    ds.metadata["key"] = "changed"
+    assert catalog.get_using_identifier(1).metadata == {"key": "value"}
+
+    # listing, with filters and ordering
+    assert [ds.identifier for ds in catalog.list()] == [1, 2]
+    assert [ds.identifier for ds in catalog.list(order="platform")] == [2, 1]
+    assert [ds.identifier for ds in aurorax.search.sources.list(program="program-b", use_cache=True)] == [2]
+    assert aurorax.search.metadata.get_ephemeris_schema(2) == [{"field_name": "key"}]
+
+    # unknown identifiers surface from the schema functions as API errors
+    with pytest.raises(AuroraXAPIError, match="could not be found"):
+        aurorax.search.metadata.get_ephemeris_schema(999)
+    with pytest.raises(AuroraXAPIError, match="could not be found"):
+        aurorax.search.metadata.get_data_products_schema(999)
+
+    # invalidate
+    catalog.invalidate()
+    assert len(catalog) == 0 and catalog.last_refreshed is None and catalog.is_stale is True
+    assert os.path.exists(cache_path) is False
+
+
+@pytest.mark.search_ro
+def test_catalog_settings(api_url):
+    aurorax = pyaurorax.PyAuroraX(api_base_url=api_url)
+    assert aurorax.sources_cache_ttl > 0 and aurorax.sources_cache_path is None
+    assert aurorax.search.sources.catalog.enabled is True
+
+    # disable
+    aurorax.sources_cache_ttl = 0
+    assert aurorax.search.sources.catalog.enabled is False
+
+    # reset
+    aurorax.sources_cache_ttl = None
+    assert aurorax.sources_cache_ttl > 0
+
+
+@pytest.mark.search_ro
+def test_catalog_lookups(aurorax):
+    # refresh
+    catalog = aurorax.search.sources.catalog
+    catalog.refresh()
+    assert len(catalog) > 0 and catalog.is_stale is False
+
+    # compare with the API
+    source = aurorax.search.sources.get("swarm", "swarma", "footprint", format=FORMAT_FULL_RECORD)
+    source_cached = aurorax.search.sources.get("swarm", "swarma", "footprint", format=FORMAT_FULL_RECORD, use_cache=True)
+    assert source.identifier == source_cached.identifier
+    source_cached = aurorax.search.sources.get_using_identifier(source.identifier, use_cache=True)
+    assert source.program == source_cached.program and source.platform == source_cached.platform
+
+    # compare lists
+    sources = aurorax.search.sources.get_using_filters(program="swarm", instrument_type="footprint")
+    sources_cached = aurorax.search.sources.get_using_filters(program="swarm", instrument_type="footprint", use_cache=True)
+    assert [s.identifier for s in sources] == [s.identifier for s in sources_cached]
+
+    # not found
+    with pytest.raises(pyaurorax.AuroraXNotFoundError):
+        aurorax.search.sources.get("definitely", "doesnt", "exist", use_cache=True)
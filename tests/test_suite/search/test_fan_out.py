@@ -0,0 +1,206 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import datetime
+import requests
+from pyaurorax.search import FanOutSearchResult, EphemerisData, EphemerisSearch, Conjunction
+from pyaurorax.exceptions import AuroraXAPIError, AuroraXSearchError
+from pyaurorax.search._fan_out import get_windows
+
+
+@pytest.mark.search_ro
+def test_get_windows():
+    # even split
+    windows = get_windows(datetime.datetime(2020, 1, 1, 0, 0, 0), datetime.datetime(2020, 1, 3, 23, 59, 59), datetime.timedelta(days=1))
+    assert windows == [
+        (datetime.datetime(2020, 1, 1, 0, 0, 0), datetime.datetime(2020, 1, 1, 23, 59, 59)),
+        (datetime.datetime(2020, 1, 2, 0, 0, 0), datetime.datetime(2020, 1, 2, 23, 59, 59)),
+        (datetime.datetime(2020, 1, 3, 0, 0, 0), datetime.datetime(2020, 1, 3, 23, 59, 59)),
+    ]
+
+    # last window is clipped
+    windows = get_windows(datetime.datetime(2020, 1, 1, 0, 0, 0), datetime.datetime(2020, 1, 1, 15, 0, 0), datetime.timedelta(hours=6))
+    assert len(windows) == 3
+    assert windows[-1] == (datetime.datetime(2020, 1, 1, 12, 0, 0), datetime.datetime(2020, 1, 1, 15, 0, 0))
+
+    # single window
+    windows = get_windows(datetime.datetime(2020, 1, 1, 0, 0, 0), datetime.datetime(2020, 1, 1, 0, 0, 0), datetime.timedelta(days=7))
+    assert windows == [(datetime.datetime(2020, 1, 1, 0, 0, 0), datetime.datetime(2020, 1, 1, 0, 0, 0))]
+
+
+@pytest.mark.search_ro
+def test_bad_params(aurorax):
+    start = datetime.datetime(2020, 1, 1, 0, 0, 0)
+    end = datetime.datetime(2020, 1, 2, 0, 0, 0)
+
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.fan_out_search("some_search", start, end, programs=["swarm"])
+    assert "Invalid search_type" in str(e_info)
+
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.fan_out_search("ephemeris", end, start, programs=["swarm"])
+    assert "end timestamp must be after" in str(e_info)
+
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.fan_out_search("ephemeris", start, end, window=datetime.timedelta(seconds=0), programs=["swarm"])
+    assert "window must be at least" in str(e_info)
+
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.fan_out_search("ephemeris", start, end, n_parallel=0, programs=["swarm"])
+    assert "n_parallel" in str(e_info)
+
+    with pytest.raises(TypeError):
+        aurorax.search.fan_out_search("ephemeris", start, end, some_param=["swarm"])
+
+
+@pytest.mark.search_ro
+def test_ephemeris(aurorax, capsys):
+    start = datetime.datetime(2019, 1, 1, 0, 0, 0)
+    end = datetime.datetime(2019, 1, 1, 0, 59, 59)
+    kwargs = {"programs": ["swarm"], "platforms": ["swarma"], "instrument_types": ["footprint"]}
+
+    # do search
+    r = aurorax.search.fan_out_search("ephemeris", start, end, window=datetime.timedelta(minutes=15), **kwargs)
+    assert isinstance(r, FanOutSearchResult) is True
+    assert len(r.searches) == 4
+    assert len(r.failed_windows) == 0
+    for e in r.data:
+        assert isinstance(e, EphemerisData) is True
+    epochs = [e.epoch for e in r.data]
+    assert epochs == sorted(epochs)
+
+    # compare to a single search
+    s = aurorax.search.ephemeris.search(start, end, **kwargs)
+    assert epochs == sorted([e.epoch for e in s.data])
+
+    # check __str__, __repr__, and pretty_print
+    assert isinstance(str(r), str) is True
+    assert isinstance(repr(r), str) is True
+    r.pretty_print()
+    captured_stdout = capsys.readouterr().out
+    assert captured_stdout != ""
+
+
+@pytest.mark.search_ro
+def test_conjunctions(aurorax):
+    r = aurorax.search.fan_out_search(
+        "conjunctions",
+        datetime.datetime(2020, 1, 1, 0, 0, 0),
+        datetime.datetime(2020, 1, 2, 23, 59, 59),
+        distance=500,
+        ground=[aurorax.search.GroundCriteriaBlock(programs=["themis-asi"])],
+        space=[aurorax.search.SpaceCriteriaBlock(programs=["swarm"])],
+        n_parallel=2,
+        progress_bar_disable=True,
+    )
+    assert len(r.searches) == 2
+    assert len(r.data) > 0
+    for c in r.data:
+        assert isinstance(c, Conjunction) is True
+    starts = [c.start for c in r.data]
+    assert starts == sorted(starts)
+
+
+class FakeSearchCalls:
+
+    def __init__(self, monkeypatch, execute_error=None, wait_errors=None):
+        self.execute = 0
+        self.wait = 0
+        self.cancel = 0
+        self.execute_error = execute_error
+        self.wait_errors = [] if wait_errors is None else list(wait_errors)
+
+        # stub out the API calls of the search class
+        calls = self
+
+        def execute(s):
+            calls.execute += 1
+            if (calls.execute_error is not None):
+                raise calls.execute_error
+            s.executed = True
+            s.request_url = "https://example.com/api/v1/ephemeris/requests/%d" % (calls.execute)
+
+        def wait(s, poll_interval=1.0, verbose=False):
+            calls.wait += 1
+            if (len(calls.wait_errors) > 0):
+                raise calls.wait_errors.pop(0)
+            s.update_status({"search_result": {"data_uri": "/data", "error_condition": False}, "logs": []})
+
+        def get_data(s):
+            s.data = []
+
+        def cancel(s, wait=False, poll_interval=1.0, verbose=False):
+            calls.cancel += 1
+            return 0
+
+        monkeypatch.setattr(EphemerisSearch, "execute", execute)
+        monkeypatch.setattr(EphemerisSearch, "wait", wait)
+        monkeypatch.setattr(EphemerisSearch, "get_data", get_data)
+        monkeypatch.setattr(EphemerisSearch, "cancel", cancel)
+
+
+@pytest.mark.search_ro
+def test_client_error_not_retried(aurorax, monkeypatch):
+    calls = FakeSearchCalls(monkeypatch, execute_error=AuroraXAPIError("API error code 400: invalid search"))
+
+    # a window with a client error should fail after a single attempt
+    with pytest.raises(AuroraXSearchError) as e_info:
+        aurorax.search.fan_out_search(
+            "ephemeris",
+            datetime.datetime(2020, 1, 1, 0, 0, 0),
+            datetime.datetime(2020, 1, 1, 23, 59, 59),
+            max_retries=3,
+            retry_backoff=0,
+            progress_bar_disable=True,
+            programs=["swarm"],
+        )
+    assert "API error code 400" in str(e_info)
+    assert calls.execute == 1
+    assert calls.cancel == 0
+
+
+@pytest.mark.search_ro
+def test_retry_same_request(aurorax, monkeypatch):
+    calls = FakeSearchCalls(monkeypatch, wait_errors=[requests.exceptions.ConnectionError("connection dropped")])
+
+    # a failure while waiting should keep waiting for the same request
+    res = aurorax.search.fan_out_search(
+        "ephemeris",
+        datetime.datetime(2020, 1, 1, 0, 0, 0),
+        datetime.datetime(2020, 1, 1, 23, 59, 59),
+        max_retries=3,
+        retry_backoff=0,
+        progress_bar_disable=True,
+        programs=["swarm"],
+    )
+    assert len(res.failed_windows) == 0
+    assert calls.execute == 1
+    assert calls.wait == 2
+
+    # a request that is still running when retries run out should be cancelled
+    calls = FakeSearchCalls(monkeypatch, wait_errors=[requests.exceptions.ConnectionError("connection dropped")] * 2)
+    with pytest.raises(AuroraXSearchError):
+        aurorax.search.fan_out_search(
+            "ephemeris",
+            datetime.datetime(2020, 1, 1, 0, 0, 0),
+            datetime.datetime(2020, 1, 1, 23, 59, 59),
+            max_retries=1,
+            retry_backoff=0,
+            progress_bar_disable=True,
+            programs=["swarm"],
+        )
+    assert calls.execute == 1
+    assert calls.wait == 2
+    assert calls.cancel == 1
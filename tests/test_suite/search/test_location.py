@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import pickle
 import pytest
-from pyaurorax.search import Location
+from pyaurorax.search import Location, FrozenLocation
+from pyaurorax.search.location import EMPTY_LOCATION
 
 
 @pytest.mark.search_ro
@@ -75,3 +78,40 @@ def test_invalid_change4():
     with pytest.raises(ValueError) as e_info:
         loc.lon = -114.
     assert "Latitude and longitude must both be numbers, or both be None" in str(e_info)
+
+
+@pytest.mark.search_ro
+def test_frozen_object():
+    loc = FrozenLocation(lat=51, lon=-114.)
+    assert loc.lat == 51.0 and loc.lon == -114.0
+    assert isinstance(loc, Location) is True
+    with pytest.raises(AttributeError):
+        loc.lat = 52.0
+    with pytest.raises(AttributeError):
+        loc.lon = -115.0
+    assert loc.lat == 51.0 and loc.lon == -114.0
+
+    # equality and hashing
+    assert loc == Location(lat=51, lon=-114.)
+    assert Location(lat=51, lon=-114.) == loc
+    assert loc != FrozenLocation(lat=52, lon=-114.)
+    assert len(set([loc, FrozenLocation(lat=51, lon=-114.)])) == 1
+
+    # copies and pickles
+    assert copy.deepcopy(loc) is loc
+    assert pickle.loads(pickle.dumps(loc)) == loc
+
+
+@pytest.mark.search_ro
+def test_empty_location():
+    assert EMPTY_LOCATION.lat is None and EMPTY_LOCATION.lon is None
+    assert EMPTY_LOCATION.to_json_serializable() == {"lat": None, "lon": None}
+    with pytest.raises(AttributeError):
+        EMPTY_LOCATION.lat = 51.0
+
+
+@pytest.mark.search_ro
+def test_no_extra_attributes():
+    loc = Location(lat=51, lon=-114.)
+    with pytest.raises(AttributeError):
+        loc.alt = 100.0  # type: ignore
@@ -76,3 +76,53 @@ def test_convert_sbtrace_southern(aurorax):
     sbtrace = aurorax.search.util.ground_geo_to_sbtrace(geo_location, timestamp)
 
     assert np.floor(sbtrace.lat) == -48 and np.floor(sbtrace.lon) == 39
+
+
+@pytest.mark.search_ro
+def test_convert_btrace_array(aurorax):
+    # set locations and timestamps, including a repeated location and a missing one
+    lat = np.array([56.0, -56.0, -56.0, 62.5, -30.2, np.nan])
+    lon = np.array([20.0, 20.0, 20.0, -114.0, 150.5, np.nan])
+    timestamps = [datetime.datetime(2020, 1, 1, 0, 0, 0) + datetime.timedelta(minutes=i) for i in range(0, 6)]
+
+    # convert, and compare to converting one location at a time
+    nbtrace_lat, nbtrace_lon = aurorax.search.util.ground_geo_to_nbtrace_array(lat, lon, timestamps)
+    sbtrace_lat, sbtrace_lon = aurorax.search.util.ground_geo_to_sbtrace_array(lat, lon, timestamps)
+    assert nbtrace_lat.shape == lat.shape and sbtrace_lon.shape == lat.shape
+    for i in range(0, 5):
+        nbtrace = aurorax.search.util.ground_geo_to_nbtrace(Location(lat=lat[i], lon=lon[i]), timestamps[i])
+        sbtrace = aurorax.search.util.ground_geo_to_sbtrace(Location(lat=lat[i], lon=lon[i]), timestamps[i])
+        assert nbtrace_lat[i] == pytest.approx(nbtrace.lat) and nbtrace_lon[i] == pytest.approx(nbtrace.lon)
+        assert sbtrace_lat[i] == pytest.approx(sbtrace.lat) and sbtrace_lon[i] == pytest.approx(sbtrace.lon)
+    assert np.isnan(nbtrace_lat[5]) and np.isnan(sbtrace_lon[5])
+
+    # a single timestamp, and a 2-D array of locations
+    nbtrace_lat, nbtrace_lon = aurorax.search.util.ground_geo_to_nbtrace_array(lat.reshape((2, 3)), lon.reshape((2, 3)), timestamps[0])
+    assert nbtrace_lat.shape == (2, 3)
+    assert np.floor(nbtrace_lat[0, 1]) == 58 and np.floor(nbtrace_lon[0, 1]) == -9
+
+
+@pytest.mark.search_ro
+def test_convert_btrace_array_time_resolution(aurorax):
+    # timestamps are rounded down to the resolution before converting
+    lat = np.full(120, -56.0)
+    lon = np.full(120, 20.0)
+    timestamps = np.datetime64("2020-01-01T00:00:00") + np.arange(0, 120).astype("timedelta64[m]")
+    nbtrace_lat, nbtrace_lon = aurorax.search.util.ground_geo_to_nbtrace_array(lat, lon, timestamps, time_resolution=datetime.timedelta(hours=1))
+    expected_lat, expected_lon = aurorax.search.util.ground_geo_to_nbtrace_array(lat, lon, timestamps.astype("datetime64[h]"))
+    assert np.array_equal(nbtrace_lat, expected_lat) and np.array_equal(nbtrace_lon, expected_lon)
+    assert np.all(nbtrace_lat[0:60] == nbtrace_lat[0]) and nbtrace_lat[60] != nbtrace_lat[0]
+
+
+@pytest.mark.search_ro
+def test_convert_btrace_array_bad_params(aurorax):
+    timestamp = datetime.datetime(2020, 1, 1, 0, 0, 0)
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.util.ground_geo_to_nbtrace_array([56.0, 57.0], [20.0], timestamp)
+    assert "must be the same shape" in str(e_info)
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.util.ground_geo_to_nbtrace_array([56.0, 57.0], [20.0, 21.0], [timestamp] * 3)
+    assert "can't be matched to the locations" in str(e_info)
+    with pytest.raises(ValueError) as e_info:
+        aurorax.search.util.ground_geo_to_sbtrace_array([56.0], [20.0], timestamp, time_resolution=datetime.timedelta(0))
+    assert "time_resolution" in str(e_info)
@@ -18,6 +18,7 @@ import random
 import string
 import pytest
 import platform
+import requests
 import pyaurorax
 import pyucalgarysrs
 import datetime
@@ -141,6 +142,44 @@ def test_api_timeout(aurorax):
     assert aurorax.api_timeout == default_timeout
 
 
+@pytest.mark.top_level
+def test_api_session(aurorax, capsys):
+    # check defaults
+    assert isinstance(aurorax.api_session, requests.Session) is True
+    assert aurorax.api_pool_size > 0
+    assert aurorax.api_max_retries > 0
+    assert aurorax.api_retry_backoff > 0
+    adapter = aurorax.api_session.get_adapter(aurorax.api_base_url)
+    assert adapter.max_retries.total == aurorax.api_max_retries
+
+    # set values, which should re-create the session
+    default_pool_size = aurorax.api_pool_size
+    old_session = aurorax.api_session
+    aurorax.api_pool_size = 2
+    assert aurorax.api_pool_size == 2
+    assert aurorax.api_session is not old_session
+    aurorax.api_max_retries = 0
+    assert aurorax.api_max_retries == 0
+    assert aurorax.api_session.get_adapter(aurorax.api_base_url).max_retries.total == 0
+    aurorax.api_retry_backoff = 2.0
+    assert aurorax.api_retry_backoff == 2.0
+    assert aurorax.api_session.get_adapter(aurorax.api_base_url).max_retries.backoff_factor == 2.0
+
+    # set back to defaults
+    aurorax.api_pool_size = None
+    assert aurorax.api_pool_size == default_pool_size
+    aurorax.api_max_retries = None
+    assert aurorax.api_max_retries > 0
+    aurorax.api_retry_backoff = None
+    assert aurorax.api_retry_backoff < 2.0
+
+    # check printing
+    aurorax.pretty_print()
+    captured_stdout = capsys.readouterr().out
+    assert "api_pool_size" in captured_stdout
+    assert "api_pool_size" in repr(aurorax)
+
+
 @pytest.mark.top_level
 def test_progress_bar_backend(aurorax):
     # save default for later
@@ -248,3 +287,35 @@ def test_show_data_usage(aurorax, capsys):
     print(aurorax.show_data_usage(order="name"))
     captured_stdout = capsys.readouterr().out
     assert captured_stdout != ""
+
+
+@pytest.mark.top_level
+def test_mosaic_skymap_cache(aurorax, capsys):
+    # check defaults
+    assert aurorax.mosaic_skymap_cache_path == "%s/mosaic_skymap_cache" % (aurorax.download_output_root_path)
+    assert aurorax.mosaic_skymap_cache_max_size > 0
+
+    # set values
+    new_path = str("%s/pyaurorax_mosaic_skymap_cache_testing_%s" %
+                   (Path.home(), ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))))
+    aurorax.mosaic_skymap_cache_path = new_path
+    assert aurorax.mosaic_skymap_cache_path == new_path
+    aurorax.mosaic_skymap_cache_max_size = 1024
+    assert aurorax.mosaic_skymap_cache_max_size == 1024
+    aurorax.mosaic_skymap_cache_max_size = None
+    assert aurorax.mosaic_skymap_cache_max_size > 1024
+
+    # check purge function
+    os.makedirs("%s/testing1" % (new_path), exist_ok=True)
+    Path("%s/testing1/testing.npy" % (new_path)).touch()
+    aurorax.purge_mosaic_skymap_cache()
+    assert os.path.exists(new_path) is False
+
+    # purging a cache that doesn't exist is fine
+    aurorax.purge_mosaic_skymap_cache()
+
+    # check printing
+    aurorax.pretty_print()
+    captured_stdout = capsys.readouterr().out
+    assert "mosaic_skymap_cache_path" in captured_stdout
+    assert "mosaic_skymap_cache_path" in repr(aurorax)
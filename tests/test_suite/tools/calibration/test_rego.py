@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import pytest
+import numpy as np
 
 
 @pytest.mark.tools
@@ -57,3 +58,52 @@ def test_bad_rayleighs_arg(at, rego_calibration_data):
             step_rayleighs_calibration=True,
         )
     assert "The cal_rayleighs parameter must be supplied to perform the rayleighs conversion step" in str(e_info)
+
+
+@pytest.mark.tools
+def test_out(at, rego_calibration_data):
+    images = rego_calibration_data["raw_data"].data
+    cal_flatfield = rego_calibration_data["flatfield_data"].data[0]
+    cal_rayleighs = rego_calibration_data["rayleighs_data"].data[0]
+    expected = at.calibration.rego(images, cal_flatfield=cal_flatfield, cal_rayleighs=cal_rayleighs)
+    assert expected.dtype == np.float32
+
+    # calibrate into a supplied array, using several threads
+    out = np.empty(images.shape, dtype=np.float32)
+    calibrated_data = at.calibration.rego(images, cal_flatfield=cal_flatfield, cal_rayleighs=cal_rayleighs, out=out, n_parallel=4)
+    assert calibrated_data is out
+    assert np.array_equal(calibrated_data, expected) is True
+
+    # calibrate in place, without the rayleighs conversion
+    expected = at.calibration.rego(images, cal_flatfield=cal_flatfield, step_rayleighs_calibration=False)
+    images_copy = images.copy()
+    calibrated_data = at.calibration.rego(images_copy, cal_flatfield=cal_flatfield, step_rayleighs_calibration=False, out=images_copy)
+    assert calibrated_data is images_copy
+    assert calibrated_data.dtype == images.dtype
+    assert np.array_equal(calibrated_data, expected) is True
+
+    # bad output arrays
+    with pytest.raises(ValueError) as e_info:
+        at.calibration.rego(images, cal_flatfield=cal_flatfield, cal_rayleighs=cal_rayleighs, out=np.empty(images.shape, dtype=np.float64))
+    assert "The out array must be of dtype float32" in str(e_info)
+    with pytest.raises(ValueError) as e_info:
+        at.calibration.rego(images, cal_flatfield=cal_flatfield, cal_rayleighs=cal_rayleighs, out=out[:, :, 0])
+    assert "The out array must be the same shape as the images" in str(e_info)
+
+
+@pytest.mark.tools
+def test_single_image_axis(at, rego_calibration_data):
+    images = rego_calibration_data["raw_data"].data
+    cal_flatfield = rego_calibration_data["flatfield_data"].data[0]
+    cal_rayleighs = rego_calibration_data["rayleighs_data"].data[0]
+
+    # a single image with a last axis should have the axis removed, the same as a 2D image
+    expected = at.calibration.rego(images[:, :, 0], cal_flatfield=cal_flatfield, cal_rayleighs=cal_rayleighs)
+    calibrated_data = at.calibration.rego(images[:, :, 0:1], cal_flatfield=cal_flatfield, cal_rayleighs=cal_rayleighs)
+    assert calibrated_data.shape == images.shape[0:2]
+    assert np.array_equal(calibrated_data, expected) is True
+
+    # unless an out array is supplied
+    out = np.empty(images[:, :, 0:1].shape, dtype=np.float32)
+    calibrated_data = at.calibration.rego(images[:, :, 0:1], cal_flatfield=cal_flatfield, cal_rayleighs=cal_rayleighs, out=out)
+    assert calibrated_data is out
@@ -14,6 +14,8 @@
 
 import pytest
 import warnings
+import datetime
+import numpy as np
 from pyaurorax.tools import Keogram
 
 
@@ -153,3 +155,55 @@ def test_inject_burst_keogram(at, trex_rgb_burst_keogram_data, capsys):
     keogram.pretty_print()
     captured_stdout = capsys.readouterr().out
     assert captured_stdout != ""
+
+
+@pytest.mark.tools
+@pytest.mark.parametrize("cadence,n_channels", [(3, 1), (3, 3), (0.333, 3)])
+def test_gap_filling(cadence, n_channels, capsys):
+    # create a keogram with some frames missing, and a bit of jitter in the nominal timestamps
+    start_dt = datetime.datetime(2021, 11, 4, 9, 0, 0)
+    frame_idx = [0, 1, 2, 5, 6, 9, 10, 11]
+    jitter_us = 20000 if (cadence >= 1) else 0
+    timestamp = [start_dt + datetime.timedelta(seconds=i * cadence, microseconds=(i % 2) * jitter_us) for i in frame_idx]
+    data = np.arange(1, 256 * len(frame_idx) * n_channels + 1, dtype=np.uint16).reshape((256, len(frame_idx), n_channels))
+    if (n_channels == 1):
+        data = data[:, :, 0]
+
+    # fill with nans
+    keogram = Keogram(data.copy(), timestamp, "asi")
+    keogram.inject_nans()
+    assert keogram.data.shape[1] == 12
+    assert keogram.data.dtype == np.float64
+    assert len(keogram.timestamp) == 12
+    expected_mask = np.isin(np.arange(0, 12), frame_idx)
+    assert np.array_equal(keogram.mask, expected_mask) is True
+    assert bool(np.all(np.isnan(keogram.data[:, ~expected_mask]))) is True
+    assert np.array_equal(keogram.data[:, expected_mask], data) is True
+    assert [keogram.timestamp[i] for i in frame_idx] == timestamp
+    assert keogram.timestamp[2] < keogram.timestamp[3] < keogram.timestamp[4] < keogram.timestamp[5]
+
+    # fill with zeros, keeping the dtype
+    keogram_preserved = Keogram(data.copy(), timestamp, "asi")
+    keogram_preserved.inject_nans(preserve_dtype=True)
+    assert keogram_preserved.data.dtype == data.dtype
+    assert keogram_preserved.timestamp == keogram.timestamp
+    assert np.array_equal(keogram_preserved.mask, expected_mask) is True
+    assert np.array_equal(keogram_preserved.data, np.nan_to_num(keogram.data)) is True
+
+    # the mask should be printed
+    assert "mask=array(12 values)" in repr(keogram)
+    keogram.pretty_print()
+    assert "array(12 values)" in capsys.readouterr().out
+
+
+@pytest.mark.tools
+def test_no_gaps():
+    # nothing should change
+    timestamp = [datetime.datetime(2021, 11, 4, 9, 0, 0) + datetime.timedelta(seconds=3 * i) for i in range(0, 10)]
+    data = np.ones((256, 10), dtype=np.uint16)
+    keogram = Keogram(data, timestamp, "asi")
+    assert keogram.mask is None
+    keogram.inject_nans()
+    assert keogram.data is data
+    assert keogram.timestamp == timestamp
+    assert bool(np.all(keogram.mask)) is True
@@ -55,6 +55,29 @@ def test_simple(mock_show, plot_cleanup, at, themis_mosaic_data, capsys):
     assert mock_show.call_count == 1
 
 
+@pytest.mark.tools
+@patch("matplotlib.pyplot.show")
+def test_simple_raster(mock_show, plot_cleanup, at, themis_mosaic_data):
+    # init
+    mosaic_dt = themis_mosaic_data["dt"]
+    prepped_images = themis_mosaic_data["prepped_images"]
+    prepped_skymaps = themis_mosaic_data["prepped_skymaps"]
+
+    # create projection
+    center_lat = -100.0
+    center_lon = 55.0
+    projection_obj = cartopy.crs.NearsidePerspective(central_longitude=center_lat, central_latitude=center_lon)
+
+    # create mosaic
+    mosaic = at.mosaic.create(prepped_images, prepped_skymaps, mosaic_dt, projection_obj, backend="raster", raster_resolution=500)
+    assert isinstance(mosaic, Mosaic)
+
+    # plot
+    map_extent = [-145, -65, 35, 80]
+    mosaic.plot(map_extent, title="THEMIS ASI", rayleighs=True)
+    assert mock_show.call_count == 1
+
+
 @pytest.mark.tools
 @patch("matplotlib.pyplot.show")
 def test_simple_spect(mock_show, plot_cleanup, at, trex_spect_mosaic_data, capsys):
@@ -14,6 +14,7 @@
 
 import pytest
 import warnings
+import numpy as np
 from pyaurorax.tools import Keogram
 
 
@@ -127,3 +128,43 @@ def test_manual_spect_band(at, trex_spect_keogram_data, capsys):
     keogram.pretty_print()
     captured_stdout = capsys.readouterr().out
     assert captured_stdout != ""
+
+
+@pytest.mark.tools
+def test_copy(at, themis_keogram_data, trex_rgb_keogram_data):
+    for keogram_data in [themis_keogram_data, trex_rgb_keogram_data]:
+        data = keogram_data["raw_data"].data
+        timestamp = keogram_data["raw_data"].timestamp
+        middle_column_idx = int(np.floor((data.shape[1]) / 2 - 1))
+
+        # create the keogram as a copy, and as a view
+        keogram = at.keogram.create(data, timestamp)
+        keogram_view = at.keogram.create(data, timestamp, copy=False)
+        assert np.array_equal(keogram.data, keogram_view.data) is True
+        assert np.shares_memory(keogram.data, data) is False
+        assert np.shares_memory(keogram_view.data, data) is True
+
+        # check against the slice of each image
+        for i in [0, data.shape[-1] // 2, data.shape[-1] - 1]:
+            assert np.array_equal(keogram.data[:, i], data[:, middle_column_idx, ..., i]) is True
+
+
+@pytest.mark.tools
+def test_spect_values(at, trex_spect_keogram_data):
+    data = trex_spect_keogram_data["raw_data"].data
+    meta = trex_spect_keogram_data["raw_data"].metadata
+    timestamp = trex_spect_keogram_data["raw_data"].timestamp
+    wavelength = meta[0]["wavelength"]
+    keogram = at.keogram.create(data, timestamp, spectra=True, wavelength=wavelength, spect_band=[560.0, 564.0], spect_band_bg=[559.0, 559.5])
+    assert keogram.data.shape == (data.shape[1], data.shape[2])
+    assert keogram.data.dtype == data.dtype
+
+    # check against integrating each timestamp individually
+    int_w = np.where((wavelength >= 560.0) & (wavelength <= 564.0))[0]
+    int_bg_w = np.where((wavelength >= 559.0) & (wavelength <= 559.5))[0]
+    for i in [0, data.shape[-1] // 2, data.shape[-1] - 1]:
+        rayleighs = np.trapezoid(data[int_w, :, i], x=wavelength[int_w], axis=0)
+        rayleighs -= np.trapezoid(data[int_bg_w, :, i], x=wavelength[int_bg_w], axis=0)
+        rayleighs = np.nan_to_num(rayleighs, nan=0.0)
+        rayleighs[rayleighs < 0.0] = 0.0
+        assert np.allclose(keogram.data[:, i], rayleighs.astype(data.dtype)) is True
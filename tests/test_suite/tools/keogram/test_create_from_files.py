@@ -0,0 +1,72 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import datetime
+import numpy as np
+from pyaurorax.tools import Keogram
+
+
+def __download(aurorax, dataset_name, site_uid):
+    start_dt = datetime.datetime(2021, 11, 4, 9, 0)
+    end_dt = datetime.datetime(2021, 11, 4, 9, 9)
+    return aurorax.data.ucalgary.download(dataset_name, start_dt, end_dt, site_uid=site_uid, progress_bar_disable=True)
+
+
+@pytest.mark.tools
+@pytest.mark.parametrize("dataset_name,site_uid", [("THEMIS_ASI_RAW", "atha"), ("TREX_RGB_RAW_NOMINAL", "rabb")])
+def test_simple(aurorax, at, dataset_name, site_uid):
+    r = __download(aurorax, dataset_name, site_uid)
+    data = aurorax.data.ucalgary.read(r.dataset, r.filenames)
+    expected = at.keogram.create(data.data, data.timestamp)
+
+    # create the keogram from the files, a few at a time
+    keogram = at.keogram.create_from_files(r.dataset, r.filenames, chunk_size=3)
+    assert isinstance(keogram, Keogram) is True
+    assert keogram.timestamp == data.timestamp
+    assert np.array_equal(keogram.data, expected.data) is True
+
+
+@pytest.mark.tools
+def test_custom(aurorax, at):
+    r = __download(aurorax, "THEMIS_ASI_RAW", "atha")
+    data = aurorax.data.ucalgary.read(r.dataset, r.filenames)
+    x_locs = [100, 150, 200]
+    y_locs = [50, 120, 200]
+    expected = at.keogram.create_custom(data.data, data.timestamp, "ccd", 5, x_locs, y_locs)
+
+    # create the keogram from the files, a few at a time
+    keogram = at.keogram.create_custom_from_files(r.dataset, r.filenames, "ccd", 5, x_locs, y_locs, chunk_size=3)
+    assert keogram.timestamp == data.timestamp
+    assert np.array_equal(keogram.data, expected.data) is True
+
+
+@pytest.mark.tools
+def test_no_data(aurorax, at):
+    r = __download(aurorax, "THEMIS_ASI_RAW", "atha")
+
+    # no files
+    with pytest.raises(ValueError) as e_info:
+        at.keogram.create_from_files(r.dataset, [])
+    assert "No files were supplied to read" in str(e_info)
+
+    # no records in the time range
+    with pytest.raises(ValueError) as e_info:
+        at.keogram.create_from_files(r.dataset, r.filenames, start_time=datetime.datetime(2021, 11, 5), end_time=datetime.datetime(2021, 11, 6))
+    assert "No data was read from the supplied files" in str(e_info)
+
+    # bad chunk size
+    with pytest.raises(ValueError) as e_info:
+        at.keogram.create_from_files(r.dataset, r.filenames, chunk_size=0)
+    assert "The chunk_size value must be at least 1" in str(e_info)
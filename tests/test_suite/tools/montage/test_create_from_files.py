@@ -0,0 +1,49 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import datetime
+import warnings
+import numpy as np
+from pyaurorax.tools import Montage
+
+
+@pytest.mark.tools
+def test_simple(aurorax, at):
+    start_dt = datetime.datetime(2021, 11, 4, 9, 0)
+    end_dt = datetime.datetime(2021, 11, 4, 9, 9)
+    r = aurorax.data.ucalgary.download("THEMIS_ASI_RAW", start_dt, end_dt, site_uid="atha", progress_bar_disable=True)
+    data = aurorax.data.ucalgary.read(r.dataset, r.filenames)
+
+    # create the montage from the files, a few at a time
+    timestamp = [datetime.datetime(2021, 11, 4, 9, minute) for minute in range(0, 10, 2)]
+    montage = at.montage.create_from_files(r.dataset, r.filenames, timestamp, ccd_bounds=[50, 199, 20, 119], chunk_size=3)
+    assert isinstance(montage, Montage) is True
+    assert montage.data.shape == (100, 150, len(timestamp))
+    for i in range(0, len(timestamp)):
+        frame_idx = data.timestamp.index(montage.timestamp[i])
+        assert abs((montage.timestamp[i] - timestamp[i]).total_seconds()) < 3
+        assert np.array_equal(montage.data[:, :, i], data.data[20:120, 50:200, frame_idx]) is True
+
+    # check that timestamps without data are left out
+    with warnings.catch_warnings(record=True) as w:
+        montage = at.montage.create_from_files(r.dataset, r.filenames, timestamp + [datetime.datetime(2021, 11, 4, 12, 0)])
+    assert len(w) == 1
+    assert "No data was found within 60.0 seconds of 1 of the supplied timestamps" in str(w[-1].message)
+    assert len(montage.timestamp) == len(timestamp)
+
+    # check that no data at all is an error
+    with pytest.raises(ValueError) as e_info:
+        at.montage.create_from_files(r.dataset, r.filenames, [datetime.datetime(2021, 11, 4, 12, 0)])
+    assert "No data was found for any of the supplied timestamps" in str(e_info)
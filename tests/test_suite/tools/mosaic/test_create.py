@@ -15,6 +15,7 @@
 import pytest
 import cartopy.crs
 import datetime
+import numpy as np
 from pyaurorax.tools import Mosaic
 from pyaurorax.exceptions import AuroraXError
 
@@ -212,3 +213,126 @@ def test_themis_mosaic_zero_frame(at, themis_mosaic_data, capsys):
     # create mosaic
     mosaic = at.mosaic.create(prepped_images, prepped_skymaps, mosaic_dt, projection_obj)
     assert isinstance(mosaic, Mosaic) is True
+
+
+@pytest.mark.tools
+def test_preserve_dtype(at, themis_mosaic_data):
+    # init
+    mosaic_dt = themis_mosaic_data["dt"]
+    prepped_images = themis_mosaic_data["prepped_images"]
+    prepped_skymaps = themis_mosaic_data["prepped_skymaps"]
+    prepped_images_preserved = at.mosaic.prep_images(themis_mosaic_data["raw_data"], preserve_dtype=True)
+
+    # create projection
+    center_lat = -100.0
+    center_lon = 55.0
+    projection_obj = cartopy.crs.NearsidePerspective(central_longitude=center_lat, central_latitude=center_lon)
+
+    # should be the same as the mosaic created from the float data
+    mosaic = at.mosaic.create(prepped_images, prepped_skymaps, mosaic_dt, projection_obj)
+    mosaic_preserved = at.mosaic.create(prepped_images_preserved, prepped_skymaps, mosaic_dt, projection_obj)
+    assert isinstance(mosaic_preserved, Mosaic) is True
+    assert len(mosaic_preserved.polygon_data.get_paths()) == len(mosaic.polygon_data.get_paths())
+    assert np.array_equal(mosaic_preserved.polygon_data.get_facecolor(), mosaic.polygon_data.get_facecolor())
+
+
+@pytest.mark.tools
+def test_create_batch(at, themis_mosaic_data):
+    # init
+    prepped_images = themis_mosaic_data["prepped_images"]
+    prepped_skymaps = themis_mosaic_data["prepped_skymaps"]
+    timestamps = prepped_images.timestamps[0:3]
+
+    # create projection
+    center_lat = -100.0
+    center_lon = 55.0
+    projection_obj = cartopy.crs.NearsidePerspective(central_longitude=center_lat, central_latitude=center_lon)
+
+    # create mosaics
+    mosaics = list(at.mosaic.create_batch(prepped_images, prepped_skymaps, timestamps, projection_obj))
+    assert len(mosaics) == len(timestamps)
+    for i in range(0, len(timestamps)):
+        assert isinstance(mosaics[i], Mosaic) is True
+
+        # should be the same as creating each mosaic individually
+        mosaic = at.mosaic.create(prepped_images, prepped_skymaps, timestamps[i], projection_obj)
+        assert len(mosaics[i].polygon_data.get_paths()) == len(mosaic.polygon_data.get_paths())
+        assert np.array_equal(mosaics[i].polygon_data.get_facecolor(), mosaic.polygon_data.get_facecolor())
+
+    # requested timestamp not in data
+    bad_dt = datetime.datetime(2025, 1, 1, 0, 0, 0)
+    with pytest.raises(ValueError) as e_info:
+        _ = at.mosaic.create_batch(prepped_images, prepped_skymaps, [timestamps[0], bad_dt], projection_obj)
+    assert "Could not create mosaic for timestamp" in str(e_info)
+
+
+@pytest.mark.tools
+@pytest.mark.parametrize("raster_interpolation", ["nearest", "linear"])
+def test_raster_backend(at, themis_mosaic_data, capsys, raster_interpolation):
+    # init
+    mosaic_dt = themis_mosaic_data["dt"]
+    prepped_images = themis_mosaic_data["prepped_images"]
+    prepped_skymaps = themis_mosaic_data["prepped_skymaps"]
+
+    # create projection
+    center_lat = -100.0
+    center_lon = 55.0
+    projection_obj = cartopy.crs.NearsidePerspective(central_longitude=center_lat, central_latitude=center_lon)
+
+    # create mosaic
+    mosaic = at.mosaic.create(
+        prepped_images,
+        prepped_skymaps,
+        mosaic_dt,
+        projection_obj,
+        backend="raster",
+        raster_resolution=500,
+        raster_interpolation=raster_interpolation,
+    )
+    assert isinstance(mosaic, Mosaic) is True
+    assert mosaic.polygon_data is None
+    assert mosaic.raster_data is not None
+    assert mosaic.raster_extent is not None
+    assert mosaic.raster_data.shape[2] == 4
+    assert max(mosaic.raster_data.shape[0:2]) == 500
+    assert np.any(mosaic.raster_data[:, :, 3] > 0)
+    assert np.min(mosaic.raster_data) >= 0 and np.max(mosaic.raster_data) <= 1
+
+    # check __str__ and __repr__ for Mosaic type
+    assert isinstance(str(mosaic), str) is True
+    assert isinstance(repr(mosaic), str) is True
+    mosaic.pretty_print()
+    captured_stdout = capsys.readouterr().out
+    assert "raster_data" in captured_stdout
+
+    # batch mode reuses the resampling index, and should give the same result
+    mosaics = list(
+        at.mosaic.create_batch(
+            prepped_images,
+            prepped_skymaps,
+            [mosaic_dt],
+            projection_obj,
+            backend="raster",
+            raster_resolution=500,
+            raster_interpolation=raster_interpolation,
+        ))
+    assert np.array_equal(mosaics[0].raster_data, mosaic.raster_data)
+
+
+@pytest.mark.tools
+def test_raster_backend_bad_params(at, themis_mosaic_data):
+    # init
+    mosaic_dt = themis_mosaic_data["dt"]
+    prepped_images = themis_mosaic_data["prepped_images"]
+    prepped_skymaps = themis_mosaic_data["prepped_skymaps"]
+    projection_obj = cartopy.crs.NearsidePerspective(central_longitude=-100.0, central_latitude=55.0)
+
+    # check bad backend
+    with pytest.raises(ValueError) as e_info:
+        at.mosaic.create(prepped_images, prepped_skymaps, mosaic_dt, projection_obj, backend="bad")
+    assert "Invalid backend" in str(e_info)
+
+    # check bad interpolation
+    with pytest.raises(ValueError) as e_info:
+        at.mosaic.create(prepped_images, prepped_skymaps, mosaic_dt, projection_obj, backend="raster", raster_interpolation="bad")
+    assert "Invalid raster_interpolation" in str(e_info)
@@ -14,6 +14,7 @@
 
 import pytest
 import warnings
+import numpy as np
 from pyaurorax.tools import MosaicData
 
 
@@ -193,3 +194,49 @@ def test_prep_burst_data(at, trex_rgb_burst_keogram_data, capsys):
     prepped_data.pretty_print()
     captured_stdout = capsys.readouterr().out
     assert captured_stdout != ""
+
+
+@pytest.mark.tools
+def test_preserve_dtype(at, themis_mosaic_data, capsys):
+    # init
+    data = themis_mosaic_data["raw_data"]
+
+    prepped_data = at.mosaic.prep_images(data)
+    prepped_data_preserved = at.mosaic.prep_images(data, preserve_dtype=True)
+
+    # the timestamps and frames should be the same, with zeros instead of nans
+    assert prepped_data_preserved.timestamps == prepped_data.timestamps
+    assert prepped_data_preserved.site_uid_list == prepped_data.site_uid_list
+    for i in range(0, len(prepped_data.site_uid_list)):
+        site_uid = prepped_data.site_uid_list[i]
+        assert prepped_data_preserved.images[site_uid].dtype == data[i].data.dtype
+        assert np.array_equal(prepped_data_preserved.images[site_uid], np.nan_to_num(prepped_data.images[site_uid])) is True
+
+        # the masks should mark the timestamps without data
+        has_data = ~np.all(np.isnan(prepped_data.images[site_uid]), axis=(0, 1))
+        assert np.array_equal(prepped_data.masks[site_uid], has_data) is True
+        assert np.array_equal(prepped_data_preserved.masks[site_uid], has_data) is True
+
+    # the masks should be printed
+    assert "masks=" in repr(prepped_data_preserved)
+    prepped_data_preserved.pretty_print()
+    captured_stdout = capsys.readouterr().out
+    assert "masks" in captured_stdout and "array(%d values)" % (len(prepped_data.timestamps)) in captured_stdout
+
+
+@pytest.mark.tools
+def test_prep_burst_data_nearest(at, trex_rgb_burst_keogram_data):
+    # init
+    data = trex_rgb_burst_keogram_data["raw_data"]
+    data.data = data.data[:, :, :, 0:25]
+    data.metadata = data.metadata[0:25]
+    data.timestamp = data.timestamp[0:25]
+
+    prepped_data = at.mosaic.prep_images([data], preserve_dtype=True)
+    site_uid = prepped_data.site_uid_list[0]
+    assert bool(np.all(prepped_data.masks[site_uid])) is True
+
+    # each timestamp should have the closest frame
+    for i in range(0, len(prepped_data.timestamps)):
+        closest_idx = int(np.argmin([abs(ts - prepped_data.timestamps[i]) for ts in data.timestamp]))
+        assert np.array_equal(prepped_data.images[site_uid][:, :, :, i], data.data[:, :, :, closest_idx]) is True
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import pytest
+import numpy as np
+import pyaurorax
 from pyaurorax.tools import MosaicSkymap
 
 
@@ -68,3 +71,29 @@ def test_errors(at, themis_mosaic_data, capsys):
 
     assert ("Number of items in supplied skymaps and site_uid_order lists do not match, or " +
             "some site_uids specified in the order were not found. Unable to flatten skymaps due to this mismatch.") in str(e_info)
+
+
+@pytest.mark.tools
+def test_use_cache(themis_mosaic_data, tmp_path):
+    # init
+    skymaps = themis_mosaic_data["skymaps"]
+    at = pyaurorax.PyAuroraX(mosaic_skymap_cache_path=str(tmp_path)).tools
+
+    # first call populates the cache
+    prepped_skymaps = at.mosaic.prep_skymaps(skymaps, height_km=110, use_cache=True)
+    assert isinstance(prepped_skymaps, MosaicSkymap)
+    assert len(os.listdir(tmp_path)) == len(skymaps)
+
+    # second call loads from the cache
+    cached_skymaps = at.mosaic.prep_skymaps(skymaps, height_km=110, use_cache=True)
+    assert isinstance(cached_skymaps, MosaicSkymap)
+    assert cached_skymaps.site_uid_list == prepped_skymaps.site_uid_list
+    for i in range(0, len(skymaps)):
+        assert isinstance(cached_skymaps.polyfill_lat[i], np.memmap)
+        assert np.array_equal(cached_skymaps.polyfill_lat[i], prepped_skymaps.polyfill_lat[i])
+        assert np.array_equal(cached_skymaps.polyfill_lon[i], prepped_skymaps.polyfill_lon[i])
+        assert np.array_equal(cached_skymaps.elevation[i], prepped_skymaps.elevation[i], equal_nan=True)
+
+    # different height is a different cache entry
+    _ = at.mosaic.prep_skymaps(skymaps, height_km=150, use_cache=True)
+    assert len(os.listdir(tmp_path)) == len(skymaps) * 2
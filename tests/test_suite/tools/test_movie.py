@@ -13,10 +13,12 @@
 # limitations under the License.
 
 import os
+import cv2
 import pytest
 import random
 import string
 import shutil
+import numpy as np
 import matplotlib.pyplot as plt
 
 
@@ -87,3 +89,89 @@ def test_corrupt_videofile(at, themis_single_file):
 
     # Delete temporary files from system
     shutil.rmtree("/tmp/pyaurorax_testing_dir")
+
+
+def __read_movie_frames(filename):
+    capture = cv2.VideoCapture(filename)
+    frames = []
+    while (True):
+        success, frame = capture.read()
+        if (success is False):
+            break
+        frames.append(frame)
+    capture.release()
+    return frames
+
+
+@pytest.mark.tools
+@pytest.mark.parametrize("n_parallel", [1, 3])
+def test_from_frames_arrays(at, n_parallel):
+    output_filename = "/tmp/pyaurorax_testing_%s.mp4" % (''.join(random.choices(string.ascii_lowercase + string.digits, k=8)))
+
+    # create the movie from a generator of RGB arrays
+    def frame_generator():
+        for i in range(0, 20):
+            frame = np.zeros((120, 160, 3), dtype=np.uint8)
+            frame[:, :, 0] = 200
+            frame[10:30, i:i + 20, 1] = 255
+            yield frame
+
+    at.movie_from_frames(frame_generator(), output_filename, n_parallel=n_parallel, max_queued_frames=2, progress_bar_disable=True)
+    assert os.path.exists(output_filename)
+
+    # check the frames, which are read back in BGR order
+    frames = __read_movie_frames(output_filename)
+    assert len(frames) == 20
+    assert frames[0].shape == (120, 160, 3)
+    assert frames[0][60:, :, 2].mean() > 150
+    assert frames[0][60:, :, 0].mean() < 50
+    os.remove(output_filename)
+
+
+@pytest.mark.tools
+def test_from_frames_figures(at):
+    output_filename = "/tmp/pyaurorax_testing_%s.mp4" % (''.join(random.choices(string.ascii_lowercase + string.digits, k=8)))
+
+    # create the movie from figures, which are closed once used
+    def figure_generator():
+        for i in range(0, 5):
+            fig, ax = plt.subplots(figsize=(4, 3), dpi=50)
+            ax.plot([0, i])
+            yield (fig, ax)
+
+    n_figures = len(plt.get_fignums())
+    at.movie_from_frames(figure_generator(), output_filename, progress_bar_disable=True)
+    assert len(__read_movie_frames(output_filename)) == 5
+    assert len(plt.get_fignums()) == n_figures
+    os.remove(output_filename)
+
+
+@pytest.mark.tools
+def test_from_frames_errors(at):
+    output_filename = "/tmp/pyaurorax_testing_%s.mp4" % (''.join(random.choices(string.ascii_lowercase + string.digits, k=8)))
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    # different sized frames
+    with pytest.raises(IOError) as e_info:
+        at.movie_from_frames([frame, frame[0:60]], output_filename, progress_bar_disable=True)
+    assert "All frames must be the same size" in str(e_info)
+
+    # unsupported frames
+    with pytest.raises(ValueError) as e_info:
+        at.movie_from_frames([frame.astype(np.float32)], output_filename, progress_bar_disable=True)
+    assert "Frame arrays must be of dtype uint8" in str(e_info)
+    with pytest.raises(ValueError) as e_info:
+        at.movie_from_frames([1, 2, 3], output_filename, progress_bar_disable=True)
+    assert "Unsupported frame type" in str(e_info)
+
+    # missing file
+    with pytest.raises(IOError) as e_info:
+        at.movie_from_frames(["/tmp/pyaurorax_testing_missing_file.png"], output_filename, progress_bar_disable=True)
+    assert "Unable to read frame from file" in str(e_info)
+
+    # bad parameters
+    with pytest.raises(ValueError) as e_info:
+        at.movie_from_frames([frame], output_filename, n_parallel=0)
+    assert "The n_parallel value must be at least 1" in str(e_info)
+    if (os.path.exists(output_filename) is True):
+        os.remove(output_filename)
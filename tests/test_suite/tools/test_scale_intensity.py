@@ -102,3 +102,45 @@ def test_bad_top_double(at, themis_single_file):
     with pytest.raises(ValueError) as e_info:
         _ = at.scale_intensity(img)
     assert "The top parameter must be specified when a float array is supplied" in str(e_info)
+
+
+@pytest.mark.tools
+@pytest.mark.parametrize("memory_saver", [True, False])
+def test_lookup_table(at, themis_single_file, memory_saver):
+    img = themis_single_file.data[:, :, 0:5]
+
+    # compare against scaling the values directly
+    img_scaled = at.scale_intensity(img, min=1000, max=10000, top=255, memory_saver=memory_saver)
+    expected = ((((img - 1000.0) * (255.0 / 9000.0)).clip(0, 255) + 0.5).astype(img.dtype))
+    assert img_scaled.dtype == img.dtype
+    assert np.array_equal(img_scaled, expected) is True
+
+
+@pytest.mark.tools
+@pytest.mark.parametrize("min,max", [(None, None), (1000, None), (1000, 10000)])
+def test_out(at, trex_rgb_single_file, min, max):
+    img = trex_rgb_single_file.data[:, :, :, 0:5]
+    expected = at.scale_intensity(img, min=min, max=max, top=230)
+
+    # scale into a supplied array, using several threads
+    out = np.empty(img.shape, dtype=img.dtype)
+    img_scaled = at.scale_intensity(img, min=min, max=max, top=230, out=out, n_parallel=4)
+    assert img_scaled is out
+    assert np.array_equal(img_scaled, expected) is True
+
+    # scale in place
+    img_copy = img.copy()
+    img_scaled = at.scale_intensity(img_copy, min=min, max=max, top=230, out=img_copy)
+    assert img_scaled is img_copy
+    assert np.array_equal(img_scaled, expected) is True
+
+
+@pytest.mark.tools
+def test_bad_out(at, themis_single_file):
+    img = themis_single_file.data[:, :, 0:5]
+    with pytest.raises(ValueError) as e_info:
+        _ = at.scale_intensity(img, out=np.empty(img.shape, dtype=np.float32))
+    assert "The out array must be of dtype" in str(e_info)
+    with pytest.raises(ValueError) as e_info:
+        _ = at.scale_intensity(img, out=np.empty(img.shape[0:2], dtype=img.dtype))
+    assert "The out array must be the same shape as the data" in str(e_info)
@@ -0,0 +1,97 @@
+# Copyright 2024 University of Calgary
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import datetime
+import numpy as np
+from types import SimpleNamespace
+from pyaurorax.tools import _skymap_geometry
+
+
+@pytest.mark.tools
+@pytest.mark.parametrize("altitude_km", [110, 115])
+def test_get_latlon(ccd_contour_data, altitude_km):
+    skymap = ccd_contour_data["trex_rgb_skymap"]
+    _skymap_geometry.clear_cache()
+
+    # get lats and lons
+    lats, lons = _skymap_geometry.get_latlon(skymap, altitude_km)
+    assert lats.shape == skymap.full_map_latitude.shape[1:]
+    assert lons.shape == skymap.full_map_longitude.shape[1:]
+    assert np.nanmax(lons) <= 180
+
+    # compare to per-pixel interpolation
+    for i, j in [(100, 100), (200, 250), (0, 0)]:
+        expected_lat = np.interp(altitude_km * 1000.0, skymap.full_map_altitude, skymap.full_map_latitude[:, i, j])
+        assert np.array_equal(lats[i, j], expected_lat.astype(lats.dtype), equal_nan=True)
+
+    # second call should be cached, and read-only
+    lats2, lons2 = _skymap_geometry.get_latlon(skymap, altitude_km)
+    assert lats2 is lats
+    assert lons2 is lons
+    with pytest.raises(ValueError):
+        lats2[0, 0] = 0
+
+
+@pytest.mark.tools
+def test_get_latlon_bad_altitude(ccd_contour_data):
+    skymap = ccd_contour_data["trex_rgb_skymap"]
+    with pytest.raises(ValueError) as e_info:
+        _skymap_geometry.get_latlon(skymap, 5000)
+    assert "Altitude" in str(e_info) and "outside valid range of" in str(e_info)
+
+
+@pytest.mark.tools
+def test_get_mag_latlon(ccd_contour_data):
+    skymap = ccd_contour_data["trex_rgb_skymap"]
+    timestamp = datetime.datetime(2021, 11, 4, 9, 0)
+    _skymap_geometry.clear_cache()
+
+    # get magnetic lats and lons
+    mag_lats, mag_lons = _skymap_geometry.get_mag_latlon(skymap, 115, timestamp)
+    assert mag_lats.shape == skymap.full_map_latitude.shape[1:]
+    assert mag_lons.shape == skymap.full_map_longitude.shape[1:]
+
+    # cached per timestamp
+    assert _skymap_geometry.get_mag_latlon(skymap, 115, timestamp)[0] is mag_lats
+    assert _skymap_geometry.get_mag_latlon(skymap, 115, timestamp + datetime.timedelta(days=1))[0] is not mag_lats
+
+
+@pytest.mark.tools
+def test_get_latlon_incomplete_pixels():
+    # skymap with one pixel that is missing at the lowest altitude only
+    latitude = np.full((3, 2, 2), 50.0, dtype=np.float32)
+    longitude = np.full((3, 2, 2), 250.0, dtype=np.float32)
+    latitude[0, 0, 0] = np.nan
+    longitude[0, 0, 0] = np.nan
+    skymap = SimpleNamespace(
+        full_map_altitude=np.array([90000.0, 110000.0, 150000.0]),
+        full_map_latitude=latitude,
+        full_map_longitude=longitude,
+    )
+    _skymap_geometry.clear_cache()
+
+    # by default, only the altitudes on either side are used, the same as np.interp
+    lats, lons = _skymap_geometry.get_latlon(skymap, 130)
+    assert lats[0, 0] == 50.0 and lons[0, 0] == -110.0
+    assert lats[0, 0] == np.interp(130000.0, skymap.full_map_altitude, latitude[:, 0, 0])
+
+    # the pixel is nan when masking incomplete pixels, and the others are unchanged
+    lats_masked, lons_masked = _skymap_geometry.get_latlon(skymap, 130, mask_incomplete=True)
+    assert np.isnan(lats_masked[0, 0]) and np.isnan(lons_masked[0, 0])
+    assert np.array_equal(lats_masked[1:, :], lats[1:, :]) and np.array_equal(lons_masked[:, 1:], lons[:, 1:])
+
+    # masking doesn't apply at a skymap altitude, where there is no interpolation
+    lats_exact, _ = _skymap_geometry.get_latlon(skymap, 110, mask_incomplete=True)
+    assert lats_exact[0, 0] == 50.0